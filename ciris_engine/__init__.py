@@ -1,15 +1,31 @@
 """CIRIS Engine - Core Agent Runtime and Services"""
 
+from typing import TYPE_CHECKING, Any
+
 from .constants import CIRIS_VERSION
 
 __version__ = CIRIS_VERSION
 
-# Import key runtime components for easy access
-from .logic.runtime.ciris_runtime import CIRISRuntime
-from .logic.runtime.runtime_interface import RuntimeInterface
+if TYPE_CHECKING:
+    from .logic.runtime.ciris_runtime import CIRISRuntime
+    from .logic.runtime.runtime_interface import RuntimeInterface
 
 __all__ = [
     "__version__",
     "CIRISRuntime",
     "RuntimeInterface",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Key runtime components are resolved on first access so that importing a
+    # schema or utility module does not pull in the whole runtime.
+    if name == "CIRISRuntime":
+        from .logic.runtime.ciris_runtime import CIRISRuntime
+
+        return CIRISRuntime
+    if name == "RuntimeInterface":
+        from .logic.runtime.runtime_interface import RuntimeInterface
+
+        return RuntimeInterface
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
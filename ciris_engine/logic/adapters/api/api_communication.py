@@ -5,12 +5,17 @@ Communication service for API adapter.
 import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
 from ciris_engine.protocols.services.governance.communication import CommunicationServiceProtocol
 from ciris_engine.schemas.runtime.enums import ServiceType
 from ciris_engine.schemas.runtime.messages import FetchedMessage
 
+from ..side_effects import SideEffectPipeline
+from .config import APIAdapterConfig
+from .middleware.rate_limiter import RateLimiter
+from .websocket_broadcaster import OverflowPolicy, StreamConnection, WebSocketBroadcaster
+
 if TYPE_CHECKING:
     from ciris_engine.schemas.services.core import ServiceCapabilities, ServiceStatus
 
@@ -23,10 +28,19 @@ class APICommunicationService(CommunicationServiceProtocol):
     def __init__(self, config: Optional[Any] = None) -> None:
         """Initialize API communication service."""
         self._response_queue: asyncio.Queue = asyncio.Queue()
-        self._websocket_clients: Dict[str, Any] = {}
         self._is_started = False
         self._config = config  # Store the API adapter config
 
+        # WebSocket clients are only written to through their broadcaster queues
+        if isinstance(config, APIAdapterConfig):
+            self.broadcaster = WebSocketBroadcaster(
+                max_queue=config.websocket_queue_size,
+                heartbeat_seconds=config.websocket_heartbeat_seconds,
+                send_timeout=config.websocket_send_timeout,
+            )
+        else:
+            self.broadcaster = WebSocketBroadcaster()
+
         # Metrics tracking
         self._requests_handled = 0
         self._error_count = 0
@@ -34,62 +48,29 @@ class APICommunicationService(CommunicationServiceProtocol):
         self._max_response_times = 100  # Keep last 100 response times
         self._start_time: Optional[datetime] = None
         self._time_service: Optional[Any] = None  # Will be injected from adapter
+        # Correlation writes happen after the response is delivered
+        self._side_effects = SideEffectPipeline("api")
 
     async def send_message(self, channel_id: str, content: str) -> bool:
         """Send message through API response or WebSocket."""
         start_time = datetime.now(timezone.utc)
         try:
-            # Create a "speak" correlation for this outgoing message
-            import uuid
-
-            from ciris_engine.logic import persistence
-            from ciris_engine.schemas.telemetry.core import (
-                ServiceCorrelation,
-                ServiceCorrelationStatus,
-                ServiceRequestData,
-                ServiceResponseData,
-            )
-
-            correlation_id = str(uuid.uuid4())
-            now = datetime.now(timezone.utc)
-
-            # Create correlation for the outgoing message
-            correlation = ServiceCorrelation(
-                correlation_id=correlation_id,
-                service_type="api",
-                handler_name="APIAdapter",
-                action_type="speak",
-                request_data=ServiceRequestData(
-                    service_type="api",
-                    method_name="speak",
-                    channel_id=channel_id,
-                    parameters={"content": content, "channel_id": channel_id},
-                    request_timestamp=now,
-                ),
-                response_data=ServiceResponseData(
-                    success=True, result_summary="Message sent", execution_time_ms=0, response_timestamp=now
-                ),
-                status=ServiceCorrelationStatus.COMPLETED,
-                created_at=now,
-                updated_at=now,
-                timestamp=now,
-            )
-
-            # Get time service if available (passed from adapter)
-            time_service = getattr(self, "_time_service", None)
-            persistence.add_correlation(correlation, time_service)
-            logger.debug(f"Created speak correlation for channel {channel_id}")
+            # Deliver first; the correlation is persisted off the reply path
             # If it's a WebSocket channel, send through WebSocket
             if channel_id and channel_id.startswith("ws:"):
                 client_id = channel_id[3:]  # Remove "ws:" prefix
-                if client_id in self._websocket_clients:
-                    ws = self._websocket_clients[client_id]
-                    await ws.send_json(
+                if client_id in self.broadcaster.connections:
+                    queued = self.broadcaster.send_to(
+                        client_id,
                         {
                             "type": "message",
                             "data": {"content": content, "timestamp": datetime.now(timezone.utc).isoformat()},
-                        }
+                        },
                     )
+                    if not queued:
+                        logger.warning(f"WebSocket client {client_id} is disconnecting, message not sent")
+                        return False
+                    await self._record_speak_correlation(channel_id, content, start_time)
                     return True
                 else:
                     logger.warning(f"WebSocket client not found: {client_id}")
@@ -97,6 +78,12 @@ class APICommunicationService(CommunicationServiceProtocol):
 
             # Otherwise, queue for HTTP response
             await self._response_queue.put({"channel_id": channel_id, "content": content})
+            # Stream clients subscribed to "messages" see the replies on channels they can read
+            self.broadcast(
+                "message",
+                {"channel_id": channel_id, "content": content, "timestamp": datetime.now(timezone.utc).isoformat()},
+                channel_id=channel_id,
+            )
 
             # Check if there's a waiting interact request for this channel
             if channel_id and channel_id.startswith("api_"):
@@ -116,6 +103,8 @@ class APICommunicationService(CommunicationServiceProtocol):
                 except Exception as e:
                     logger.debug(f"Could not notify interact response: {e}")
 
+            await self._record_speak_correlation(channel_id, content, start_time)
+
             # Track successful request
             self._requests_handled += 1
             elapsed_ms = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
@@ -130,17 +119,79 @@ class APICommunicationService(CommunicationServiceProtocol):
             self._error_count += 1
             return False
 
-    def register_websocket(self, client_id: str, websocket: Any) -> None:
-        """Register a WebSocket client."""
-        self._websocket_clients[client_id] = websocket
-        logger.info(f"WebSocket client registered: {client_id}")
+    async def _record_speak_correlation(self, channel_id: str, content: str, sent_at: datetime) -> None:
+        """Queue the "speak" correlation for an outgoing message."""
+        import uuid
+
+        from ciris_engine.schemas.telemetry.core import (
+            ServiceCorrelation,
+            ServiceCorrelationStatus,
+            ServiceRequestData,
+            ServiceResponseData,
+        )
+
+        now = datetime.now(timezone.utc)
+        correlation = ServiceCorrelation(
+            correlation_id=str(uuid.uuid4()),
+            service_type="api",
+            handler_name="APIAdapter",
+            action_type="speak",
+            request_data=ServiceRequestData(
+                service_type="api",
+                method_name="speak",
+                channel_id=channel_id,
+                parameters={"content": content, "channel_id": channel_id},
+                request_timestamp=sent_at,
+            ),
+            response_data=ServiceResponseData(
+                success=True,
+                result_summary="Message sent",
+                execution_time_ms=(now - sent_at).total_seconds() * 1000,
+                response_timestamp=now,
+            ),
+            status=ServiceCorrelationStatus.COMPLETED,
+            created_at=sent_at,
+            updated_at=now,
+            timestamp=sent_at,
+        )
+        await self._side_effects.record_correlation(correlation)
+        logger.debug(f"Queued speak correlation for channel {channel_id}")
+
+    def register_websocket(
+        self,
+        client_id: str,
+        websocket: Any,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        max_queue: Optional[int] = None,
+        user_id: Optional[str] = None,
+        role: Optional[str] = None,
+        readable_channels: Iterable[str] = (),
+    ) -> StreamConnection:
+        """Register a WebSocket client; it only receives replies from its readable channels."""
+        connection = self.broadcaster.register(
+            client_id,
+            websocket,
+            policy=policy,
+            max_queue=max_queue,
+            user_id=user_id,
+            role=role,
+            readable_channels=readable_channels,
+        )
+        logger.info(f"WebSocket client registered: {client_id} (overflow policy: {policy.value})")
+        return connection
 
-    def unregister_websocket(self, client_id: str) -> None:
-        """Unregister a WebSocket client."""
-        if client_id in self._websocket_clients:
-            del self._websocket_clients[client_id]
+    async def unregister_websocket(self, client_id: str) -> None:
+        """Unregister a WebSocket client and stop its writer."""
+        if client_id in self.broadcaster.connections:
+            await self.broadcaster.unregister(client_id)
             logger.info(f"WebSocket client unregistered: {client_id}")
 
+    def broadcast(
+        self, event_type: str, data: Any, channel: str = "messages", channel_id: Optional[str] = None
+    ) -> int:
+        """Queue an event for every WebSocket client subscribed to the channel that may read channel_id."""
+        return self.broadcaster.broadcast(event_type, data, channel=channel, channel_id=channel_id)
+
     async def fetch_messages(
         self,
         channel_id: str,
@@ -151,6 +202,9 @@ class APICommunicationService(CommunicationServiceProtocol):
         """Retrieve messages from a channel using the correlations database."""
         from ciris_engine.logic.persistence import get_correlations_by_channel
 
+        # Include messages whose correlations are still queued
+        await self._side_effects.flush()
+
         try:
             # Get correlations for this channel
             correlations = get_correlations_by_channel(channel_id=channel_id, limit=limit, before=before)
@@ -233,6 +287,9 @@ class APICommunicationService(CommunicationServiceProtocol):
     async def stop(self) -> None:
         """Stop the communication service."""
         self._is_started = False
+        await self.broadcaster.stop()
+        # Persist correlations still queued from sent messages
+        await self._side_effects.stop()
         # Clear any pending responses
         while not self._response_queue.empty():
             try:
@@ -280,19 +337,27 @@ class APICommunicationService(CommunicationServiceProtocol):
         if self._response_times:
             avg_response_time = sum(self._response_times) / len(self._response_times)
 
+        metrics = {
+            "requests_handled": float(self._requests_handled),
+            "error_count": float(self._error_count),
+            "avg_response_time_ms": avg_response_time,
+            "queued_responses": float(self._response_queue.qsize()),
+            **self.broadcaster.get_metrics(),
+            **self._side_effects.get_metrics(),
+        }
+
+        # Rate limiter decisions, when rate limiting is enabled
+        rate_limiter = getattr(getattr(self, "_app_state", None), "rate_limiter", None)
+        if isinstance(rate_limiter, RateLimiter):
+            metrics.update(rate_limiter.get_metrics())
+
         return ServiceStatus(
             service_name="APICommunicationService",
             service_type="communication",
             is_healthy=self._is_started,
             uptime_seconds=uptime_seconds,
             last_error=None,  # Could track last error message
-            metrics={
-                "requests_handled": float(self._requests_handled),
-                "error_count": float(self._error_count),
-                "avg_response_time_ms": avg_response_time,
-                "queued_responses": float(self._response_queue.qsize()),
-                "websocket_clients": float(len(self._websocket_clients)),
-            },
+            metrics=metrics,
         )
 
     def get_capabilities(self) -> "ServiceCapabilities":
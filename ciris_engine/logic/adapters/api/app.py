@@ -76,7 +76,13 @@ def create_app(runtime: Any = None, adapter_config: Any = None) -> FastAPI:
         rate_limit = getattr(adapter_config, "rate_limit_per_minute", 60)
 
         # Create middleware instance
-        rate_limit_middleware = RateLimitMiddleware(requests_per_minute=rate_limit)
+        rate_limit_middleware = RateLimitMiddleware(
+            requests_per_minute=rate_limit,
+            route_costs=getattr(adapter_config, "rate_limit_route_costs", None),
+            shared_db_path=getattr(adapter_config, "rate_limit_shared_db", None),
+        )
+        # Exposed so the communication service can report limiter metrics
+        app.state.rate_limiter = rate_limit_middleware.limiter
 
         # Add middleware using a wrapper function
         @app.middleware("http")
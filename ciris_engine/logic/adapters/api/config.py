@@ -1,5 +1,7 @@
 """Configuration schema for API adapter."""
 
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 from ciris_engine.constants import DEFAULT_API_HOST, DEFAULT_API_PORT
@@ -32,12 +34,27 @@ class APIAdapterConfig(BaseModel):
 
     rate_limit_enabled: bool = Field(default=False, description="Enable rate limiting")
     rate_limit_per_minute: int = Field(default=60, description="Requests per minute limit")
+    rate_limit_route_costs: dict[str, float] = Field(
+        default_factory=dict, description="Token cost per request by path prefix (overrides the defaults)"
+    )
+    rate_limit_shared_db: Optional[str] = Field(
+        default=None, description="SQLite file shared by all workers so they enforce one rate limit budget"
+    )
 
     auth_enabled: bool = Field(default=True, description="Enable authentication")
 
     # Timeout configuration
     interaction_timeout: float = Field(default=55.0, description="Timeout for agent interactions in seconds")
 
+    # WebSocket stream fan-out
+    websocket_queue_size: int = Field(default=256, description="Frames queued per WebSocket client before overflow")
+    websocket_heartbeat_seconds: float = Field(
+        default=30.0, description="Interval between WebSocket heartbeats (0 disables them)"
+    )
+    websocket_send_timeout: float = Field(
+        default=10.0, description="Seconds a single WebSocket send may block before the client is disconnected"
+    )
+
     def get_home_channel_id(self, host: str, port: int) -> str:
         """Get the home channel ID for this API adapter instance."""
         return f"api_{host}_{port}"
@@ -65,6 +82,10 @@ class APIAdapterConfig(BaseModel):
         if env_auth is not None:
             self.auth_enabled = env_auth.lower() in ("true", "1", "yes", "on")
 
+        env_rate_limit_db = get_env_var("CIRIS_API_RATE_LIMIT_SHARED_DB")
+        if env_rate_limit_db:
+            self.rate_limit_shared_db = env_rate_limit_db
+
         env_timeout = get_env_var("CIRIS_API_INTERACTION_TIMEOUT")
         if env_timeout:
             try:
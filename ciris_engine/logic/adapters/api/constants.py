@@ -21,6 +21,7 @@ ERROR_WISE_AUTHORITY_SERVICE_NOT_AVAILABLE = "Wise Authority service not availab
 DESC_RESULTS_OFFSET = "Results offset"
 DESC_CONFIGURATION_KEY = "Configuration key"
 DESC_AUDIT_ENTRY_ID = "Audit entry ID"
+DESC_AUDIT_CURSOR = "Cursor from a previous response's next_cursor to page through older entries"
 DESC_ADAPTER_ID = "Adapter ID"
 DESC_ADAPTER_TYPE = "Adapter type"
 
@@ -1,119 +1,277 @@
 """
-Simple rate limiting middleware for CIRIS API.
+Rate limiting middleware for CIRIS API.
 
-Implements a basic in-memory rate limiter using token bucket algorithm.
+Token buckets keyed by client, refilled continuously at the configured rate.
+Buckets live in a fixed number of shards and are only touched synchronously
+from the event loop, so no lock is needed; idle buckets are swept one shard
+at a time. Routes can cost more than one token, and an optional SQLite store
+lets several uvicorn workers enforce one shared budget.
 """
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, Tuple, cast
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
 
+RATE_LIMIT_SHARDS = 16
+BUCKET_IDLE_SECONDS = 3600.0  # Buckets unused for an hour are dropped
+CLEANUP_INTERVAL_SECONDS = 300.0  # Each shard is swept this often
 
-class RateLimiter:
-    """Simple in-memory rate limiter using token bucket algorithm."""
+# Token cost per request by path prefix; anything else costs 1
+DEFAULT_ROUTE_COSTS: Dict[str, float] = {
+    "/v1/agent/interact": 5.0,
+    "/v1/memory/visualize/graph": 10.0,
+    "/v1/system/health": 0.0,
+}
+
+
+@dataclass
+class RateLimitDecision:
+    """Outcome of one rate limit check."""
+
+    allowed: bool
+    remaining: float
+    retry_after: int
+
+
+class _Bucket:
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float, updated: float) -> None:
+        self.tokens = tokens
+        self.updated = updated
+
+
+def _retry_after(tokens: float, cost: float, refill_per_second: float) -> int:
+    if tokens >= cost:
+        return 0
+    return int((cost - tokens) / refill_per_second) + 1
+
+
+class SharedRateLimitStore:
+    """SQLite-backed buckets so several worker processes share one budget.
 
-    def __init__(self, requests_per_minute: int = 60):
+    Uses wall-clock time, since monotonic clocks are not comparable across
+    processes. Each check is a short ``BEGIN IMMEDIATE`` transaction.
+    """
+
+    def __init__(self, db_path: str, capacity: float, refill_per_second: float) -> None:
+        self.db_path = db_path
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._local = threading.local()
+        self._next_cleanup = time.time() + CLEANUP_INTERVAL_SECONDS
+
+        conn = self._connection()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+                client_id TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated REAL NOT NULL
+            )
+        """
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def acquire(self, client_id: str, cost: float) -> RateLimitDecision:
+        now = time.time()
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated FROM rate_limit_buckets WHERE client_id = ?", (client_id,)
+            ).fetchone()
+            if row is None:
+                tokens = self.capacity
+            else:
+                tokens = min(self.capacity, row[0] + max(0.0, now - row[1]) * self.refill_per_second)
+
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limit_buckets (client_id, tokens, updated) VALUES (?, ?, ?)",
+                (client_id, tokens, now),
+            )
+            if now >= self._next_cleanup:
+                self._next_cleanup = now + CLEANUP_INTERVAL_SECONDS
+                conn.execute("DELETE FROM rate_limit_buckets WHERE updated < ?", (now - BUCKET_IDLE_SECONDS,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        return RateLimitDecision(allowed, tokens, _retry_after(tokens, cost, self.refill_per_second))
+
+
+class RateLimiter:
+    """In-memory token bucket rate limiter, optionally backed by a shared store."""
+
+    def __init__(
+        self,
+        requests_per_minute: int = 60,
+        shards: int = RATE_LIMIT_SHARDS,
+        shared_db_path: Optional[str] = None,
+    ):
         """
         Initialize rate limiter.
 
         Args:
             requests_per_minute: Number of requests allowed per minute
+            shards: Number of bucket shards (bounds the work of each cleanup pass)
+            shared_db_path: SQLite file shared by all workers; in-memory when None
         """
         self.rate = requests_per_minute
-        self.buckets: Dict[str, Tuple[float, datetime]] = {}
-        self._lock = asyncio.Lock()
-        self._cleanup_interval = 300  # Cleanup old entries every 5 minutes
-        self._last_cleanup = datetime.now()
+        self._refill_per_second = self.rate / 60.0
+        self._shards: List[Dict[str, _Bucket]] = [{} for _ in range(max(1, shards))]
+        start = time.monotonic()
+        # Stagger sweeps so no single request pays for every shard
+        self._next_cleanup = [
+            start + CLEANUP_INTERVAL_SECONDS * (i + 1) / len(self._shards) for i in range(len(self._shards))
+        ]
+        self._shared = (
+            SharedRateLimitStore(shared_db_path, float(self.rate), self._refill_per_second)
+            if shared_db_path
+            else None
+        )
+
+        # Metrics
+        self._allowed = 0
+        self._rejected = 0
+        self._check_time_ms = 0.0
+        self._max_check_time_ms = 0.0
+
+    def _cost(self, cost: float) -> float:
+        # A route can never cost more than a full bucket, or it could never be called
+        return min(float(cost), float(self.rate))
+
+    def _bucket(self, client_id: str, now: float) -> _Bucket:
+        index = hash(client_id) % len(self._shards)
+        shard = self._shards[index]
+
+        if now >= self._next_cleanup[index]:
+            self._next_cleanup[index] = now + CLEANUP_INTERVAL_SECONDS
+            cutoff = now - BUCKET_IDLE_SECONDS
+            for stale in [key for key, bucket in shard.items() if bucket.updated < cutoff]:
+                del shard[stale]
+
+        bucket = shard.get(client_id)
+        if bucket is None:
+            bucket = _Bucket(float(self.rate), now)
+            shard[client_id] = bucket
+        else:
+            elapsed = max(0.0, now - bucket.updated)
+            bucket.tokens = min(float(self.rate), bucket.tokens + elapsed * self._refill_per_second)
+            bucket.updated = now
+        return bucket
 
-    async def check_rate_limit(self, client_id: str) -> bool:
+    def try_acquire(self, client_id: str, cost: float = 1.0) -> RateLimitDecision:
+        """Take ``cost`` tokens from the client's in-memory bucket if available.
+
+        Runs without awaiting, so it is atomic with respect to other requests
+        on the event loop.
+        """
+        cost = self._cost(cost)
+        bucket = self._bucket(client_id, time.monotonic())
+        allowed = bucket.tokens >= cost
+        if allowed:
+            bucket.tokens -= cost
+        return RateLimitDecision(allowed, bucket.tokens, _retry_after(bucket.tokens, cost, self._refill_per_second))
+
+    async def acquire(self, client_id: str, cost: float = 1.0) -> RateLimitDecision:
+        """Check and consume ``cost`` tokens, recording decision metrics."""
+        started = time.perf_counter()
+        if cost <= 0:
+            decision = RateLimitDecision(True, float(self.rate), 0)
+        elif self._shared is not None:
+            decision = await asyncio.to_thread(self._shared.acquire, client_id, self._cost(cost))
+        else:
+            decision = self.try_acquire(client_id, cost)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._check_time_ms += elapsed_ms
+        self._max_check_time_ms = max(self._max_check_time_ms, elapsed_ms)
+        if decision.allowed:
+            self._allowed += 1
+        else:
+            self._rejected += 1
+        return decision
+
+    async def check_rate_limit(self, client_id: str, cost: float = 1.0) -> bool:
         """
         Check if request is within rate limit.
 
         Args:
             client_id: Unique identifier for client (IP or user)
+            cost: Tokens this request consumes
 
         Returns:
             True if allowed, False if rate limited
         """
-        async with self._lock:
-            now = datetime.now()
-
-            # Cleanup old entries periodically
-            if (now - self._last_cleanup).seconds > self._cleanup_interval:
-                await self._cleanup_old_entries()
-                self._last_cleanup = now
-
-            # Get or create bucket
-            if client_id not in self.buckets:
-                self.buckets[client_id] = (float(self.rate), now)
-                return True
-
-            tokens, last_update = self.buckets[client_id]
-
-            # Calculate time elapsed and refill tokens
-            elapsed = (now - last_update).total_seconds()
-            tokens = min(self.rate, tokens + elapsed * (self.rate / 60.0))
+        return (await self.acquire(client_id, cost)).allowed
 
-            # Check if we have tokens available
-            if tokens >= 1:
-                tokens -= 1
-                self.buckets[client_id] = (tokens, now)
-                return True
-
-            # No tokens available
-            self.buckets[client_id] = (tokens, now)
-            return False
-
-    def _cleanup_old_entries(self) -> None:
-        """Remove entries that haven't been used in over an hour."""
-        now = datetime.now()
-        cutoff = now - timedelta(hours=1)
-
-        to_remove = []
-        for client_id, (_, last_update) in self.buckets.items():
-            if last_update < cutoff:
-                to_remove.append(client_id)
-
-        for client_id in to_remove:
-            del self.buckets[client_id]
-
-    def get_retry_after(self, client_id: str) -> int:
+    def get_retry_after(self, client_id: str, cost: float = 1.0) -> int:
         """
-        Get seconds until next request is allowed.
+        Get seconds until next request is allowed (in-memory buckets only).
 
         Args:
             client_id: Unique identifier for client
+            cost: Tokens the next request needs
 
         Returns:
             Seconds to wait before retry
         """
-        if client_id not in self.buckets:
+        bucket = self._shards[hash(client_id) % len(self._shards)].get(client_id)
+        if bucket is None:
             return 0
-
-        tokens, _ = self.buckets[client_id]
-        if tokens >= 1:
-            return 0
-
-        # Calculate time needed to get 1 token
-        tokens_needed = 1 - tokens
-        seconds_per_token = 60.0 / self.rate
-        return int(tokens_needed * seconds_per_token) + 1
+        elapsed = max(0.0, time.monotonic() - bucket.updated)
+        tokens = min(float(self.rate), bucket.tokens + elapsed * self._refill_per_second)
+        return _retry_after(tokens, self._cost(cost), self._refill_per_second)
+
+    def get_metrics(self) -> Dict[str, float]:
+        """Limiter decisions and check latency."""
+        checks = self._allowed + self._rejected
+        return {
+            "rate_limit_allowed": float(self._allowed),
+            "rate_limit_rejected": float(self._rejected),
+            "rate_limit_check_avg_ms": self._check_time_ms / checks if checks else 0.0,
+            "rate_limit_check_max_ms": self._max_check_time_ms,
+            "rate_limit_tracked_clients": float(sum(len(shard) for shard in self._shards)),
+            "rate_limit_shared": 1.0 if self._shared is not None else 0.0,
+        }
 
 
 class RateLimitMiddleware:
     """FastAPI middleware for rate limiting."""
 
-    def __init__(self, requests_per_minute: int = 60):
+    def __init__(
+        self,
+        requests_per_minute: int = 60,
+        route_costs: Optional[Dict[str, float]] = None,
+        shared_db_path: Optional[str] = None,
+    ):
         """
         Initialize middleware.
 
         Args:
             requests_per_minute: Rate limit per minute
+            route_costs: Token cost by path prefix, merged over DEFAULT_ROUTE_COSTS
+            shared_db_path: SQLite file for a budget shared across workers
         """
-        self.limiter = RateLimiter(requests_per_minute)
+        self.limiter = RateLimiter(requests_per_minute, shared_db_path=shared_db_path)
         # Exempt paths that should not be rate limited
         self.exempt_paths = {
             "/openapi.json",
@@ -122,6 +280,16 @@ class RateLimitMiddleware:
             "/emergency/shutdown",  # Emergency endpoints bypass rate limiting
             "/v1/system/health",  # Health checks should not be rate limited
         }
+        costs = {**DEFAULT_ROUTE_COSTS, **(route_costs or {})}
+        # Longest prefix wins
+        self._route_costs: List[Tuple[str, float]] = sorted(costs.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def route_cost(self, path: str) -> float:
+        """Token cost of a request to ``path``."""
+        for prefix, cost in self._route_costs:
+            if path == prefix or path.startswith(prefix.rstrip("/") + "/"):
+                return cost
+        return 1.0
 
     async def __call__(self, request: Request, call_next: Callable[..., Any]) -> Response:
         """Process request through rate limiter."""
@@ -146,15 +314,14 @@ class RateLimitMiddleware:
             client_id = f"ip_{client_host}"
 
         # Check rate limit
-        allowed = await self.limiter.check_rate_limit(client_id)
+        decision = await self.limiter.acquire(client_id, self.route_cost(request.url.path))
 
-        if not allowed:
-            retry_after = self.limiter.get_retry_after(client_id)
+        if not decision.allowed:
             return JSONResponse(
                 status_code=429,
-                content={"detail": "Rate limit exceeded", "retry_after": retry_after},
+                content={"detail": "Rate limit exceeded", "retry_after": decision.retry_after},
                 headers={
-                    "Retry-After": str(retry_after),
+                    "Retry-After": str(decision.retry_after),
                     "X-RateLimit-Limit": str(self.limiter.rate),
                     "X-RateLimit-Remaining": "0",
                     "X-RateLimit-Window": "60",
@@ -166,10 +333,8 @@ class RateLimitMiddleware:
         response = cast(Response, response)
 
         # Add rate limit headers to response
-        if client_id in self.limiter.buckets:
-            tokens, _ = self.limiter.buckets[client_id]
-            response.headers["X-RateLimit-Limit"] = str(self.limiter.rate)
-            response.headers["X-RateLimit-Remaining"] = str(int(tokens))
-            response.headers["X-RateLimit-Window"] = "60"
+        response.headers["X-RateLimit-Limit"] = str(self.limiter.rate)
+        response.headers["X-RateLimit-Remaining"] = str(int(decision.remaining))
+        response.headers["X-RateLimit-Window"] = "60"
 
         return response
@@ -20,6 +20,7 @@ from ciris_engine.schemas.runtime.messages import IncomingMessage
 
 from ..constants import DESC_CURRENT_COGNITIVE_STATE, ERROR_MEMORY_SERVICE_NOT_AVAILABLE
 from ..dependencies.auth import AuthContext, require_observer
+from ..websocket_broadcaster import OverflowPolicy, WebSocketBroadcaster
 
 logger = logging.getLogger(__name__)
 
@@ -261,39 +262,43 @@ async def interact(
         return SuccessResponse(data=response)
 
 
-@router.get("/history", response_model=SuccessResponse[ConversationHistory])
-async def get_history(
-    request: Request,
-    limit: int = Query(50, ge=1, le=200, description="Maximum messages to return"),
-    before: Optional[datetime] = Query(None, description="Get messages before this time"),
-    auth: AuthContext = Depends(require_observer),
-) -> SuccessResponse[ConversationHistory]:
-    """
-    Conversation history.
-
-    Get the conversation history for the current user.
-    """
+def _readable_channels(app_state: Any, auth: AuthContext) -> List[str]:
+    """Channels whose conversation a user may read: their own, plus the home channel for admins."""
     # Use user-specific channel
-    channel_id = f"api_{auth.user_id}"
+    channels = [f"api_{auth.user_id}"]
 
     # For admin users and above, also include the default API channel (home)
-    channels_to_query = [channel_id]
     if auth.role in ["ADMIN", "AUTHORITY", "SYSTEM_ADMIN"]:
         # Get default API channel from config
-        api_host = getattr(request.app.state, "api_host", "127.0.0.1")
-        api_port = getattr(request.app.state, "api_port", "8080")
-        default_channel = f"api_{api_host}_{api_port}"
-        channels_to_query.append(default_channel)
+        api_host = getattr(app_state, "api_host", "127.0.0.1")
+        api_port = getattr(app_state, "api_port", "8080")
+        channels.append(f"api_{api_host}_{api_port}")
 
         # Also add common variations of the API channel
         # This ensures we catch messages regardless of how the channel was recorded
-        channels_to_query.extend(
+        channels.extend(
             [
                 f"api_0.0.0.0_{api_port}",  # Bind address
                 f"api_127.0.0.1_{api_port}",  # Localhost
                 f"api_localhost_{api_port}",  # Hostname variant
             ]
         )
+    return channels
+
+
+@router.get("/history", response_model=SuccessResponse[ConversationHistory])
+async def get_history(
+    request: Request,
+    limit: int = Query(50, ge=1, le=200, description="Maximum messages to return"),
+    before: Optional[datetime] = Query(None, description="Get messages before this time"),
+    auth: AuthContext = Depends(require_observer),
+) -> SuccessResponse[ConversationHistory]:
+    """
+    Conversation history.
+
+    Get the conversation history for the current user.
+    """
+    channels_to_query = _readable_channels(request.app.state, auth)
 
     logger.info(f"History query for user {auth.user_id} with role {auth.role}, channels: {channels_to_query}")
 
@@ -920,9 +925,14 @@ async def notify_interact_response(message_id: str, content: str) -> None:
 from fastapi import WebSocket, WebSocketDisconnect
 
 
+MAX_WEBSOCKET_QUEUE_SIZE = 4096
+
+
 @router.websocket("/stream")
 async def websocket_stream(
     websocket: WebSocket,
+    overflow_policy: str = OverflowPolicy.DROP_OLDEST.value,
+    queue_size: Optional[int] = None,
 ) -> None:
     """
     WebSocket endpoint for real-time updates.
@@ -932,7 +942,21 @@ async def websocket_stream(
     - telemetry: Real-time metrics
     - reasoning: Reasoning traces
     - logs: System logs
+
+    Events are delivered through a bounded per-client queue. The
+    overflow_policy query parameter (drop_oldest, coalesce or disconnect)
+    decides what happens when the client falls behind, and queue_size
+    overrides the queue length. Heartbeats are sent periodically.
     """
+    try:
+        policy = OverflowPolicy(overflow_policy)
+    except ValueError:
+        await websocket.close(code=1008, reason=f"Invalid overflow_policy: {overflow_policy}")
+        return
+    if queue_size is not None and not 1 <= queue_size <= MAX_WEBSOCKET_QUEUE_SIZE:
+        await websocket.close(code=1008, reason=f"queue_size must be between 1 and {MAX_WEBSOCKET_QUEUE_SIZE}")
+        return
+
     # Extract authorization header from WebSocket request
     authorization = websocket.headers.get("authorization")
 
@@ -976,12 +1000,35 @@ async def websocket_stream(
     await websocket.accept()
     client_id = f"ws_{id(websocket)}"
 
-    # Get communication service to register WebSocket
+    # All writes go through the client's queue; the communication service broadcasts to it
     comm_service = getattr(websocket.app.state, "communication_service", None)
+    # Agent replies are only streamed for the channels this user could read through /history
+    readable = _readable_channels(websocket.app.state, auth_context)
     if comm_service and hasattr(comm_service, "register_websocket"):
-        comm_service.register_websocket(client_id, websocket)
-
-    subscribed_channels = set(["messages"])  # Default subscription
+        connection = comm_service.register_websocket(
+            client_id,
+            websocket,
+            policy=policy,
+            max_queue=queue_size,
+            user_id=auth_context.user_id,
+            role=auth_context.role,
+            readable_channels=readable,
+        )
+        unregister = comm_service.unregister_websocket
+    else:
+        # Without a communication service the client only gets replies to its own actions
+        broadcaster = WebSocketBroadcaster()
+        connection = broadcaster.register(
+            client_id,
+            websocket,
+            policy=policy,
+            max_queue=queue_size,
+            user_id=auth_context.user_id,
+            role=auth_context.role,
+            readable_channels=readable,
+        )
+        unregister = broadcaster.unregister
+    # Default subscription is "messages"
 
     try:
         while True:
@@ -990,31 +1037,32 @@ async def websocket_stream(
 
             if data.get("action") == "subscribe":
                 channels = data.get("channels", [])
-                subscribed_channels.update(channels)
-                await websocket.send_json(
+                connection.channels.update(channels)
+                connection.send(
                     {
                         "type": "subscription_update",
-                        "channels": list(subscribed_channels),
+                        "channels": list(connection.channels),
                         "timestamp": datetime.now(timezone.utc).isoformat(),
-                    }
+                    },
                 )
 
             elif data.get("action") == "unsubscribe":
                 channels = data.get("channels", [])
-                subscribed_channels.difference_update(channels)
-                await websocket.send_json(
+                connection.channels.difference_update(channels)
+                connection.send(
                     {
                         "type": "subscription_update",
-                        "channels": list(subscribed_channels),
+                        "channels": list(connection.channels),
                         "timestamp": datetime.now(timezone.utc).isoformat(),
-                    }
+                    },
                 )
 
             elif data.get("action") == "ping":
-                await websocket.send_json({"type": "pong", "timestamp": datetime.now(timezone.utc).isoformat()})
+                pong = {"type": "pong", "timestamp": datetime.now(timezone.utc).isoformat()}
+                connection.send(pong, coalesce_key="pong")
 
     except WebSocketDisconnect:
-        # Clean up on disconnect
-        if comm_service and hasattr(comm_service, "unregister_websocket"):
-            comm_service.unregister_websocket(client_id)
         logger.info(f"WebSocket client {client_id} disconnected")
+    finally:
+        # Clean up on disconnect
+        await unregister(client_id)
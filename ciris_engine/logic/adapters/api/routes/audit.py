@@ -11,15 +11,27 @@ from datetime import datetime, timezone
 from typing import Any, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, field_serializer
 
+from ciris_engine.logic.audit.export_stream import (
+    export_filename,
+    export_media_type,
+    validate_export_options,
+)
 from ciris_engine.protocols.services.graph.audit import AuditServiceProtocol
 from ciris_engine.schemas.api.audit import AuditContext, EntryVerification
 from ciris_engine.schemas.api.responses import ResponseMetadata, SuccessResponse
 from ciris_engine.schemas.services.graph.audit import AuditQuery, VerificationReport
 from ciris_engine.schemas.services.nodes import AuditEntry
 
-from ..constants import DESC_END_TIME, DESC_RESULTS_OFFSET, DESC_START_TIME, ERROR_AUDIT_SERVICE_NOT_AVAILABLE
+from ..constants import (
+    DESC_AUDIT_CURSOR,
+    DESC_END_TIME,
+    DESC_RESULTS_OFFSET,
+    DESC_START_TIME,
+    ERROR_AUDIT_SERVICE_NOT_AVAILABLE,
+)
 from ..dependencies.auth import AuthContext, require_admin, require_observer
 
 router = APIRouter(prefix="/audit", tags=["audit"])
@@ -60,6 +72,7 @@ class AuditEntriesResponse(BaseModel):
     total: int = Field(..., description="Total matching entries")
     offset: int = Field(0, description=DESC_RESULTS_OFFSET)
     limit: int = Field(100, description="Results limit")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, omitted on the last page")
 
 
 class AuditExportResponse(BaseModel):
@@ -139,15 +152,21 @@ async def query_audit_entries(
     # Pagination
     limit: int = Query(100, ge=1, le=1000, description="Maximum results"),
     offset: int = Query(0, ge=0, description=DESC_RESULTS_OFFSET),
+    cursor: Optional[str] = Query(None, description=DESC_AUDIT_CURSOR),
 ) -> SuccessResponse[AuditEntriesResponse]:
     """
     Query audit entries with flexible filtering.
 
     Combines time-based queries, entity filtering, and text search into a single endpoint.
-    Returns paginated results sorted by timestamp (newest first).
+    Returns paginated results sorted by timestamp (newest first). Pass the returned
+    next_cursor back as cursor to get the following page; cursor pages cost the same
+    however deep they are, unlike large offsets. offset cannot be combined with cursor.
 
     Requires OBSERVER role or higher.
     """
+    if cursor and offset:
+        raise HTTPException(status_code=400, detail="offset cannot be combined with cursor")
+
     audit_service = _get_audit_service(request)
 
     # Build unified query
@@ -167,21 +186,24 @@ async def query_audit_entries(
     )
 
     try:
-        entries = await audit_service.query_audit_trail(query)
+        try:
+            page = await audit_service.query_audit_page(query, cursor=cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
         # Convert to response format
-        response_entries = [_convert_audit_entry(entry) for entry in entries]
-
-        # Get total count (in production, service would return this)
-        # For now, if we got limit results, assume there are more
-        total = len(entries) if len(entries) < limit else offset + len(entries) + 1
+        response_entries = [_convert_audit_entry(entry) for entry in page.entries]
 
         return SuccessResponse(
-            data=AuditEntriesResponse(entries=response_entries, total=total, offset=offset, limit=limit),
+            data=AuditEntriesResponse(
+                entries=response_entries, total=page.total, offset=offset, limit=limit, next_cursor=page.next_cursor
+            ),
             metadata=ResponseMetadata(
                 timestamp=datetime.now(timezone.utc), request_id=str(uuid.uuid4()), duration_ms=0
             ),
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -284,6 +306,7 @@ async def search_audit_trails(
     outcome: Optional[str] = Query(None, description="Filter by outcome"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results"),
     offset: int = Query(0, ge=0, description=DESC_RESULTS_OFFSET),
+    cursor: Optional[str] = Query(None, description=DESC_AUDIT_CURSOR),
 ) -> SuccessResponse[AuditEntriesResponse]:
     """
     Search audit trails with text search and filters.
@@ -307,6 +330,7 @@ async def search_audit_trails(
         outcome=outcome,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
 
 
@@ -314,13 +338,15 @@ async def search_audit_trails(
 async def verify_audit_entry(
     request: Request,
     entry_id: str = Path(..., description="Audit entry ID to verify"),
+    full: bool = Query(False, description="Re-verify the whole chain instead of resuming from the last checkpoint"),
     auth: AuthContext = Depends(require_admin),
 ) -> SuccessResponse[VerificationReport]:
     """
     Verify the integrity of a specific audit entry.
 
     Returns detailed verification information including signature validation
-    and hash chain integrity.
+    and hash chain integrity. Only entries added since the last verified
+    checkpoint are checked unless `full=true`.
 
     Requires ADMIN role or higher.
     """
@@ -328,7 +354,7 @@ async def verify_audit_entry(
 
     try:
         # Get the full verification report
-        verification_report = await audit_service.get_verification_report()
+        verification_report = await audit_service.get_verification_report(full=full)
         return SuccessResponse(data=verification_report)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -389,7 +415,7 @@ async def export_audit_data(
                 data=AuditExportResponse(
                     format=format,
                     total_entries=total_entries,
-                    export_url=f"/v1/audit/export/download/{format}",  # Placeholder URL
+                    export_url=f"/v1/audit/export/stream?format={'csv' if format == 'csv' else 'ndjson'}",
                     export_data=None,
                 ),
                 metadata=ResponseMetadata(
@@ -407,3 +433,49 @@ async def export_audit_data(
             )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/export/stream")
+async def stream_audit_export(
+    request: Request,
+    auth: AuthContext = Depends(require_admin),
+    start_date: Optional[datetime] = Query(None, description="Export start date"),
+    end_date: Optional[datetime] = Query(None, description="Export end date"),
+    format: str = Query("ndjson", pattern="^(ndjson|csv|columnar|parquet)$", description="Export format"),
+    compression: str = Query("none", pattern="^(none|gzip|zstd)$", description="Response compression"),
+) -> StreamingResponse:
+    """
+    Stream the signed audit log.
+
+    Entries are read from the hash-chained audit log in sequence order and sent
+    as a chunked response, so exports of any size use constant memory.
+
+    Formats:
+    - **ndjson**: one JSON object per entry
+    - **csv**: CSV with a header row
+    - **columnar**: one JSON object per chunk, with a value list per column
+    - **parquet**: Parquet file with one row group per chunk (requires pyarrow)
+
+    Compression: **none**, **gzip** or **zstd** (requires zstandard).
+
+    Requires ADMIN role or higher.
+    """
+    audit_service = _get_audit_service(request)
+
+    if not hasattr(audit_service, "stream_audit_export"):
+        raise HTTPException(status_code=501, detail="Audit service does not support streaming export")
+    if not getattr(audit_service, "enable_hash_chain", False):
+        raise HTTPException(status_code=503, detail="Signed audit log not available")
+    try:
+        validate_export_options(format, compression)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    return StreamingResponse(
+        audit_service.stream_audit_export(
+            start_time=start_date, end_time=end_date, format=format, compression=compression
+        ),
+        media_type=export_media_type(format, compression),
+        headers={"Content-Disposition": f'attachment; filename="{export_filename(format, compression, stamp)}"'},
+    )
@@ -5,6 +5,9 @@ The memory service implements the three universal verbs: MEMORIZE, RECALL, FORGE
 All operations work through the graph memory system.
 """
 
+import asyncio
+import base64
+import json
 import logging
 import uuid
 from datetime import datetime, timedelta, timezone
@@ -16,6 +19,7 @@ from pydantic import BaseModel, Field, field_serializer, model_validator
 
 from ciris_engine.constants import UTC_TIMEZONE_SUFFIX
 from ciris_engine.logic.persistence.db.core import get_db_connection
+from ciris_engine.logic.persistence.models.graph import count_graph_nodes, get_graph_nodes_page
 from ciris_engine.schemas.api.responses import ResponseMetadata, SuccessResponse
 from ciris_engine.schemas.services.graph.memory import MemorySearchFilter
 from ciris_engine.schemas.services.graph_core import GraphEdge, GraphEdgeAttributes, GraphNode, GraphScope, NodeType
@@ -92,6 +96,9 @@ class QueryRequest(BaseModel):
     # Pagination
     limit: int = Field(20, ge=1, le=1000, description="Maximum results")
     offset: int = Field(0, ge=0, description="Pagination offset")
+    cursor: Optional[str] = Field(
+        None, description="Cursor from a previous response's next_cursor; type and time listings only"
+    )
 
     # Options
     include_edges: bool = Field(False, description="Include relationship data")
@@ -105,6 +112,19 @@ class QueryRequest(BaseModel):
         return self
 
 
+class QueryMetadata(ResponseMetadata):
+    """Response metadata with pagination for type and time listings."""
+
+    total: Optional[int] = Field(None, description="Exact number of matching nodes, for type and time listings")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, omitted on the last page")
+
+
+class QueryResponse(SuccessResponse[List[GraphNode]]):
+    """Query results; the nodes stay a plain list in data."""
+
+    metadata: QueryMetadata
+
+
 class TimelineResponse(BaseModel):
     """Temporal view of memories."""
 
@@ -164,10 +184,46 @@ async def store_memory(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/query", response_model=SuccessResponse[List[GraphNode]])
+def _encode_query_cursor(updated_at: str, node_id: str) -> str:
+    payload = {"v": 1, "t": updated_at, "id": node_id}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def _decode_query_cursor(cursor: str) -> Tuple[str, str]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return str(payload["t"]), str(payload["id"])
+    except (ValueError, TypeError, KeyError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid memory cursor: {e}")
+
+
+async def _list_memory(body: QueryRequest) -> QueryResponse:
+    """Page a type or time listing by (updated_at, node_id) with an exact count, all on indexes."""
+    after = _decode_query_cursor(body.cursor) if body.cursor else None
+    scope = body.scope or GraphScope.LOCAL
+    node_type = body.type.value if body.type else None
+
+    nodes, next_key = await asyncio.to_thread(
+        get_graph_nodes_page, scope, node_type, body.since, body.until, body.limit, body.offset, after
+    )
+    total = await asyncio.to_thread(count_graph_nodes, scope, node_type, body.since, body.until)
+
+    return QueryResponse(
+        data=nodes,
+        metadata=QueryMetadata(
+            timestamp=datetime.now(timezone.utc),
+            request_id=str(uuid.uuid4()),
+            duration_ms=0,
+            total=total,
+            next_cursor=_encode_query_cursor(*next_key) if next_key else None,
+        ),
+    )
+
+
+@router.post("/query", response_model=QueryResponse)
 async def query_memory(
     request: Request, body: QueryRequest, auth: AuthContext = Depends(require_observer)
-) -> SuccessResponse[List[GraphNode]]:
+) -> QueryResponse:
     """
     Flexible query interface for memory (RECALL).
 
@@ -179,13 +235,25 @@ async def query_memory(
     - By time: Temporal queries
     - By correlation: Find related nodes
 
+    Type and time listings are newest first by updated_at and report an exact
+    total; pass metadata.next_cursor back as cursor to get the following page.
+
     OBSERVER role can read all memories.
     """
     memory_service = getattr(request.app.state, "memory_service", None)
     if not memory_service:
         raise HTTPException(status_code=503, detail=MEMORY_SERVICE_NOT_AVAILABLE)
 
+    is_listing = not (body.node_id or body.query or body.related_to)
+    if body.cursor and not is_listing:
+        raise HTTPException(status_code=400, detail="cursor is only supported for type and time listings")
+    if body.cursor and body.offset:
+        raise HTTPException(status_code=400, detail="offset cannot be combined with cursor")
+
     try:
+        if is_listing:
+            return await _list_memory(body)
+
         nodes = []
 
         # Query by specific node ID
@@ -230,22 +298,6 @@ async def query_memory(
             # Filter out the source node
             nodes = [n for n in related_nodes if n.id != body.related_to]
 
-        # Type-based query
-        elif body.type:
-            # Use a broad recall with type filter
-            # This is a simplified approach - in practice, the memory service
-            # should support type-based queries directly
-            all_nodes = await memory_service.recall(
-                MemoryQuery(
-                    node_id="*",  # Wildcard to get all
-                    scope=body.scope or GraphScope.LOCAL,
-                    type=body.type,
-                    include_edges=False,
-                    depth=1,
-                )
-            )
-            nodes = all_nodes
-
         # Apply time filters if provided
         if body.since or body.until:
             filtered_nodes = []
@@ -273,13 +325,15 @@ async def query_memory(
         if body.limit:
             nodes = nodes[: body.limit]
 
-        return SuccessResponse(
+        return QueryResponse(
             data=nodes,
-            metadata=ResponseMetadata(
+            metadata=QueryMetadata(
                 timestamp=datetime.now(timezone.utc), request_id=str(uuid.uuid4()), duration_ms=0
             ),
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -322,6 +376,129 @@ async def forget_memory(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Timeline sampling helpers
+
+
+def _timeline_filters(scope: Optional[GraphScope], node_type: Optional[NodeType]) -> Tuple[str, List[Any]]:
+    """Filter clauses, after the time range, shared by the timeline count and sample queries."""
+    clauses = [SQL_EXCLUDE_METRICS]
+    params: List[Any] = []
+    if scope:
+        clauses.append(SQL_WHERE_SCOPE)
+        params.append(scope.value)
+    if node_type:
+        clauses.append(SQL_WHERE_NODE_TYPE)
+        params.append(node_type.value)
+    return " ".join(clauses), params
+
+
+def _timeline_hour_buckets(start_time: datetime, end_time: datetime) -> List[Tuple[str, datetime, datetime]]:
+    """Clock-hour buckets covering [start_time, end_time), clipped to the range."""
+    buckets = []
+    hour = start_time.replace(minute=0, second=0, microsecond=0)
+    while hour < end_time:
+        next_hour = hour + timedelta(hours=1)
+        buckets.append((hour.strftime("%Y-%m-%d %H:00"), max(hour, start_time), min(next_hour, end_time)))
+        hour = next_hour
+    return buckets
+
+
+def _count_timeline_buckets(
+    cursor: Any, hour_buckets: List[Tuple[str, datetime, datetime]], filters: str, filter_params: List[Any]
+) -> Dict[str, int]:
+    """Exact node counts per hour bucket, one range count per bucket on the updated_at covering index."""
+    bounds = [[key, low.isoformat(), high.isoformat()] for key, low, high in hour_buckets]
+    cursor.execute(
+        f"""
+        SELECT json_extract(bucket.value, '$[0]') AS bucket,
+               (SELECT COUNT(*) {SQL_FROM_NODES}
+                WHERE updated_at >= json_extract(bucket.value, '$[1]')
+                AND updated_at < json_extract(bucket.value, '$[2]') {filters}) AS count
+        FROM json_each(?) AS bucket
+        """,
+        filter_params + [json.dumps(bounds)],
+    )
+    return {row["bucket"]: row["count"] for row in cursor.fetchall() if row["count"]}
+
+
+def _allocate_timeline_samples(counts: Dict[str, int], limit: int) -> Dict[str, int]:
+    """
+    Split the sample limit across buckets in proportion to their counts.
+
+    Uses largest remainders so the quotas add up to min(limit, total) and no
+    bucket is asked for more nodes than it holds.
+    """
+    total = sum(counts.values())
+    if total <= limit:
+        return dict(counts)
+    quotas = {bucket: count * limit // total for bucket, count in counts.items()}
+    leftover = limit - sum(quotas.values())
+    by_remainder = sorted(counts, key=lambda bucket: (-(counts[bucket] * limit % total), bucket))
+    for bucket in by_remainder[:leftover]:
+        quotas[bucket] += 1
+    return {bucket: quota for bucket, quota in quotas.items() if quota}
+
+
+def _sample_timeline_rows(
+    cursor: Any,
+    hour_buckets: List[Tuple[str, datetime, datetime]],
+    quotas: Dict[str, int],
+    filters: str,
+    filter_params: List[Any],
+) -> List[Any]:
+    """
+    Deterministic time-stride sample of each hour bucket.
+
+    A bucket with quota k is cut into k equal slices and each slice start is
+    probed for the first node at or after it, so every pick is a single index
+    seek and the cost depends on the limit, not on how many nodes the range
+    holds. All probes run as one query. Probes collide only when a bucket's
+    nodes are bunched together; those buckets are topped up from their
+    earliest nodes.
+    """
+    probes: List[List[str]] = []
+    for key, low, high in hour_buckets:
+        quota = quotas.get(key, 0)
+        probes.extend([key, (low + (high - low) * i / quota).isoformat(), high.isoformat()] for i in range(quota))
+    if not probes:
+        return []
+
+    cursor.execute(
+        f"""
+        {SQL_SELECT_NODES}, json_extract(probe.value, '$[0]') AS bucket
+        FROM json_each(?) AS probe
+        JOIN graph_nodes ON graph_nodes.rowid = (
+            SELECT rowid {SQL_FROM_NODES}
+            WHERE updated_at >= json_extract(probe.value, '$[1]')
+            AND updated_at < json_extract(probe.value, '$[2]') {filters}
+            ORDER BY updated_at
+            LIMIT 1
+        )
+        """,
+        [json.dumps(probes)] + filter_params,
+    )
+
+    picked: Dict[str, Dict[Tuple[str, str], Any]] = {}
+    for row in cursor.fetchall():
+        picked.setdefault(row["bucket"], {})[(row["node_id"], row["scope"])] = row
+
+    for key, low, high in hour_buckets:
+        quota = quotas.get(key, 0)
+        bucket_rows = picked.setdefault(key, {})
+        if len(bucket_rows) >= quota:
+            continue
+        query = " ".join(
+            [SQL_SELECT_NODES, SQL_FROM_NODES, SQL_WHERE_TIME_RANGE, filters, "ORDER BY updated_at", SQL_LIMIT]
+        )
+        cursor.execute(query, [low.isoformat(), high.isoformat()] + filter_params + [quota])
+        for row in cursor.fetchall():
+            if len(bucket_rows) >= quota:
+                break
+            bucket_rows.setdefault((row["node_id"], row["scope"]), row)
+
+    return [row for bucket_rows in picked.values() for row in bucket_rows.values()]
+
+
 @router.get("/timeline", response_model=SuccessResponse[TimelineResponse])
 async def get_timeline(
     request: Request,
@@ -368,109 +545,43 @@ async def get_timeline(
         # For timeline, we need to query nodes within the time range directly
         # The standard recall/search methods order by updated_at DESC which gives us only recent nodes
         nodes = []
-
-        # Import database utilities
-        import json
-
-        from ciris_engine.logic.persistence import get_db_connection
-        from ciris_engine.schemas.services.graph_core import GraphNode
-        from ciris_engine.schemas.services.graph_core import NodeType as NodeTypeEnum
+        # Exact per-hour counts; stays None if we fall back to the memory service
+        hour_counts: Optional[Dict[str, int]] = None
 
         # Query the database directly for timeline data
         try:
             with get_db_connection() as conn:
                 cursor = conn.cursor()
 
-                # For timeline, we need to sample across time buckets
-                # First, get the days in our range
-                days_in_range = int((now - start_time).total_seconds() / 86400) + 1
-                nodes_per_day = max(1, (limit or 100) // days_in_range)
-
-                # Sample nodes from each day
-                all_db_nodes = []
-                for day_offset in range(days_in_range):
-                    day_start = (now - timedelta(days=day_offset)).replace(hour=0, minute=0, second=0, microsecond=0)
-                    day_end = day_start + timedelta(days=1)
-
-                    # Build query for this day
-                    query_parts = [SQL_SELECT_NODES, SQL_FROM_NODES, SQL_WHERE_TIME_RANGE, SQL_EXCLUDE_METRICS]
-                    params: List[Any] = [day_start.isoformat(), day_end.isoformat()]
-
-                    # Add scope filter
-                    if scope:
-                        query_parts.append(SQL_WHERE_SCOPE)
-                        params.append(scope.value)
-
-                    # Add type filter
-                    if type:
-                        query_parts.append(SQL_WHERE_NODE_TYPE)
-                        params.append(type.value)
-
-                    # Random sampling for better distribution
-                    query_parts.extend([SQL_ORDER_RANDOM, SQL_LIMIT])
-                    params.append(nodes_per_day * 2)  # Get extra to allow for filtering
-
-                    query = " ".join(query_parts)
-                    cursor.execute(query, params)
-
-                    # Convert rows to GraphNode objects for this day
-                    for row in cursor.fetchall():
-                        try:
-                            # Parse attributes
-                            attributes = json.loads(row["attributes_json"]) if row["attributes_json"] else {}
-
-                            # Create GraphNode
-                            node = GraphNode(
-                                id=row["node_id"],
-                                type=NodeTypeEnum(row["node_type"]),
-                                scope=GraphScope(row["scope"]),
-                                attributes=attributes,
-                                version=row["version"],
-                                updated_by=row["updated_by"],
-                                updated_at=datetime.fromisoformat(row["updated_at"].replace("Z", UTC_TIMEZONE_SUFFIX)),
-                            )
-                            all_db_nodes.append(node)
-                        except Exception as e:
-                            logger.warning(f"Failed to parse node {row['node_id']}: {e}")
-                            continue
-
-                # For timeline layout, sample nodes evenly across time range
-                if len(all_db_nodes) > (limit or 100):
-                    # Group by hour buckets
-                    hour_buckets: Dict[datetime, List[Any]] = {}
-                    for node in all_db_nodes:
-                        if node.updated_at is None:
-                            continue
-                        hour = node.updated_at.replace(minute=0, second=0, microsecond=0)
-                        if hour not in hour_buckets:
-                            hour_buckets[hour] = []
-                        hour_buckets[hour].append(node)
-
-                    # Sample nodes from each bucket
-                    target_per_bucket = max(1, (limit or 100) // len(hour_buckets)) if hour_buckets else 1
-                    for hour, bucket_nodes in hour_buckets.items():
-                        # Take up to target_per_bucket nodes from each hour
-                        sampled = bucket_nodes[:target_per_bucket]
-                        nodes.extend(sampled)
-
-                    # If we don't have enough, add more from the most populated buckets
-                    if len(nodes) < (limit or 100):
-                        remaining = (limit or 100) - len(nodes)
-                        sorted_buckets = sorted(hour_buckets.items(), key=lambda x: len(x[1]), reverse=True)
-                        for hour, bucket_nodes in sorted_buckets:
-                            already_taken = min(target_per_bucket, len(bucket_nodes))
-                            available = bucket_nodes[already_taken:]
-                            if available:
-                                take = min(len(available), remaining)
-                                nodes.extend(available[:take])
-                                remaining -= take
-                                if remaining <= 0:
-                                    break
-                else:
-                    nodes = all_db_nodes
+                # Count every hour bucket, then sample each one in proportion to its count
+                hour_buckets = _timeline_hour_buckets(start_time, now)
+                filters, filter_params = _timeline_filters(scope, type)
+                hour_counts = _count_timeline_buckets(cursor, hour_buckets, filters, filter_params)
+                quotas = _allocate_timeline_samples(hour_counts, limit or 100)
+
+                for row in _sample_timeline_rows(cursor, hour_buckets, quotas, filters, filter_params):
+                    try:
+                        # Parse attributes
+                        attributes = json.loads(row["attributes_json"]) if row["attributes_json"] else {}
+
+                        # Create GraphNode
+                        node = GraphNode(
+                            id=row["node_id"],
+                            type=NodeType(row["node_type"]),
+                            scope=GraphScope(row["scope"]),
+                            attributes=attributes,
+                            version=row["version"],
+                            updated_by=row["updated_by"],
+                            updated_at=datetime.fromisoformat(row["updated_at"].replace("Z", UTC_TIMEZONE_SUFFIX)),
+                        )
+                        nodes.append(node)
+                    except Exception as e:
+                        logger.warning(f"Failed to parse node {row['node_id']}: {e}")
+                        continue
 
         except Exception as e:
             logger.error(f"Failed to query timeline data: {e}")
+            hour_counts = None
             # Fall back to standard search
             all_nodes = await memory_service.search(
                 "",
@@ -516,30 +627,39 @@ async def get_timeline(
         buckets = {}
         bucket_delta = timedelta(hours=1) if bucket_size == "hour" else timedelta(days=1)
 
-        current_bucket = start_time
+        # Start at the boundary of the first bucket so the current hour/day gets a bucket too
+        current_bucket = start_time.replace(minute=0, second=0, microsecond=0)
+        if bucket_size != "hour":
+            current_bucket = current_bucket.replace(hour=0)
         while current_bucket < now:
             bucket_key = current_bucket.strftime("%Y-%m-%d %H:00" if bucket_size == "hour" else "%Y-%m-%d")
             buckets[bucket_key] = 0
             current_bucket += bucket_delta
 
-        # Count nodes in buckets
-        for node in nodes:
-            if isinstance(node.attributes, dict):
-                node_time = node.attributes.get("created_at") or node.attributes.get("timestamp")
-            else:
-                node_time = node.attributes.created_at
+        # Count nodes in buckets - exact counts when they came from the database
+        if hour_counts is not None:
+            for hour_key, count in hour_counts.items():
+                bucket_key = hour_key if bucket_size == "hour" else hour_key[:10]
+                if bucket_key in buckets:
+                    buckets[bucket_key] += count
+        else:
+            for node in nodes:
+                if isinstance(node.attributes, dict):
+                    node_time = node.attributes.get("created_at") or node.attributes.get("timestamp")
+                else:
+                    node_time = node.attributes.created_at
 
-            # Fallback to top-level updated_at
-            if not node_time and hasattr(node, "updated_at"):
-                node_time = node.updated_at
+                # Fallback to top-level updated_at
+                if not node_time and hasattr(node, "updated_at"):
+                    node_time = node.updated_at
 
-            if node_time:
-                if isinstance(node_time, str):
-                    node_time = datetime.fromisoformat(node_time.replace("Z", UTC_TIMEZONE_SUFFIX))
+                if node_time:
+                    if isinstance(node_time, str):
+                        node_time = datetime.fromisoformat(node_time.replace("Z", UTC_TIMEZONE_SUFFIX))
 
-                bucket_key = node_time.strftime("%Y-%m-%d %H:00" if bucket_size == "hour" else "%Y-%m-%d")
-                if bucket_key in buckets:
-                    buckets[bucket_key] += 1
+                    bucket_key = node_time.strftime("%Y-%m-%d %H:00" if bucket_size == "hour" else "%Y-%m-%d")
+                    if bucket_key in buckets:
+                        buckets[bucket_key] += 1
 
         # Limit nodes to return
         returned_nodes = nodes[:limit]
@@ -593,8 +713,9 @@ async def get_timeline(
                 logger.error(f"Failed to fetch edges: {e}")
                 edges = []
 
+        total = sum(hour_counts.values()) if hour_counts is not None else len(nodes)
         response = TimelineResponse(
-            memories=returned_nodes, edges=edges, buckets=buckets, start_time=start_time, end_time=now, total=len(nodes)
+            memories=returned_nodes, edges=edges, buckets=buckets, start_time=start_time, end_time=now, total=total
         )
 
         return SuccessResponse(
@@ -1605,7 +1726,7 @@ def _calculate_timeline_layout(
 
 def _generate_svg(
     G: "nx.DiGraph",
-    pos: Dict[str, tuple],
+    pos: Dict[str, Tuple[float, float]],
     width: int,
     height: int,
     layout: str,
@@ -25,6 +25,7 @@ from ciris_engine.schemas.runtime.adapter_management import (
 )
 from ciris_engine.schemas.runtime.adapter_management import AdapterStatus as AdapterStatusSchema
 from ciris_engine.schemas.runtime.enums import ServiceType
+from ciris_engine.schemas.services.lifecycle.initialization import StartupTimeline
 from ciris_engine.schemas.services.resources_core import ResourceBudget, ResourceSnapshot
 from ciris_engine.utils.serialization import serialize_timestamp
 
@@ -286,6 +287,23 @@ async def get_system_health(request: Request) -> SuccessResponse[SystemHealthRes
     return SuccessResponse(data=response)
 
 
+@router.get("/startup", response_model=SuccessResponse[StartupTimeline])
+async def get_startup_timeline(
+    request: Request, auth: AuthContext = Depends(require_observer)
+) -> SuccessResponse[StartupTimeline]:
+    """
+    Service startup timeline.
+
+    Returns per-service start times and durations grouped by startup wave,
+    plus cold-start time to the first completed WORK round.
+    """
+    init_service = getattr(request.app.state, "initialization_service", None)
+    if not init_service or not hasattr(init_service, "get_startup_timeline"):
+        raise HTTPException(status_code=503, detail="Initialization service not available")
+
+    return SuccessResponse(data=init_service.get_startup_timeline())
+
+
 @router.get("/time", response_model=SuccessResponse[SystemTimeResponse])
 async def get_system_time(
     request: Request, auth: AuthContext = Depends(require_observer)
@@ -4,6 +4,7 @@ Telemetry & Observability endpoints for CIRIS API v1.
 Consolidated metrics, traces, logs, and insights from all system components.
 """
 
+import asyncio
 import logging
 import uuid
 from collections import defaultdict
@@ -187,6 +188,7 @@ class LogsResponse(BaseModel):
     logs: List[LogEntry] = Field(..., description="Log entries")
     total: int = Field(..., description="Total matching logs")
     has_more: bool = Field(False, description="More logs available")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next (older) page of log file entries")
 
 
 class TelemetryQuery(BaseModel):
@@ -860,16 +862,20 @@ async def get_system_logs(
     level: Optional[str] = Query(None, description="Log level filter"),
     service: Optional[str] = Query(None, description="Service filter"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum logs to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous response to page through older logs"),
 ) -> SuccessResponse[LogsResponse]:
     """
     System logs.
 
-    Get system logs from all services with filtering capabilities.
+    Get system logs from all services with filtering capabilities. Log file entries
+    are paged: pass next_cursor back as cursor to get the page before this one.
     """
     audit_service = getattr(request.app.state, "audit_service", None)
     logs = []
+    next_cursor = None
 
-    if audit_service:
+    # Audit entries are only part of the first page; cursors page through log files
+    if audit_service and not cursor:
         try:
             # Query audit entries as logs
             entries = await audit_service.query_entries(
@@ -924,23 +930,33 @@ async def get_system_logs(
 
     # Add actual system logs from log files
     if len(logs) < limit:
-        try:
-            from .telemetry_logs_reader import log_reader
+        from .telemetry_logs_reader import log_reader
 
-            file_logs = log_reader.read_logs(
+        try:
+            page = await asyncio.to_thread(
+                log_reader.read_page,
                 level=level,
                 service=service,
                 limit=limit - len(logs),
                 start_time=start_time,
                 end_time=end_time,
                 include_incidents=True,
+                cursor=cursor,
             )
-            logs.extend(file_logs)
+            logs.extend(page.entries)
+            next_cursor = page.next_cursor
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             # Log reading failed, but don't fail the endpoint
             print(f"Failed to read log files: {e}")
 
-    response = LogsResponse(logs=logs[:limit], total=len(logs), has_more=len(logs) > limit)
+    response = LogsResponse(
+        logs=logs[:limit],
+        total=len(logs),
+        has_more=len(logs) > limit or next_cursor is not None,
+        next_cursor=next_cursor,
+    )
 
     return SuccessResponse(
         data=response,
@@ -0,0 +1,257 @@
+"""
+Sidecar offset index for log files read by the telemetry logs endpoint.
+
+Each log segment gets an append-only index file that splits the log into blocks
+of roughly BLOCK_SIZE bytes and records, per block, its byte range, first and
+last timestamp, the levels and services it contains and how many entries it
+holds. Readers use it to seek straight to the blocks that can match a query
+instead of parsing the file. Only complete blocks are indexed; the short tail
+after the last one is scanned directly.
+"""
+
+import hashlib
+import json
+import logging
+import re
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+BLOCK_SIZE = 64 * 1024
+FINGERPRINT_BYTES = 512
+INDEX_DIR_NAME = ".index"
+
+LOG_LINE_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3}) - ([^-]+) - (\w+) - (.*)$")
+
+LEVEL_BITS = {"DEBUG": 1, "INFO": 2, "WARNING": 4, "ERROR": 8, "CRITICAL": 16}
+OTHER_LEVEL_BIT = 32
+
+
+def level_bit(level: str) -> int:
+    """Bit used for a level in a block's level mask."""
+    return LEVEL_BITS.get(level.upper(), OTHER_LEVEL_BIT)
+
+
+def parse_line_header(line: str) -> Optional[Tuple[str, str, str]]:
+    """Return (timestamp, level, service) for a log line, or None if it is not an entry line."""
+    match = LOG_LINE_PATTERN.match(line.strip())
+    if not match:
+        return None
+    timestamp, module, level, _ = match.groups()
+    return timestamp, level.upper(), module.strip().split(".")[0]
+
+
+class LogQuery(NamedTuple):
+    """Filters a block can be checked against; timestamps use the log's own string format."""
+
+    levels: int = 0  # Level mask, 0 for any level
+    service: Optional[str] = None  # Lowercase substring of the service name
+    start_ts: Optional[str] = None
+    end_ts: Optional[str] = None
+
+
+class LogBlock(NamedTuple):
+    """Summary of one indexed block of a log file."""
+
+    start: int
+    end: int
+    first_ts: str
+    last_ts: str
+    levels: int
+    services: Tuple[str, ...]
+    entries: int
+
+    def may_match(self, query: LogQuery) -> bool:
+        """Whether any entry in this block can match the query."""
+        if not self.entries:
+            return False
+        if query.levels and not self.levels & query.levels:
+            return False
+        if query.service and not any(query.service in service.lower() for service in self.services):
+            return False
+        if query.start_ts and self.last_ts < query.start_ts:
+            return False
+        if query.end_ts and self.first_ts > query.end_ts:
+            return False
+        return True
+
+
+class _BlockBuilder:
+    """Accumulates line statistics until a block is complete."""
+
+    def __init__(self, start: int):
+        self.start = start
+        self.end = start
+        self.first_ts = ""
+        self.last_ts = ""
+        self.levels = 0
+        self.services: Set[str] = set()
+        self.entries = 0
+
+    def add(self, raw: bytes) -> None:
+        self.end += len(raw)
+        header = parse_line_header(raw.decode("utf-8", errors="ignore"))
+        if header is None:
+            return
+        timestamp, level, service = header
+        if not self.entries:
+            self.first_ts = timestamp
+        self.last_ts = timestamp
+        self.levels |= level_bit(level)
+        self.services.add(service)
+        self.entries += 1
+
+    def build(self) -> LogBlock:
+        return LogBlock(
+            self.start,
+            self.end,
+            self.first_ts,
+            self.last_ts,
+            self.levels,
+            tuple(sorted(self.services)),
+            self.entries,
+        )
+
+
+class LogSegmentIndex:
+    """Block index for one log file, kept in memory and mirrored to a sidecar file.
+
+    The index grows incrementally as the log grows. It is rebuilt when the file
+    is rotated in place: truncated below the indexed size, or replaced by a file
+    whose first bytes differ.
+    """
+
+    def __init__(self, log_path: Path, index_path: Path):
+        self.log_path = log_path
+        self.index_path = index_path
+        self.blocks: List[LogBlock] = []
+        self._fingerprint: Optional[str] = None
+        self._loaded = False
+
+    @property
+    def indexed_end(self) -> int:
+        """Byte offset up to which the file is indexed."""
+        return self.blocks[-1].end if self.blocks else 0
+
+    def refresh(self) -> int:
+        """Bring the index up to date with the file and return the file size."""
+        try:
+            size = self.log_path.stat().st_size
+        except OSError:
+            self._reset()
+            return 0
+
+        if not self._loaded:
+            self._load(size)
+            self._loaded = True
+
+        if self.blocks and (size < self.indexed_end or self._read_fingerprint() != self._fingerprint):
+            logger.debug(f"Log file {self.log_path} was rotated, rebuilding its index")
+            self._reset()
+            self._remove_sidecar()
+
+        if size - self.indexed_end >= BLOCK_SIZE:
+            self._extend(size)
+        return size
+
+    def _reset(self) -> None:
+        self.blocks = []
+        self._fingerprint = None
+
+    def _read_fingerprint(self) -> Optional[str]:
+        try:
+            with open(self.log_path, "rb") as f:
+                head = f.read(FINGERPRINT_BYTES)
+        except OSError:
+            return None
+        return hashlib.sha1(head).hexdigest()
+
+    def _extend(self, size: int) -> None:
+        """Index complete blocks between the indexed end and the current size."""
+        if self._fingerprint is None:
+            self._fingerprint = self._read_fingerprint()
+
+        new_blocks: List[LogBlock] = []
+        try:
+            with open(self.log_path, "rb") as f:
+                f.seek(self.indexed_end)
+                builder = _BlockBuilder(self.indexed_end)
+                while builder.end < size:
+                    raw = f.readline()
+                    if not raw.endswith(b"\n"):
+                        break  # Partial line still being written
+                    builder.add(raw)
+                    if builder.end - builder.start >= BLOCK_SIZE:
+                        new_blocks.append(builder.build())
+                        builder = _BlockBuilder(builder.end)
+        except OSError as e:
+            logger.debug(f"Failed to index log file {self.log_path}: {e}")
+
+        if new_blocks:
+            self.blocks.extend(new_blocks)
+            self._append_sidecar(new_blocks)
+
+    def _load(self, size: int) -> None:
+        """Load the sidecar index, keeping only blocks that still describe the file."""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return
+
+        try:
+            header = json.loads(lines[0])
+            if header.get("version") != INDEX_VERSION or header.get("block_size") != BLOCK_SIZE:
+                raise ValueError("index format changed")
+            fingerprint = header["fingerprint"]
+        except (IndexError, KeyError, ValueError, AttributeError):
+            self._remove_sidecar()
+            return
+
+        if fingerprint != self._read_fingerprint():
+            self._remove_sidecar()
+            return
+
+        blocks: List[LogBlock] = []
+        for line in lines[1:]:
+            try:
+                block = LogBlock(*json.loads(line))
+            except (ValueError, TypeError):
+                break  # Torn write at the end of the sidecar
+            if block.start != (blocks[-1].end if blocks else 0) or block.end > size:
+                break
+            blocks.append(LogBlock(*block[:5], tuple(block.services), block.entries))
+
+        self.blocks = blocks
+        self._fingerprint = fingerprint
+        if len(blocks) != len(lines) - 1:
+            self._rewrite_sidecar()
+
+    def _append_sidecar(self, blocks: List[LogBlock]) -> None:
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            new_file = not self.index_path.exists()
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                if new_file:
+                    f.write(self._header() + "\n")
+                for block in blocks:
+                    f.write(json.dumps(list(block)) + "\n")
+        except OSError as e:
+            # The in-memory index still works, it just is not persisted
+            logger.debug(f"Failed to write log index {self.index_path}: {e}")
+
+    def _rewrite_sidecar(self) -> None:
+        self._remove_sidecar()
+        if self.blocks:
+            self._append_sidecar(self.blocks)
+
+    def _remove_sidecar(self) -> None:
+        try:
+            self.index_path.unlink()
+        except OSError:
+            pass
+
+    def _header(self) -> str:
+        return json.dumps({"version": INDEX_VERSION, "block_size": BLOCK_SIZE, "fingerprint": self._fingerprint})
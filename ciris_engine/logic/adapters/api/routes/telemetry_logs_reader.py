@@ -1,30 +1,63 @@
 """
 Log file reader for telemetry endpoint.
 Reads actual log files from disk instead of audit entries.
+
+Every segment of a log stream gets a sidecar block index (see telemetry_logs_index),
+so a page of results only parses the blocks that can match it.
 """
 
+import base64
+import heapq
 import json
 import logging
-import re
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import IO, List, Optional
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 from ciris_engine.schemas.api.telemetry import LogContext
 
+from .telemetry_logs_index import (
+    INDEX_DIR_NAME,
+    LOG_LINE_PATTERN,
+    LogQuery,
+    LogSegmentIndex,
+    level_bit,
+    parse_line_header,
+)
+
 logger = logging.getLogger(__name__)
 
 # Import LogEntry from the route file where it's defined
 from .telemetry import LogEntry
 
 
+class LogPosition(NamedTuple):
+    """Start of a line within a log segment; a page continues with the entries before it."""
+
+    segment: str
+    offset: int
+
+
+class LogPage(NamedTuple):
+    """One page of log entries, oldest first, and the cursor for the page before it."""
+
+    entries: List[LogEntry]
+    next_cursor: Optional[str]
+
+
 class LogFileReader:
     """Reads and parses log files from disk."""
 
-    LOG_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3}) - ([^-]+) - (\w+) - (.*)$")
+    LOG_PATTERN = LOG_LINE_PATTERN
+
+    # Every segment of each log stream, including those from earlier runs
+    SEGMENT_PATTERNS = {"main": "ciris_agent_*.log", "incidents": "incidents_*.log"}
 
     def __init__(self, logs_dir: str = "/app/logs"):
         self.logs_dir = Path(logs_dir)
+        self._indexes: Dict[Path, LogSegmentIndex] = {}
+        self._lock = threading.Lock()
 
     def _get_actual_log_files(self) -> tuple[Optional[Path], Optional[Path]]:
         """Get the actual log files from stored filenames or logging handlers."""
@@ -94,107 +127,205 @@ class LogFileReader:
         end_time: Optional[datetime] = None,
         include_incidents: bool = True,
     ) -> List[LogEntry]:
-        """Read logs from files and return as LogEntry objects."""
-        logs = []
-
-        # Get actual log files instead of using symlinks
-        main_log_file, incident_log_file = self._get_actual_log_files()
-
-        # Read from main log file
-        if main_log_file and main_log_file.exists():
-            logs.extend(self._parse_log_file(main_log_file, level, service, limit, start_time, end_time))
+        """Read the most recent matching logs, oldest first."""
+        return self.read_page(level, service, limit, start_time, end_time, include_incidents).entries
 
-        # Read from incidents log if requested
-        if include_incidents and len(logs) < limit and incident_log_file and incident_log_file.exists():
-            logs.extend(
-                self._parse_log_file(incident_log_file, level, service, limit - len(logs), start_time, end_time)
-            )
-
-        # Sort by timestamp ascending (oldest first, newest last)
-        logs.sort(key=lambda x: x.timestamp, reverse=False)
-
-        # Return the most recent logs (last N entries)
-        return logs[-limit:] if len(logs) > limit else logs
-
-    def _parse_log_file(
+    def read_page(
         self,
-        file_path: Path,
         level: Optional[str] = None,
         service: Optional[str] = None,
         limit: int = 100,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-    ) -> List[LogEntry]:
-        """Parse a single log file."""
-        logs = []
+        include_incidents: bool = True,
+        cursor: Optional[str] = None,
+    ) -> LogPage:
+        """Read one page of matching logs, newest page first.
+
+        Entries come from every segment of the main (and incident) log, merged by
+        timestamp. The returned cursor continues with the entries just before this
+        page and stays valid while new lines are written or segments are rotated.
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        positions = self._decode_cursor(cursor)
+        query = self._build_query(level, service, start_time, end_time)
+
+        with self._lock:
+            main_log_file, incident_log_file = self._get_actual_log_files()
+            currents = {"main": main_log_file}
+            if include_incidents:
+                currents["incidents"] = incident_log_file
+
+            streams = []
+            for name, current in currents.items():
+                segments = self._get_segments(name, current)
+                position = positions[name] if name in positions else self._newest_position(segments)
+                positions[name] = position
+                if position is not None:
+                    streams.append(self._iter_stream(name, segments, position, query, start_time))
+
+            entries: List[LogEntry] = []
+            has_more = False
+            merged = heapq.merge(*streams, key=lambda item: item[0].timestamp, reverse=True)
+            for entry, stream, entry_position in merged:
+                if len(entries) >= limit:
+                    has_more = True
+                    break
+                entries.append(entry)
+                positions[stream] = entry_position
+
+        entries.reverse()
+        return LogPage(entries=entries, next_cursor=self._encode_cursor(positions) if has_more else None)
+
+    def _build_query(
+        self,
+        level: Optional[str],
+        service: Optional[str],
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+    ) -> LogQuery:
+        return LogQuery(
+            levels=level_bit(level) if level else 0,
+            service=service.lower() if service else None,
+            start_ts=self._format_timestamp(start_time) if start_time else None,
+            end_ts=self._format_timestamp(end_time) if end_time else None,
+        )
+
+    @staticmethod
+    def _local_time(value: datetime) -> datetime:
+        """Log timestamps are naive local time; convert aware datetimes to match."""
+        return value.astimezone().replace(tzinfo=None) if value.tzinfo else value
+
+    def _format_timestamp(self, value: datetime) -> str:
+        return self._local_time(value).strftime("%Y-%m-%d %H:%M:%S.%f")[:23]
+
+    def _get_segments(self, stream: str, current: Optional[Path]) -> List[Path]:
+        """All segments of a log stream, oldest first."""
+        segments = {
+            path.name: path
+            for path in self.logs_dir.glob(self.SEGMENT_PATTERNS[stream])
+            if path.is_file() and not path.is_symlink()
+        }
+        if current is not None and current.is_file():
+            segments.setdefault(current.name, current)
+
+        # Forget indexes of segments that were deleted
+        for path in [path for path in self._indexes if not path.exists()]:
+            self._indexes.pop(path)._remove_sidecar()
+
+        # Segment names carry their start time, so name order is time order
+        return [segments[name] for name in sorted(segments)]
+
+    def _get_index(self, path: Path) -> LogSegmentIndex:
+        index = self._indexes.get(path)
+        if index is None:
+            index = LogSegmentIndex(path, path.parent / INDEX_DIR_NAME / f"{path.name}.idx")
+            self._indexes[path] = index
+        return index
+
+    def _newest_position(self, segments: List[Path]) -> Optional[LogPosition]:
+        if not segments:
+            return None
+        newest = segments[-1]
+        return LogPosition(newest.name, self._get_index(newest).refresh())
 
+    def _iter_stream(
+        self,
+        stream: str,
+        segments: List[Path],
+        position: LogPosition,
+        query: LogQuery,
+        start_time: Optional[datetime],
+    ) -> Iterator[Tuple[LogEntry, str, LogPosition]]:
+        """Yield matching entries of a stream, newest first, starting before a position."""
+        earliest = self._local_time(start_time) if start_time else None
+        for path in reversed(segments):
+            if path.name > position.segment:
+                continue
+            if earliest is not None:
+                try:
+                    if datetime.fromtimestamp(path.stat().st_mtime) < earliest:
+                        return  # Nothing in this or any older segment is recent enough
+                except OSError:
+                    continue
+            before = position.offset if path.name == position.segment else None
+            for entry, offset in self._iter_segment(path, before, query):
+                yield entry, stream, LogPosition(path.name, offset)
+
+    def _iter_segment(self, path: Path, before: Optional[int], query: LogQuery) -> Iterator[Tuple[LogEntry, int]]:
+        """Yield matching entries of one segment that start before an offset, newest first."""
+        index = self._get_index(path)
+        size = index.refresh()
+        end = size if before is None else min(before, size)
+
+        if end > index.indexed_end:
+            yield from self._scan_range(path, index.indexed_end, end, query)
+
+        for block in reversed(index.blocks):
+            if block.start >= end:
+                continue
+            if query.start_ts and block.entries and block.last_ts < query.start_ts:
+                return  # Blocks are in time order, so every earlier block is older still
+            if block.may_match(query):
+                yield from self._scan_range(path, block.start, min(block.end, end), query)
+
+    def _scan_range(self, path: Path, start: int, end: int, query: LogQuery) -> Iterator[Tuple[LogEntry, int]]:
+        """Parse complete lines in a byte range and yield matching entries, newest first."""
+        try:
+            with open(path, "rb") as f:
+                f.seek(start)
+                data = f.read(end - start)
+        except OSError as e:
+            logger.debug(f"Error reading log file {path}: {e}")
+            return
+
+        matches: List[Tuple[LogEntry, int]] = []
+        offset = start
+        for raw in data.splitlines(keepends=True):
+            if not raw.endswith(b"\n"):
+                break  # Partial line still being written
+            line_start, offset = offset, offset + len(raw)
+            header = parse_line_header(raw.decode("utf-8", errors="ignore"))
+            if header is None or not self._header_matches(header, query):
+                continue
+            entry = self._parse_log_line(raw.decode("utf-8", errors="ignore"))
+            if entry:
+                matches.append((entry, line_start))
+
+        yield from reversed(matches)
+
+    @staticmethod
+    def _header_matches(header: Tuple[str, str, str], query: LogQuery) -> bool:
+        timestamp, level, service = header
+        if query.levels and not level_bit(level) & query.levels:
+            return False
+        if query.service and query.service not in service.lower():
+            return False
+        if query.start_ts and timestamp < query.start_ts:
+            return False
+        if query.end_ts and timestamp > query.end_ts:
+            return False
+        return True
+
+    @staticmethod
+    def _encode_cursor(positions: Dict[str, Optional[LogPosition]]) -> str:
+        payload = {"v": 1, "p": {name: list(position) if position else None for name, position in positions.items()}}
+        return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: Optional[str]) -> Dict[str, Optional[LogPosition]]:
+        if not cursor:
+            return {}
         try:
-            # Read file from end (most recent logs)
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                # Read more lines than needed to account for filtering
-                # but cap it to avoid reading huge files
-                read_lines = min(limit * 20, 10000)
-                lines = self._tail(f, read_lines)
-
-                # Process lines in order (they're already in chronological order from tail)
-                for line in lines:
-                    entry = self._parse_log_line(line)
-                    if entry:
-                        # Apply filters
-                        if level and entry.level != level.upper():
-                            continue
-                        if service and service.lower() not in entry.service.lower():
-                            continue
-                        if start_time and entry.timestamp < start_time:
-                            continue
-                        if end_time and entry.timestamp > end_time:
-                            continue
-
-                        logs.append(entry)
-
-        except Exception as e:
-            # Log parsing error, but don't fail the endpoint
-            print(f"Error reading log file {file_path}: {e}")
-
-        return logs
-
-    def _tail(self, file_obj: IO[str], num_lines: int) -> List[str]:
-        """Read last N lines from a file efficiently."""
-        # For large files, seek to end and read backwards
-        file_obj.seek(0, 2)  # Go to end of file
-        file_size = file_obj.tell()
-
-        if file_size == 0:
-            return []
-
-        # Read chunk size (adjust based on expected line length)
-        chunk_size = min(file_size, 8192)
-        lines: List[str] = []
-        position = file_size
-
-        while len(lines) < num_lines + 1 and position > 0:
-            # Calculate how much to read
-            read_size = min(chunk_size, position)
-            position -= read_size
-
-            # Seek to position and read
-            file_obj.seek(position)
-            chunk = file_obj.read(read_size)
-
-            # Split into lines
-            chunk_lines = chunk.split("\n")
-
-            # Combine with existing lines
-            if lines:
-                # Last line from previous chunk might be incomplete
-                chunk_lines[-1] += lines[0]
-                lines = chunk_lines + lines[1:]
-            else:
-                lines = chunk_lines
-
-        # Remove empty lines and return last N non-empty lines
-        lines = [line for line in lines if line.strip()]
-        return lines[-num_lines:]
+            payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            return {
+                str(name): LogPosition(str(position[0]), int(position[1])) if position else None
+                for name, position in payload["p"].items()
+            }
+        except (ValueError, TypeError, KeyError, IndexError, AttributeError) as e:
+            raise ValueError(f"Invalid log cursor: {e}") from e
 
     def _parse_log_line(self, line: str) -> Optional[LogEntry]:
         """Parse a single log line into a LogEntry."""
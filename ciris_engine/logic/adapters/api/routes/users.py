@@ -171,19 +171,20 @@ async def list_users(
 
     Requires: users.read permission (ADMIN or higher)
     """
-    # Get all WA certificates from the auth service
-    users = auth_service.list_users(
-        search=search, auth_type=auth_type, api_role=api_role, wa_role=wa_role, is_active=is_active
+    # Only the requested page is materialized
+    users, total = auth_service.list_users_page(
+        search=search,
+        auth_type=auth_type,
+        api_role=api_role,
+        wa_role=wa_role,
+        is_active=is_active,
+        offset=(page - 1) * page_size,
+        limit=page_size,
     )
 
-    # Paginate results
-    total = len(users)
-    start = (page - 1) * page_size
-    end = start + page_size
-
     # Convert to UserSummary objects
     items = []
-    for user in users[start:end]:
+    for user in users:
         items.append(
             UserSummary(
                 user_id=user.wa_id,
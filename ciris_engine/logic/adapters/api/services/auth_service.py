@@ -8,11 +8,12 @@ import hashlib
 import secrets
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 import aiofiles
 import bcrypt
 
+from ciris_engine.logic.utils.password_hashing import get_password_hash_pool
 from ciris_engine.protocols.services.infrastructure.authentication import AuthenticationServiceProtocol
 from ciris_engine.schemas.api.auth import UserRole
 from ciris_engine.schemas.runtime.api import APIRole
@@ -95,6 +96,11 @@ class User:
     permission_requested_at: Optional[datetime] = None  # Timestamp when user requested permissions
 
 
+def _sortable_time(value: datetime) -> datetime:
+    """Make naive datetimes (e.g. datetime.min) comparable with aware ones."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
 class APIAuthService:
     """Simple in-memory authentication service with database persistence."""
 
@@ -104,6 +110,10 @@ class APIAuthService:
         self._oauth_users: Dict[str, OAuthUser] = {}
         self._users: Dict[str, User] = {}
 
+        # Secondary indexes over _users, maintained by _store_user
+        self._username_index: Dict[str, str] = {}  # name -> wa_id (first user with that name)
+        self._oauth_index: Dict[Tuple[str, str], str] = {}  # (provider, external_id) -> wa_id
+
         # Store reference to the actual authentication service
         self._auth_service = auth_service
 
@@ -123,7 +133,7 @@ class APIAuthService:
                 is_active=True,
                 password_hash=self._hash_password("ciris_admin_password"),
             )
-            self._users[admin_user.wa_id] = admin_user
+            self._store_user(admin_user)
 
     def _load_users_from_db(self) -> None:
         """Load existing users from the database."""
@@ -152,10 +162,10 @@ class APIAuthService:
                     password_hash=wa.password_hash,
                     custom_permissions=wa.custom_permissions if hasattr(wa, "custom_permissions") else None,
                 )
-                self._users[user.wa_id] = user
+                self._store_user(user)
 
             # If no admin user exists, create the default one
-            if not any(u.name == "admin" for u in self._users.values()):
+            if "admin" not in self._username_index:
                 asyncio.run(self._create_default_admin())
 
         except Exception as e:
@@ -172,7 +182,7 @@ class APIAuthService:
                 is_active=True,
                 password_hash=self._hash_password("ciris_admin_password"),
             )
-            self._users[admin_user.wa_id] = admin_user
+            self._store_user(admin_user)
 
     async def _create_default_admin(self) -> None:
         """Create the default admin user in the database."""
@@ -204,11 +214,42 @@ class APIAuthService:
                 is_active=True,
                 password_hash=self._hash_password("ciris_admin_password"),
             )
-            self._users[admin_user.wa_id] = admin_user
+            self._store_user(admin_user)
 
         except Exception as e:
             print(f"Error creating default admin: {e}")
 
+    def _store_user(self, user: User) -> None:
+        """Add or replace a user and keep the lookup indexes in step."""
+        previous = self._users.get(user.wa_id)
+        if previous is not None:
+            self._unindex_user(previous)
+        self._users[user.wa_id] = user
+        self._username_index.setdefault(user.name, user.wa_id)
+        if user.oauth_provider and user.oauth_external_id:
+            self._oauth_index.setdefault((user.oauth_provider, user.oauth_external_id), user.wa_id)
+
+    def _unindex_user(self, user: User) -> None:
+        if self._username_index.get(user.name) == user.wa_id:
+            del self._username_index[user.name]
+            # Another user with the same name becomes the match, as with a scan
+            for other in self._users.values():
+                if other.name == user.name and other.wa_id != user.wa_id:
+                    self._username_index[user.name] = other.wa_id
+                    break
+        oauth_key = (user.oauth_provider or "", user.oauth_external_id or "")
+        if self._oauth_index.get(oauth_key) == user.wa_id:
+            del self._oauth_index[oauth_key]
+
+    def get_user_by_oauth(self, provider: str, external_id: str) -> Optional[User]:
+        """Get a user by OAuth identity."""
+        user_id = self._oauth_index.get((provider, external_id))
+        if user_id is not None:
+            return self._users.get(user_id)
+        if f"{provider}:{external_id}" in self._oauth_users:
+            return self.get_user(f"{provider}:{external_id}")
+        return None
+
     def _wa_role_to_api_role(self, wa_role: Optional[WARole]) -> APIRole:
         """Convert WA role to API role."""
         if not wa_role:
@@ -286,7 +327,7 @@ class APIAuthService:
                 is_active=True,
                 password_hash=self._hash_password("ciris_admin_password"),
             )
-            self._users[admin_user.wa_id] = admin_user
+            self._store_user(admin_user)
 
         return stored_key
 
@@ -346,22 +387,28 @@ class APIAuthService:
             # If verification fails (e.g., invalid hash format), return False
             return False
 
+    async def _hash_password_async(self, password: str) -> str:
+        """Hash a password on the password hashing pool so the event loop keeps serving requests."""
+        return await get_password_hash_pool().run(self._hash_password, password)
+
+    async def _verify_password_async(self, password: str, password_hash: str) -> bool:
+        """Verify a password on the password hashing pool."""
+        return await get_password_hash_pool().run(self._verify_password, password, password_hash)
+
     async def verify_user_password(self, username: str, password: str) -> Optional[User]:
         """Verify a user's password and return the user if valid."""
         user = self.get_user_by_username(username)
-        if not user:
+        if not user or not user.password_hash:
             return None
 
-        if self._verify_password(password, user.password_hash):
+        if await self._verify_password_async(password, user.password_hash):
             return user
         return None
 
     def get_user_by_username(self, username: str) -> Optional[User]:
         """Get a user by username."""
-        for user in self._users.values():
-            if user.name == username:
-                return user
-        return None
+        user_id = self._username_index.get(username)
+        return self._users.get(user_id) if user_id is not None else None
 
     async def create_user(self, username: str, password: str, api_role: APIRole = APIRole.OBSERVER) -> Optional[User]:
         """Create a new user account."""
@@ -378,6 +425,7 @@ class APIAuthService:
             APIRole.OBSERVER: WARole.OBSERVER,
         }
         wa_role = wa_role_map.get(api_role, WARole.OBSERVER)
+        password_hash = await self._hash_password_async(password)
 
         # If we have an auth service, create in database
         if self._auth_service:
@@ -391,9 +439,7 @@ class APIAuthService:
                 )
 
                 # Update with password hash
-                await self._auth_service.update_wa(
-                    wa_cert.wa_id, updates=None, password_hash=self._hash_password(password)
-                )
+                await self._auth_service.update_wa(wa_cert.wa_id, updates=None, password_hash=password_hash)
 
                 # Create user object
                 user = User(
@@ -404,11 +450,11 @@ class APIAuthService:
                     wa_role=wa_role,
                     created_at=wa_cert.created_at,
                     is_active=True,
-                    password_hash=self._hash_password(password),
+                    password_hash=password_hash,
                 )
 
                 # Store in cache
-                self._users[wa_cert.wa_id] = user
+                self._store_user(user)
                 return user
 
             except Exception as e:
@@ -425,11 +471,11 @@ class APIAuthService:
             api_role=api_role,
             created_at=now,
             is_active=True,
-            password_hash=self._hash_password(password),
+            password_hash=password_hash,
         )
 
         # Store user
-        self._users[user_id] = user
+        self._store_user(user)
 
         return user
 
@@ -440,62 +486,82 @@ class APIAuthService:
         api_role: Optional[APIRole] = None,
         wa_role: Optional[WARole] = None,
         is_active: Optional[bool] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[User]:
-        """List all users with optional filtering."""
-        users = []
-
-        # Add all stored users
-        for user in self._users.values():
-            # Apply filters
-            if search and search.lower() not in user.name.lower():
-                continue
-            if auth_type and user.auth_type != auth_type:
-                continue
-            if api_role and user.api_role != api_role:
-                continue
-            if wa_role and user.wa_role != wa_role:
-                continue
-            if is_active is not None and user.is_active != is_active:
-                continue
+        """List users with optional filtering, newest first.
 
-            users.append(user)
+        ``offset``/``limit`` select a page; see ``list_users_page`` for the total.
+        """
+        users, _ = self.list_users_page(search, auth_type, api_role, wa_role, is_active, offset, limit)
+        return users
 
-        # Add OAuth users not in _users
-        for oauth_user in self._oauth_users.values():
-            # Check if already in users
-            if any(u.oauth_external_id == oauth_user.external_id for u in users):
-                continue
+    def list_users_page(
+        self,
+        search: Optional[str] = None,
+        auth_type: Optional[str] = None,
+        api_role: Optional[APIRole] = None,
+        wa_role: Optional[WARole] = None,
+        is_active: Optional[bool] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[User], int]:
+        """Return one page of matching users and the total number of matches.
 
-            # Convert OAuth user to User
-            user = User(
-                wa_id=oauth_user.user_id,
-                name=oauth_user.name or oauth_user.email or oauth_user.user_id,
-                auth_type="oauth",
-                api_role=self._user_role_to_api_role(oauth_user.role),
-                oauth_provider=oauth_user.provider,
-                oauth_email=oauth_user.email,
-                oauth_external_id=oauth_user.external_id,
-                oauth_name=oauth_user.name,  # Map OAuth name to oauth_name field
-                created_at=oauth_user.created_at,
-                last_login=oauth_user.last_login,
-                is_active=True,
-            )
+        Filters run against the stored users and the raw OAuth records; only
+        the OAuth users on the requested page are converted to ``User``.
+        """
+        needle = search.lower() if search else None
+        # (created_at, user) for stored users, (created_at, oauth user id) for OAuth-only users
+        matches: List[Tuple[datetime, Union[User, str]]] = []
 
-            # Apply filters
-            if search and search.lower() not in user.name.lower():
+        for user in self._users.values():
+            if needle and needle not in user.name.lower():
                 continue
             if auth_type and user.auth_type != auth_type:
                 continue
             if api_role and user.api_role != api_role:
                 continue
-            if wa_role is not None:
-                continue  # OAuth users without WA role
+            if wa_role and user.wa_role != wa_role:
+                continue
             if is_active is not None and user.is_active != is_active:
                 continue
+            matches.append((user.created_at or datetime.min, user))
+
+        # OAuth users are never WAs and are always active
+        include_oauth = wa_role is None and is_active is not False and auth_type in (None, "oauth")
+        if include_oauth:
+            for oauth_user in self._oauth_users.values():
+                # Skip OAuth identities already represented by a stored user
+                if (oauth_user.provider, oauth_user.external_id) in self._oauth_index:
+                    continue
+                name = oauth_user.name or oauth_user.email or oauth_user.user_id
+                if needle and needle not in name.lower():
+                    continue
+                if api_role and self._user_role_to_api_role(oauth_user.role) != api_role:
+                    continue
+                matches.append((oauth_user.created_at or datetime.min, oauth_user.user_id))
 
-            users.append(user)
+        matches.sort(key=lambda match: _sortable_time(match[0]), reverse=True)
+        total = len(matches)
+        page = matches[offset : offset + limit if limit is not None else None]
+        return [entry if isinstance(entry, User) else self._oauth_to_user(entry) for _, entry in page], total
 
-        return sorted(users, key=lambda u: u.created_at or datetime.min, reverse=True)
+    def _oauth_to_user(self, user_id: str) -> User:
+        oauth_user = self._oauth_users[user_id]
+        return User(
+            wa_id=oauth_user.user_id,
+            name=oauth_user.name or oauth_user.email or oauth_user.user_id,
+            auth_type="oauth",
+            api_role=self._user_role_to_api_role(oauth_user.role),
+            oauth_provider=oauth_user.provider,
+            oauth_email=oauth_user.email,
+            oauth_external_id=oauth_user.external_id,
+            oauth_name=oauth_user.name,  # Map OAuth name to oauth_name field
+            created_at=oauth_user.created_at,
+            last_login=oauth_user.last_login,
+            is_active=True,
+        )
 
     def _user_role_to_api_role(self, role: UserRole) -> APIRole:
         """Convert UserRole to APIRole."""
@@ -561,7 +627,7 @@ class APIAuthService:
             user.is_active = is_active
 
         # Store updated user
-        self._users[user_id] = user
+        self._store_user(user)
 
         # Also update in database if we have auth service
         if self._auth_service:
@@ -611,21 +677,17 @@ class APIAuthService:
 
         # Verify current password unless skip_current_check is True
         if not skip_current_check and current_password:
-            if not self._verify_password(current_password, user.password_hash):
+            if not user.password_hash or not await self._verify_password_async(current_password, user.password_hash):
                 return False
 
         # Update password
-        user.password_hash = self._hash_password(new_password)
-        self._users[user_id] = user
+        user.password_hash = await self._hash_password_async(new_password)
+        self._store_user(user)
 
         # Also update in database if we have auth service
         if self._auth_service:
             try:
-                import asyncio
-
-                asyncio.run(
-                    self._auth_service.update_wa(user_id, updates=None, password_hash=self._hash_password(new_password))
-                )
+                await self._auth_service.update_wa(user_id, updates=None, password_hash=user.password_hash)
             except Exception as e:
                 print(f"Error updating password in database: {e}")
 
@@ -638,7 +700,7 @@ class APIAuthService:
             return False
 
         user.is_active = False
-        self._users[user_id] = user
+        self._store_user(user)
 
         # Also update in database if we have auth service
         if self._auth_service:
@@ -723,7 +785,7 @@ class APIAuthService:
 
         # Update custom permissions
         user.custom_permissions = permissions
-        self._users[user_id] = user
+        self._store_user(user)
 
         # Also update in database if we have auth service
         if self._auth_service:
@@ -878,7 +940,7 @@ class APIAuthService:
             user.api_role = APIRole.OBSERVER
 
         # Store updated user
-        self._users[user_id] = user
+        self._store_user(user)
 
         # Also update in database if we have auth service
         if self._auth_service:
@@ -0,0 +1,418 @@
+"""
+Fan-out broadcaster for API WebSocket streams.
+
+Producers never write to a socket. Each event is serialized once and the
+resulting text is appended to a bounded queue per connection; a writer task
+per connection drains its queue. A slow or stalled client therefore only
+delays itself, and what happens when it falls behind is decided by the
+overflow policy it chose when connecting:
+
+- drop_oldest: discard the oldest queued frame to make room
+- coalesce: replace the queued frame with the same coalesce key (the latest
+  value wins), falling back to dropping the oldest frame
+- disconnect: close the connection
+
+Heartbeats are coalesced for every policy, so an idle-but-slow client never
+accumulates more than one.
+"""
+
+import asyncio
+import collections
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Deque, Dict, FrozenSet, Iterable, NamedTuple, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE = 256
+DEFAULT_HEARTBEAT_SECONDS = 30.0
+DEFAULT_SEND_TIMEOUT_SECONDS = 10.0
+SLOW_CLIENT_CLOSE_CODE = 1013  # Try again later
+HEARTBEAT_KEY = "heartbeat"
+
+
+class OverflowPolicy(str, Enum):
+    """What to do when a client's queue is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+    DISCONNECT = "disconnect"
+
+
+class _Frame(NamedTuple):
+    text: str
+    key: str  # Coalesce key; "" for frames that must never be merged
+    enqueued_at: float
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class StreamConnection:
+    """One WebSocket client: its subscriptions, bounded queue and writer task."""
+
+    def __init__(
+        self,
+        client_id: str,
+        websocket: Any,
+        broadcaster: "WebSocketBroadcaster",
+        policy: OverflowPolicy,
+        max_queue: int,
+        channels: Iterable[str],
+        user_id: Optional[str] = None,
+        role: Optional[str] = None,
+        readable_channels: Iterable[str] = (),
+    ) -> None:
+        self.client_id = client_id
+        self.websocket = websocket
+        self.policy = policy
+        self.max_queue = max(1, max_queue)
+        self.channels: Set[str] = set(channels)
+        self.closed = False
+
+        # Who is connected, and which conversation channels they may see
+        self.user_id = user_id
+        self.role = role
+        self.readable_channels: FrozenSet[str] = frozenset(readable_channels)
+
+        self._broadcaster = broadcaster
+        self._queue: Deque[_Frame] = collections.deque()
+        self._ready = asyncio.Event()
+        self._writer: Optional["asyncio.Task[None]"] = None
+
+        # Statistics
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.last_lag_seconds = 0.0
+
+    def start(self) -> None:
+        self._writer = asyncio.create_task(self._run(), name=f"ws-writer-{self.client_id}")
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    @property
+    def lag_seconds(self) -> float:
+        """Age of the oldest undelivered frame, or of the last delivered one when the queue is empty."""
+        if self._queue:
+            return time.monotonic() - self._queue[0].enqueued_at
+        return self.last_lag_seconds
+
+    def can_read(self, channel_id: Optional[str]) -> bool:
+        """Whether events from a conversation channel may be sent to this client; None is not channel scoped."""
+        return channel_id is None or channel_id in self.readable_channels
+
+    def send(self, payload: Dict[str, Any], coalesce_key: Optional[str] = None) -> bool:
+        """
+        Queue a complete JSON frame for this client.
+
+        Args:
+            payload: JSON-serializable frame, sent as is
+            coalesce_key: See WebSocketBroadcaster.broadcast()
+
+        Returns:
+            False if the connection is closing
+        """
+        if self.closed:
+            return False
+        if self.enqueue(_Frame(json.dumps(payload, default=str), coalesce_key or "", time.monotonic())):
+            self._broadcaster._frames_enqueued += 1
+            return True
+        return False
+
+    def enqueue(self, frame: _Frame) -> bool:
+        """Queue a frame, applying the overflow policy; False if the connection is closed."""
+        if self.closed:
+            return False
+
+        full = len(self._queue) >= self.max_queue
+        if frame.key and (frame.key == HEARTBEAT_KEY or (full and self.policy == OverflowPolicy.COALESCE)):
+            for index, queued in enumerate(self._queue):
+                if queued.key == frame.key:
+                    # Keep its place (and age) in the queue, deliver the newest value
+                    self._queue[index] = queued._replace(text=frame.text)
+                    self.coalesced += 1
+                    return True
+
+        if len(self._queue) >= self.max_queue:
+            if self.policy == OverflowPolicy.DISCONNECT:
+                self._broadcaster._close_slow(self, "Client queue overflow")
+                return False
+            self._queue.popleft()
+            self.dropped += 1
+
+        self._queue.append(frame)
+        self._ready.set()
+        return True
+
+    async def _run(self) -> None:
+        send_timeout = self._broadcaster.send_timeout
+        try:
+            # closed is checked as well as cancellation: wait_for can swallow a
+            # cancel that races with a send completing
+            while not self.closed:
+                if not self._queue:
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+                frame = self._queue.popleft()
+                await asyncio.wait_for(self.websocket.send_text(frame.text), timeout=send_timeout)
+                self.sent += 1
+                self.last_lag_seconds = time.monotonic() - frame.enqueued_at
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            self._broadcaster._close_slow(self, "Client stalled")
+        except Exception as e:
+            # Socket already gone; the route's receive loop unregisters it
+            logger.debug(f"WebSocket writer for {self.client_id} stopped: {e}")
+            self.closed = True
+
+    def cancel(self) -> None:
+        self.closed = True
+        self._ready.set()
+        if self._writer and not self._writer.done() and self._writer is not asyncio.current_task():
+            self._writer.cancel()
+
+    async def stop(self) -> None:
+        self.cancel()
+        if self._writer and self._writer is not asyncio.current_task():
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+
+    def get_stats(self) -> Dict[str, float]:
+        return {
+            "queue_depth": float(len(self._queue)),
+            "lag_ms": self.lag_seconds * 1000,
+            "sent": float(self.sent),
+            "dropped": float(self.dropped),
+            "coalesced": float(self.coalesced),
+        }
+
+
+class WebSocketBroadcaster:
+    """
+    Serializes each event once and fans it out to per-connection queues.
+
+    A broadcast costs one json.dumps plus one append per subscribed client,
+    whatever the clients' speed. All socket writes happen in the connections'
+    writer tasks.
+    """
+
+    def __init__(
+        self,
+        max_queue: int = DEFAULT_QUEUE_SIZE,
+        heartbeat_seconds: float = DEFAULT_HEARTBEAT_SECONDS,
+        send_timeout: float = DEFAULT_SEND_TIMEOUT_SECONDS,
+    ) -> None:
+        """
+        Initialize the broadcaster.
+
+        Args:
+            max_queue: Default per-connection queue size
+            heartbeat_seconds: Interval between heartbeats; 0 disables them
+            send_timeout: A send blocked for longer than this disconnects the client
+        """
+        self.max_queue = max_queue
+        self.heartbeat_seconds = heartbeat_seconds
+        self.send_timeout = send_timeout
+        self.connections: Dict[str, StreamConnection] = {}
+        self._heartbeat_task: Optional["asyncio.Task[None]"] = None
+        self._close_tasks: Set["asyncio.Task[None]"] = set()
+
+        # Statistics
+        self._events_broadcast = 0
+        self._frames_enqueued = 0
+        self._slow_disconnects = 0
+        self._retired_dropped = 0
+        self._retired_coalesced = 0
+
+    def register(
+        self,
+        client_id: str,
+        websocket: Any,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        max_queue: Optional[int] = None,
+        channels: Iterable[str] = ("messages",),
+        user_id: Optional[str] = None,
+        role: Optional[str] = None,
+        readable_channels: Iterable[str] = (),
+    ) -> StreamConnection:
+        """
+        Add a connection and start its writer task. Must be called from the event loop.
+
+        Args:
+            client_id: Unique client identifier
+            websocket: Accepted WebSocket
+            policy: Overflow policy chosen by the client
+            max_queue: Queue size for this client; the broadcaster default if None
+            channels: Initial subscriptions
+            user_id: Authenticated user behind the connection
+            role: The user's API role
+            readable_channels: Conversation channels whose events this client may receive
+
+        Returns:
+            The connection
+        """
+        previous = self.connections.pop(client_id, None)
+        if previous is not None:
+            self._retire(previous)
+            previous.cancel()
+        connection = StreamConnection(
+            client_id,
+            websocket,
+            self,
+            policy,
+            max_queue or self.max_queue,
+            channels,
+            user_id=user_id,
+            role=role,
+            readable_channels=readable_channels,
+        )
+        connection.start()
+        self.connections[client_id] = connection
+        self._ensure_heartbeat()
+        return connection
+
+    async def unregister(self, client_id: str) -> None:
+        """Remove a connection and stop its writer."""
+        connection = self.connections.pop(client_id, None)
+        if connection is not None:
+            self._retire(connection)
+            await connection.stop()
+        if not self.connections:
+            await self._stop_heartbeat()
+
+    def _retire(self, connection: StreamConnection) -> None:
+        """Keep the counters of a connection that is going away."""
+        self._retired_dropped += connection.dropped
+        self._retired_coalesced += connection.coalesced
+
+    def broadcast(
+        self,
+        event_type: str,
+        data: Any,
+        channel: str = "messages",
+        coalesce_key: Optional[str] = None,
+        channel_id: Optional[str] = None,
+    ) -> int:
+        """
+        Queue an event for every client subscribed to the channel.
+
+        Args:
+            event_type: Value of the frame's "type" field
+            data: JSON-serializable payload
+            channel: Subscription channel the event belongs to
+            coalesce_key: Frames with the same key replace each other for coalescing
+                clients, e.g. successive values of one metric; None never coalesces
+            channel_id: Conversation channel the event comes from; only clients
+                allowed to read that channel receive it
+
+        Returns:
+            Number of clients the event was queued for
+        """
+        subscribers = [
+            c
+            for c in self.connections.values()
+            if channel in c.channels and not c.closed and c.can_read(channel_id)
+        ]
+        if not subscribers:
+            return 0
+        text = json.dumps({"type": event_type, "channel": channel, "data": data, "timestamp": _now_iso()}, default=str)
+        frame = _Frame(text, coalesce_key or "", time.monotonic())
+        self._events_broadcast += 1
+        delivered = sum(1 for connection in subscribers if connection.enqueue(frame))
+        self._frames_enqueued += delivered
+        return delivered
+
+    def send_to(self, client_id: str, payload: Dict[str, Any], coalesce_key: Optional[str] = None) -> bool:
+        """
+        Queue a complete JSON frame for one client.
+
+        Args:
+            client_id: Target client
+            payload: JSON-serializable frame, sent as is
+            coalesce_key: See broadcast()
+
+        Returns:
+            False if the client is not connected
+        """
+        connection = self.connections.get(client_id)
+        return connection is not None and connection.send(payload, coalesce_key)
+
+    def _ensure_heartbeat(self) -> None:
+        if self.heartbeat_seconds > 0 and (self._heartbeat_task is None or self._heartbeat_task.done()):
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop(), name="ws-heartbeat")
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            text = json.dumps({"type": HEARTBEAT_KEY, "timestamp": _now_iso()})
+            frame = _Frame(text, HEARTBEAT_KEY, time.monotonic())
+            for connection in list(self.connections.values()):
+                connection.enqueue(frame)
+
+    def _close_slow(self, connection: StreamConnection, reason: str) -> None:
+        """Close a client that cannot keep up; its route handler then unregisters it."""
+        if connection.closed:
+            return
+        connection.closed = True
+        self._slow_disconnects += 1
+        logger.warning(f"Disconnecting slow WebSocket client {connection.client_id}: {reason}")
+
+        async def close() -> None:
+            await connection.stop()
+            try:
+                await connection.websocket.close(code=SLOW_CLIENT_CLOSE_CODE, reason=reason)
+            except Exception as e:
+                logger.debug(f"Error closing WebSocket {connection.client_id}: {e}")
+
+        task = asyncio.create_task(close())
+        self._close_tasks.add(task)
+        task.add_done_callback(self._close_tasks.discard)
+
+    async def _stop_heartbeat(self) -> None:
+        task, self._heartbeat_task = self._heartbeat_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def stop(self) -> None:
+        """Stop the heartbeat and every writer task."""
+        for client_id in list(self.connections):
+            await self.unregister(client_id)
+        await self._stop_heartbeat()
+
+    def get_client_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-client queue depth, lag and delivery counters."""
+        return {client_id: connection.get_stats() for client_id, connection in self.connections.items()}
+
+    def get_metrics(self) -> Dict[str, float]:
+        """
+        Get broadcaster metrics.
+
+        Returns:
+            Metrics dictionary
+        """
+        connections = list(self.connections.values())
+        return {
+            "websocket_clients": float(len(connections)),
+            "websocket_events_broadcast": float(self._events_broadcast),
+            "websocket_frames_enqueued": float(self._frames_enqueued),
+            "websocket_frames_dropped": float(self._retired_dropped + sum(c.dropped for c in connections)),
+            "websocket_frames_coalesced": float(self._retired_coalesced + sum(c.coalesced for c in connections)),
+            "websocket_slow_disconnects": float(self._slow_disconnects),
+            "websocket_max_queue_depth": float(max((c.queue_depth for c in connections), default=0)),
+            "websocket_max_client_lag_ms": max((c.lag_seconds for c in connections), default=0.0) * 1000,
+        }
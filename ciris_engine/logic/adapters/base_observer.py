@@ -125,11 +125,11 @@ class BaseObserver(Generic[MessageT], ABC):
     async def _get_correlation_history(
         self, channel_id: str, limit: int = PASSIVE_CONTEXT_LIMIT
     ) -> List[Dict[str, Any]]:
-        """Get message history from correlations database."""
-        from ciris_engine.logic.persistence import get_correlations_by_channel
+        """Get message history from correlations, including replies not yet persisted."""
+        from ciris_engine.logic.adapters.side_effects import get_channel_correlations
 
         try:
-            correlations = get_correlations_by_channel(channel_id=channel_id, limit=limit)
+            correlations = get_channel_correlations(channel_id=channel_id, limit=limit)
 
             history = []
             for corr in correlations:
@@ -283,6 +283,8 @@ class DiscordPlatform(Service):
             secrets_service=secrets_service,
             communication_service=self.discord_adapter,
             time_service=time_service,
+            vision_cache_path=self.config.vision_cache_path,
+            vision_describer=self.config.vision_describer,
         )
 
         # Secrets tools are now registered globally by SecretsToolService
@@ -609,6 +611,7 @@ class DiscordPlatform(Service):
         if hasattr(self.discord_observer, "stop"):
             if self.discord_observer:
                 self.discord_observer.stop()
+                await self.discord_observer.close()
         if hasattr(self.tool_service, "stop"):
             self.tool_service.stop()
         if hasattr(self.discord_adapter, "stop"):
@@ -1,6 +1,6 @@
 """Configuration schema for Discord adapter."""
 
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -49,6 +49,13 @@ class DiscordAdapterConfig(BaseModel):
     enable_guild_messages: bool = Field(default=True, description="Enable guild messages intent")
     enable_dm_messages: bool = Field(default=True, description="Enable DM messages intent")
 
+    vision_cache_path: Optional[str] = Field(
+        default=None, description="JSON file image descriptions are cached in across restarts"
+    )
+    vision_describer: Optional[Callable[[bytes, str], Awaitable[str]]] = Field(
+        default=None, exclude=True, description="Describes image bytes instead of the OpenAI Vision API"
+    )
+
     def get_intents(self) -> Any:
         """Get Discord intents based on configuration."""
         import discord
@@ -154,6 +161,10 @@ class DiscordAdapterConfig(BaseModel):
         if env_deferral:
             self.deferral_channel_id = env_deferral
 
+        env_vision_cache = get_env_var("DISCORD_VISION_CACHE_PATH")
+        if env_vision_cache:
+            self.vision_cache_path = env_vision_cache
+
         # User permissions
         env_admin = get_env_var("WA_USER_ID")
         if env_admin:
@@ -9,6 +9,7 @@ from discord.errors import ConnectionClosed, HTTPException
 
 from ciris_engine.logic import persistence
 from ciris_engine.logic.adapters.base import Service
+from ciris_engine.logic.adapters.side_effects import SideEffectPipeline
 from ciris_engine.protocols.services import CommunicationService, WiseAuthorityService
 from ciris_engine.schemas.adapters.discord import (
     DiscordApprovalData,
@@ -49,6 +50,7 @@ from .discord_embed_formatter import DiscordEmbedFormatter
 from .discord_error_handler import DiscordErrorHandler
 from .discord_guidance_handler import DiscordGuidanceHandler
 from .discord_message_handler import DiscordMessageHandler
+from .discord_outbound_queue import DiscordOutboundQueue, MessagePriority, bare_channel_id
 from .discord_rate_limiter import DiscordRateLimiter
 from .discord_reaction_handler import ApprovalRequest, ApprovalStatus, DiscordReactionHandler
 from .discord_tool_handler import DiscordToolHandler
@@ -101,19 +103,27 @@ class DiscordAdapter(Service, CommunicationService, WiseAuthorityService):
             self._time_service = TimeService()
 
         self._channel_manager = DiscordChannelManager(token, bot, on_message)
-        self._message_handler = DiscordMessageHandler(bot)
+        self._rate_limiter = DiscordRateLimiter()
+        self._message_handler = DiscordMessageHandler(bot, self._rate_limiter)
+        # Outgoing messages are scheduled per channel, guidance traffic first
+        self._outbound_queue = DiscordOutboundQueue(self._deliver_message)
         self._guidance_handler = DiscordGuidanceHandler(
-            bot, self._time_service, self.bus_manager.memory if self.bus_manager else None
+            bot,
+            self._time_service,
+            self.bus_manager.memory if self.bus_manager else None,
+            outbound_queue=self._outbound_queue,
+            rate_limiter=self._rate_limiter,
         )
         self._reaction_handler = DiscordReactionHandler(bot, self._time_service)
         self._audit_logger = DiscordAuditLogger(self._time_service)
         self._connection_manager = DiscordConnectionManager(token, bot, self._time_service)
         self._error_handler = DiscordErrorHandler()
-        self._rate_limiter = DiscordRateLimiter()
         self._embed_formatter = DiscordEmbedFormatter()
         self._tool_handler = DiscordToolHandler(None, bot, self._time_service)
         self._start_time: Optional[datetime] = None
         self._approval_timeout_task: Optional[asyncio.Task] = None
+        # Correlation, telemetry and audit writes happen after the message is delivered
+        self._side_effects = SideEffectPipeline("discord", self._time_service)
 
         # Set up connection callbacks
         self._setup_connection_callbacks()
@@ -124,12 +134,17 @@ class DiscordAdapter(Service, CommunicationService, WiseAuthorityService):
         *args: Any,
         operation_name: str,
         config_key: str = "discord_api",
+        rate_limit: bool = True,
         **kwargs: Any,
     ) -> Any:
-        """Wrapper for retry_with_backoff that handles Discord-specific configuration."""
+        """Wrapper for retry_with_backoff that handles Discord-specific configuration.
+
+        Pass rate_limit=False for operations that acquire their own Discord buckets.
+        """
         # Apply rate limiting before the operation
-        endpoint = kwargs.get("endpoint", operation_name)
-        await self._rate_limiter.acquire(endpoint)
+        if rate_limit:
+            endpoint = kwargs.get("endpoint", operation_name)
+            await self._rate_limiter.acquire(endpoint)
 
         try:
             # Get retry config from base class config (which is a dict)
@@ -214,20 +229,14 @@ class DiscordAdapter(Service, CommunicationService, WiseAuthorityService):
         start_time = time_service.now()
 
         try:
-            # The retry logic will handle connection issues and wait for reconnection
-            await self._retry_discord_operation(
-                self._message_handler.send_message_to_channel,
-                channel_id,
-                content,
-                operation_name="send_message",
-                config_key="discord_api",
-            )
+            # Waits for the channel's turn; delivery retries handle connection issues
+            await self._outbound_queue.send(channel_id, content, self._message_priority(channel_id))
 
             end_time = time_service.now()
             execution_time_ms = (end_time - start_time).total_seconds() * 1000
 
-            # result contains the return value from send_message_to_channel
-            persistence.add_correlation(
+            # The message is out; bookkeeping goes through the side-effect pipeline
+            await self._side_effects.record_correlation(
                 ServiceCorrelation(
                     correlation_id=correlation_id,
                     service_type="discord",
@@ -250,23 +259,26 @@ class DiscordAdapter(Service, CommunicationService, WiseAuthorityService):
                     created_at=start_time,
                     updated_at=end_time,
                     timestamp=start_time,
-                ),
-                time_service,
+                )
             )
 
             # Emit telemetry for message sent
-            await self._emit_telemetry(
-                "discord.message.sent",
-                1.0,
-                {"adapter_type": "discord", "channel_id": channel_id, "execution_time": str(execution_time_ms)},
+            await self._side_effects.run(
+                lambda: self._emit_telemetry(
+                    "discord.message.sent",
+                    1.0,
+                    {"adapter_type": "discord", "channel_id": channel_id, "execution_time": str(execution_time_ms)},
+                )
             )
 
             # Audit log the operation
-            await self._audit_logger.log_message_sent(
-                channel_id=channel_id,
-                author_id="discord_adapter",
-                message_content=content,
-                correlation_id=correlation_id,
+            await self._side_effects.run(
+                lambda: self._audit_logger.log_message_sent(
+                    channel_id=channel_id,
+                    author_id="discord_adapter",
+                    message_content=content,
+                    correlation_id=correlation_id,
+                )
             )
 
             return True
@@ -283,12 +295,36 @@ class DiscordAdapter(Service, CommunicationService, WiseAuthorityService):
             logger.error(f"Failed to send message via Discord (non-retryable): {error_info}")
             return False
 
+    async def _deliver_message(self, channel_id: str, content: str) -> None:
+        """Send content queued by the outbound queue."""
+        # The retry logic will handle connection issues and wait for reconnection
+        await self._retry_discord_operation(
+            self._message_handler.send_message_to_channel,
+            channel_id,
+            content,
+            self._message_priority(channel_id),
+            operation_name="send_message",
+            config_key="discord_api",
+            # The message handler acquires the channel's bucket for every chunk
+            rate_limit=False,
+        )
+
+    def _message_priority(self, channel_id: str) -> MessagePriority:
+        """Messages to the deferral channel are WA traffic and go before ordinary replies."""
+        deferral_channel_id = self.discord_config.deferral_channel_id
+        if deferral_channel_id and bare_channel_id(channel_id) == str(deferral_channel_id):
+            return MessagePriority.GUIDANCE
+        return MessagePriority.NORMAL
+
     async def fetch_messages(
         self, channel_id: str, *, limit: int = 50, before: Optional[datetime] = None
     ) -> List[DiscordMessageData]:
         """Implementation of CommunicationService.fetch_messages - fetches from correlations"""
         from ciris_engine.logic.persistence import get_correlations_by_channel
 
+        # Include messages whose correlations are still queued
+        await self._side_effects.flush()
+
         try:
             # Get correlations for this channel
             correlations = get_correlations_by_channel(channel_id=channel_id, limit=limit)
@@ -392,6 +428,8 @@ class DiscordAdapter(Service, CommunicationService, WiseAuthorityService):
                 context.model_dump(),
                 operation_name="fetch_guidance",
                 config_key="discord_api",
+                # The guidance handler acquires the buckets at guidance priority
+                rate_limit=False,
             )
             # guidance_result should be a dict from fetch_guidance_from_channel
             guidance = guidance_result if isinstance(guidance_result, dict) else {}
@@ -503,8 +541,8 @@ class DiscordAdapter(Service, CommunicationService, WiseAuthorityService):
                 logger.error(f"Could not resolve deferral channel {deferral_channel_id}")
                 return False
 
-            # Send embed message
-            sent_message = await channel.send(embed=embed)
+            # Send embed message ahead of queued replies
+            sent_message = await self._guidance_handler.send_guidance(str(deferral_channel_id), channel, embed=embed)
 
             # Create approval result container
             approval_result = None
@@ -974,18 +1012,23 @@ class DiscordAdapter(Service, CommunicationService, WiseAuthorityService):
             # Split the message if needed using the message handler's method
             chunks = self._message_handler._split_message(message_text, max_length=1900)
 
+            # WA traffic goes ahead of queued replies and is paced by the rate limiter
+            send_guidance = self._guidance_handler.send_guidance
+            channel_key = str(deferral_channel_id)
+
             # Send the first chunk with the embed
             if chunks:
-                sent_message = await channel.send(content=chunks[0], embed=embed)
+                sent_message = await send_guidance(channel_key, channel, content=chunks[0], embed=embed)
 
                 # Send additional chunks if any (without embed)
                 for i in range(1, len(chunks)):
                     continuation = f"*(Continued from deferral {correlation_id})*\n\n{chunks[i]}"
-                    await channel.send(content=continuation)
-                    await asyncio.sleep(0.5)  # Small delay between messages
+                    await send_guidance(channel_key, channel, content=continuation)
             else:
                 # Fallback if no chunks
-                sent_message = await channel.send(content="**DEFERRAL REQUEST** (content too long)", embed=embed)
+                sent_message = await send_guidance(
+                    channel_key, channel, content="**DEFERRAL REQUEST** (content too long)", embed=embed
+                )
 
             # Add reaction UI for WAs to respond
             await sent_message.add_reaction("✅")  # Approve
@@ -1142,7 +1185,7 @@ class DiscordAdapter(Service, CommunicationService, WiseAuthorityService):
                 if self._start_time and self._time_service
                 else 0.0
             ),
-            metrics={"latency": latency_ms},
+            metrics={"latency": latency_ms, **self._outbound_queue.get_stats()},
         )
 
     async def _send_output(self, channel_id: str, content: str) -> None:
@@ -1275,6 +1318,10 @@ class DiscordAdapter(Service, CommunicationService, WiseAuthorityService):
 
             self._tool_handler.clear_tool_results()
 
+            # Let queued messages go out, then persist their bookkeeping
+            await self._outbound_queue.drain()
+            await self._side_effects.stop()
+
             # Disconnect gracefully
             await self._connection_manager.disconnect()
 
@@ -6,10 +6,15 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 import discord
 from discord import ui
 
+from .discord_outbound_queue import MessagePriority
+
 if TYPE_CHECKING:
     from ciris_engine.protocols.services.graph.memory import MemoryServiceProtocol
     from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
 
+    from .discord_outbound_queue import DiscordOutboundQueue
+    from .discord_rate_limiter import DiscordRateLimiter
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +26,8 @@ class DiscordGuidanceHandler:
         client: Optional[discord.Client] = None,
         time_service: Optional["TimeServiceProtocol"] = None,
         memory_service: Optional["MemoryServiceProtocol"] = None,
+        outbound_queue: Optional["DiscordOutboundQueue"] = None,
+        rate_limiter: Optional["DiscordRateLimiter"] = None,
     ) -> None:
         """Initialize the guidance handler.
 
@@ -28,9 +35,13 @@ class DiscordGuidanceHandler:
             client: Discord client instance
             time_service: Time service for consistent time operations
             memory_service: Memory service for WA lookups
+            outbound_queue: Schedules WA sends ahead of queued replies; without it they go out directly
+            rate_limiter: Paces WA sends at guidance priority
         """
         self.client = client
         self._memory_service = memory_service
+        self._outbound_queue = outbound_queue
+        self._rate_limiter = rate_limiter
         self._wa_cache: Dict[str, bool] = {}  # Cache WA status
         self._time_service: TimeServiceProtocol
 
@@ -50,6 +61,32 @@ class DiscordGuidanceHandler:
         """
         self.client = client
 
+    async def send_guidance(self, channel_id: str, channel: Any, *args: Any, **kwargs: Any) -> Any:
+        """Send Wise Authority traffic to a channel at guidance priority.
+
+        The send takes its turn in the channel's outbound queue ahead of ordinary
+        replies and waits on the shared rate limits ahead of them.
+
+        Args:
+            channel_id: Channel the message goes to
+            channel: Resolved Discord channel
+            *args: Passed to channel.send
+            **kwargs: Passed to channel.send
+
+        Returns:
+            The sent Discord message
+        """
+
+        async def send() -> Any:
+            if self._rate_limiter:
+                endpoint = f"channels/{getattr(channel, 'id', channel_id)}/messages"
+                await self._rate_limiter.acquire(endpoint, "POST", MessagePriority.GUIDANCE)
+            return await channel.send(*args, **kwargs)
+
+        if self._outbound_queue:
+            return await self._outbound_queue.submit(str(channel_id), send, MessagePriority.GUIDANCE)
+        return await send()
+
     def set_memory_service(self, memory_service: "MemoryServiceProtocol") -> None:
         """Set the memory service after initialization.
 
@@ -153,7 +190,7 @@ class DiscordGuidanceHandler:
         for i, chunk in enumerate(chunks):
             if len(chunks) > 1 and i > 0:
                 chunk = f"*(Continued from previous message)*\n\n{chunk}"
-            sent_msg = await channel.send(chunk)
+            sent_msg = await self.send_guidance(deferral_channel_id, channel, chunk)
             if i == 0:
                 request_message = sent_msg  # Track first message for replies
 
@@ -244,7 +281,7 @@ class DiscordGuidanceHandler:
         view = DeferralHelperView(thought_id, context)
 
         # Send embed with view
-        await channel.send(embed=embed, view=view)
+        await self.send_guidance(deferral_channel_id, channel, embed=embed, view=view)
 
     def _build_deferral_report(self, thought_id: str, reason: str, context: Optional[dict] = None) -> str:
         """Build a formatted deferral report.
@@ -2,25 +2,35 @@
 
 import asyncio
 import logging
-from typing import Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
 import discord
 
 from ciris_engine.schemas.runtime.messages import DiscordMessage, FetchedMessage
 
+from .discord_outbound_queue import MessagePriority
+
+if TYPE_CHECKING:
+    from .discord_rate_limiter import DiscordRateLimiter
+
 logger = logging.getLogger(__name__)
 
 
 class DiscordMessageHandler:
     """Handles Discord message operations including sending, fetching, and splitting."""
 
-    def __init__(self, client: Optional[discord.Client] = None) -> None:
+    def __init__(
+        self, client: Optional[discord.Client] = None, rate_limiter: Optional["DiscordRateLimiter"] = None
+    ) -> None:
         """Initialize the message handler.
 
         Args:
             client: Discord client instance
+            rate_limiter: Paces chunk sends by the channel's message bucket; without it
+                chunks are spaced by a fixed delay
         """
         self.client = client
+        self.rate_limiter = rate_limiter
 
     def set_client(self, client: discord.Client) -> None:
         """Set the Discord client after initialization.
@@ -30,12 +40,15 @@ class DiscordMessageHandler:
         """
         self.client = client
 
-    async def send_message_to_channel(self, channel_id: str, content: str) -> None:
+    async def send_message_to_channel(
+        self, channel_id: str, content: str, priority: MessagePriority = MessagePriority.NORMAL
+    ) -> None:
         """Send a message to a Discord channel, splitting if necessary.
 
         Args:
             channel_id: The Discord channel ID
             content: Message content to send
+            priority: Order among sends waiting on the global rate limit
 
         Raises:
             RuntimeError: If client is not initialized or channel not found
@@ -55,6 +68,7 @@ class DiscordMessageHandler:
             raise ValueError(f"Discord channel {channel_id} not found")
 
         chunks = self._split_message(content)
+        endpoint = f"channels/{getattr(channel, 'id', channel_id)}/messages"
 
         for i, chunk in enumerate(chunks):
             if len(chunks) > 1:
@@ -65,11 +79,20 @@ class DiscordMessageHandler:
                 else:
                     chunk = f"*(Continued from previous message)*\n\n{chunk}"
 
-            await channel.send(chunk)
-
-            if i < len(chunks) - 1:
+            if self.rate_limiter:
+                # Chunks go out back to back while the channel bucket has room
+                await self.rate_limiter.acquire(endpoint, "POST", priority)
+            elif i > 0:
                 await asyncio.sleep(0.5)
 
+            try:
+                await channel.send(chunk)
+            except discord.HTTPException as e:
+                response = getattr(e, "response", None)
+                if self.rate_limiter and e.status == 429 and response is not None:
+                    self.rate_limiter.update_from_response(endpoint, dict(getattr(response, "headers", {}) or {}))
+                raise
+
     async def fetch_messages_from_channel(self, channel_id: str, limit: int) -> List[FetchedMessage]:
         """Fetch messages from a Discord channel.
 
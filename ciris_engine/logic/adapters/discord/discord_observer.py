@@ -3,7 +3,7 @@ import logging
 from typing import Any, List, Optional
 
 from ciris_engine.logic.adapters.base_observer import BaseObserver
-from ciris_engine.logic.adapters.discord.discord_vision_helper import DiscordVisionHelper
+from ciris_engine.logic.adapters.discord.discord_vision_helper import DiscordVisionHelper, ImageDescriber
 from ciris_engine.logic.buses import BusManager
 from ciris_engine.logic.secrets.service import SecretsService
 from ciris_engine.schemas.runtime.messages import DiscordMessage
@@ -33,6 +33,8 @@ class DiscordObserver(BaseObserver[DiscordMessage]):
         secrets_service: Optional[SecretsService] = None,
         communication_service: Optional[Any] = None,
         time_service: Optional[Any] = None,
+        vision_cache_path: Optional[str] = None,
+        vision_describer: Optional[ImageDescriber] = None,
     ) -> None:
         super().__init__(
             on_observe=lambda _: asyncio.sleep(0),
@@ -58,7 +60,7 @@ class DiscordObserver(BaseObserver[DiscordMessage]):
         logger.info(f"  - WA user IDs: {self.wa_user_ids}")
 
         # Initialize vision helper
-        self._vision_helper = DiscordVisionHelper()
+        self._vision_helper = DiscordVisionHelper(describer=vision_describer, cache_path=vision_cache_path)
         if self._vision_helper.is_available():
             logger.info("Discord Vision Helper initialized - image processing enabled")
         else:
@@ -88,6 +90,10 @@ class DiscordObserver(BaseObserver[DiscordMessage]):
         """Stop the observer - no background tasks to clean up."""
         logger.info("DiscordObserver stopped")
 
+    async def close(self) -> None:
+        """Release the vision helper's HTTP session."""
+        await self._vision_helper.close()
+
     def _extract_channel_id(self, full_channel_id: str) -> str:
         """Extract the raw channel ID from discord_guildid_channelid format."""
         if full_channel_id.startswith("discord_") and full_channel_id.count("_") == 2:
@@ -128,13 +134,12 @@ class DiscordObserver(BaseObserver[DiscordMessage]):
         # Process any images in the message if vision is available
         if self._vision_helper.is_available() and hasattr(msg, "raw_message") and msg.raw_message:
             try:
-                # Process attachments
-                image_descriptions = await self._vision_helper.process_message_images(msg.raw_message)
-
-                # Process embeds if any
-                embed_descriptions = None
-                if hasattr(msg.raw_message, "embeds") and msg.raw_message.embeds:
-                    embed_descriptions = await self._vision_helper.process_embeds(msg.raw_message.embeds)
+                # Process attachments and embeds together
+                embeds = getattr(msg.raw_message, "embeds", None) or []
+                image_descriptions, embed_descriptions = await asyncio.gather(
+                    self._vision_helper.process_message_images(msg.raw_message),
+                    self._vision_helper.process_embeds(embeds),
+                )
 
                 # Append descriptions to the message content
                 if image_descriptions or embed_descriptions:
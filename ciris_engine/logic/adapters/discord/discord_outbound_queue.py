@@ -0,0 +1,255 @@
+"""Discord outbound message scheduling component."""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class MessagePriority(IntEnum):
+    """Send order within a channel; lower values go first."""
+
+    GUIDANCE = 0  # Wise Authority deferral and guidance traffic
+    NORMAL = 1  # Ordinary SPEAK replies
+
+
+def bare_channel_id(channel_id: str) -> str:
+    """Discord channel id without the 'discord_' or 'discord_<guild>_' prefix."""
+    return channel_id.rsplit("_", 1)[-1]
+
+
+class _OutboundMessage:
+    """A queued message and the future its sender is waiting on."""
+
+    __slots__ = ("channel_id", "content", "priority", "enqueued_at", "future", "operation")
+
+    def __init__(
+        self,
+        channel_id: str,
+        content: str,
+        priority: MessagePriority,
+        future: "asyncio.Future[Any]",
+        operation: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> None:
+        # Delivered to the channel id the sender used; the queue itself is keyed by the bare id
+        self.channel_id = channel_id
+        self.content = content
+        self.priority = priority
+        self.enqueued_at = time.monotonic()
+        self.future = future
+        # Sends that are more than text (embeds, views) bring their own delivery
+        self.operation = operation
+
+
+class DiscordOutboundQueue:
+    """Per-channel outbound scheduler.
+
+    Each channel has a priority queue drained by its own worker, so channels never
+    wait on each other and guidance traffic overtakes queued replies in the same
+    channel. Ordinary replies that pile up behind a send are coalesced into one
+    Discord message when they fit. Senders wait until their message went out and
+    see the delivery error, if any. submit() queues a whole send operation, such
+    as an embed with reaction buttons, that takes its turn like a message.
+    """
+
+    COALESCE_SEPARATOR = "\n\n"
+
+    def __init__(
+        self,
+        send: Callable[[str, str], Awaitable[None]],
+        max_length: int = 1950,
+        max_coalesce: int = 10,
+    ):
+        """Initialize the outbound queue.
+
+        Args:
+            send: Delivers content to a channel, raising on failure
+            max_length: Longest coalesced message; matches the message handler's chunk size
+            max_coalesce: Maximum number of queued messages combined into one send
+        """
+        self._send = send
+        self.max_length = max_length
+        self.max_coalesce = max(1, max_coalesce)
+        self._queues: Dict[str, List[Tuple[int, int, _OutboundMessage]]] = {}
+        self._workers: Dict[str, "asyncio.Task[None]"] = {}
+        self._sequence = itertools.count()
+
+        # Statistics
+        self._stats = {
+            "enqueued": 0,
+            "sent": 0,
+            "failed": 0,
+            "coalesced": 0,
+            "max_depth": 0,
+            "total_queue_ms": 0.0,
+            "max_queue_ms": 0.0,
+        }
+
+    async def send(self, channel_id: str, content: str, priority: MessagePriority = MessagePriority.NORMAL) -> None:
+        """Queue a message and wait until it has been delivered.
+
+        Args:
+            channel_id: Channel to send to
+            content: Message content
+            priority: Send order within the channel
+
+        Raises:
+            Whatever the delivery raised for this message
+        """
+        await self._enqueue(channel_id, _OutboundMessage(channel_id, content, priority, self._new_future()))
+
+    async def submit(
+        self,
+        channel_id: str,
+        operation: Callable[[], Awaitable[Any]],
+        priority: MessagePriority = MessagePriority.GUIDANCE,
+    ) -> Any:
+        """Queue a send operation and wait for its result.
+
+        The operation runs in the channel's turn and is never coalesced.
+
+        Args:
+            channel_id: Channel the operation sends to
+            operation: Performs the send, e.g. an embed plus a view
+            priority: Send order within the channel
+
+        Returns:
+            Whatever the operation returned, usually the sent message
+        """
+        message = _OutboundMessage(channel_id, "", priority, self._new_future(), operation)
+        return await self._enqueue(channel_id, message)
+
+    @staticmethod
+    def _new_future() -> "asyncio.Future[Any]":
+        return asyncio.get_running_loop().create_future()
+
+    async def _enqueue(self, channel_id: str, message: _OutboundMessage) -> Any:
+        # 'discord_<guild>_<channel>', 'discord_<channel>' and the bare id share one queue
+        channel_id = bare_channel_id(channel_id)
+        priority = message.priority
+        future = message.future
+        queue = self._queues.setdefault(channel_id, [])
+        heapq.heappush(queue, (int(priority), next(self._sequence), message))
+        self._stats["enqueued"] += 1
+        self._stats["max_depth"] = max(self._stats["max_depth"], self.depth())
+
+        worker = self._workers.get(channel_id)
+        if worker is None or worker.done():
+            self._workers[channel_id] = asyncio.create_task(
+                self._drain(channel_id, queue), name=f"discord-outbound:{channel_id}"
+            )
+
+        # A cancelled sender cancels the future, and the worker drops the message
+        return await future
+
+    async def _drain(self, channel_id: str, queue: List[Tuple[int, int, _OutboundMessage]]) -> None:
+        """Send everything queued for a channel, then exit."""
+        try:
+            while queue:
+                batch = self._next_batch(queue)
+                if not batch:
+                    continue
+
+                now = time.monotonic()
+                for message in batch:
+                    queue_ms = (now - message.enqueued_at) * 1000
+                    self._stats["total_queue_ms"] += queue_ms
+                    self._stats["max_queue_ms"] = max(self._stats["max_queue_ms"], queue_ms)
+                if len(batch) > 1:
+                    self._stats["coalesced"] += len(batch) - 1
+                    logger.debug(f"Coalesced {len(batch)} queued messages for channel {channel_id}")
+
+                result = None
+                try:
+                    if batch[0].operation is not None:
+                        result = await batch[0].operation()
+                    else:
+                        content = self.COALESCE_SEPARATOR.join(m.content for m in batch)
+                        await self._send(batch[0].channel_id, content)
+                except Exception as e:
+                    self._stats["failed"] += len(batch)
+                    for message in batch:
+                        if not message.future.done():
+                            message.future.set_exception(e)
+                except BaseException:
+                    # The worker is being cancelled; its senders must not wait forever
+                    self._stats["failed"] += len(batch)
+                    for message in batch:
+                        message.future.cancel()
+                    raise
+                else:
+                    self._stats["sent"] += len(batch)
+                    for message in batch:
+                        if not message.future.done():
+                            message.future.set_result(result)
+        finally:
+            # Messages still queued behind a cancelled worker are cancelled too
+            while queue:
+                _, _, message = heapq.heappop(queue)
+                message.future.cancel()
+            # A send() that arrives later starts a new worker
+            if self._queues.get(channel_id) is queue and not queue:
+                del self._queues[channel_id]
+            if self._workers.get(channel_id) is asyncio.current_task():
+                del self._workers[channel_id]
+
+    def _next_batch(self, queue: List[Tuple[int, int, _OutboundMessage]]) -> List[_OutboundMessage]:
+        """Pop the next message, plus following replies that fit into the same send."""
+        _, _, first = heapq.heappop(queue)
+        if first.future.done():
+            return []
+
+        batch = [first]
+        if first.priority != MessagePriority.NORMAL or first.operation is not None:
+            # Guidance, deferral and operation sends stay separate so each can be reacted to
+            return batch
+
+        length = len(first.content)
+        while queue and len(batch) < self.max_coalesce:
+            priority, _, candidate = queue[0]
+            if priority != first.priority:
+                break
+            if candidate.future.done():
+                heapq.heappop(queue)
+                continue
+            if candidate.operation is not None:
+                break
+            length += len(self.COALESCE_SEPARATOR) + len(candidate.content)
+            if length > self.max_length:
+                break
+            heapq.heappop(queue)
+            batch.append(candidate)
+        return batch
+
+    def depth(self) -> int:
+        """Number of messages waiting to be sent across all channels."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    async def drain(self) -> None:
+        """Wait until every queued message has been sent or failed."""
+        while self._workers:
+            await asyncio.gather(*list(self._workers.values()), return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get outbound queue statistics.
+
+        Returns:
+            Statistics dictionary
+        """
+        dequeued = self._stats["sent"] + self._stats["failed"]
+        return {
+            "outbound_queue_depth": float(self.depth()),
+            "outbound_queue_max_depth": float(self._stats["max_depth"]),
+            "outbound_channels_active": float(len(self._workers)),
+            "outbound_messages_enqueued": float(self._stats["enqueued"]),
+            "outbound_messages_sent": float(self._stats["sent"]),
+            "outbound_messages_failed": float(self._stats["failed"]),
+            "outbound_messages_coalesced": float(self._stats["coalesced"]),
+            "outbound_avg_queue_ms": self._stats["total_queue_ms"] / dequeued if dequeued else 0.0,
+            "outbound_max_queue_ms": float(self._stats["max_queue_ms"]),
+        }
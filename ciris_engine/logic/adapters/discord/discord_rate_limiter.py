@@ -1,10 +1,15 @@
 """Discord rate limiting component."""
 
 import asyncio
+import heapq
+import itertools
 import logging
+import re
 import time
 from collections import defaultdict
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .discord_outbound_queue import MessagePriority
 
 logger = logging.getLogger(__name__)
 
@@ -32,35 +37,51 @@ class RateLimitBucket:
             Wait time in seconds (0 if can proceed immediately)
         """
         async with self._lock:
-            now = time.time()
+            return self.try_acquire()
+
+    def try_acquire(self) -> float:
+        """Take a request slot if one is free.
+
+        Returns:
+            Wait time in seconds until a slot frees up (0 if a slot was taken)
+        """
+        now = time.time()
 
-            # Reset if window expired
-            if now >= self.reset_at:
-                self.remaining = self.limit
-                self.reset_at = now + self.window
+        # Reset if window expired
+        if now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = now + self.window
 
-            # Check if we can proceed
-            if self.remaining > 0:
-                self.remaining -= 1
-                return 0.0
+        # Check if we can proceed
+        if self.remaining > 0:
+            self.remaining -= 1
+            return 0.0
 
-            # Need to wait
-            wait_time = self.reset_at - now
-            return wait_time
+        # Need to wait
+        return self.reset_at - now
 
-    def update_from_headers(self, remaining: int, reset_at: float) -> None:
+    def update_from_headers(self, remaining: int, reset_at: float, limit: Optional[int] = None) -> None:
         """Update bucket from Discord rate limit headers.
 
         Args:
             remaining: Remaining requests from header
             reset_at: Reset timestamp from header
+            limit: Bucket size from header, if sent
         """
         self.remaining = remaining
         self.reset_at = reset_at
+        if limit is not None and limit > 0:
+            self.limit = limit
 
 
 class DiscordRateLimiter:
-    """Manages rate limiting for Discord API calls."""
+    """Manages rate limiting for Discord API calls.
+
+    Endpoint buckets are per channel, so ordering within a channel is left to
+    the outbound queue. The global bucket is shared by every channel: while it
+    is exhausted, waiters are let through by priority, then in arrival order,
+    so guidance traffic overtakes ordinary replies queued in other channels.
+    """
 
     # Discord's global rate limit
     GLOBAL_LIMIT = 50
@@ -84,6 +105,9 @@ class DiscordRateLimiter:
         "webhooks/{webhook_id}/{webhook_token}": {"limit": 30, "window": 60.0},
     }
 
+    # Buckets are per route and major parameter
+    _MAJOR_PARAMETER = re.compile(r"^/?(?:channels|guilds|webhooks)/(\d+)")
+
     def __init__(self, safety_margin: float = 0.1):
         """Initialize rate limiter.
 
@@ -94,36 +118,72 @@ class DiscordRateLimiter:
         self._global_bucket = RateLimitBucket(self.GLOBAL_LIMIT, self.GLOBAL_WINDOW)
         self._endpoint_buckets: Dict[str, RateLimitBucket] = {}
         self._bucket_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._global_waiters: List[Tuple[int, int, "asyncio.Future[None]"]] = []
+        self._global_sequence = itertools.count()
+        self._global_dispatcher: Optional[asyncio.Task] = None
 
         # Statistics
         self._stats = {"requests": 0, "rate_limited": 0, "total_wait_time": 0.0, "max_wait_time": 0.0}
 
-    async def acquire(self, endpoint: str, method: str = "GET") -> None:
+    async def acquire(
+        self, endpoint: str, method: str = "GET", priority: MessagePriority = MessagePriority.NORMAL
+    ) -> None:
         """Wait if necessary before making an API call.
 
         Args:
             endpoint: API endpoint path
             method: HTTP method
+            priority: Order among callers waiting on the global bucket
         """
         self._stats["requests"] += 1
 
         # Normalize endpoint for bucket lookup
-        bucket_key = self._normalize_endpoint(endpoint)
+        route = self._normalize_endpoint(endpoint)
+        bucket_key = self._bucket_key(endpoint, route)
 
         # Check global rate limit
-        global_wait = await self._global_bucket.acquire()
-        if global_wait > 0:
-            wait_time = global_wait * (1 + self.safety_margin)
-            await self._wait_and_log(wait_time, "global", endpoint)
+        await self._acquire_global(priority, endpoint)
 
         # Check endpoint-specific rate limit
-        if bucket_key in self.ENDPOINT_LIMITS:
-            bucket = await self._get_or_create_bucket(bucket_key)
+        if route in self.ENDPOINT_LIMITS or bucket_key in self._endpoint_buckets:
+            bucket = await self._get_or_create_bucket(bucket_key, route)
             endpoint_wait = await bucket.acquire()
             if endpoint_wait > 0:
                 wait_time = endpoint_wait * (1 + self.safety_margin)
                 await self._wait_and_log(wait_time, bucket_key, endpoint)
 
+    async def _acquire_global(self, priority: MessagePriority, endpoint: str) -> None:
+        """Take a global slot, queueing by priority while the bucket is exhausted."""
+        if not self._global_waiters and self._global_bucket.try_acquire() == 0.0:
+            return
+
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._global_waiters, (int(priority), next(self._global_sequence), future))
+        if self._global_dispatcher is None or self._global_dispatcher.done():
+            self._global_dispatcher = asyncio.create_task(self._serve_global_waiters())
+
+        started = time.monotonic()
+        # A cancelled caller cancels the future, and the dispatcher skips it
+        await future
+        waited = time.monotonic() - started
+        logger.info(f"Rate limit (global) - waited {waited:.2f}s for {endpoint}")
+        self._record_wait(waited)
+
+    async def _serve_global_waiters(self) -> None:
+        """Hand out global slots to waiters as the bucket refills, best priority first."""
+        while self._global_waiters:
+            future = self._global_waiters[0][2]
+            if future.done():
+                heapq.heappop(self._global_waiters)
+                continue
+            wait = self._global_bucket.try_acquire()
+            if wait > 0:
+                # Waiters that arrive meanwhile are ranked before the next slot is given out
+                await asyncio.sleep(wait * (1 + self.safety_margin))
+                continue
+            heapq.heappop(self._global_waiters)
+            future.set_result(None)
+
     def update_from_response(self, endpoint: str, headers: Dict[str, str]) -> None:
         """Update rate limits from Discord response headers.
 
@@ -134,17 +194,27 @@ class DiscordRateLimiter:
         # Check for rate limit headers
         remaining_str = headers.get("X-RateLimit-Remaining")
         reset_at_str = headers.get("X-RateLimit-Reset")
-        headers.get("X-RateLimit-Bucket")
+        reset_after_str = headers.get("X-RateLimit-Reset-After")
+        limit_str = headers.get("X-RateLimit-Limit")
 
-        if remaining_str is not None and reset_at_str is not None:
+        if remaining_str is not None and (reset_at_str is not None or reset_after_str is not None):
             try:
                 remaining = int(remaining_str)
-                reset_at = float(reset_at_str)
-
-                # Update the appropriate bucket
-                bucket_key = self._normalize_endpoint(endpoint)
-                if bucket_key in self._endpoint_buckets:
-                    self._endpoint_buckets[bucket_key].update_from_headers(remaining, reset_at)
+                # Reset-After is relative, so it is immune to clock skew with Discord
+                if reset_after_str is not None:
+                    reset_at = time.time() + float(reset_after_str)
+                else:
+                    reset_at = float(str(reset_at_str))
+                limit = int(limit_str) if limit_str is not None else None
+
+                # Update the appropriate bucket, learning buckets Discord reports but we had no limits for
+                route = self._normalize_endpoint(endpoint)
+                bucket_key = self._bucket_key(endpoint, route)
+                bucket = self._endpoint_buckets.get(bucket_key)
+                if bucket is None:
+                    bucket = RateLimitBucket(limit or remaining or 1, max(reset_at - time.time(), 0.0))
+                    self._endpoint_buckets[bucket_key] = bucket
+                bucket.update_from_headers(remaining, reset_at, limit)
 
             except (ValueError, TypeError) as e:
                 logger.debug(f"Failed to parse rate limit headers: {e}")
@@ -179,8 +249,6 @@ class DiscordRateLimiter:
             endpoint = endpoint[1:]
 
         # Replace IDs with placeholders
-        import re
-
         # Channel endpoints
         endpoint = re.sub(r"channels/\d+", "channels/{channel_id}", endpoint)
         endpoint = re.sub(r"messages/\d+", "messages/{message_id}", endpoint)
@@ -199,18 +267,35 @@ class DiscordRateLimiter:
 
         return endpoint
 
-    async def _get_or_create_bucket(self, bucket_key: str) -> RateLimitBucket:
+    def _bucket_key(self, endpoint: str, route: str) -> str:
+        """Key of the bucket an endpoint counts against.
+
+        Discord keeps separate buckets per major parameter (channel, guild or webhook),
+        so two channels never share a message bucket.
+
+        Args:
+            endpoint: Raw endpoint path
+            route: Normalized endpoint
+
+        Returns:
+            Bucket key
+        """
+        major = self._MAJOR_PARAMETER.match(endpoint)
+        return f"{route}:{major.group(1)}" if major else route
+
+    async def _get_or_create_bucket(self, bucket_key: str, route: Optional[str] = None) -> RateLimitBucket:
         """Get or create a rate limit bucket.
 
         Args:
-            bucket_key: Normalized endpoint key
+            bucket_key: Bucket key
+            route: Normalized endpoint whose limits apply, defaults to the bucket key
 
         Returns:
             Rate limit bucket
         """
         async with self._bucket_locks[bucket_key]:
             if bucket_key not in self._endpoint_buckets:
-                limits = self.ENDPOINT_LIMITS.get(bucket_key, {"limit": 5, "window": 60.0})
+                limits = self.ENDPOINT_LIMITS.get(route or bucket_key, {"limit": 5, "window": 60.0})
                 self._endpoint_buckets[bucket_key] = RateLimitBucket(int(limits["limit"]), limits["window"])
             return self._endpoint_buckets[bucket_key]
 
@@ -224,7 +309,10 @@ class DiscordRateLimiter:
         """
         logger.info(f"Rate limit ({bucket_type}) - waiting {wait_time:.2f}s for {endpoint}")
         await asyncio.sleep(wait_time)
+        self._record_wait(wait_time)
 
+    def _record_wait(self, wait_time: float) -> None:
+        """Add a rate limit delay to the statistics."""
         self._stats["total_wait_time"] += wait_time
         self._stats["max_wait_time"] = max(self._stats["max_wait_time"], wait_time)
 
@@ -1,32 +1,99 @@
 """Discord Vision Helper for processing images with GPT-4 Vision."""
 
+import asyncio
 import base64
+import hashlib
+import io
+import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import aiohttp
 import discord
 
+# Optional import for Pillow, used to downscale images before upload
+try:
+    from PIL import Image
+
+    PIL_AVAILABLE = True
+except ImportError:
+    Image = None  # type: ignore
+    PIL_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Describes raw image bytes of the given content type; replaces the vision API call (e.g. in tests)
+ImageDescriber = Callable[[bytes, str], Awaitable[str]]
+
+VISION_MAX_CONCURRENT = 4  # Images processed at once per helper
+VISION_CACHE_MAX_ENTRIES = 512
+VISION_MAX_DIMENSION = 1024  # Longest side sent to the API, in pixels
+VISION_REQUEST_TIMEOUT_SECONDS = 60.0
+
+
+class VisionAPIError(Exception):
+    """The vision API could not describe an image; the message is shown in place of a description."""
+
 
 class DiscordVisionHelper:
     """Helper class for processing Discord images with GPT-4 Vision."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        describer: Optional[ImageDescriber] = None,
+        max_concurrent: int = VISION_MAX_CONCURRENT,
+        cache_max_entries: int = VISION_CACHE_MAX_ENTRIES,
+        cache_path: Optional[str] = None,
+        max_dimension: int = VISION_MAX_DIMENSION,
+    ):
         """Initialize the vision helper.
 
         Args:
             api_key: OpenAI API key for Vision. If not provided, uses CIRIS_OPENAI_VISION_KEY env var.
+            describer: Replaces the OpenAI call, e.g. with a local stub. Makes the helper available
+                without an API key.
+            max_concurrent: Maximum number of images downloaded and described at once.
+            cache_max_entries: Number of descriptions kept, keyed by SHA-256 of the image bytes.
+            cache_path: Optional JSON file the description cache is loaded from and saved to.
+            max_dimension: Images whose longest side exceeds this are downscaled before upload.
         """
         self.api_key = api_key or os.environ.get("CIRIS_OPENAI_VISION_KEY")
-        if not self.api_key:
+        self._describer = describer
+        if not self.api_key and not describer:
             logger.warning("No OpenAI Vision API key found. Image processing will be disabled.")
 
         self.api_url = "https://api.openai.com/v1/chat/completions"
         self.model = "gpt-4o"  # Updated to current vision-capable model
         self.max_image_size = 20 * 1024 * 1024  # 20MB limit
+        self.max_dimension = max_dimension
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._max_concurrent = max(1, max_concurrent)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        # SHA-256 of image bytes -> description, least recently used first
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_max_entries = cache_max_entries
+        self._cache_path = Path(cache_path) if cache_path else None
+        # Saves run in worker threads; the lock and versions keep an older snapshot from overwriting a newer one
+        self._save_lock = threading.Lock()
+        self._cache_version = 0
+        self._saved_version = 0
+        self._load_cache()
+        self._in_flight: Dict[str, "asyncio.Future[str]"] = {}
+
+        # Metrics
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._api_calls = 0
+        self._bytes_downloaded = 0
+        self._bytes_uploaded = 0
 
     async def process_message_images(self, message: discord.Message) -> Optional[str]:
         """Process all images in a Discord message and return descriptions.
@@ -37,7 +104,7 @@ class DiscordVisionHelper:
         Returns:
             Combined description of all images, or None if no images
         """
-        if not self.api_key:
+        if not self.is_available():
             return None
 
         if not message.attachments:
@@ -51,16 +118,18 @@ class DiscordVisionHelper:
         if not image_attachments:
             return None
 
-        descriptions = []
-
-        for attachment in image_attachments:
+        async def describe(attachment: discord.Attachment) -> Optional[str]:
             try:
                 description = await self._process_single_image(attachment)
                 if description:
-                    descriptions.append(f"Image '{attachment.filename}': {description}")
+                    return f"Image '{attachment.filename}': {description}"
             except Exception as e:
                 logger.error(f"Failed to process image {attachment.filename}: {e}")
-                descriptions.append(f"Image '{attachment.filename}': [Failed to process - {str(e)}]")
+                return f"Image '{attachment.filename}': [Failed to process - {str(e)}]"
+            return None
+
+        results = await asyncio.gather(*(describe(att) for att in image_attachments))
+        descriptions = [d for d in results if d]
 
         if descriptions:
             return "\n\n".join(descriptions)
@@ -80,62 +149,211 @@ class DiscordVisionHelper:
         if attachment.size > self.max_image_size:
             return f"Image too large ({attachment.size / 1024 / 1024:.1f}MB, max {self.max_image_size / 1024 / 1024}MB)"
 
-        try:
-            # Download the image
-            async with aiohttp.ClientSession() as session:
-                async with session.get(attachment.url) as response:
-                    if response.status != 200:
-                        return f"Failed to download image (HTTP {response.status})"
-
-                    image_data = await response.read()
-                    base64_image = base64.b64encode(image_data).decode("utf-8")
-
-            # Prepare the API request
-            headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
-
-            payload = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are a helpful assistant that describes images clearly and concisely. Focus on the main subjects, actions, text, and any notable details.",
-                    },
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": "Please describe this image in detail. If there is any text in the image, transcribe it exactly.",
-                            },
-                            {
-                                "type": "image_url",
-                                "image_url": {"url": f"data:{attachment.content_type};base64,{base64_image}"},
-                            },
-                        ],
-                    },
-                ],
-                "max_tokens": 500,
-            }
-
-            # Call GPT-4 Vision API
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.api_url, headers=headers, json=payload) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"OpenAI API error: {response.status} - {error_text}")
-                        return f"API error: {response.status}"
-
-                    result = await response.json()
-
-                    if "choices" in result and result["choices"]:
-                        content: str = result["choices"][0]["message"]["content"]
-                        return content
-                    else:
-                        return "No description generated"
+        async with self._get_semaphore():
+            try:
+                image_data = await self._download_image(attachment.url)
+                if len(image_data) > self.max_image_size:
+                    # URL images have no size until downloaded
+                    size_mb = len(image_data) / 1024 / 1024
+                    return f"Image too large ({size_mb:.1f}MB, max {self.max_image_size / 1024 / 1024}MB)"
+
+                # Reposted or re-fetched images are described once
+                digest = hashlib.sha256(image_data).hexdigest()
+                cached = self._cache_get(digest)
+                if cached is not None:
+                    self._cache_hits += 1
+                    return cached
+                pending = self._in_flight.get(digest)
+                if pending is not None:
+                    # The same image is already being described, e.g. attached twice
+                    self._cache_hits += 1
+                    return await asyncio.shield(pending)
+                self._cache_misses += 1
+
+                future: "asyncio.Future[str]" = asyncio.get_running_loop().create_future()
+                self._in_flight[digest] = future
+                try:
+                    content_type = attachment.content_type or "image/png"
+                    image_data, content_type = await asyncio.to_thread(self._downscale, image_data, content_type)
+                    description = await self._describe(image_data, content_type)
+                    await self._cache_put(digest, description)
+                    future.set_result(description)
+                    return description
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except Exception as e:
+                    future.set_exception(e)
+                    future.exception()  # Retrieved here so waiters are optional
+                    raise
+                finally:
+                    del self._in_flight[digest]
+
+            except VisionAPIError as e:
+                return str(e)
+            except Exception as e:
+                logger.exception(f"Error processing image with GPT-4 Vision: {e}")
+                return f"Error: {str(e)}"
+
+    async def _download_image(self, url: str) -> bytes:
+        """Download an image with the shared session."""
+        session = self._get_session()
+        async with session.get(url) as response:
+            if response.status != 200:
+                raise VisionAPIError(f"Failed to download image (HTTP {response.status})")
+            data: bytes = await response.read()
+        self._bytes_downloaded += len(data)
+        return data
+
+    async def _describe(self, image_data: bytes, content_type: str) -> str:
+        """Describe image bytes with the configured describer or the OpenAI vision API."""
+        self._api_calls += 1
+        self._bytes_uploaded += len(image_data)
+        if self._describer:
+            return await self._describer(image_data, content_type)
+
+        base64_image = base64.b64encode(image_data).decode("utf-8")
+
+        # Prepare the API request
+        headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
+
+        payload = {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are a helpful assistant that describes images clearly and concisely. Focus on the main subjects, actions, text, and any notable details.",
+                },
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": "Please describe this image in detail. If there is any text in the image, transcribe it exactly.",
+                        },
+                        {
+                            "type": "image_url",
+                            "image_url": {"url": f"data:{content_type};base64,{base64_image}"},
+                        },
+                    ],
+                },
+            ],
+            "max_tokens": 500,
+        }
+
+        # Call GPT-4 Vision API
+        session = self._get_session()
+        async with session.post(self.api_url, headers=headers, json=payload) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                logger.error(f"OpenAI API error: {response.status} - {error_text}")
+                raise VisionAPIError(f"API error: {response.status}")
 
+            result = await response.json()
+
+            if "choices" in result and result["choices"]:
+                content: str = result["choices"][0]["message"]["content"]
+                return content
+            else:
+                raise VisionAPIError("No description generated")
+
+    def _downscale(self, image_data: bytes, content_type: str) -> Tuple[bytes, str]:
+        """Shrink images larger than max_dimension; returns the bytes and content type to upload.
+
+        Runs in a worker thread. Without Pillow, or if the image cannot be decoded, the
+        original bytes are sent unchanged.
+        """
+        if not PIL_AVAILABLE:
+            return image_data, content_type
+
+        try:
+            with Image.open(io.BytesIO(image_data)) as image:
+                if max(image.size) <= self.max_dimension:
+                    return image_data, content_type
+
+                image.thumbnail((self.max_dimension, self.max_dimension))
+                output = io.BytesIO()
+                if image.mode in ("RGBA", "LA", "P"):
+                    image.save(output, format="PNG", optimize=True)
+                    scaled = output.getvalue(), "image/png"
+                else:
+                    image.convert("RGB").save(output, format="JPEG", quality=85)
+                    scaled = output.getvalue(), "image/jpeg"
+        except Exception as e:
+            logger.debug(f"Could not downscale image, sending original: {e}")
+            return image_data, content_type
+
+        # Re-encoding is not guaranteed to be smaller
+        return scaled if len(scaled[0]) < len(image_data) else (image_data, content_type)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the long-lived HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._max_concurrent * 2),
+                timeout=aiohttp.ClientTimeout(total=VISION_REQUEST_TIMEOUT_SECONDS),
+            )
+        return self._session
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent)
+        return self._semaphore
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _cache_get(self, digest: str) -> Optional[str]:
+        description = self._cache.get(digest)
+        if description is not None:
+            self._cache.move_to_end(digest)
+        return description
+
+    async def _cache_put(self, digest: str, description: str) -> None:
+        self._cache[digest] = description
+        self._cache.move_to_end(digest)
+        while len(self._cache) > self._cache_max_entries:
+            self._cache.popitem(last=False)
+        if self._cache_path:
+            self._cache_version += 1
+            await asyncio.to_thread(self._save_cache, dict(self._cache), self._cache_version)
+
+    def _load_cache(self) -> None:
+        if not self._cache_path or not self._cache_path.exists():
+            return
+        try:
+            entries = json.loads(self._cache_path.read_text())
+            for digest, description in list(entries.items())[-self._cache_max_entries :]:
+                self._cache[str(digest)] = str(description)
+            logger.info(f"Loaded {len(self._cache)} cached image descriptions from {self._cache_path}")
         except Exception as e:
-            logger.exception(f"Error processing image with GPT-4 Vision: {e}")
-            return f"Error: {str(e)}"
+            logger.warning(f"Could not load image description cache {self._cache_path}: {e}")
+
+    def _save_cache(self, entries: Dict[str, str], version: int) -> None:
+        assert self._cache_path is not None
+        with self._save_lock:
+            if version <= self._saved_version:
+                return
+            tmp_name: Optional[str] = None
+            try:
+                self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+                # A unique file in the same directory, so os.replace() stays atomic
+                with tempfile.NamedTemporaryFile(
+                    "w", dir=self._cache_path.parent, prefix=f".{self._cache_path.name}.", delete=False
+                ) as tmp_file:
+                    tmp_name = tmp_file.name
+                    json.dump(entries, tmp_file)
+                os.replace(tmp_name, self._cache_path)
+                tmp_name = None
+                self._saved_version = version
+            except Exception as e:
+                logger.warning(f"Could not save image description cache {self._cache_path}: {e}")
+            finally:
+                if tmp_name:
+                    Path(tmp_name).unlink(missing_ok=True)
 
     async def process_embeds(self, embeds: List[discord.Embed]) -> Optional[str]:
         """Process images from Discord embeds.
@@ -146,23 +364,21 @@ class DiscordVisionHelper:
         Returns:
             Combined description of embed images, or None
         """
-        if not self.api_key or not embeds:
+        if not self.is_available() or not embeds:
             return None
 
-        descriptions = []
-
+        images: List[Tuple[str, str]] = []
         for embed in embeds:
             # Check for image in embed
             if embed.image and embed.image.url:
-                description = await self._process_image_url(embed.image.url, "Embed image")
-                if description:
-                    descriptions.append(description)
+                images.append((embed.image.url, "Embed image"))
 
             # Check for thumbnail
             if embed.thumbnail and embed.thumbnail.url:
-                description = await self._process_image_url(embed.thumbnail.url, "Embed thumbnail")
-                if description:
-                    descriptions.append(description)
+                images.append((embed.thumbnail.url, "Embed thumbnail"))
+
+        results = await asyncio.gather(*(self._process_image_url(url, image_type) for url, image_type in images))
+        descriptions = [d for d in results if d]
 
         if descriptions:
             return "\n\n".join(descriptions)
@@ -203,9 +419,9 @@ class DiscordVisionHelper:
         """Check if vision processing is available.
 
         Returns:
-            True if API key is configured
+            True if API key or a describer is configured
         """
-        return bool(self.api_key)
+        return bool(self.api_key or self._describer)
 
     def get_status(self) -> Dict[str, Any]:
         """Get current status of vision helper.
@@ -218,4 +434,12 @@ class DiscordVisionHelper:
             "model": self.model,
             "max_image_size_mb": self.max_image_size / 1024 / 1024,
             "api_key_configured": bool(self.api_key),
+            "max_dimension": self.max_dimension,
+            "downscaling_enabled": PIL_AVAILABLE,
+            "cache_size": len(self._cache),
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses,
+            "api_calls": self._api_calls,
+            "bytes_downloaded": self._bytes_downloaded,
+            "bytes_uploaded": self._bytes_uploaded,
         }
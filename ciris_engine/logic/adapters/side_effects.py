@@ -0,0 +1,225 @@
+"""
+Post-delivery side effects for outbound messages.
+
+Adapters deliver the user-visible message first and hand the bookkeeping
+(correlation rows, telemetry, audit entries) to a SideEffectPipeline. A single
+worker drains the queue, writing queued correlations in one transaction on a
+worker thread so a slow disk never stalls the event loop. The queue is
+bounded: when it is full, producers wait for room instead of buffering
+without limit. stop() flushes everything still queued.
+
+Readers that cannot flush a pipeline first use get_channel_correlations(),
+which adds correlations that are still queued to the persisted history.
+"""
+
+import asyncio
+import logging
+import weakref
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from ciris_engine.schemas.telemetry.core import ServiceCorrelation
+
+logger = logging.getLogger(__name__)
+
+SIDE_EFFECT_MAX_PENDING = 1000
+SIDE_EFFECT_BATCH_SIZE = 50
+
+SideEffect = Callable[[], Awaitable[Any]]
+_Item = Union[ServiceCorrelation, SideEffect]
+
+# Live pipelines, so history reads can include correlations not written yet
+_pipelines: "weakref.WeakSet[SideEffectPipeline]" = weakref.WeakSet()
+
+
+class SideEffectPipeline:
+    """Bounded, batched queue of work that does not need to finish before a reply is sent."""
+
+    def __init__(
+        self,
+        name: str,
+        time_service: Optional[Any] = None,
+        max_pending: int = SIDE_EFFECT_MAX_PENDING,
+        batch_size: int = SIDE_EFFECT_BATCH_SIZE,
+        db_path: Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self._time_service = time_service
+        self._max_pending = max_pending
+        self._batch_size = max(1, batch_size)
+        self._db_path = db_path
+        self._queue: Optional["asyncio.Queue[_Item]"] = None
+        self._worker: Optional["asyncio.Task[None]"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopped = False
+        # Queued or in-flight correlations, by id, until their write is attempted
+        self._unwritten: Dict[str, ServiceCorrelation] = {}
+        _pipelines.add(self)
+
+        # Metrics
+        self._correlations_written = 0
+        self._effects_run = 0
+        self._failures = 0
+        self._backpressure_waits = 0
+        self._batches = 0
+
+    def _ensure_worker(self) -> "asyncio.Queue[_Item]":
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            # asyncio queues belong to one loop
+            self._queue = asyncio.Queue(maxsize=self._max_pending)
+            self._worker = None
+            self._loop = loop
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run(), name=f"side-effects:{self.name}")
+        return self._queue
+
+    async def _submit(self, item: _Item) -> None:
+        if self._stopped:
+            # Nothing will drain the queue any more; do the work inline
+            await self._process([item])
+            return
+        queue = self._ensure_worker()
+        if queue.full():
+            self._backpressure_waits += 1
+        await queue.put(item)
+
+    async def record_correlation(self, correlation: ServiceCorrelation) -> None:
+        """Queue a correlation for batched persistence."""
+        self._unwritten[correlation.correlation_id] = correlation
+        await self._submit(correlation)
+
+    async def run(self, effect: SideEffect) -> None:
+        """Queue an async callable (telemetry, audit, ...) to run after delivery."""
+        await self._submit(effect)
+
+    def pending_for_channel(self, channel_id: str) -> List[ServiceCorrelation]:
+        """Message correlations for a channel that are queued but not written yet."""
+        return [
+            correlation
+            for correlation in list(self._unwritten.values())
+            if correlation.action_type in ("speak", "observe")
+            and correlation.request_data is not None
+            and correlation.request_data.channel_id == channel_id
+        ]
+
+    async def flush(self) -> None:
+        """Wait until everything queued so far has been processed."""
+        if self._queue is None or self._loop is not asyncio.get_running_loop():
+            return
+        worker = self._worker
+        if worker is not None and not worker.done():
+            joined = asyncio.ensure_future(self._queue.join())
+            await asyncio.wait({joined, worker}, return_when=asyncio.FIRST_COMPLETED)
+            if joined.done():
+                return
+            joined.cancel()
+        # No worker left to drain the queue; process what it left behind here
+        await self._drain()
+
+    async def stop(self) -> None:
+        """Flush the queue and stop the worker; later submissions run inline."""
+        self._stopped = True
+        await self.flush()
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            await self._process_batch(queue, [await queue.get()])
+
+    async def _drain(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        while not queue.empty():
+            await self._process_batch(queue, [queue.get_nowait()])
+
+    async def _process_batch(self, queue: "asyncio.Queue[_Item]", batch: List[_Item]) -> None:
+        while len(batch) < self._batch_size and not queue.empty():
+            batch.append(queue.get_nowait())
+        try:
+            await self._process(batch)
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+    async def _process(self, batch: List[_Item]) -> None:
+        correlations = [item for item in batch if isinstance(item, ServiceCorrelation)]
+        if correlations:
+            try:
+                await self._write_correlations(correlations)
+            finally:
+                for correlation in correlations:
+                    self._unwritten.pop(correlation.correlation_id, None)
+
+        for item in batch:
+            if isinstance(item, ServiceCorrelation):
+                continue
+            try:
+                await item()
+                self._effects_run += 1
+            except Exception as e:
+                self._failures += 1
+                logger.warning(f"{self.name} side effect failed: {e}")
+
+    async def _write_correlations(self, correlations: List[ServiceCorrelation]) -> None:
+        from ciris_engine.logic import persistence
+
+        self._batches += 1
+        try:
+            await asyncio.to_thread(persistence.add_correlations, correlations, self._time_service, self._db_path)
+            self._correlations_written += len(correlations)
+            return
+        except Exception as e:
+            logger.warning(f"{self.name}: writing {len(correlations)} correlations failed ({e}), retrying singly")
+
+        # One bad row should not lose the whole batch
+        for correlation in correlations:
+            try:
+                await asyncio.to_thread(persistence.add_correlation, correlation, self._time_service, self._db_path)
+                self._correlations_written += 1
+            except Exception as e:
+                self._failures += 1
+                logger.error(f"{self.name}: failed to persist correlation {correlation.correlation_id}: {e}")
+
+    def get_metrics(self) -> Dict[str, float]:
+        return {
+            "side_effects_pending": float(self._queue.qsize() if self._queue is not None else 0),
+            "side_effect_correlations_written": float(self._correlations_written),
+            "side_effects_run": float(self._effects_run),
+            "side_effect_failures": float(self._failures),
+            "side_effect_backpressure_waits": float(self._backpressure_waits),
+            "side_effect_batches": float(self._batches),
+        }
+
+
+def _history_sort_key(correlation: ServiceCorrelation) -> datetime:
+    timestamp = correlation.timestamp
+    return timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=timezone.utc)
+
+
+def get_channel_correlations(channel_id: str, limit: int = 50) -> List[ServiceCorrelation]:
+    """
+    Message history for a channel, oldest first, including correlations still queued.
+
+    Same result as persistence.get_correlations_by_channel, except that a reply
+    whose correlation has not been written yet still shows up.
+    """
+    from ciris_engine.logic import persistence
+
+    correlations = persistence.get_correlations_by_channel(channel_id=channel_id, limit=limit)
+    pending = [correlation for pipeline in list(_pipelines) for correlation in pipeline.pending_for_channel(channel_id)]
+    if not pending:
+        return correlations
+
+    seen = {correlation.correlation_id for correlation in correlations}
+    merged = list(correlations) + [c for c in pending if c.correlation_id not in seen]
+    merged.sort(key=_history_sort_key)
+    return merged[-limit:]
@@ -0,0 +1,306 @@
+"""
+Streaming export of the signed audit log.
+
+Rows are read from ``audit_log`` in sequence-number order with keyset
+pagination, encoded chunk by chunk and optionally compressed, so an export
+holds at most one chunk in memory regardless of the requested time range.
+
+Formats:
+- ndjson: one JSON object per entry
+- csv: header row plus one row per entry
+- columnar: one JSON object per chunk with a list of values per column
+- parquet: one row group per chunk (requires pyarrow)
+
+Compression: none, gzip, zstd (requires zstandard).
+"""
+
+import asyncio
+import csv
+import io
+import json
+import logging
+import sqlite3
+import zlib
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional, Protocol
+
+logger = logging.getLogger(__name__)
+
+# Optional import for zstd compression
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+# Optional import for Parquet output
+try:
+    import pyarrow
+    import pyarrow.parquet
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pyarrow = None
+    PYARROW_AVAILABLE = False
+
+EXPORT_CHUNK_SIZE = 1000
+
+EXPORT_COLUMNS = [
+    "sequence_number",
+    "event_id",
+    "event_timestamp",
+    "event_type",
+    "originator_id",
+    "target_id",
+    "event_summary",
+    "event_payload",
+    "previous_hash",
+    "entry_hash",
+    "signature",
+    "signing_key_id",
+]
+
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv", "csv"),
+    "columnar": ("application/x-ndjson", "columnar.ndjson"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+EXPORT_COMPRESSIONS = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+
+class _Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class _Identity:
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+def validate_export_options(format: str, compression: str) -> None:
+    """Raise ValueError for unknown or unavailable format/compression choices."""
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {format}")
+    if compression not in EXPORT_COMPRESSIONS:
+        raise ValueError(f"Unsupported export compression: {compression}")
+    if format == "parquet" and not PYARROW_AVAILABLE:
+        raise ValueError("Parquet export requires pyarrow")
+    if compression == "zstd" and not ZSTD_AVAILABLE:
+        raise ValueError("zstd compression requires zstandard")
+
+
+def export_media_type(format: str, compression: str) -> str:
+    if compression == "gzip":
+        return "application/gzip"
+    if compression == "zstd":
+        return "application/zstd"
+    return EXPORT_FORMATS[format][0]
+
+
+def export_filename(format: str, compression: str, stamp: str) -> str:
+    return f"audit_export_{stamp}.{EXPORT_FORMATS[format][1]}{EXPORT_COMPRESSIONS[compression]}"
+
+
+def _make_compressor(compression: str) -> _Compressor:
+    if compression == "gzip":
+        return zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    if compression == "zstd":
+        return zstandard.ZstdCompressor().compressobj()  # type: ignore[no-any-return]
+    return _Identity()
+
+
+def _iso_utc(value: Optional[datetime]) -> Optional[str]:
+    """Normalize a bound to the UTC ISO format used for event_timestamp."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def fetch_audit_chunk(
+    db_path: str,
+    after_sequence: int,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    limit: int = EXPORT_CHUNK_SIZE,
+) -> List[Dict[str, Any]]:
+    """Read the next chunk of audit_log rows after ``after_sequence``."""
+    clauses = ["sequence_number > ?"]
+    params: List[Any] = [after_sequence]
+    start_iso, end_iso = _iso_utc(start_time), _iso_utc(end_time)
+    if start_iso:
+        clauses.append("event_timestamp >= ?")
+        params.append(start_iso)
+    if end_iso:
+        clauses.append("event_timestamp <= ?")
+        params.append(end_iso)
+    params.append(limit)
+
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        cursor = conn.execute(
+            f"""
+            SELECT {", ".join(EXPORT_COLUMNS)}
+            FROM audit_log
+            WHERE {" AND ".join(clauses)}
+            ORDER BY sequence_number
+            LIMIT ?
+        """,
+            params,
+        )
+        return [dict(row) for row in cursor.fetchall()]
+    finally:
+        conn.close()
+
+
+async def iter_audit_chunks(
+    db_path: str,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Yield audit_log rows in chunks without holding a connection between chunks."""
+    after = 0
+    while True:
+        rows = await asyncio.to_thread(fetch_audit_chunk, db_path, after, start_time, end_time, chunk_size)
+        if not rows:
+            return
+        yield rows
+        if len(rows) < chunk_size:
+            return
+        after = rows[-1]["sequence_number"]
+
+
+class _ParquetSink(io.RawIOBase):
+    """Write-only file object that hands back written bytes as they arrive.
+
+    Tracks the absolute position so the Parquet footer offsets stay correct
+    even though the buffer is drained after each row group.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._parts: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._parts.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts = []
+        return data
+
+
+class _Encoder:
+    """Turns chunks of rows into bytes for one export format."""
+
+    def __init__(self, format: str) -> None:
+        self.format = format
+        self._header_written = False
+        self._parquet_sink: Optional[_ParquetSink] = None
+        self._parquet_writer: Any = None
+
+    def encode(self, rows: List[Dict[str, Any]]) -> bytes:
+        if self.format == "ndjson":
+            return "".join(json.dumps(row, separators=(",", ":")) + "\n" for row in rows).encode("utf-8")
+
+        if self.format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            if not self._header_written:
+                writer.writerow(EXPORT_COLUMNS)
+                self._header_written = True
+            writer.writerows([row.get(column) for column in EXPORT_COLUMNS] for row in rows)
+            return buffer.getvalue().encode("utf-8")
+
+        if self.format == "columnar":
+            batch = {
+                "rows": len(rows),
+                "columns": {column: [row.get(column) for row in rows] for column in EXPORT_COLUMNS},
+            }
+            return (json.dumps(batch, separators=(",", ":")) + "\n").encode("utf-8")
+
+        return self._encode_parquet(rows)
+
+    def _encode_parquet(self, rows: List[Dict[str, Any]]) -> bytes:
+        table = pyarrow.table(
+            {column: [row.get(column) for row in rows] for column in EXPORT_COLUMNS},
+            schema=_parquet_schema(),
+        )
+        if self._parquet_writer is None:
+            self._parquet_sink = _ParquetSink()
+            self._parquet_writer = pyarrow.parquet.ParquetWriter(self._parquet_sink, table.schema)
+        self._parquet_writer.write_table(table)
+        assert self._parquet_sink is not None
+        return self._parquet_sink.drain()
+
+    def finish(self) -> bytes:
+        if self.format == "csv" and not self._header_written:
+            buffer = io.StringIO()
+            csv.writer(buffer).writerow(EXPORT_COLUMNS)
+            return buffer.getvalue().encode("utf-8")
+        if self.format == "parquet":
+            if self._parquet_writer is None:
+                # Still emit a valid (empty) file
+                self._parquet_sink = _ParquetSink()
+                self._parquet_writer = pyarrow.parquet.ParquetWriter(self._parquet_sink, _parquet_schema())
+            self._parquet_writer.close()
+            assert self._parquet_sink is not None
+            return self._parquet_sink.drain()
+        return b""
+
+
+def _parquet_schema() -> Any:
+    return pyarrow.schema(
+        [
+            (column, pyarrow.int64() if column == "sequence_number" else pyarrow.string())
+            for column in EXPORT_COLUMNS
+        ]
+    )
+
+
+async def stream_audit_export(
+    db_path: str,
+    format: str = "ndjson",
+    compression: str = "none",
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Yield the encoded (and optionally compressed) export one chunk at a time."""
+    validate_export_options(format, compression)
+    encoder = _Encoder(format)
+    compressor = _make_compressor(compression)
+
+    exported = 0
+    async for rows in iter_audit_chunks(db_path, start_time, end_time, chunk_size):
+        exported += len(rows)
+        data = compressor.compress(encoder.encode(rows))
+        if data:
+            yield data
+
+    tail = compressor.compress(encoder.finish()) + compressor.flush()
+    if tail:
+        yield tail
+    logger.info(f"Streamed audit export of {exported} entries ({format}, compression={compression})")
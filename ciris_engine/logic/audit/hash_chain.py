@@ -16,6 +16,15 @@ from ciris_engine.schemas.audit.hash_chain import ChainSummary, HashChainVerific
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip when streaming the chain for verification
+VERIFY_CHUNK_SIZE = 1000
+
+# Only the fields that feed compute_entry_hash are needed to verify the chain
+CHAIN_COLUMNS = (
+    "event_id, event_timestamp, event_type, originator_id, event_payload, "
+    "sequence_number, previous_hash, entry_hash"
+)
+
 
 class AuditHashChain:
     """Manages the cryptographic hash chain for audit entries"""
@@ -84,6 +93,26 @@ class AuditHashChain:
 
         return entry
 
+    def prepare_entries(self, entries: List[dict]) -> List[dict]:
+        """Prepare a batch of entries from the in-memory chain head.
+
+        Unlike ``prepare_entry`` this does not re-read the database, so it must
+        only be used by the single writer that owns the chain. If the batch is
+        not committed, call ``initialize(force=True)`` to resync the head.
+        """
+        if not self._initialized:
+            self.initialize()
+
+        with self._lock:
+            for entry in entries:
+                self._sequence_number += 1
+                entry["sequence_number"] = self._sequence_number
+                entry["previous_hash"] = self._last_hash or "genesis"
+                entry["entry_hash"] = self.compute_entry_hash(entry)
+                self._last_hash = entry["entry_hash"]
+
+        return entries
+
     def get_last_entry(self) -> Optional[dict]:
         """Retrieve the last entry from the chain"""
         try:
@@ -110,8 +139,20 @@ class AuditHashChain:
             logger.error(f"Failed to get last entry: {e}")
             return None
 
-    def verify_chain_integrity(self, start_seq: int = 1, end_seq: Optional[int] = None) -> HashChainVerificationResult:
-        """Verify the integrity of the hash chain"""
+    def verify_chain_integrity(
+        self,
+        start_seq: int = 1,
+        end_seq: Optional[int] = None,
+        previous_hash: Optional[str] = None,
+        chunk_size: int = VERIFY_CHUNK_SIZE,
+    ) -> HashChainVerificationResult:
+        """Verify the integrity of the hash chain
+
+        Rows are streamed in chunks of ``chunk_size`` so memory stays flat as the
+        log grows. ``previous_hash`` anchors the first entry when resuming from
+        a verified checkpoint; otherwise it is read from the entry before
+        ``start_seq``.
+        """
         conn = None
         result = None
         try:
@@ -119,11 +160,24 @@ class AuditHashChain:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
+            # If not starting from sequence 1, get the previous entry's hash
+            if start_seq > 1 and previous_hash is None:
+                cursor.execute(
+                    """
+                    SELECT entry_hash FROM audit_log
+                    WHERE sequence_number = ?
+                """,
+                    (start_seq - 1,),
+                )
+                prev_row = cursor.fetchone()
+                if prev_row:
+                    previous_hash = prev_row[0]
+
             # Build query
             if end_seq:
                 cursor.execute(
-                    """
-                    SELECT * FROM audit_log
+                    f"""
+                    SELECT {CHAIN_COLUMNS} FROM audit_log
                     WHERE sequence_number >= ? AND sequence_number <= ?
                     ORDER BY sequence_number
                 """,
@@ -131,43 +185,30 @@ class AuditHashChain:
                 )
             else:
                 cursor.execute(
-                    """
-                    SELECT * FROM audit_log
+                    f"""
+                    SELECT {CHAIN_COLUMNS} FROM audit_log
                     WHERE sequence_number >= ?
                     ORDER BY sequence_number
                 """,
                     (start_seq,),
                 )
 
-            entries = [dict(row) for row in cursor.fetchall()]
+            errors: List[str] = []
+            checked = 0
+            last_sequence = 0
 
-            if not entries:
-                result = HashChainVerificationResult(
-                    valid=True, entries_checked=0, errors=[], last_sequence=0, tampering_location=None
-                )
-            else:
-                errors: List[str] = []
-                previous_hash: Optional[str] = None
-
-                # If not starting from sequence 1, get the previous entry's hash
-                if start_seq > 1:
-                    cursor.execute(
-                        """
-                        SELECT entry_hash FROM audit_log
-                        WHERE sequence_number = ?
-                    """,
-                        (start_seq - 1,),
-                    )
-                    prev_row = cursor.fetchone()
-                    if prev_row:
-                        previous_hash = prev_row[0]
-
-                for i, entry in enumerate(entries):
-                    expected_seq = start_seq + i
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+
+                for row in rows:
+                    entry = dict(row)
+                    expected_seq = start_seq + checked
                     if entry["sequence_number"] != expected_seq:
                         errors.append(f"Sequence gap at {entry['sequence_number']}, expected {expected_seq}")
 
-                    if i == 0 and start_seq == 1:
+                    if checked == 0 and start_seq == 1:
                         expected_prev = "genesis"
                     else:
                         expected_prev = previous_hash or ""
@@ -180,14 +221,16 @@ class AuditHashChain:
                         errors.append(f"Entry hash mismatch at sequence {entry['sequence_number']}")
 
                     previous_hash = entry["entry_hash"]
+                    last_sequence = entry["sequence_number"]
+                    checked += 1
 
-                result = HashChainVerificationResult(
-                    valid=len(errors) == 0,
-                    entries_checked=len(entries),
-                    errors=errors,
-                    last_sequence=entries[-1]["sequence_number"] if entries else 0,
-                    tampering_location=None,
-                )
+            result = HashChainVerificationResult(
+                valid=len(errors) == 0,
+                entries_checked=checked,
+                errors=errors,
+                last_sequence=last_sequence,
+                tampering_location=None,
+            )
 
         except sqlite3.Error as e:
             logger.error(f"Chain verification failed: {e}")
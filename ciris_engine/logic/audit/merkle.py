@@ -0,0 +1,90 @@
+"""
+Merkle tree helpers for batched audit signing.
+
+A batch of hash-chain entries is signed once over the Merkle root of their
+entry hashes. Each entry stores its inclusion proof so a single entry can be
+verified against the signed root without reading the rest of the batch.
+
+Leaves and interior nodes are domain-separated (0x00 / 0x01 prefixes) and an
+odd node at the end of a level is promoted unchanged rather than duplicated.
+"""
+
+import hashlib
+import json
+from typing import List, Tuple
+
+ProofStep = Tuple[str, str]  # ("L" | "R", sibling hash)
+
+
+def _leaf_hash(entry_hash: str) -> str:
+    return hashlib.sha256(b"\x00" + entry_hash.encode("utf-8")).hexdigest()
+
+
+def _node_hash(left: str, right: str) -> str:
+    return hashlib.sha256(b"\x01" + left.encode("utf-8") + right.encode("utf-8")).hexdigest()
+
+
+def _next_level(level: List[str]) -> List[str]:
+    parents = [_node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+    if len(level) % 2:
+        parents.append(level[-1])
+    return parents
+
+
+def merkle_root(entry_hashes: List[str]) -> str:
+    """Compute the Merkle root of a non-empty list of entry hashes."""
+    if not entry_hashes:
+        raise ValueError("Cannot compute Merkle root of an empty batch")
+
+    level = [_leaf_hash(h) for h in entry_hashes]
+    while len(level) > 1:
+        level = _next_level(level)
+    return level[0]
+
+
+def merkle_proofs(entry_hashes: List[str]) -> List[List[ProofStep]]:
+    """Compute the inclusion proof for every entry in the batch."""
+    if not entry_hashes:
+        raise ValueError("Cannot compute Merkle proofs for an empty batch")
+
+    proofs: List[List[ProofStep]] = [[] for _ in entry_hashes]
+    # Leaf indices covered by each node of the current level
+    members: List[List[int]] = [[i] for i in range(len(entry_hashes))]
+    level = [_leaf_hash(h) for h in entry_hashes]
+
+    while len(level) > 1:
+        for i in range(0, len(level) - 1, 2):
+            for leaf in members[i]:
+                proofs[leaf].append(("R", level[i + 1]))
+            for leaf in members[i + 1]:
+                proofs[leaf].append(("L", level[i]))
+        merged = [members[i] + members[i + 1] for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            merged.append(members[-1])
+        members = merged
+        level = _next_level(level)
+
+    return proofs
+
+
+def verify_merkle_proof(entry_hash: str, proof: List[ProofStep], root: str) -> bool:
+    """Check that ``entry_hash`` is included under ``root``."""
+    current = _leaf_hash(entry_hash)
+    for side, sibling in proof:
+        if side == "L":
+            current = _node_hash(sibling, current)
+        elif side == "R":
+            current = _node_hash(current, sibling)
+        else:
+            return False
+    return current == root
+
+
+def encode_proof(proof: List[ProofStep]) -> str:
+    """Serialize a proof for storage in the audit_log table."""
+    return json.dumps([[side, sibling] for side, sibling in proof], separators=(",", ":"))
+
+
+def decode_proof(encoded: str) -> List[ProofStep]:
+    """Parse a proof stored by ``encode_proof``."""
+    return [(str(side), str(sibling)) for side, sibling in json.loads(encoded)]
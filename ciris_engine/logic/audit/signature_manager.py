@@ -11,7 +11,7 @@ import logging
 import os
 import sqlite3
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives import hashes, serialization
@@ -23,6 +23,23 @@ from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
 logger = logging.getLogger(__name__)
 
 
+def verify_with_public_key(public_key: PublicKeyTypes, entry_hash: str, signature: str) -> bool:
+    """Verify an RSA-PSS signature over an entry hash with an already loaded key.
+
+    Raises InvalidSignature on mismatch so callers can distinguish it from other failures.
+    """
+    if not isinstance(public_key, rsa.RSAPublicKey):
+        raise TypeError("Only RSA keys are supported for verification")
+
+    public_key.verify(
+        base64.b64decode(signature.encode("ascii")),
+        entry_hash.encode("utf-8"),
+        padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH),
+        hashes.SHA256(),
+    )
+    return True
+
+
 class AuditSignatureManager:
     """Manages signing keys and signatures for audit entries"""
 
@@ -33,6 +50,8 @@ class AuditSignatureManager:
         self._private_key: Optional[PrivateKeyTypes] = None
         self._public_key: Optional[PublicKeyTypes] = None
         self._key_id: Optional[str] = None
+        # Public keys are immutable per key_id, so lookups are cached for the process lifetime
+        self._public_key_cache: Dict[str, PublicKeyTypes] = {}
 
         # Ensure key directory exists
         self.key_path.mkdir(parents=True, exist_ok=True)
@@ -210,16 +229,7 @@ class AuditSignatureManager:
                 logger.error("Only RSA keys are supported for verification")
                 return False
 
-            signature_bytes = base64.b64decode(signature.encode("ascii"))
-
-            public_key.verify(
-                signature_bytes,
-                entry_hash.encode("utf-8"),
-                padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH),
-                hashes.SHA256(),
-            )
-
-            return True
+            return verify_with_public_key(public_key, entry_hash, signature)
 
         except InvalidSignature:
             logger.warning(f"Invalid signature for entry hash: {entry_hash[:16]}...")
@@ -230,6 +240,10 @@ class AuditSignatureManager:
 
     def _load_public_key(self, key_id: str) -> Optional[PublicKeyTypes]:
         """Load a public key from the database by key ID"""
+        cached = self._public_key_cache.get(key_id)
+        if cached is not None:
+            return cached
+
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
@@ -243,12 +257,37 @@ class AuditSignatureManager:
                 return None
 
             # Load public key from PEM
-            return serialization.load_pem_public_key(row[0].encode("ascii"))
+            public_key = serialization.load_pem_public_key(row[0].encode("ascii"))
+            self._public_key_cache[key_id] = public_key
+            return public_key
 
         except Exception as e:
             logger.error(f"Failed to load public key {key_id}: {e}")
             return None
 
+    def get_public_key_map(self) -> Dict[str, str]:
+        """Return PEM public keys for every registered key ID.
+
+        Used to hand all verification keys to worker processes in one go
+        instead of looking them up per entry.
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute("SELECT key_id, public_key FROM audit_signing_keys")
+            rows = cursor.fetchall()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to load public keys: {e}")
+            rows = []
+
+        key_map = {key_id: pem for key_id, pem in rows}
+        if self._key_id and self._public_key and self._key_id not in key_map:
+            key_map[self._key_id] = self._public_key.public_bytes(
+                encoding=serialization.Encoding.PEM, format=serialization.PublicFormat.SubjectPublicKeyInfo
+            ).decode("ascii")
+        return key_map
+
     def rotate_keys(self) -> str:
         """Rotate to a new key pair and return the new key ID"""
         logger.info("Rotating audit signing keys")
@@ -6,8 +6,13 @@ hash chains, digital signatures, and root anchoring.
 """
 
 import logging
+import multiprocessing
+import os
 import sqlite3
-from typing import List, Optional
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from cryptography.hazmat.primitives import serialization
 
 from ciris_engine.protocols.services.lifecycle import TimeServiceProtocol
 from ciris_engine.schemas.audit.verification import (
@@ -20,20 +25,59 @@ from ciris_engine.schemas.audit.verification import (
 )
 
 from .hash_chain import AuditHashChain
-from .signature_manager import AuditSignatureManager
+from .merkle import decode_proof, merkle_root, verify_merkle_proof
+from .signature_manager import AuditSignatureManager, verify_with_public_key
 
 logger = logging.getLogger(__name__)
 
+# Rows read per round trip (and per worker task) while verifying signatures
+SIGNATURE_CHUNK_SIZE = 1000
+
+# Below this many per-entry signatures, spawning worker processes costs more than it saves
+PARALLEL_SIGNATURE_THRESHOLD = 5000
+
+SignatureRow = Tuple[int, str, str, str]  # entry_id, entry_hash, signature, signing_key_id
+
+_worker_keys: Dict[str, object] = {}
+
+
+def _verify_signature_chunk(public_keys: Dict[str, str], rows: List[SignatureRow]) -> List[int]:
+    """Verify a chunk of per-entry signatures in a worker process.
+
+    Returns the entry IDs whose signature did not verify.
+    """
+    failed: List[int] = []
+    for entry_id, entry_hash, signature, key_id in rows:
+        public_key = _worker_keys.get(key_id)
+        if public_key is None and key_id in public_keys:
+            public_key = serialization.load_pem_public_key(public_keys[key_id].encode("ascii"))
+            _worker_keys[key_id] = public_key
+        try:
+            if public_key is None or not verify_with_public_key(public_key, entry_hash, signature):  # type: ignore[arg-type]
+                failed.append(entry_id)
+        except Exception:
+            failed.append(entry_id)
+    return failed
+
 
 class AuditVerifier:
     """Verifies audit log integrity and detects tampering"""
 
-    def __init__(self, db_path: str, key_path: str, time_service: TimeServiceProtocol) -> None:
+    def __init__(
+        self,
+        db_path: str,
+        key_path: str,
+        time_service: TimeServiceProtocol,
+        max_workers: Optional[int] = None,
+        parallel_threshold: int = PARALLEL_SIGNATURE_THRESHOLD,
+    ) -> None:
         self.db_path = db_path
         self.hash_chain = AuditHashChain(db_path)
         self.signature_manager = AuditSignatureManager(key_path, db_path, time_service)
         self._time_service = time_service
         self._initialized = False
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self.parallel_threshold = parallel_threshold
 
     def initialize(self) -> None:
         """Initialize the verifier components"""
@@ -42,15 +86,136 @@ class AuditVerifier:
 
         self.hash_chain.initialize()
         self.signature_manager.initialize()
+        self._init_checkpoint_table()
         self._initialized = True
         logger.info("Audit verifier initialized")
 
-    def verify_complete_chain(self) -> CompleteVerificationResult:
-        """Perform complete verification of the entire audit chain"""
+    def _init_checkpoint_table(self) -> None:
+        """Create the table that records how far the chain has been verified."""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS audit_verification_checkpoints (
+                    checkpoint_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    sequence_number INTEGER NOT NULL,
+                    entry_hash TEXT NOT NULL,
+                    verified_at TEXT NOT NULL,
+                    signature TEXT,
+                    signing_key_id TEXT
+                )
+            """
+            )
+            # Tables created before checkpoints were signed lack the signature columns
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(audit_verification_checkpoints)")}
+            for column in ("signature", "signing_key_id"):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE audit_verification_checkpoints ADD COLUMN {column} TEXT")
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to create verification checkpoint table: {e}")
+
+    def get_last_checkpoint(self) -> Optional[dict]:
+        """Return the most recent verified checkpoint, if any."""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT sequence_number, entry_hash, verified_at, signature, signing_key_id
+                FROM audit_verification_checkpoints
+                ORDER BY sequence_number DESC
+                LIMIT 1
+            """
+            )
+            row = cursor.fetchone()
+            conn.close()
+            return dict(row) if row else None
+        except sqlite3.Error as e:
+            logger.error(f"Failed to read verification checkpoint: {e}")
+            return None
+
+    @staticmethod
+    def _checkpoint_payload(sequence_number: int, entry_hash: str) -> str:
+        """The string a checkpoint signature covers."""
+        return f"checkpoint:{sequence_number}:{entry_hash}"
+
+    def _record_checkpoint(self, sequence_number: int) -> None:
+        """Record that the chain up to ``sequence_number`` verified cleanly."""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute("SELECT entry_hash FROM audit_log WHERE sequence_number = ?", (sequence_number,))
+            row = cursor.fetchone()
+            if row:
+                signature = self.signature_manager.sign_entry(self._checkpoint_payload(sequence_number, row[0]))
+                cursor.execute(
+                    """
+                    INSERT INTO audit_verification_checkpoints
+                        (sequence_number, entry_hash, verified_at, signature, signing_key_id)
+                    VALUES (?, ?, ?, ?, ?)
+                """,
+                    (sequence_number, row[0], self._time_service.now_iso(), signature, self.signature_manager.key_id),
+                )
+                conn.commit()
+            conn.close()
+        except (sqlite3.Error, RuntimeError) as e:
+            logger.error(f"Failed to record verification checkpoint: {e}")
+
+    def _resume_point(self) -> Tuple[int, Optional[str], Optional[int]]:
+        """Where incremental verification starts: (start_seq, previous_hash, checkpoint_seq).
+
+        A checkpoint that is unsigned, carries a signature that does not verify
+        against the audit key, or whose entry no longer matches the stored hash
+        is ignored, which forces a full verification that will report any tampering.
+        """
+        checkpoint = self.get_last_checkpoint()
+        if not checkpoint:
+            return 1, None, None
+
+        payload = self._checkpoint_payload(checkpoint["sequence_number"], checkpoint["entry_hash"])
+        if not checkpoint["signature"] or not self.signature_manager.verify_signature(
+            payload, checkpoint["signature"], checkpoint["signing_key_id"]
+        ):
+            logger.warning(
+                f"Verification checkpoint at sequence {checkpoint['sequence_number']} is not validly signed - "
+                "running full verification"
+            )
+            return 1, None, None
+
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT entry_hash FROM audit_log WHERE sequence_number = ?", (checkpoint["sequence_number"],)
+            )
+            row = cursor.fetchone()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to check verification checkpoint: {e}")
+            return 1, None, None
+
+        if not row or row[0] != checkpoint["entry_hash"]:
+            logger.warning(
+                f"Verification checkpoint at sequence {checkpoint['sequence_number']} no longer matches the chain - "
+                "running full verification"
+            )
+            return 1, None, None
+
+        return checkpoint["sequence_number"] + 1, checkpoint["entry_hash"], checkpoint["sequence_number"]
+
+    def verify_complete_chain(self, full: bool = False) -> CompleteVerificationResult:
+        """Verify the audit chain.
+
+        By default only entries after the last verified checkpoint are checked;
+        pass ``full=True`` to re-verify the whole chain from genesis.
+        """
         if not self._initialized:
             self.initialize()
 
-        logger.info("Starting complete audit chain verification")
+        logger.info(f"Starting {'full' if full else 'incremental'} audit chain verification")
         start_time = self._time_service.now()
 
         # Get chain summary
@@ -63,6 +228,7 @@ class AuditVerifier:
                 signatures_valid=False,
                 verification_time_ms=0,
                 error=summary.error,
+                full_verification=full,
             )
 
         total_entries = summary.total_entries
@@ -74,13 +240,31 @@ class AuditVerifier:
                 signatures_valid=True,
                 verification_time_ms=0,
                 summary="Empty audit log",
+                full_verification=full,
+            )
+
+        start_seq, previous_hash, checkpoint_seq = (1, None, None) if full else self._resume_point()
+        last_seq = summary.sequence_range[1]
+
+        if start_seq > last_seq:
+            return CompleteVerificationResult(
+                valid=True,
+                entries_verified=total_entries,
+                entries_checked=0,
+                hash_chain_valid=True,
+                signatures_valid=True,
+                verification_time_ms=0,
+                chain_summary=summary.model_dump(),
+                summary=f"No new entries since checkpoint at sequence {checkpoint_seq}",
+                checkpoint_sequence=checkpoint_seq,
+                full_verification=False,
             )
 
         # Verify hash chain integrity
-        chain_result = self.hash_chain.verify_chain_integrity()
+        chain_result = self.hash_chain.verify_chain_integrity(start_seq, previous_hash=previous_hash)
 
         # Verify signatures
-        signature_result = self._verify_all_signatures()
+        signature_result = self._verify_signatures(start_seq, expected_rows=last_seq - start_seq + 1)
 
         # Calculate verification time
         end_time = self._time_service.now()
@@ -89,19 +273,28 @@ class AuditVerifier:
         # Combine results
         overall_valid = chain_result.valid and signature_result.valid
 
+        if overall_valid and chain_result.last_sequence:
+            self._record_checkpoint(chain_result.last_sequence)
+
         result = CompleteVerificationResult(
             valid=overall_valid,
             entries_verified=total_entries,
+            entries_checked=chain_result.entries_checked,
             hash_chain_valid=chain_result.valid,
             signatures_valid=signature_result.valid,
             verification_time_ms=verification_time,
             hash_chain_errors=chain_result.errors,
             signature_errors=signature_result.errors,
             chain_summary=summary.model_dump() if summary else None,
+            checkpoint_sequence=checkpoint_seq,
+            full_verification=checkpoint_seq is None,
         )
 
         if overall_valid:
-            logger.info(f"Audit verification passed: {total_entries} entries in {verification_time}ms")
+            logger.info(
+                f"Audit verification passed: {chain_result.entries_checked} of {total_entries} entries checked "
+                f"in {verification_time}ms"
+            )
         else:
             logger.error(
                 f"Audit verification FAILED: {len(chain_result.errors)} hash + {len(signature_result.errors)} signature errors"
@@ -193,12 +386,10 @@ class AuditVerifier:
         if not hash_valid:
             errors.append(f"Entry hash mismatch: computed {computed_hash}, stored {entry['entry_hash']}")
 
-        # Verify signature
-        signature_valid = self.signature_manager.verify_signature(
-            entry["entry_hash"], entry["signature"], entry["signing_key_id"]
-        )
+        # Verify signature (per-entry, or batch root plus inclusion proof)
+        signature_valid, signature_error = self._verify_entry_signature(entry, {})
         if not signature_valid:
-            errors.append(f"Invalid signature for entry {entry['entry_id']}")
+            errors.append(signature_error or f"Invalid signature for entry {entry['entry_id']}")
 
         # Check previous hash link
         previous_hash_valid = True  # Assume valid unless we find otherwise
@@ -217,37 +408,91 @@ class AuditVerifier:
 
     def _verify_all_signatures(self) -> SignatureVerificationResult:
         """Verify signatures for all entries in the audit log"""
+        return self._verify_signatures(1)
+
+    def _verify_signatures_in_range(self, start_seq: int, end_seq: int) -> SignatureVerificationResult:
+        """Verify signatures for entries in a specific sequence range"""
+        result = self._verify_signatures(start_seq, end_seq)
+        result.errors = [f"{error} (seq {start_seq}-{end_seq})" for error in result.errors]
+        return result
+
+    def _verify_signatures(
+        self, start_seq: int, end_seq: Optional[int] = None, expected_rows: int = 0
+    ) -> SignatureVerificationResult:
+        """Stream entries from ``start_seq`` and verify their signatures.
+
+        Batched entries are checked against their signed Merkle root in-process.
+        Per-entry RSA signatures are fanned out to a process pool when at least
+        ``parallel_threshold`` rows are expected, using one public-key map for
+        the whole run rather than a key lookup per row.
+        """
+        conn = None
+        executor: Optional[ProcessPoolExecutor] = None
         try:
             conn = sqlite3.connect(self.db_path)
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
+            root_cursor = conn.cursor()
 
+            where = "sequence_number >= ?" + (" AND sequence_number <= ?" if end_seq is not None else "")
+            params: Tuple[int, ...] = (start_seq, end_seq) if end_seq is not None else (start_seq,)
             cursor.execute(
-                """
-                SELECT entry_id, entry_hash, signature, signing_key_id
+                f"""
+                SELECT {self._signature_columns(cursor)}
                 FROM audit_log
+                WHERE {where}
                 ORDER BY sequence_number
-            """
+            """,
+                params,
             )
 
-            entries = cursor.fetchall()
-            conn.close()
+            public_keys: Dict[str, str] = {}
+            if self.max_workers > 1 and expected_rows >= self.parallel_threshold:
+                executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+                public_keys = self.signature_manager.get_public_key_map()
 
             errors: List[str] = []
-            verified_count = 0
-
-            for entry in entries:
-                if self.signature_manager.verify_signature(
-                    entry["entry_hash"], entry["signature"], entry["signing_key_id"]
-                ):
-                    verified_count += 1
+            failed_ids: List[int] = []
+            futures: List[Future] = []
+            total = 0
+            root_cache: Dict[int, Tuple[bool, Optional[dict]]] = {}
+
+            while True:
+                rows = cursor.fetchmany(SIGNATURE_CHUNK_SIZE)
+                if not rows:
+                    break
+                total += len(rows)
+
+                per_entry: List[SignatureRow] = []
+                for row in rows:
+                    entry = dict(row)
+                    if entry.get("merkle_root_id") is not None:
+                        valid, error = self._verify_entry_signature(entry, root_cache, root_cursor)
+                        if not valid:
+                            errors.append(error or f"Invalid signature for entry {entry['entry_id']}")
+                    else:
+                        per_entry.append(
+                            (entry["entry_id"], entry["entry_hash"], entry["signature"], entry["signing_key_id"])
+                        )
+
+                if not per_entry:
+                    continue
+                if executor:
+                    futures.append(executor.submit(_verify_signature_chunk, public_keys, per_entry))
                 else:
-                    errors.append(f"Invalid signature for entry {entry['entry_id']}")
+                    failed_ids.extend(self._verify_signature_rows(per_entry))
+
+            for future in futures:
+                failed_ids.extend(future.result())
+
+            errors.extend(f"Invalid signature for entry {entry_id}" for entry_id in sorted(failed_ids))
 
             return SignatureVerificationResult(
                 valid=len(errors) == 0,
-                entries_signed=len(entries),
-                entries_verified=verified_count,
+                entries_signed=total,
+                entries_verified=total - len(errors),
                 errors=errors,
                 untrusted_keys=[],
             )
@@ -257,51 +502,90 @@ class AuditVerifier:
             return SignatureVerificationResult(
                 valid=False, entries_signed=0, entries_verified=0, errors=[f"Database error: {e}"], untrusted_keys=[]
             )
-
-    def _verify_signatures_in_range(self, start_seq: int, end_seq: int) -> SignatureVerificationResult:
-        """Verify signatures for entries in a specific sequence range"""
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
+            if conn:
+                conn.close()
+
+    def _verify_signature_rows(self, rows: List[SignatureRow]) -> List[int]:
+        """In-process counterpart of ``_verify_signature_chunk`` using the manager's key cache."""
+        return [
+            entry_id
+            for entry_id, entry_hash, signature, key_id in rows
+            if not self.signature_manager.verify_signature(entry_hash, signature, key_id)
+        ]
+
+    @staticmethod
+    def _signature_columns(cursor: sqlite3.Cursor) -> str:
+        """Columns needed for signature checks; batch columns only exist once batched signing was enabled."""
+        cursor.execute("PRAGMA table_info(audit_log)")
+        columns = {row[1] for row in cursor.fetchall()}
+        selected = "entry_id, entry_hash, signature, signing_key_id"
+        if "merkle_root_id" in columns:
+            selected += ", merkle_root_id, merkle_proof"
+        return selected
+
+    def _load_batch_root(
+        self, root_id: int, root_cache: Dict[int, Tuple[bool, Optional[dict]]], cursor: Optional[sqlite3.Cursor]
+    ) -> Tuple[bool, Optional[dict]]:
+        """Load a batch root and check its signature once per verification pass."""
+        if root_id in root_cache:
+            return root_cache[root_id]
+
+        conn = None
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
+            if cursor is None:
+                conn = sqlite3.connect(self.db_path)
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
             cursor.execute(
-                """
-                SELECT entry_id, entry_hash, signature, signing_key_id
-                FROM audit_log
-                WHERE sequence_number >= ? AND sequence_number <= ?
-                ORDER BY sequence_number
-            """,
-                (start_seq, end_seq),
+                "SELECT root_id, root_hash, signature, signing_key_id FROM audit_roots WHERE root_id = ?", (root_id,)
             )
+            row = cursor.fetchone()
+        finally:
+            if conn:
+                conn.close()
 
-            entries = cursor.fetchall()
-            conn.close()
-
-            errors: List[str] = []
-            verified_count = 0
-
-            for entry in entries:
-                if self.signature_manager.verify_signature(
-                    entry["entry_hash"], entry["signature"], entry["signing_key_id"]
-                ):
-                    verified_count += 1
-                else:
-                    errors.append(f"Invalid signature for entry {entry['entry_id']} (seq {start_seq}-{end_seq})")
-
-            return SignatureVerificationResult(
-                valid=len(errors) == 0,
-                entries_signed=len(entries),
-                entries_verified=verified_count,
-                errors=errors,
-                untrusted_keys=[],
-            )
+        if not row or not row["signature"]:
+            root_cache[root_id] = (False, None)
+        else:
+            root = dict(row)
+            signed = self.signature_manager.verify_signature(root["root_hash"], root["signature"], root["signing_key_id"])
+            root_cache[root_id] = (signed, root)
+        return root_cache[root_id]
+
+    def _verify_entry_signature(
+        self,
+        entry: dict,
+        root_cache: Dict[int, Tuple[bool, Optional[dict]]],
+        cursor: Optional[sqlite3.Cursor] = None,
+    ) -> Tuple[bool, Optional[str]]:
+        """Verify an entry's own signature or, for batched entries, its inclusion under a signed root."""
+        root_id = entry.get("merkle_root_id")
+        if root_id is None:
+            if self.signature_manager.verify_signature(
+                entry["entry_hash"], entry["signature"], entry["signing_key_id"]
+            ):
+                return True, None
+            return False, f"Invalid signature for entry {entry['entry_id']}"
 
+        try:
+            signed, root = self._load_batch_root(root_id, root_cache, cursor)
         except sqlite3.Error as e:
-            logger.error(f"Database error verifying range signatures: {e}")
-            return SignatureVerificationResult(
-                valid=False, entries_signed=0, entries_verified=0, errors=[f"Database error: {e}"], untrusted_keys=[]
-            )
+            return False, f"Entry {entry['entry_id']}: failed to load batch root {root_id}: {e}"
+        if root is None:
+            return False, f"Entry {entry['entry_id']}: batch root {root_id} missing or unsigned"
+        if not signed:
+            return False, f"Invalid signature for batch root {root_id} (entry {entry['entry_id']})"
+
+        try:
+            proof = decode_proof(entry.get("merkle_proof") or "[]")
+        except (ValueError, TypeError):
+            return False, f"Entry {entry['entry_id']}: malformed Merkle proof"
+        if not verify_merkle_proof(entry["entry_hash"], proof, root["root_hash"]):
+            return False, f"Entry {entry['entry_id']} not included in batch root {root_id}"
+        return True, None
 
     def get_verification_report(self) -> VerificationReport:
         """Generate a comprehensive verification report"""
@@ -354,13 +638,33 @@ class AuditVerifier:
 
             cursor.execute(
                 """
-                SELECT root_id, sequence_start, sequence_end, root_hash, timestamp
+                SELECT *
                 FROM audit_roots
                 ORDER BY sequence_start
             """
             )
 
-            roots = cursor.fetchall()
+            roots = [dict(row) for row in cursor.fetchall()]
+
+            # Batch roots written by batched signing must match the Merkle root of their range
+            batch_root_errors: Dict[int, str] = {}
+            for root in roots:
+                if not root.get("signature"):
+                    continue
+                cursor.execute(
+                    """
+                    SELECT entry_hash FROM audit_log
+                    WHERE sequence_number >= ? AND sequence_number <= ?
+                    ORDER BY sequence_number
+                """,
+                    (root["sequence_start"], root["sequence_end"]),
+                )
+                leaves = [row[0] for row in cursor.fetchall()]
+                if not leaves or merkle_root(leaves) != root["root_hash"]:
+                    batch_root_errors[root["root_id"]] = (
+                        f"Root {root['root_id']} invalid: Merkle root does not match entries "
+                        f"{root['sequence_start']}-{root['sequence_end']}"
+                    )
             conn.close()
 
             if not roots:
@@ -372,6 +676,10 @@ class AuditVerifier:
             verified_count = 0
 
             for root in roots:
+                if root["root_id"] in batch_root_errors:
+                    errors.append(batch_root_errors[root["root_id"]])
+                    continue
+
                 range_result = self.verify_range(root["sequence_start"], root["sequence_end"])
 
                 if range_result.valid:
@@ -249,8 +249,9 @@ class MemoryBus(BaseBus[MemoryService]):
         handler_name: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
+        limit: Optional[int] = 1000,
     ) -> List[TimeSeriesDataPoint]:
-        """Recall time-series data."""
+        """Recall time-series data, capped at limit points unless limit is None."""
         service = await self.get_service(
             handler_name=handler_name or "unknown", required_capabilities=["recall_timeseries"]
         )
@@ -260,7 +261,9 @@ class MemoryBus(BaseBus[MemoryService]):
             return []
 
         try:
-            return await service.recall_timeseries(scope, hours, correlation_types)
+            return await service.recall_timeseries(
+                scope, hours, correlation_types, start_time=start_time, end_time=end_time, limit=limit
+            )
         except Exception as e:
             logger.error(f"Failed to recall timeseries: {e}", exc_info=True)
             return []
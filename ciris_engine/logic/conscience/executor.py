@@ -0,0 +1,148 @@
+"""
+Concurrent conscience execution.
+
+Every enabled conscience checks the same (original) action, so the checks are
+independent and can run in parallel. Results are still resolved in registry
+priority order: the first conscience in that order that fails decides the
+override, exactly as the serial loop did.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from ciris_engine.logic.registries.circuit_breaker import CircuitBreakerError
+from ciris_engine.schemas.conscience.core import ConscienceCheckResult
+from ciris_engine.schemas.dma.results import ActionSelectionDMAResult
+
+from .registry import conscienceEntry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONSCIENCE_TIMEOUT_SECONDS = 30.0
+
+# Outcome statuses
+PASSED = "passed"
+FAILED = "failed"
+ERROR = "error"
+TIMEOUT = "timeout"
+UNAVAILABLE = "unavailable"
+CANCELLED = "cancelled"
+
+
+@dataclass
+class ConscienceOutcome:
+    """What happened when one conscience was evaluated."""
+
+    name: str
+    status: str
+    latency_ms: float = 0.0
+    result: Optional[ConscienceCheckResult] = None
+
+    @property
+    def overrides(self) -> bool:
+        return self.status == FAILED
+
+
+def _timeout_for(entry: conscienceEntry) -> float:
+    cb = entry.circuit_breaker
+    if cb is not None and getattr(cb, "config", None) is not None:
+        return float(cb.config.timeout_duration)
+    return DEFAULT_CONSCIENCE_TIMEOUT_SECONDS
+
+
+async def _run_one(
+    entry: conscienceEntry, action: ActionSelectionDMAResult, context: Dict[str, Any]
+) -> ConscienceOutcome:
+    cb = entry.circuit_breaker
+    start = time.perf_counter()
+    try:
+        if cb:
+            cb.check_and_raise()
+        async with asyncio.timeout(_timeout_for(entry)):
+            result = await entry.conscience.check(action, context)
+        if cb:
+            cb.record_success()
+        status = PASSED if result.passed else FAILED
+        return ConscienceOutcome(entry.name, status, (time.perf_counter() - start) * 1000, result)
+    except CircuitBreakerError as e:
+        logger.warning(f"conscience {entry.name} unavailable: {e}")
+        return ConscienceOutcome(entry.name, UNAVAILABLE, (time.perf_counter() - start) * 1000)
+    except TimeoutError:
+        logger.error(f"conscience {entry.name} timed out after {_timeout_for(entry):.1f}s")
+        if cb:
+            cb.record_failure()
+        return ConscienceOutcome(entry.name, TIMEOUT, (time.perf_counter() - start) * 1000)
+    except asyncio.CancelledError:
+        # Early-cancelled because a higher priority conscience already decided; not a fault
+        return ConscienceOutcome(entry.name, CANCELLED, (time.perf_counter() - start) * 1000)
+    except Exception as e:  # noqa: BLE001
+        logger.error(f"conscience {entry.name} error: {e}", exc_info=True)
+        if cb:
+            cb.record_failure()
+        return ConscienceOutcome(entry.name, ERROR, (time.perf_counter() - start) * 1000)
+
+
+def _decided(outcomes: Sequence[Optional[ConscienceOutcome]]) -> Optional[int]:
+    """Index of the deciding override, once every higher priority conscience has finished."""
+    for index, outcome in enumerate(outcomes):
+        if outcome is None:
+            return None
+        if outcome.overrides:
+            return index
+    return None
+
+
+async def run_consciences(
+    entries: Sequence[conscienceEntry],
+    action: ActionSelectionDMAResult,
+    context: Dict[str, Any],
+    early_cancel: bool = False,
+) -> List[ConscienceOutcome]:
+    """Run all consciences concurrently and return their outcomes in priority order.
+
+    With ``early_cancel`` the remaining checks are cancelled as soon as an
+    override is decisive, i.e. it failed and every conscience ahead of it in
+    priority order has already finished.
+    """
+    if not entries:
+        return []
+
+    tasks: Dict["asyncio.Task[ConscienceOutcome]", int] = {
+        asyncio.create_task(_run_one(entry, action, context), name=f"conscience:{entry.name}"): index
+        for index, entry in enumerate(entries)
+    }
+    outcomes: List[Optional[ConscienceOutcome]] = [None] * len(entries)
+    pending = set(tasks)
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                outcomes[tasks[task]] = task.result()
+
+            if early_cancel and pending:
+                decided = _decided(outcomes)
+                if decided is not None:
+                    logger.debug(
+                        f"conscience {entries[decided].name} override is decisive - cancelling {len(pending)} checks"
+                    )
+                    for task in pending:
+                        task.cancel()
+                    for task in pending:
+                        try:
+                            outcomes[tasks[task]] = await task
+                        except asyncio.CancelledError:
+                            # Cancelled before it started running
+                            outcomes[tasks[task]] = ConscienceOutcome(entries[tasks[task]].name, CANCELLED)
+                    pending = set()
+    finally:
+        # If the caller is cancelled, do not leave checks running
+        for task in pending:
+            task.cancel()
+
+    return [outcome for outcome in outcomes if outcome is not None]
@@ -4,14 +4,17 @@ Separates per-batch vs per-thought operations for performance.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Union
 
 from ciris_engine.logic import persistence
 from ciris_engine.schemas.runtime.models import Task
-from ciris_engine.schemas.runtime.system_context import SystemSnapshot, TaskSummary, TelemetrySummary
+from ciris_engine.schemas.runtime.system_context import SystemSnapshot, TaskSummary, TelemetrySummary, UserProfile
+from ciris_engine.schemas.services.graph.memory import UserGraphProfile
 from ciris_engine.schemas.services.graph_core import GraphScope, NodeType
 from ciris_engine.schemas.services.operations import MemoryQuery
 
+from .system_snapshot import build_user_profile, extract_user_ids, recall_user_graph_profiles
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,6 +44,9 @@ class BatchContextData:
         from ciris_engine.schemas.runtime.extended import ShutdownContext
 
         self.shutdown_context: Optional[ShutdownContext] = None
+        # User graph profiles for every user referenced by the batch
+        self.user_profiles: Dict[str, UserGraphProfile] = {}
+        self.user_profiles_checked: Set[str] = set()
 
 
 async def prefetch_batch_context(
@@ -50,6 +56,7 @@ async def prefetch_batch_context(
     resource_monitor: Optional[Any] = None,
     telemetry_service: Optional[Any] = None,
     runtime: Optional[Any] = None,
+    thoughts: Optional[List[Any]] = None,
 ) -> BatchContextData:
     """Pre-fetch all data that's common across a batch of thoughts."""
 
@@ -175,6 +182,14 @@ async def prefetch_batch_context(
     if runtime and hasattr(runtime, "current_shutdown_context"):
         batch_data.shutdown_context = runtime.current_shutdown_context
 
+    # 8. User Profiles (one lookup for every user mentioned across the batch)
+    if memory_service and thoughts:
+        user_ids = list(dict.fromkeys(user_id for thought in thoughts for user_id in extract_user_ids(thought)))
+        if user_ids:
+            logger.info(f"[DEBUG DB TIMING] Batch: fetching {len(user_ids)} user profiles")
+            batch_data.user_profiles = await recall_user_graph_profiles(memory_service, user_ids)
+            batch_data.user_profiles_checked.update(user_ids)
+
     logger.info("[DEBUG DB TIMING] Batch context prefetch complete")
     return batch_data
 
@@ -240,6 +255,21 @@ async def build_system_snapshot_with_batch(
         except Exception as e:
             logger.debug(f"Failed to retrieve channel context: {e}")
 
+    # User profiles, normally all prefetched for the batch
+    user_profiles: List[UserProfile] = []
+    if thought:
+        user_ids = extract_user_ids(thought)
+        unchecked = [user_id for user_id in user_ids if user_id not in batch_data.user_profiles_checked]
+        fetched = await recall_user_graph_profiles(memory_service, unchecked) if memory_service and unchecked else {}
+        for user_id in user_ids:
+            graph_profile = batch_data.user_profiles.get(user_id) or fetched.get(user_id)
+            if graph_profile is None:
+                continue
+            try:
+                user_profiles.append(build_user_profile(graph_profile))
+            except Exception as e:
+                logger.warning(f"Failed to build user profile for {user_id}: {e}")
+
     # Current task summary
     current_task_summary = None
     if task:
@@ -288,5 +318,5 @@ async def build_system_snapshot_with_batch(
         # Other fields
         shutdown_context=batch_data.shutdown_context,
         telemetry_summary=batch_data.telemetry_summary,
-        user_profiles=[],  # Not using dict, it expects a list
+        user_profiles=user_profiles,
     )
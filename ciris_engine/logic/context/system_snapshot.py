@@ -1,5 +1,6 @@
 import json
 import logging
+import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -13,11 +14,13 @@ from ciris_engine.schemas.adapters.tools import ToolInfo
 from ciris_engine.schemas.runtime.models import Task
 from ciris_engine.schemas.runtime.system_context import ChannelContext, SystemSnapshot, UserProfile
 from ciris_engine.schemas.services.core.runtime import ServiceHealthStatus
+from ciris_engine.schemas.services.graph.memory import ConnectedNodeInfo, UserGraphProfile
 from ciris_engine.schemas.services.graph_core import GraphScope, NodeType
 from ciris_engine.schemas.services.operations import MemoryQuery
 from ciris_engine.schemas.services.runtime_control import CircuitBreakerStatus
 
 from .secrets_snapshot import build_secrets_snapshot
+from .tool_catalog import get_tool_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -346,70 +349,13 @@ async def build_system_snapshot(
             logger.error(f"Failed to get adapter channels: {e}")
             raise  # FAIL FAST AND LOUD
 
-    # Get available tools from all adapters via tool bus
+    # Get available tools from all adapters, served from the cached tool catalog
     available_tools: Dict[str, List[ToolInfo]] = {}
     if runtime and hasattr(runtime, "bus_manager") and hasattr(runtime, "service_registry"):
         try:
-            service_registry = runtime.service_registry
-
-            # Get all tool services from registry
-            tool_services = service_registry.get_services_by_type("tool")
-
-            # Validate tool_services is iterable
-            if not hasattr(tool_services, "__iter__"):
-                logger.error(f"get_services_by_type('tool') returned non-iterable: {type(tool_services)}")
-                tool_services = []
-
-            for tool_service in tool_services:
-                # Get adapter context from the tool service
-                adapter_id = getattr(tool_service, "adapter_id", "unknown")
-
-                # Get available tools from this service
-                if hasattr(tool_service, "get_available_tools"):
-                    # Check if it's a coroutine function
-                    import inspect
-
-                    if inspect.iscoroutinefunction(tool_service.get_available_tools):
-                        tool_names = await tool_service.get_available_tools()
-                    else:
-                        tool_names = tool_service.get_available_tools()
-
-                    # Get detailed info for each tool
-                    tool_infos: List[ToolInfo] = []
-                    for tool_name in tool_names:
-                        # Get tool info - must return ToolInfo or None
-                        if hasattr(tool_service, "get_tool_info"):
-                            try:
-                                if inspect.iscoroutinefunction(tool_service.get_tool_info):
-                                    tool_info = await tool_service.get_tool_info(tool_name)
-                                else:
-                                    tool_info = tool_service.get_tool_info(tool_name)
-
-                                if tool_info:
-                                    if not isinstance(tool_info, ToolInfo):
-                                        raise TypeError(
-                                            f"Tool service {adapter_id} returned invalid type for {tool_name}: {type(tool_info)}, expected ToolInfo"
-                                        )
-                                    tool_infos.append(tool_info)
-                            except Exception as e:
-                                logger.error(f"Failed to get info for tool {tool_name}: {e}")
-                                raise
-
-                    if tool_infos:
-                        # Verify ALL tools are ToolInfo instances - FAIL FAST
-                        for ti in tool_infos:
-                            if not isinstance(ti, ToolInfo):
-                                raise TypeError(
-                                    f"Non-ToolInfo object in tool_infos: {type(ti)}, this violates type safety!"
-                                )
-
-                        # Group by adapter type (extract from adapter_id)
-                        adapter_type = adapter_id.split("_")[0] if "_" in adapter_id else adapter_id
-                        if adapter_type not in available_tools:
-                            available_tools[adapter_type] = []
-                        available_tools[adapter_type].extend(tool_infos)
-                        logger.debug(f"Found {len(tool_infos)} tools for {adapter_type} adapter")
-
+            available_tools = await get_tool_catalog(runtime.service_registry).get_available_tools(
+                runtime.service_registry
+            )
         except Exception as e:
             logger.error(f"Failed to get available tools: {e}")
             raise  # FAIL FAST AND LOUD
@@ -495,203 +441,37 @@ async def build_system_snapshot(
 
     # Enrich user profiles from memory graph (supplement or replace GraphQL data)
     if memory_service and thought:
-        # Extract user IDs from the thought content and context
-        user_ids_to_enrich = set()
-
-        # Look for user mentions in thought content (Discord format: <@USER_ID> or @username)
-        import re
-
-        thought_content = getattr(thought, "content", "")
-        # Discord user ID pattern
-        discord_mentions = re.findall(r"<@(\d+)>", thought_content)
-        user_ids_to_enrich.update(discord_mentions)
-        # Also look for "ID: <number>" pattern
-        id_mentions = re.findall(r"ID:\s*(\d+)", thought_content)
-        user_ids_to_enrich.update(id_mentions)
-
-        # Also check the current channel context for the message author
-        if hasattr(thought, "context") and thought.context:
-            if hasattr(thought.context, "user_id") and thought.context.user_id:
-                user_ids_to_enrich.add(str(thought.context.user_id))
-
+        user_ids_to_enrich = extract_user_ids(thought)
         logger.info(f"Enriching user profiles for users: {user_ids_to_enrich}")
 
         # Get existing user profiles or create new list
         existing_profiles = context_data.get("user_profiles", [])
         existing_user_ids = {p.user_id for p in existing_profiles}
+        # Already have profiles from GraphQL for these
+        needed = [user_id for user_id in user_ids_to_enrich if user_id not in existing_user_ids]
 
-        for user_id in user_ids_to_enrich:
-            if user_id in existing_user_ids:
-                continue  # Already have profile from GraphQL
+        graph_profiles = await recall_user_graph_profiles(memory_service, needed) if needed else {}
 
+        for user_id in needed:
+            graph_profile = graph_profiles.get(user_id)
+            if graph_profile is None:
+                continue
             try:
-                # Query user node with ALL attributes
-                user_query = MemoryQuery(
-                    node_id=f"user/{user_id}",
-                    scope=GraphScope.LOCAL,
-                    type=NodeType.USER,
-                    include_edges=True,  # Get edges too
-                    depth=2,  # Get connected nodes
+                user_profile = build_user_profile(graph_profile)
+                existing_profiles.append(user_profile)
+                logger.info(
+                    f"Added user profile for {user_id} with attributes: {list(graph_profile.attributes.keys())} "
+                    f"and {len(graph_profile.connected_nodes)} connected nodes"
                 )
-                logger.info(f"[DEBUG] Querying memory for user/{user_id}")
-                user_results = await memory_service.recall(user_query)
-
-                if user_results:
-                    user_node = user_results[0]
-                    # Extract ALL attributes from the user node - handle both dict and Pydantic model
-                    if not user_node.attributes:
-                        attrs = {}
-                    elif isinstance(user_node.attributes, dict):
-                        attrs = user_node.attributes
-                    elif hasattr(user_node.attributes, "model_dump"):
-                        attrs = user_node.attributes.model_dump()
-                    else:
-                        # Log warning but continue with empty dict instead of raising
-                        logger.warning(
-                            f"Unexpected user node attributes type for user {user_id}: {type(user_node.attributes)}, using empty dict"
-                        )
-                        attrs = {}
-
-                    # Get edges and connected nodes
-                    connected_nodes_info = []
-                    try:
-                        # Get edges for this user node
-                        from ciris_engine.logic.persistence.models.graph import get_edges_for_node
-
-                        edges = get_edges_for_node(f"user/{user_id}", GraphScope.LOCAL)
-
-                        for edge in edges:
-                            # Get the connected node
-                            connected_node_id = edge.target if edge.source == f"user/{user_id}" else edge.source
-                            connected_query = MemoryQuery(
-                                node_id=connected_node_id, scope=GraphScope.LOCAL, include_edges=False, depth=1
-                            )
-                            connected_results = await memory_service.recall(connected_query)
-                            if connected_results:
-                                connected_node = connected_results[0]
-                                # Handle different attribute types
-                                if not connected_node.attributes:
-                                    connected_attrs = {}
-                                elif hasattr(connected_node.attributes, "model_dump"):
-                                    # Pydantic model
-                                    connected_attrs = connected_node.attributes.model_dump()
-                                elif isinstance(connected_node.attributes, dict):
-                                    # Already a dict (e.g., from tsdb_summary nodes)
-                                    connected_attrs = connected_node.attributes
-                                else:
-                                    # Unknown type - log and skip this node
-                                    logger.debug(
-                                        f"Unexpected attributes type for {connected_node_id}: {type(connected_node.attributes)}"
-                                    )
-                                    continue
-                                connected_nodes_info.append(
-                                    {
-                                        "node_id": connected_node.id,
-                                        "node_type": connected_node.type,
-                                        "relationship": edge.relationship,
-                                        "attributes": connected_attrs,
-                                    }
-                                )
-                    except Exception as e:
-                        logger.warning(f"Failed to get connected nodes for user {user_id}: {e}")
-
-                    # Create UserProfile with all available data
-                    # Use json.dumps with default handler for datetime objects
-                    def json_serial(obj):
-                        """JSON serializer for objects not serializable by default json code"""
-                        if hasattr(obj, "isoformat"):
-                            return obj.isoformat()
-                        if hasattr(obj, "model_dump"):
-                            return obj.model_dump()
-                        return str(obj)
-
-                    notes_content = f"All attributes: {json.dumps(attrs, default=json_serial)}"
-                    if connected_nodes_info:
-                        notes_content += f"\nConnected nodes: {json.dumps(connected_nodes_info, default=json_serial)}"
-
-                    user_profile = UserProfile(
-                        user_id=user_id,
-                        display_name=attrs.get("username", attrs.get("display_name", f"User_{user_id}")),
-                        created_at=datetime.now(),  # Could parse from node if available
-                        preferred_language=attrs.get("language", "en"),
-                        timezone=attrs.get("timezone", "UTC"),
-                        communication_style=attrs.get("communication_style", "formal"),
-                        trust_level=attrs.get("trust_level", 0.5),
-                        last_interaction=attrs.get("last_seen"),
-                        is_wa=attrs.get("is_wa", False),
-                        permissions=attrs.get("permissions", []),
-                        restrictions=attrs.get("restrictions", []),
-                        # Store ALL other attributes and connected nodes in notes for access
-                        notes=notes_content,
-                    )
-                    existing_profiles.append(user_profile)
-                    logger.info(
-                        f"Added user profile for {user_id} with attributes: {list(attrs.keys())} and {len(connected_nodes_info)} connected nodes"
-                    )
 
                 # Get messages from other channels
                 if channel_id:
-                    # Query service correlations for user's recent messages
-                    with persistence.get_db_connection() as conn:
-                        cursor = conn.cursor()
-                        # Look for handler actions from this user in other channels
-                        cursor.execute(
-                            """
-                            SELECT
-                                c.correlation_id,
-                                c.handler_name,
-                                c.request_data,
-                                c.created_at,
-                                c.tags
-                            FROM service_correlations c
-                            WHERE
-                                c.tags LIKE ?
-                                AND c.tags NOT LIKE ?
-                                AND c.handler_name IN ('ObserveHandler', 'SpeakHandler')
-                            ORDER BY c.created_at DESC
-                            LIMIT 3
-                        """,
-                            (f'%"user_id":"{user_id}"%', f'%"channel_id":"{channel_id}"%'),
+                    recent_messages = _recent_messages_in_other_channels(user_id, str(channel_id))
+                    if recent_messages:
+                        user_profile.notes = (
+                            f"{user_profile.notes}\nRecent messages from other channels: "
+                            f"{json.dumps(recent_messages, default=_json_serial)}"
                         )
-
-                        recent_messages = []
-                        for row in cursor.fetchall():
-                            try:
-                                tags = json.loads(row["tags"]) if row["tags"] else {}
-                                msg_channel = tags.get("channel_id", "unknown")
-                                msg_content = "Message in " + msg_channel
-
-                                # Try to extract content from request_data
-                                if row["request_data"]:
-                                    req_data = json.loads(row["request_data"])
-                                    if isinstance(req_data, dict):
-                                        msg_content = req_data.get("content", req_data.get("message", msg_content))
-
-                                recent_messages.append(
-                                    {
-                                        "channel": msg_channel,
-                                        "content": msg_content,
-                                        "timestamp": (
-                                            row["created_at"].isoformat()
-                                            if hasattr(row["created_at"], "isoformat")
-                                            else str(row["created_at"])
-                                        ),
-                                    }
-                                )
-                            except (json.JSONDecodeError, TypeError, AttributeError, KeyError):
-                                # JSONDecodeError: malformed JSON in tags or request_data
-                                # TypeError: row['tags'] or row['request_data'] is not a string
-                                # AttributeError: row object missing expected attributes
-                                # KeyError: row dictionary missing expected keys
-                                pass
-
-                        if recent_messages and existing_profiles:
-                            # Find the user profile we just added
-                            for profile in existing_profiles:
-                                if profile.user_id == user_id:
-                                    profile.notes += f"\nRecent messages from other channels: {json.dumps(recent_messages, default=json_serial)}"
-                                    break
-
             except Exception as e:
                 logger.warning(f"Failed to enrich user {user_id}: {e}")
 
@@ -706,3 +486,211 @@ async def build_system_snapshot(
     # as it stores telemetry data directly in the graph
 
     return snapshot
+
+
+def extract_user_ids(thought: Any) -> List[str]:
+    """User IDs mentioned in a thought's content or attached to its context."""
+    user_ids: List[str] = []
+
+    # Look for user mentions in thought content (Discord format: <@USER_ID>)
+    thought_content = getattr(thought, "content", "")
+    if not isinstance(thought_content, str):
+        thought_content = ""
+    user_ids.extend(re.findall(r"<@(\d+)>", thought_content))
+    # Also look for "ID: <number>" pattern
+    user_ids.extend(re.findall(r"ID:\s*(\d+)", thought_content))
+
+    # Also check the current channel context for the message author
+    if hasattr(thought, "context") and thought.context:
+        if hasattr(thought.context, "user_id") and thought.context.user_id:
+            user_ids.append(str(thought.context.user_id))
+
+    return list(dict.fromkeys(user_ids))
+
+
+async def recall_user_graph_profiles(memory_service: Any, user_ids: List[str]) -> Dict[str, UserGraphProfile]:
+    """User nodes and their connected nodes, keyed by user ID.
+
+    The local graph service answers for all users at once from its profile
+    cache; other memory services fall back to recalling each user separately.
+    """
+    if isinstance(memory_service, LocalGraphMemoryService):
+        try:
+            return await memory_service.recall_user_profiles(user_ids)
+        except Exception as e:
+            logger.warning(f"Failed to recall user profiles for {user_ids}: {e}")
+            return {}
+
+    profiles: Dict[str, UserGraphProfile] = {}
+    for user_id in user_ids:
+        try:
+            profile = await _recall_user_graph_profile(memory_service, user_id)
+        except Exception as e:
+            logger.warning(f"Failed to enrich user {user_id}: {e}")
+            continue
+        if profile is not None:
+            profiles[user_id] = profile
+    return profiles
+
+
+async def _recall_user_graph_profile(memory_service: Any, user_id: str) -> Optional[UserGraphProfile]:
+    # Query user node with ALL attributes
+    user_query = MemoryQuery(
+        node_id=f"user/{user_id}",
+        scope=GraphScope.LOCAL,
+        type=NodeType.USER,
+        include_edges=True,  # Get edges too
+        depth=2,  # Get connected nodes
+    )
+    user_results = await memory_service.recall(user_query)
+    if not user_results:
+        return None
+
+    attrs = _attributes_dict(user_results[0].attributes)
+    if attrs is None:
+        # Log warning but continue with empty dict instead of raising
+        logger.warning(
+            f"Unexpected user node attributes type for user {user_id}: {type(user_results[0].attributes)}, "
+            "using empty dict"
+        )
+        attrs = {}
+
+    # Get edges and connected nodes
+    connected_nodes: List[ConnectedNodeInfo] = []
+    try:
+        from ciris_engine.logic.persistence.models.graph import get_edges_for_node
+
+        edges = get_edges_for_node(f"user/{user_id}", GraphScope.LOCAL)
+
+        for edge in edges:
+            # Get the connected node
+            connected_node_id = edge.target if edge.source == f"user/{user_id}" else edge.source
+            connected_query = MemoryQuery(
+                node_id=connected_node_id, scope=GraphScope.LOCAL, include_edges=False, depth=1
+            )
+            connected_results = await memory_service.recall(connected_query)
+            if not connected_results:
+                continue
+            connected_node = connected_results[0]
+            connected_attrs = _attributes_dict(connected_node.attributes)
+            if connected_attrs is None:
+                # Unknown type - log and skip this node
+                logger.debug(f"Unexpected attributes type for {connected_node_id}: {type(connected_node.attributes)}")
+                continue
+            connected_nodes.append(
+                ConnectedNodeInfo(
+                    node_id=connected_node.id,
+                    node_type=str(getattr(connected_node.type, "value", connected_node.type)),
+                    relationship=edge.relationship,
+                    attributes=connected_attrs,
+                )
+            )
+    except Exception as e:
+        logger.warning(f"Failed to get connected nodes for user {user_id}: {e}")
+
+    return UserGraphProfile(user_id=user_id, attributes=attrs, connected_nodes=connected_nodes)
+
+
+def _attributes_dict(attributes: Any) -> Optional[dict]:
+    """Node attributes as a dict, or None if they are of an unexpected type."""
+    if not attributes:
+        return {}
+    if isinstance(attributes, dict):
+        return attributes
+    if hasattr(attributes, "model_dump"):
+        return attributes.model_dump()  # type: ignore[no-any-return]
+    return None
+
+
+def _json_serial(obj: Any) -> Any:
+    """JSON serializer for objects not serializable by default json code"""
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    return str(obj)
+
+
+def build_user_profile(graph_profile: UserGraphProfile) -> UserProfile:
+    """UserProfile for a user node, with all attributes and connected nodes kept in the notes."""
+    attrs = graph_profile.attributes
+    user_id = graph_profile.user_id
+
+    notes_content = f"All attributes: {json.dumps(attrs, default=_json_serial)}"
+    if graph_profile.connected_nodes:
+        connected_nodes_info = [info.model_dump() for info in graph_profile.connected_nodes]
+        notes_content += f"\nConnected nodes: {json.dumps(connected_nodes_info, default=_json_serial)}"
+
+    return UserProfile(
+        user_id=user_id,
+        display_name=attrs.get("username", attrs.get("display_name", f"User_{user_id}")),
+        created_at=datetime.now(),  # Could parse from node if available
+        preferred_language=attrs.get("language", "en"),
+        timezone=attrs.get("timezone", "UTC"),
+        communication_style=attrs.get("communication_style", "formal"),
+        trust_level=attrs.get("trust_level", 0.5),
+        last_interaction=attrs.get("last_seen"),
+        is_wa=attrs.get("is_wa", False),
+        permissions=attrs.get("permissions", []),
+        restrictions=attrs.get("restrictions", []),
+        # Store ALL other attributes and connected nodes in notes for access
+        notes=notes_content,
+    )
+
+
+def _recent_messages_in_other_channels(user_id: str, channel_id: str) -> List[Dict[str, str]]:
+    """The user's latest messages outside ``channel_id``, from service correlations."""
+    recent_messages: List[Dict[str, str]] = []
+    with persistence.get_db_connection() as conn:
+        cursor = conn.cursor()
+        # Look for handler actions from this user in other channels
+        cursor.execute(
+            """
+            SELECT
+                c.correlation_id,
+                c.handler_name,
+                c.request_data,
+                c.created_at,
+                c.tags
+            FROM service_correlations c
+            WHERE
+                c.tags LIKE ?
+                AND c.tags NOT LIKE ?
+                AND c.handler_name IN ('ObserveHandler', 'SpeakHandler')
+            ORDER BY c.created_at DESC
+            LIMIT 3
+        """,
+            (f'%"user_id":"{user_id}"%', f'%"channel_id":"{channel_id}"%'),
+        )
+
+        for row in cursor.fetchall():
+            try:
+                tags = json.loads(row["tags"]) if row["tags"] else {}
+                msg_channel = tags.get("channel_id", "unknown")
+                msg_content = "Message in " + msg_channel
+
+                # Try to extract content from request_data
+                if row["request_data"]:
+                    req_data = json.loads(row["request_data"])
+                    if isinstance(req_data, dict):
+                        msg_content = req_data.get("content", req_data.get("message", msg_content))
+
+                recent_messages.append(
+                    {
+                        "channel": msg_channel,
+                        "content": msg_content,
+                        "timestamp": (
+                            row["created_at"].isoformat()
+                            if hasattr(row["created_at"], "isoformat")
+                            else str(row["created_at"])
+                        ),
+                    }
+                )
+            except (json.JSONDecodeError, TypeError, AttributeError, KeyError):
+                # JSONDecodeError: malformed JSON in tags or request_data
+                # TypeError: row['tags'] or row['request_data'] is not a string
+                # AttributeError: row object missing expected attributes
+                # KeyError: row dictionary missing expected keys
+                pass
+
+    return recent_messages
@@ -0,0 +1,130 @@
+"""
+Catalog of the tools every registered tool service offers.
+
+Tool sets only change when adapters load or unload, so the catalog is built
+once and reused by every snapshot. It is keyed on a version, bumped by the
+adapter manager, and on the identity of the healthy tool services, so a newly
+registered service or an opened circuit breaker also triggers a rebuild.
+"""
+
+import inspect
+import logging
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+from ciris_engine.schemas.adapters.tools import ToolInfo
+
+logger = logging.getLogger(__name__)
+
+
+class ToolCatalog:
+    """Available tools grouped by adapter type, rebuilt only when it can have changed."""
+
+    def __init__(self) -> None:
+        self._version = 0
+        self._key: Optional[Tuple[int, Tuple[int, ...]]] = None
+        self._tools: Dict[str, List[ToolInfo]] = {}
+        self._builds = 0
+        self._hits = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def invalidate(self) -> None:
+        """Force a rebuild on the next lookup (adapter loaded or unloaded)."""
+        self._version += 1
+        self._key = None
+
+    async def get_available_tools(self, service_registry: Any) -> Dict[str, List[ToolInfo]]:
+        """Tools by adapter type for the tool services currently in ``service_registry``.
+
+        The returned mapping is shared between callers and must not be mutated.
+        """
+        tool_services = service_registry.get_services_by_type("tool")
+
+        # Validate tool_services is iterable
+        if not hasattr(tool_services, "__iter__"):
+            logger.error(f"get_services_by_type('tool') returned non-iterable: {type(tool_services)}")
+            tool_services = []
+        tool_services = list(tool_services)
+
+        key = (self._version, tuple(id(service) for service in tool_services))
+        if key == self._key:
+            self._hits += 1
+            return self._tools
+
+        # Nothing is cached if building fails, so a broken tool service fails every snapshot
+        tools = await _collect_tools(tool_services)
+        if self._version == key[0]:
+            self._tools = tools
+            self._key = key
+            self._builds += 1
+            logger.debug(f"Built tool catalog v{self._version}: {sum(len(t) for t in tools.values())} tools")
+        return tools
+
+    def get_metrics(self) -> Dict[str, float]:
+        return {
+            "tool_catalog_version": float(self._version),
+            "tool_catalog_builds": float(self._builds),
+            "tool_catalog_hits": float(self._hits),
+        }
+
+
+async def _collect_tools(tool_services: List[Any]) -> Dict[str, List[ToolInfo]]:
+    available_tools: Dict[str, List[ToolInfo]] = {}
+
+    for tool_service in tool_services:
+        # Get adapter context from the tool service
+        adapter_id = getattr(tool_service, "adapter_id", "unknown")
+
+        if not hasattr(tool_service, "get_available_tools"):
+            continue
+
+        if inspect.iscoroutinefunction(tool_service.get_available_tools):
+            tool_names = await tool_service.get_available_tools()
+        else:
+            tool_names = tool_service.get_available_tools()
+
+        # Get detailed info for each tool
+        tool_infos: List[ToolInfo] = []
+        if hasattr(tool_service, "get_tool_info"):
+            get_info_is_async = inspect.iscoroutinefunction(tool_service.get_tool_info)
+            for tool_name in tool_names:
+                # Get tool info - must return ToolInfo or None
+                try:
+                    if get_info_is_async:
+                        tool_info = await tool_service.get_tool_info(tool_name)
+                    else:
+                        tool_info = tool_service.get_tool_info(tool_name)
+
+                    if tool_info:
+                        if not isinstance(tool_info, ToolInfo):
+                            raise TypeError(
+                                f"Tool service {adapter_id} returned invalid type for {tool_name}: "
+                                f"{type(tool_info)}, expected ToolInfo"
+                            )
+                        tool_infos.append(tool_info)
+                except Exception as e:
+                    logger.error(f"Failed to get info for tool {tool_name}: {e}")
+                    raise
+
+        if tool_infos:
+            # Group by adapter type (extract from adapter_id)
+            adapter_type = adapter_id.split("_")[0] if "_" in adapter_id else adapter_id
+            available_tools.setdefault(adapter_type, []).extend(tool_infos)
+            logger.debug(f"Found {len(tool_infos)} tools for {adapter_type} adapter")
+
+    return available_tools
+
+
+_catalogs: "weakref.WeakKeyDictionary[Any, ToolCatalog]" = weakref.WeakKeyDictionary()
+
+
+def get_tool_catalog(service_registry: Any) -> ToolCatalog:
+    """Return the tool catalog for ``service_registry``, creating it on first use."""
+    catalog = _catalogs.get(service_registry)
+    if catalog is None:
+        catalog = ToolCatalog()
+        _catalogs[service_registry] = catalog
+    return catalog
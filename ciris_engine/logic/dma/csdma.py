@@ -74,6 +74,7 @@ class CSDMAEvaluator(BaseDMA, CSDMAProtocol):
         """Assemble prompt messages using canonical formatting utilities and prompt loader."""
         messages = []
 
+        self.prompt_template_data = self.prompt_loader.reload_if_changed(self.prompt_template_data)
         if self.prompt_loader.uses_covenant_header(self.prompt_template_data):
             messages.append({"role": "system", "content": COVENANT_TEXT})
 
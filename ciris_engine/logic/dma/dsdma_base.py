@@ -58,6 +58,8 @@ class BaseDSDMA(BaseDMA, DSDMAProtocol):
         self.domain_specific_knowledge = domain_specific_knowledge if domain_specific_knowledge else {}
 
         self.prompt_loader = get_prompt_loader()
+        # An explicit template wins over edits to dsdma_base.yml
+        self._prompt_template_overridden = prompt_template is not None
         try:
             prompt_collection = self.prompt_loader.load_prompt_template("dsdma_base")
             self.prompt_template_data = prompt_collection
@@ -119,6 +121,15 @@ class BaseDSDMA(BaseDMA, DSDMAProtocol):
 
         return await self.evaluate_thought(input_data, dma_input_data)
 
+    def _reload_prompt_template(self) -> None:
+        """Pick up edits to the prompt file, as CSDMA and PDMA do."""
+        current = self.prompt_loader.reload_if_changed(self.prompt_template_data)
+        if current is self.prompt_template_data:
+            return
+        self.prompt_template_data = current
+        if not self._prompt_template_overridden:
+            self.prompt_template = current.get_prompt("system_guidance_header") or ""
+
     async def evaluate_thought(
         self, thought_item: ProcessingQueueItem, current_context: Optional[DMAInputData]
     ) -> DSDMAResult:
@@ -238,6 +249,7 @@ class BaseDSDMA(BaseDMA, DSDMAProtocol):
 
         task_history_block = ""
 
+        self._reload_prompt_template()
         template_has_blocks = any(
             placeholder in self.prompt_template
             for placeholder in [
@@ -251,14 +263,15 @@ class BaseDSDMA(BaseDMA, DSDMAProtocol):
 
         if template_has_blocks:
             try:
-                system_message_content = self.prompt_template.format(
+                # Domain values are fixed per evaluator, so they are pre-rendered into the compiled template
+                system_message_content = self.prompt_loader.compile(
+                    self.prompt_template, domain_name=self.domain_name, rules_summary_str=rules_summary_str
+                ).render(
                     task_history_block=task_history_block,
                     escalation_guidance_block=escalation_guidance_block,
                     system_snapshot_block=system_snapshot_block,
                     user_profiles_block=user_profiles_block,
                     crisis_resources_block=crisis_resources_block,
-                    domain_name=self.domain_name,
-                    rules_summary_str=rules_summary_str,
                     context_str=context_str,
                 )
             except KeyError as e:
@@ -284,9 +297,9 @@ class BaseDSDMA(BaseDMA, DSDMAProtocol):
                     "Focus your evaluation on domain alignment."
                 )
 
-            system_message_content = system_message_template.format(
-                domain_name=self.domain_name, rules_summary_str=rules_summary_str, context_str=context_str
-            )
+            system_message_content = self.prompt_loader.compile(
+                system_message_template, domain_name=self.domain_name, rules_summary_str=rules_summary_str
+            ).render(context_str=context_str)
 
         full_snapshot_and_profile_context_str = system_snapshot_block + user_profiles_block
         user_message_content = f"{full_snapshot_and_profile_context_str}\nEvaluate this thought for the '{self.domain_name}' domain: \"{thought_content_str}\""
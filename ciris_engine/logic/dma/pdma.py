@@ -64,6 +64,7 @@ class EthicalPDMAEvaluator(BaseDMA, PDMAProtocol):
 
         messages = []
 
+        self.prompt_template_data = self.prompt_loader.reload_if_changed(self.prompt_template_data)
         if self.prompt_loader.uses_covenant_header(self.prompt_template_data):
             messages.append({"role": "system", "content": COVENANT_TEXT})
 
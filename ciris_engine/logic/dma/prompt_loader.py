@@ -3,11 +3,19 @@ Prompt Loader for DMA Systems
 
 This module provides functionality to load prompts from YAML files,
 separating prompt content from business logic for better maintainability.
+
+Templates are compiled once into literal segments and slots and cached by
+their text and any bound values, so per-thought prompt assembly only fills
+the slots and the static sections come out byte-identical every time.
+Loaded collections are re-read automatically when their file changes.
 """
 
 import logging
+import re
+import string
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
 
 import yaml
 
@@ -15,6 +23,117 @@ from ciris_engine.schemas.dma.prompts import PromptCollection
 
 logger = logging.getLogger(__name__)
 
+# Compiled prompts kept per loader; one per template version and set of bound values
+MAX_COMPILED_PROMPTS = 128
+
+_SYSTEM_SECTIONS = (
+    "system_guidance_header",
+    "domain_principles",
+    "evaluation_steps",
+    "evaluation_criteria",
+    "response_format",
+    "response_guidance",
+)
+
+_FileStamp = Tuple[int, int]
+_FIELD_SEPARATOR = re.compile(r"[.\[]")
+
+
+class PromptSlot(NamedTuple):
+    """A placeholder in a compiled prompt."""
+
+    name: str
+    field: str = ""  # Full "{...}" source when it has a conversion, format spec or index; "" for a plain name
+
+
+class CompiledPrompt:
+    """
+    A prompt template parsed once into literal segments and slots.
+
+    Rendering joins the literals with the slot values, which is equivalent to
+    str.format on the original template but skips re-parsing it. Adjacent
+    literals are merged, so text before the first slot is one stable string.
+    """
+
+    __slots__ = ("segments", "slots")
+
+    def __init__(self, segments: Tuple[Union[str, PromptSlot], ...]):
+        self.segments = segments
+        self.slots = frozenset(segment.name for segment in segments if isinstance(segment, PromptSlot))
+
+    @property
+    def is_static(self) -> bool:
+        """Whether the prompt has no slots left to fill."""
+        return not self.slots
+
+    @property
+    def static_prefix(self) -> str:
+        """Text before the first slot; identical for every render."""
+        return self.segments[0] if self.segments and isinstance(self.segments[0], str) else ""
+
+    def render(self, **kwargs: Any) -> str:
+        """
+        Fill the slots.
+
+        Raises:
+            KeyError: If a slot has no value, as str.format would
+        """
+        if len(self.segments) == 1 and isinstance(self.segments[0], str):
+            return self.segments[0]
+        parts = []
+        for segment in self.segments:
+            if isinstance(segment, str):
+                parts.append(segment)
+            elif segment.field:
+                parts.append(segment.field.format(**kwargs))
+            else:
+                parts.append(format(kwargs[segment.name]))
+        return "".join(parts)
+
+
+def compile_prompt(template: str, **bound: Any) -> CompiledPrompt:
+    """
+    Compile a str.format template, pre-rendering the slots given in `bound`.
+
+    Args:
+        template: Template with {placeholder} fields
+        **bound: Values that are fixed for every render, such as identity fields
+
+    Returns:
+        The compiled prompt
+    """
+    segments: List[Union[str, PromptSlot]] = []
+
+    def add_literal(text: str) -> None:
+        if not text:
+            return
+        if segments and isinstance(segments[-1], str):
+            segments[-1] += text
+        else:
+            segments.append(text)
+
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        add_literal(literal)
+        if field_name is None:
+            continue
+        if not (format_spec or conversion) and field_name.isidentifier():
+            if field_name in bound:
+                add_literal(format(bound[field_name]))
+            else:
+                segments.append(PromptSlot(field_name))
+            continue
+
+        # Conversions, format specs and attribute or index access are left to str.format
+        source = "{" + field_name
+        source += f"!{conversion}" if conversion else ""
+        source += f":{format_spec}" if format_spec else ""
+        source += "}"
+        try:
+            add_literal(source.format(**bound))
+        except (KeyError, IndexError):
+            segments.append(PromptSlot(_FIELD_SEPARATOR.split(field_name, 1)[0], source))
+    return CompiledPrompt(tuple(segments))
+
 
 class DMAPromptLoader:
     """Loads and manages DMA prompts from YAML files."""
@@ -36,6 +155,21 @@ class DMAPromptLoader:
         if not self.prompts_dir.exists():
             logger.warning(f"Prompts directory does not exist: {self.prompts_dir}")
 
+        # Parsed collections by template name, with the file stamp they were read at
+        self._collections: Dict[str, Tuple[_FileStamp, PromptCollection]] = {}
+        # Compiled prompts keyed by their template text and bound values, least recently used first
+        self._compiled: "OrderedDict[Tuple[Any, ...], CompiledPrompt]" = OrderedDict()
+        self._compile_hits = 0
+        self._compile_misses = 0
+
+    @staticmethod
+    def _file_stamp(path: Path) -> Optional[_FileStamp]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def load_prompt_template(self, template_name: str) -> PromptCollection:
         """
         Load a prompt template from a YAML file.
@@ -52,9 +186,14 @@ class DMAPromptLoader:
         """
         template_path = self.prompts_dir / f"{template_name}.yml"
 
-        if not template_path.exists():
+        stamp = self._file_stamp(template_path)
+        if stamp is None:
             raise FileNotFoundError(f"Prompt template not found: {template_path}")
 
+        cached = self._collections.get(template_name)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
         try:
             with open(template_path, "r", encoding="utf-8") as f:
                 template_data = yaml.safe_load(f)
@@ -99,6 +238,7 @@ class DMAPromptLoader:
                 elif key not in prompt_collection.model_fields and isinstance(value, str):
                     prompt_collection.custom_prompts[key] = value
 
+            self._collections[template_name] = (stamp, prompt_collection)
             return prompt_collection
 
         except yaml.YAMLError as e:
@@ -108,44 +248,96 @@ class DMAPromptLoader:
             logger.error(f"Failed to load template {template_path}: {e}")
             raise
 
-    def get_system_message(self, template_data: PromptCollection, **kwargs: Any) -> str:
+    def reload_if_changed(self, template_data: PromptCollection) -> PromptCollection:
         """
-        Build a system message from template data and variables.
+        Return the current version of a loaded template, re-reading its file if it changed.
 
         Args:
-            template_data: The loaded template data
-            **kwargs: Variables to substitute in the template
+            template_data: A collection previously returned by load_prompt_template
 
         Returns:
-            Formatted system message string
+            The up-to-date collection, or template_data itself if the file is
+            unchanged, gone or no longer loads
+        """
+        template_name = template_data.component_name
+        cached = self._collections.get(template_name)
+        if cached is None or cached[1] is not template_data:
+            # Not loaded from a file by this loader (or already superseded)
+            return cached[1] if cached is not None else template_data
+        if self._file_stamp(self.prompts_dir / f"{template_name}.yml") == cached[0]:
+            return template_data
+        try:
+            return self.load_prompt_template(template_name)
+        except Exception as e:
+            logger.warning(f"Keeping previous version of prompt template {template_name}: {e}")
+            return template_data
+
+    def compile(self, template: str, **bound: Any) -> CompiledPrompt:
+        """
+        Get the compiled form of a template, compiling it on first use.
+
+        Args:
+            template: Template with {placeholder} fields
+            **bound: Values fixed for every render (e.g. identity fields); part of the cache key
+
+        Returns:
+            The compiled prompt
+        """
+        key = (template, tuple(sorted((name, str(value)) for name, value in bound.items())))
+        compiled = self._compiled.get(key)
+        if compiled is not None:
+            self._compiled.move_to_end(key)
+            self._compile_hits += 1
+            return compiled
+
+        self._compile_misses += 1
+        compiled = compile_prompt(template, **bound)
+        self._compiled[key] = compiled
+        if len(self._compiled) > MAX_COMPILED_PROMPTS:
+            self._compiled.popitem(last=False)
+        return compiled
+
+    def compile_system_message(self, template_data: PromptCollection, **bound: Any) -> CompiledPrompt:
         """
-        system_parts = []
+        Compile the system message sections of a template into one prompt.
 
-        # Add main system guidance header
-        if template_data.system_guidance_header:
-            system_parts.append(template_data.system_guidance_header.format(**kwargs))
+        Args:
+            template_data: The loaded template data
+            **bound: Values fixed for every render
+
+        Returns:
+            The compiled system message
+        """
+        sections = [getattr(template_data, name) for name in _SYSTEM_SECTIONS]
+        return self.compile("\n\n".join(section for section in sections if section), **bound)
 
-        # Add domain principles if present
-        if template_data.domain_principles:
-            system_parts.append(template_data.domain_principles.format(**kwargs))
+    def compile_user_message(self, template_data: PromptCollection, **bound: Any) -> Optional[CompiledPrompt]:
+        """
+        Compile the user message template, if the collection has one.
 
-        # Add evaluation steps if present
-        if template_data.evaluation_steps:
-            system_parts.append(template_data.evaluation_steps.format(**kwargs))
+        Args:
+            template_data: The loaded template data
+            **bound: Values fixed for every render
 
-        # Add evaluation criteria if present
-        if template_data.evaluation_criteria:
-            system_parts.append(template_data.evaluation_criteria.format(**kwargs))
+        Returns:
+            The compiled user message, or None when the fallback message is used
+        """
+        if not template_data.context_integration:
+            return None
+        return self.compile(template_data.context_integration, **bound)
 
-        # Add response format guidance if present
-        if template_data.response_format:
-            system_parts.append(template_data.response_format.format(**kwargs))
+    def get_system_message(self, template_data: PromptCollection, **kwargs: Any) -> str:
+        """
+        Build a system message from template data and variables.
 
-        # Add response guidance if present
-        if template_data.response_guidance:
-            system_parts.append(template_data.response_guidance.format(**kwargs))
+        Args:
+            template_data: The loaded template data
+            **kwargs: Variables to substitute in the template
 
-        return "\n\n".join(system_parts)
+        Returns:
+            Formatted system message string
+        """
+        return self.compile_system_message(template_data).render(**kwargs)
 
     def get_user_message(self, template_data: PromptCollection, **kwargs: Any) -> str:
         """
@@ -158,12 +350,27 @@ class DMAPromptLoader:
         Returns:
             Formatted user message string
         """
-        if template_data.context_integration:
-            return template_data.context_integration.format(**kwargs)
+        compiled = self.compile_user_message(template_data)
+        if compiled is not None:
+            return compiled.render(**kwargs)
         else:
             # Fallback for basic context integration
             return f"Thought to evaluate: {kwargs.get('original_thought_content', '')}"
 
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get compiled prompt cache statistics.
+
+        Returns:
+            Statistics dictionary
+        """
+        return {
+            "prompt_templates_loaded": float(len(self._collections)),
+            "compiled_prompts": float(len(self._compiled)),
+            "compiled_prompt_hits": float(self._compile_hits),
+            "compiled_prompt_misses": float(self._compile_misses),
+        }
+
     def uses_covenant_header(self, template_data: PromptCollection) -> bool:
         """
         Check if template requires COVENANT_TEXT as system header.
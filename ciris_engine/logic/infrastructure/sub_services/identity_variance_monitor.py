@@ -11,6 +11,7 @@ from typing import Any, Dict, List, Optional
 
 from ciris_engine.logic.buses.memory_bus import MemoryBus
 from ciris_engine.logic.buses.wise_bus import WiseBus
+from ciris_engine.logic.infrastructure.sub_services.timeseries_window_cache import TimeSeriesWindowCache
 from ciris_engine.logic.services.base_scheduled_service import BaseScheduledService
 from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
 from ciris_engine.schemas.infrastructure.behavioral_patterns import BehavioralPattern
@@ -57,6 +58,7 @@ class IdentityVarianceMonitor(BaseScheduledService):
         wa_bus: Optional[WiseBus] = None,
         variance_threshold: float = 0.20,
         check_interval_hours: int = 24,
+        timeseries_cache: Optional[TimeSeriesWindowCache] = None,
     ) -> None:
         # Initialize BaseScheduledService with check interval
         super().__init__(time_service=time_service, run_interval_seconds=check_interval_hours * 3600)
@@ -65,6 +67,7 @@ class IdentityVarianceMonitor(BaseScheduledService):
         self._wa_bus = wa_bus
         self._variance_threshold = variance_threshold
         self._check_interval_hours = check_interval_hours
+        self._timeseries_cache = timeseries_cache
 
         # Baseline tracking
         self._baseline_snapshot_id: Optional[str] = None
@@ -700,12 +703,15 @@ class IdentityVarianceMonitor(BaseScheduledService):
             # Query recent actions
             if not self._memory_bus:
                 return patterns
-            recent_actions = await self._memory_bus.recall_timeseries(
-                scope="local",
-                hours=24 * 7,  # Last week
-                correlation_types=["AUDIT_EVENT"],
-                handler_name="identity_variance_monitor",
-            )
+            if self._timeseries_cache:
+                recent_actions = await self._timeseries_cache.get_window(scope="local", hours=24 * 7)  # Last week
+            else:
+                recent_actions = await self._memory_bus.recall_timeseries(
+                    scope="local",
+                    hours=24 * 7,  # Last week
+                    correlation_types=["AUDIT_EVENT"],
+                    handler_name="identity_variance_monitor",
+                )
 
             # Analyze patterns
             action_counts: Dict[str, int] = {}
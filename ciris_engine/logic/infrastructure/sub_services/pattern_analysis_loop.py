@@ -17,6 +17,7 @@ if TYPE_CHECKING:
     from ciris_engine.schemas.services.core import ServiceCapabilities, ServiceStatus
 
 from ciris_engine.logic.buses.memory_bus import MemoryBus
+from ciris_engine.logic.infrastructure.sub_services.timeseries_window_cache import TimeSeriesWindowCache
 from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
 from ciris_engine.schemas.infrastructure.behavioral_patterns import ActionFrequency
 from ciris_engine.schemas.infrastructure.feedback_loop import (
@@ -49,12 +50,14 @@ class PatternAnalysisLoop(BaseScheduledService):
         time_service: TimeServiceProtocol,
         memory_bus: Optional[MemoryBus] = None,
         analysis_interval_hours: int = 6,
+        timeseries_cache: Optional[TimeSeriesWindowCache] = None,
     ) -> None:
         # Initialize BaseScheduledService with analysis interval
         super().__init__(time_service=time_service, run_interval_seconds=analysis_interval_hours * 3600)
         self._time_service = time_service
         self._memory_bus = memory_bus
         self._analysis_interval_hours = analysis_interval_hours
+        self._timeseries_cache = timeseries_cache
 
         # Pattern detection state
         self._detected_patterns: Dict[str, DetectedPattern] = {}
@@ -283,11 +286,9 @@ class PatternAnalysisLoop(BaseScheduledService):
             if not self._memory_bus:
                 return []
 
-            performance_data = await self._memory_bus.recall_timeseries(
-                scope="local",
+            performance_data = await self._recall_window(
                 hours=24 * 7,  # Last week
                 correlation_types=["METRIC_DATAPOINT"],
-                handler_name="config_feedback_loop",
             )
 
             # Analyze response time trends
@@ -330,11 +331,9 @@ class PatternAnalysisLoop(BaseScheduledService):
             if not self._memory_bus:
                 return []
 
-            error_data = await self._memory_bus.recall_timeseries(
-                scope="local",
+            error_data = await self._recall_window(
                 hours=24 * 3,  # Last 3 days
                 correlation_types=["LOG_ENTRY"],
-                handler_name="config_feedback_loop",
             )
 
             # Filter for errors
@@ -454,6 +453,19 @@ class PatternAnalysisLoop(BaseScheduledService):
 
     # Helper methods
 
+    async def _recall_window(self, hours: int, correlation_types: List[str]) -> List[TimeSeriesDataPoint]:
+        """Recall recent time-series data, from the shared window cache when there is one."""
+        if self._timeseries_cache:
+            return await self._timeseries_cache.get_window(scope="local", hours=hours)
+        if not self._memory_bus:
+            return []
+        return await self._memory_bus.recall_timeseries(
+            scope="local",
+            hours=hours,
+            correlation_types=correlation_types,
+            handler_name="config_feedback_loop",
+        )
+
     async def _get_actions_by_hour(self) -> Dict[int, List[TimeSeriesDataPoint]]:
         """Get actions grouped by hour of day."""
         actions_by_hour: Dict[int, List[TimeSeriesDataPoint]] = defaultdict(list)
@@ -462,11 +474,9 @@ class PatternAnalysisLoop(BaseScheduledService):
         if not self._memory_bus:
             return {}
 
-        action_data = await self._memory_bus.recall_timeseries(
-            scope="local",
+        action_data = await self._recall_window(
             hours=24 * 7,  # Last week
             correlation_types=["AUDIT_EVENT"],
-            handler_name="config_feedback_loop",
         )
 
         for action in action_data:
@@ -553,11 +563,9 @@ class PatternAnalysisLoop(BaseScheduledService):
         if not self._memory_bus:
             return {}
 
-        action_data = await self._memory_bus.recall_timeseries(
-            scope="local",
+        action_data = await self._recall_window(
             hours=24 * 7,  # Last week
             correlation_types=["AUDIT_EVENT"],
-            handler_name="config_feedback_loop",
         )
 
         for action in action_data:
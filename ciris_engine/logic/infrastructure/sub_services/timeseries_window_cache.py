@@ -0,0 +1,156 @@
+"""
+Time-Series Window Cache
+
+Shared, incrementally updated view of recent TSDB data points for the
+self-observation loops. Instead of every consumer re-reading days of history
+(capped at 1000 points) on each cycle, the cache keeps the retention window in
+memory and only fetches what arrived since its last watermark.
+"""
+
+import asyncio
+import bisect
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from ciris_engine.logic.buses.memory_bus import MemoryBus
+from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
+from ciris_engine.schemas.runtime.memory import TimeSeriesDataPoint
+
+logger = logging.getLogger(__name__)
+
+_PointKey = Tuple[datetime, str, float, Tuple[Tuple[str, str], ...]]
+
+
+def _point_key(point: TimeSeriesDataPoint) -> _PointKey:
+    return (point.timestamp, point.metric_name, point.value, tuple(sorted(point.tags.items())))
+
+
+class _ScopeWindow:
+    """Points of one scope, sorted by timestamp, plus the refresh watermark."""
+
+    def __init__(self) -> None:
+        self.points: List[TimeSeriesDataPoint] = []
+        self.timestamps: List[datetime] = []
+        self.watermark: Optional[datetime] = None
+        self.recent_keys: Set[_PointKey] = set()  # Points inside the refresh overlap
+        self.lock = asyncio.Lock()
+
+    def add(self, point: TimeSeriesDataPoint) -> None:
+        if not self.timestamps or point.timestamp >= self.timestamps[-1]:
+            self.points.append(point)
+            self.timestamps.append(point.timestamp)
+        else:
+            # Late arrival inside the overlap; rare, so an insert is fine
+            index = bisect.bisect_right(self.timestamps, point.timestamp)
+            self.points.insert(index, point)
+            self.timestamps.insert(index, point.timestamp)
+
+    def evict_before(self, cutoff: datetime) -> None:
+        index = bisect.bisect_left(self.timestamps, cutoff)
+        if index:
+            del self.points[:index]
+            del self.timestamps[:index]
+
+    def since(self, start: datetime) -> List[TimeSeriesDataPoint]:
+        return self.points[bisect.bisect_left(self.timestamps, start) :]
+
+
+class TimeSeriesWindowCache:
+    """
+    Shared window of recent time-series data, refreshed by delta queries.
+
+    Each get_window() call fetches only the points recorded since the previous
+    refresh (plus a short overlap for late writes, deduplicated), evicts points
+    older than the retention period and returns the requested window in full,
+    without the 1000-point cap of a plain recall_timeseries query.
+    """
+
+    def __init__(
+        self,
+        memory_bus: MemoryBus,
+        time_service: TimeServiceProtocol,
+        retention_hours: int = 24 * 7,
+        overlap_seconds: float = 60.0,
+        handler_name: str = "timeseries_window_cache",
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            memory_bus: Bus used to query time-series data
+            time_service: Time service for window boundaries
+            retention_hours: Longest window any consumer asks for
+            overlap_seconds: How far before the watermark each refresh looks again, for late writes
+            handler_name: Handler name used for memory bus queries
+        """
+        self._memory_bus = memory_bus
+        self._time_service = time_service
+        self._retention = timedelta(hours=retention_hours)
+        self._overlap = timedelta(seconds=overlap_seconds)
+        self._handler_name = handler_name
+        self._windows: Dict[str, _ScopeWindow] = {}
+
+        # Statistics
+        self._refreshes = 0
+        self._points_fetched = 0
+        self._duplicates_skipped = 0
+
+    async def get_window(self, scope: str = "local", hours: int = 24) -> List[TimeSeriesDataPoint]:
+        """
+        Get every data point of a scope from the last `hours` hours, oldest first.
+
+        Args:
+            scope: Memory scope to read
+            hours: Window length; at most the retention period
+
+        Returns:
+            The data points in the window
+        """
+        window = self._windows.setdefault(scope, _ScopeWindow())
+        async with window.lock:
+            now = self._time_service.now()
+            await self._refresh(scope, window, now)
+            return window.since(now - min(timedelta(hours=hours), self._retention))
+
+    async def _refresh(self, scope: str, window: _ScopeWindow, now: datetime) -> None:
+        """Fetch points recorded since the watermark and evict expired ones."""
+        start = now - self._retention if window.watermark is None else window.watermark - self._overlap
+
+        points = await self._memory_bus.recall_timeseries(
+            scope=scope, start_time=start, end_time=now, limit=None, handler_name=self._handler_name
+        )
+        self._refreshes += 1
+
+        for point in points:
+            key = _point_key(point)
+            if key in window.recent_keys:
+                self._duplicates_skipped += 1
+                continue
+            window.add(point)
+            window.recent_keys.add(key)
+            self._points_fetched += 1
+
+        window.evict_before(now - self._retention)
+        if window.timestamps:
+            window.watermark = max(window.timestamps[-1], window.watermark or window.timestamps[-1])
+        elif window.watermark is None:
+            window.watermark = now
+
+        # Only points still inside the next overlap can be fetched again
+        overlap_start = window.watermark - self._overlap
+        window.recent_keys = {key for key in window.recent_keys if key[0] >= overlap_start}
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Statistics dictionary
+        """
+        return {
+            "timeseries_cache_points": float(sum(len(window.points) for window in self._windows.values())),
+            "timeseries_cache_refreshes": float(self._refreshes),
+            "timeseries_cache_points_fetched": float(self._points_fetched),
+            "timeseries_cache_duplicates_skipped": float(self._duplicates_skipped),
+        }
@@ -22,6 +22,7 @@ from .db import (
 from .models import (
     QueueStatus,
     add_correlation,
+    add_correlations,
     add_graph_edge,
     add_graph_node,
     add_task,
@@ -42,7 +43,9 @@ from .models import (
     get_correlations_by_task_and_action,
     get_deferral_report_context,
     get_edges_for_node,
+    get_edges_for_nodes,
     get_graph_node,
+    get_graph_nodes_by_ids,
     get_nodes_by_type,
     get_pending_tasks_for_activation,
     get_queue_status,
@@ -62,6 +65,7 @@ from .models import (
     update_task_status,
     update_thought_status,
 )
+from .notifications import add_work_listener, notify_work_added, remove_work_listener
 
 __all__ = [
     "get_db_connection",
@@ -101,9 +105,12 @@ __all__ = [
     "add_graph_edge",
     "delete_graph_edge",
     "get_edges_for_node",
+    "get_edges_for_nodes",
+    "get_graph_nodes_by_ids",
     "get_all_graph_nodes",
     "get_nodes_by_type",
     "add_correlation",
+    "add_correlations",
     "update_correlation",
     "get_correlation",
     "get_correlations_by_task_and_action",
@@ -120,4 +127,7 @@ __all__ = [
     "get_service_correlations_table_schema_sql",
     "get_queue_status",
     "QueueStatus",
+    "add_work_listener",
+    "remove_work_listener",
+    "notify_work_added",
 ]
@@ -63,6 +63,8 @@ class DatabaseMaintenanceService(BaseScheduledService, DatabaseMaintenanceServic
     async def _on_stop(self) -> None:
         """Stop hook for cleanup."""
         await self._final_cleanup()
+        # Cancels the scheduled maintenance loop
+        await super()._on_stop()
 
     async def _final_cleanup(self) -> None:
         """Final cleanup before shutdown."""
@@ -0,0 +1,14 @@
+-- Indexes for time-bucketed memory timelines and keyset-paginated memory and audit queries
+
+-- Covers the timeline filters (time range, type, scope, metric node ids) so bucket
+-- counts and stride sampling never touch table rows
+CREATE INDEX IF NOT EXISTS idx_graph_nodes_updated_type_scope
+    ON graph_nodes(updated_at, node_type, scope, node_id);
+
+-- /memory/query type listings, newest first, with node_id as the keyset tiebreaker
+CREATE INDEX IF NOT EXISTS idx_graph_nodes_type_scope_updated
+    ON graph_nodes(node_type, scope, updated_at, node_id);
+
+-- Audit entries ordered by their own timestamp, with node_id as the keyset tiebreaker
+CREATE INDEX IF NOT EXISTS idx_graph_nodes_type_scope_timestamp
+    ON graph_nodes(node_type, scope, json_extract(attributes_json, '$.timestamp'), node_id);
@@ -1,5 +1,6 @@
 from .correlations import (
     add_correlation,
+    add_correlations,
     get_correlation,
     get_correlations_by_channel,
     get_correlations_by_task_and_action,
@@ -13,7 +14,9 @@ from .graph import (
     delete_graph_node,
     get_all_graph_nodes,
     get_edges_for_node,
+    get_edges_for_nodes,
     get_graph_node,
+    get_graph_nodes_by_ids,
     get_nodes_by_type,
 )
 from .identity import (
@@ -88,7 +91,10 @@ __all__ = [
     "add_graph_edge",
     "delete_graph_edge",
     "get_edges_for_node",
+    "get_edges_for_nodes",
+    "get_graph_nodes_by_ids",
     "add_correlation",
+    "add_correlations",
     "update_correlation",
     "get_correlation",
     "get_correlations_by_task_and_action",
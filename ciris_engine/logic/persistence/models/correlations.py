@@ -1,7 +1,7 @@
 import json
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ciris_engine.constants import UTC_TIMEZONE_SUFFIX
 from ciris_engine.logic.persistence.db import get_db_connection
@@ -30,21 +30,21 @@ def _parse_response_data(
     return response_data_json
 
 
-def add_correlation(
-    corr: ServiceCorrelation, time_service: Optional[TimeServiceProtocol] = None, db_path: Optional[str] = None
-) -> str:
-    sql = """
-        INSERT INTO service_correlations (
-            correlation_id, service_type, handler_name, action_type,
-            request_data, response_data, status, created_at, updated_at,
-            correlation_type, timestamp, metric_name, metric_value, log_level,
-            trace_id, span_id, parent_span_id, tags, retention_policy
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """
+_INSERT_CORRELATION_SQL = """
+    INSERT INTO service_correlations (
+        correlation_id, service_type, handler_name, action_type,
+        request_data, response_data, status, created_at, updated_at,
+        correlation_type, timestamp, metric_name, metric_value, log_level,
+        trace_id, span_id, parent_span_id, tags, retention_policy
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _correlation_params(corr: ServiceCorrelation, time_service: Optional[TimeServiceProtocol]) -> Tuple[Any, ...]:
     # Convert timestamp to ISO string
     timestamp_str = corr.timestamp.isoformat()
 
-    params = (
+    return (
         corr.correlation_id,
         corr.service_type,
         corr.handler_name,
@@ -89,9 +89,15 @@ def add_correlation(
         json.dumps(corr.tags) if corr.tags else None,
         corr.retention_policy,
     )
+
+
+def add_correlation(
+    corr: ServiceCorrelation, time_service: Optional[TimeServiceProtocol] = None, db_path: Optional[str] = None
+) -> str:
+    params = _correlation_params(corr, time_service)
     try:
         with get_db_connection(db_path=db_path) as conn:
-            conn.execute(sql, params)
+            conn.execute(_INSERT_CORRELATION_SQL, params)
             conn.commit()
         logger.debug("Inserted correlation %s", corr.correlation_id)
         return corr.correlation_id
@@ -100,6 +106,26 @@ def add_correlation(
         raise
 
 
+def add_correlations(
+    corrs: List[ServiceCorrelation],
+    time_service: Optional[TimeServiceProtocol] = None,
+    db_path: Optional[str] = None,
+) -> List[str]:
+    """Insert several correlations in one transaction."""
+    if not corrs:
+        return []
+    params = [_correlation_params(corr, time_service) for corr in corrs]
+    try:
+        with get_db_connection(db_path=db_path) as conn:
+            conn.executemany(_INSERT_CORRELATION_SQL, params)
+            conn.commit()
+        logger.debug("Inserted %d correlations", len(corrs))
+        return [corr.correlation_id for corr in corrs]
+    except Exception as e:
+        logger.exception("Failed to add %d correlations: %s", len(corrs), e)
+        raise
+
+
 def update_correlation(
     update_request_or_id: Union[CorrelationUpdateRequest, str],
     correlation_or_time_service: Union[ServiceCorrelation, TimeServiceProtocol],
@@ -1,11 +1,12 @@
 import json
 import logging
-from datetime import datetime
-from typing import Any, List, Optional
+from datetime import datetime, timezone
+from typing import Any, List, Optional, Set, Tuple
 
 from ciris_engine.logic.persistence.db import get_db_connection
 from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
-from ciris_engine.schemas.services.graph_core import GraphEdge, GraphEdgeAttributes, GraphNode, GraphScope
+from ciris_engine.schemas.services.graph.audit import AuditQuery
+from ciris_engine.schemas.services.graph_core import GraphEdge, GraphEdgeAttributes, GraphNode, GraphScope, NodeType
 
 logger = logging.getLogger(__name__)
 
@@ -180,26 +181,90 @@ def get_edges_for_node(node_id: str, scope: GraphScope, db_path: Optional[str] =
             cursor.execute(sql, (scope.value, node_id, node_id))
             rows = cursor.fetchall()
             for row in rows:
-                attrs = json.loads(row["attributes_json"]) if row["attributes_json"] else {}
-                # Extract only valid GraphEdgeAttributes fields
-                valid_attrs = {}
-                if "created_at" in attrs:
-                    valid_attrs["created_at"] = attrs["created_at"]
-                if "context" in attrs:
-                    valid_attrs["context"] = attrs["context"]
-
-                edges.append(
-                    GraphEdge(
-                        source=row["source_node_id"],
-                        target=row["target_node_id"],
-                        relationship=row["relationship"],
-                        scope=scope,
-                        weight=row["weight"],
-                        attributes=GraphEdgeAttributes(**valid_attrs) if valid_attrs else GraphEdgeAttributes(),
+                edges.append(_row_to_edge(row, scope))
+    except Exception as e:
+        logger.exception("Failed to fetch edges for node %s: %s", node_id, e)
+    return edges
+
+
+# Stay well under SQLite's default limit on bound parameters
+_IN_CLAUSE_CHUNK = 500
+
+
+def _row_to_edge(row: Any, scope: GraphScope) -> GraphEdge:
+    attrs = json.loads(row["attributes_json"]) if row["attributes_json"] else {}
+    # Extract only valid GraphEdgeAttributes fields
+    valid_attrs = {}
+    if "created_at" in attrs:
+        valid_attrs["created_at"] = attrs["created_at"]
+    if "context" in attrs:
+        valid_attrs["context"] = attrs["context"]
+
+    return GraphEdge(
+        source=row["source_node_id"],
+        target=row["target_node_id"],
+        relationship=row["relationship"],
+        scope=scope,
+        weight=row["weight"],
+        attributes=GraphEdgeAttributes(**valid_attrs) if valid_attrs else GraphEdgeAttributes(),
+    )
+
+
+def get_graph_nodes_by_ids(node_ids: List[str], scope: GraphScope, db_path: Optional[str] = None) -> List[GraphNode]:
+    """Fetch many nodes of one scope with a single IN query per chunk of ids."""
+    unique_ids = list(dict.fromkeys(node_ids))
+    nodes: List[GraphNode] = []
+    try:
+        with get_db_connection(db_path=db_path) as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(unique_ids), _IN_CLAUSE_CHUNK):
+                chunk = unique_ids[start : start + _IN_CLAUSE_CHUNK]
+                placeholders = ",".join("?" for _ in chunk)
+                cursor.execute(
+                    f"SELECT * FROM graph_nodes WHERE scope = ? AND node_id IN ({placeholders})",
+                    [scope.value, *chunk],
+                )
+                for row in cursor.fetchall():
+                    attrs = json.loads(row["attributes_json"]) if row["attributes_json"] else {}
+                    nodes.append(
+                        GraphNode(
+                            id=row["node_id"],
+                            type=row["node_type"],
+                            scope=scope,
+                            attributes=attrs,
+                            version=row["version"],
+                            updated_by=row["updated_by"],
+                            updated_at=row["updated_at"],
+                        )
                     )
+    except Exception as e:
+        logger.exception("Failed to fetch %d graph nodes: %s", len(unique_ids), e)
+    return nodes
+
+
+def get_edges_for_nodes(node_ids: List[str], scope: GraphScope, db_path: Optional[str] = None) -> List[GraphEdge]:
+    """Fetch every edge touching any of ``node_ids``; each edge is returned once."""
+    unique_ids = list(dict.fromkeys(node_ids))
+    edges: List[GraphEdge] = []
+    seen: Set[str] = set()
+    try:
+        with get_db_connection(db_path=db_path) as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(unique_ids), _IN_CLAUSE_CHUNK):
+                chunk = unique_ids[start : start + _IN_CLAUSE_CHUNK]
+                placeholders = ",".join("?" for _ in chunk)
+                cursor.execute(
+                    f"SELECT * FROM graph_edges WHERE scope = ? AND "
+                    f"(source_node_id IN ({placeholders}) OR target_node_id IN ({placeholders}))",
+                    [scope.value, *chunk, *chunk],
                 )
+                for row in cursor.fetchall():
+                    if row["edge_id"] in seen:
+                        continue
+                    seen.add(row["edge_id"])
+                    edges.append(_row_to_edge(row, scope))
     except Exception as e:
-        logger.exception("Failed to fetch edges for node %s: %s", node_id, e)
+        logger.exception("Failed to fetch edges for %d nodes: %s", len(unique_ids), e)
     return edges
 
 
@@ -294,3 +359,226 @@ def get_nodes_by_type(
         List of GraphNode objects of the specified type
     """
     return get_all_graph_nodes(scope=scope, node_type=node_type, limit=limit, offset=offset, db_path=db_path)
+
+
+def _stored_time(value: datetime) -> str:
+    """Format a bound the way graph timestamps are stored, so string comparison orders correctly."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.isoformat()
+
+
+def _graph_listing_filters(
+    scope: GraphScope, node_type: Optional[str], since: Optional[datetime], until: Optional[datetime]
+) -> Tuple[List[str], List[Any]]:
+    # Without a type, "+" keeps SQLite off the scope index so it reads the updated_at index in order
+    clauses = ["scope = ?" if node_type is not None else "+scope = ?"]
+    params: List[Any] = [scope.value]
+    if node_type is not None:
+        clauses.append("node_type = ?")
+        params.append(node_type)
+    if since is not None:
+        clauses.append("updated_at >= ?")
+        params.append(_stored_time(since))
+    if until is not None:
+        clauses.append("updated_at <= ?")
+        params.append(_stored_time(until))
+    return clauses, params
+
+
+def get_graph_nodes_page(
+    scope: GraphScope,
+    node_type: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit: int = 20,
+    offset: int = 0,
+    after: Optional[Tuple[str, str]] = None,
+    db_path: Optional[str] = None,
+) -> Tuple[List[GraphNode], Optional[Tuple[str, str]]]:
+    """
+    Fetch one page of graph nodes ordered newest first by (updated_at, node_id).
+
+    Args:
+        scope: Scope to list
+        node_type: Filter by node type (optional)
+        since: Only nodes updated at or after this time (optional)
+        until: Only nodes updated at or before this time (optional)
+        limit: Maximum number of nodes to return
+        offset: Number of nodes to skip after the keyset position
+        after: (updated_at, node_id) of the last node of the previous page
+        db_path: Optional database path
+
+    Returns:
+        The page's nodes, and the (updated_at, node_id) key to resume after if
+        another page follows
+    """
+    clauses, params = _graph_listing_filters(scope, node_type, since, until)
+    if after is not None:
+        # Spelled out rather than as a row value so SQLite seeks the index to the updated_at bound
+        clauses.append("updated_at <= ? AND (updated_at < ? OR node_id < ?)")
+        params.extend([after[0], after[0], after[1]])
+
+    # Fetch one extra node to learn whether another page follows
+    sql = (
+        f"SELECT * FROM graph_nodes WHERE {' AND '.join(clauses)} "
+        "ORDER BY updated_at DESC, node_id DESC LIMIT ? OFFSET ?"
+    )
+    params.extend([limit + 1, offset])
+
+    try:
+        with get_db_connection(db_path=db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+    except Exception as e:
+        logger.exception("Failed to fetch graph node page: %s", e)
+        return [], None
+
+    nodes = [
+        GraphNode(
+            id=row["node_id"],
+            type=row["node_type"],
+            scope=row["scope"],
+            attributes=json.loads(row["attributes_json"]) if row["attributes_json"] else {},
+            version=row["version"],
+            updated_by=row["updated_by"],
+            updated_at=row["updated_at"],
+        )
+        for row in rows[:limit]
+    ]
+    next_key = (str(rows[limit - 1]["updated_at"]), rows[limit - 1]["node_id"]) if len(rows) > limit else None
+    return nodes, next_key
+
+
+def count_graph_nodes(
+    scope: GraphScope,
+    node_type: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    db_path: Optional[str] = None,
+) -> int:
+    """Exact number of graph nodes matching the get_graph_nodes_page() filters."""
+    clauses, params = _graph_listing_filters(scope, node_type, since, until)
+    try:
+        with get_db_connection(db_path=db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT COUNT(*) FROM graph_nodes WHERE {' AND '.join(clauses)}", params)
+            row = cursor.fetchone()
+            return int(row[0]) if row else 0
+    except Exception as e:
+        logger.exception("Failed to count graph nodes: %s", e)
+        return 0
+
+
+# Matches the expression in idx_graph_nodes_type_scope_timestamp so audit queries are index ordered
+_AUDIT_TIMESTAMP = "json_extract(attributes_json, '$.timestamp')"
+
+
+def _audit_entry_filters(query: AuditQuery) -> Tuple[List[str], List[Any]]:
+    clauses = ["node_type = ?", "scope = ?"]
+    params: List[Any] = [NodeType.AUDIT_ENTRY.value, GraphScope.LOCAL.value]
+
+    if query.start_time:
+        clauses.append(f"{_AUDIT_TIMESTAMP} >= ?")
+        params.append(_stored_time(query.start_time))
+    if query.end_time:
+        clauses.append(f"{_AUDIT_TIMESTAMP} <= ?")
+        params.append(_stored_time(query.end_time))
+    if query.actor:
+        clauses.append("json_extract(attributes_json, '$.actor') = ?")
+        params.append(query.actor)
+    if query.event_type:
+        clauses.append("json_extract(attributes_json, '$.action') = ?")
+        params.append(query.event_type)
+    if query.entity_id:
+        clauses.append(
+            "COALESCE(json_extract(attributes_json, '$.context.correlation_id'), "
+            "json_extract(attributes_json, '$.correlation_id')) = ?"
+        )
+        params.append(query.entity_id)
+    if query.outcome:
+        clauses.append("json_extract(attributes_json, '$.context.additional_data.outcome') = ?")
+        params.append(query.outcome)
+    if query.severity:
+        clauses.append("json_extract(attributes_json, '$.context.additional_data.severity') = ?")
+        params.append(query.severity)
+    if query.search_text:
+        clauses.append(
+            "(instr(lower(json_extract(attributes_json, '$.action')), ?) > 0 "
+            "OR instr(lower(json_extract(attributes_json, '$.actor')), ?) > 0)"
+        )
+        params.extend([query.search_text.lower()] * 2)
+
+    return clauses, params
+
+
+def get_audit_entry_nodes(
+    query: AuditQuery, after: Optional[Tuple[str, str]] = None, db_path: Optional[str] = None
+) -> List[GraphNode]:
+    """
+    Fetch one page of audit entry nodes ordered by (timestamp, node_id).
+
+    Args:
+        query: Filters, sort direction, limit and offset
+        after: (timestamp, node_id) of the last entry of the previous page; the
+            page starts right after it in the query's sort direction
+        db_path: Optional database path
+
+    Returns:
+        List of GraphNode objects
+    """
+    clauses, params = _audit_entry_filters(query)
+    direction = "DESC" if query.order_desc else "ASC"
+    if after is not None:
+        # Spelled out rather than as a row value so SQLite seeks the index to the timestamp bound
+        op = "<" if query.order_desc else ">"
+        clauses.append(f"{_AUDIT_TIMESTAMP} {op}= ? AND ({_AUDIT_TIMESTAMP} {op} ? OR node_id {op} ?)")
+        params.extend([after[0], after[0], after[1]])
+
+    sql = (
+        f"SELECT * FROM graph_nodes WHERE {' AND '.join(clauses)} "
+        f"ORDER BY {_AUDIT_TIMESTAMP} {direction}, node_id {direction}"
+    )
+    if query.limit is not None:
+        sql += " LIMIT ? OFFSET ?"
+        params.extend([query.limit, query.offset])
+    elif query.offset:
+        sql += " LIMIT -1 OFFSET ?"
+        params.append(query.offset)
+
+    nodes = []
+    try:
+        with get_db_connection(db_path=db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            for row in cursor.fetchall():
+                attrs = json.loads(row["attributes_json"]) if row["attributes_json"] else {}
+                nodes.append(
+                    GraphNode(
+                        id=row["node_id"],
+                        type=row["node_type"],
+                        scope=row["scope"],
+                        attributes=attrs,
+                        version=row["version"],
+                        updated_by=row["updated_by"],
+                        updated_at=row["updated_at"],
+                    )
+                )
+    except Exception as e:
+        logger.exception("Failed to fetch audit entry nodes: %s", e)
+    return nodes
+
+
+def count_audit_entry_nodes(query: AuditQuery, db_path: Optional[str] = None) -> int:
+    """Exact number of audit entry nodes matching the query's filters."""
+    clauses, params = _audit_entry_filters(query)
+    try:
+        with get_db_connection(db_path=db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT COUNT(*) FROM graph_nodes WHERE {' AND '.join(clauses)}", params)
+            row = cursor.fetchone()
+            return int(row[0]) if row else 0
+    except Exception as e:
+        logger.exception("Failed to count audit entry nodes: %s", e)
+        return 0
@@ -3,6 +3,7 @@ import logging
 from typing import TYPE_CHECKING, Any, List, Optional
 
 from ciris_engine.logic.persistence.db import get_db_connection
+from ciris_engine.logic.persistence.notifications import notify_work_added
 from ciris_engine.logic.persistence.utils import map_row_to_task
 from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
 from ciris_engine.schemas.runtime.enums import TaskStatus
@@ -70,6 +71,7 @@ def add_task(task: Task, db_path: Optional[str] = None) -> str:
             conn.execute(sql, params)
             conn.commit()
         logger.info(f"Added task ID {task.task_id} to database.")
+        notify_work_added("task")
         return task.task_id
     except Exception as e:
         logger.exception(f"Failed to add task {task.task_id}: {e}")
@@ -102,6 +104,8 @@ def update_task_status(
             conn.commit()
             if cursor.rowcount > 0:
                 logger.info(f"Updated status of task ID {task_id} to {new_status.value}.")
+                if new_status == TaskStatus.ACTIVE:
+                    notify_work_added("task")
                 return True
             logger.warning(f"Task ID {task_id} not found for status update.")
             return False
@@ -4,6 +4,7 @@ import logging
 from typing import Any, List, Optional
 
 from ciris_engine.logic.persistence.db import get_db_connection
+from ciris_engine.logic.persistence.notifications import notify_work_added
 from ciris_engine.logic.persistence.utils import map_row_to_thought
 from ciris_engine.schemas.persistence.core import ThoughtSummary
 from ciris_engine.schemas.runtime.enums import ThoughtStatus
@@ -56,6 +57,7 @@ def add_thought(thought: Thought, db_path: Optional[str] = None) -> str:
             conn.execute(sql, params)
             conn.commit()
         logger.info(f"Added thought ID {thought.thought_id} to database.")
+        notify_work_added("thought")
         return thought.thought_id
     except Exception as e:
         logger.exception(f"Failed to add thought {thought.thought_id}: {e}")
@@ -229,6 +231,8 @@ def update_thought_status(
                 logger.warning(f"No thought found with id {thought_id} to update status.")
             else:
                 logger.info(f"Updated thought {thought_id} status to {status_val}")
+                if status_val == ThoughtStatus.PENDING.value:
+                    notify_work_added("thought")
             return updated
     except Exception as e:
         logger.exception(f"Failed to update status for thought {thought_id}: {e}")
@@ -0,0 +1,45 @@
+"""
+Work notifications for the persistence layer.
+
+Processors register a listener here to be told when new work is committed
+(a task created or activated, a thought created or returned to PENDING),
+so they can wake up immediately instead of polling the database on a timer.
+Listeners may be called from any thread and must not block.
+"""
+
+import logging
+import threading
+from typing import Callable, List
+
+logger = logging.getLogger(__name__)
+
+WorkListener = Callable[[str], None]
+
+_listeners: List[WorkListener] = []
+_lock = threading.Lock()
+
+
+def add_work_listener(listener: WorkListener) -> None:
+    """Register a callable invoked with the kind of work ("task" or "thought") after it is committed."""
+    with _lock:
+        if listener not in _listeners:
+            _listeners.append(listener)
+
+
+def remove_work_listener(listener: WorkListener) -> None:
+    """Unregister a listener; unknown listeners are ignored."""
+    with _lock:
+        if listener in _listeners:
+            _listeners.remove(listener)
+
+
+def notify_work_added(kind: str) -> None:
+    """Tell every registered listener that work of the given kind was committed."""
+    with _lock:
+        listeners = list(_listeners)
+    for listener in listeners:
+        try:
+            listener(kind)
+        except Exception as e:
+            # A broken listener must never fail the write that triggered it
+            logger.debug(f"Work listener {listener} failed: {e}")
@@ -5,13 +5,16 @@ Uses v1 schemas and integrates state management.
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from ciris_engine.logic import persistence
 from ciris_engine.logic.config import ConfigAccessor
+from ciris_engine.logic.context.tool_catalog import get_tool_catalog
 from ciris_engine.logic.processors.core.thought_processor import ThoughtProcessor
 from ciris_engine.logic.processors.support.processing_queue import ProcessingQueueItem
+from ciris_engine.logic.processors.support.thought_scheduler import AdaptiveThoughtScheduler
 from ciris_engine.logic.utils.context_utils import build_dispatch_context
 from ciris_engine.logic.utils.shutdown_manager import (
     get_global_shutdown_reason,
@@ -22,6 +25,7 @@ from ciris_engine.schemas.processors.context import ProcessorContext
 from ciris_engine.schemas.processors.state import StateTransitionRecord
 from ciris_engine.schemas.processors.states import AgentState
 from ciris_engine.schemas.runtime.core import AgentIdentityRoot
+from ciris_engine.schemas.runtime.enums import TaskStatus
 from ciris_engine.schemas.runtime.models import Thought, ThoughtStatus
 from ciris_engine.schemas.telemetry.core import (
     CorrelationType,
@@ -151,11 +155,25 @@ class AgentProcessor:
 
         # Processing control
         self.current_round_number = 0
+        self._first_work_round_marked = False
         self._stop_event: Optional[asyncio.Event] = None
         self._processing_task: Optional[asyncio.Task] = None
 
+        # Sizes thought rounds from observed latency and wakes the loops when work is committed
+        self.thought_scheduler = AdaptiveThoughtScheduler(
+            min_concurrency=self._workflow_setting("min_concurrent_thoughts", 1),
+            max_concurrency=self._workflow_setting("max_concurrent_thoughts", 10),
+            target_latency_seconds=self._workflow_setting("target_thought_latency_seconds", 30.0),
+        )
+
         logger.info("AgentProcessor initialized with v1 schemas and modular processors")
 
+    def _workflow_setting(self, name: str, default: Any) -> Any:
+        """Read a workflow config value, falling back to the default when unset or mistyped."""
+        workflow = getattr(self.app_config, "workflow", None)
+        value = getattr(workflow, name, default) if workflow else default
+        return value if isinstance(value, (int, float)) and not isinstance(value, bool) else default
+
     def _load_preload_tasks(self) -> None:
         """Load preload tasks after successful WORK state transition."""
         try:
@@ -188,6 +206,18 @@ class AgentProcessor:
         except Exception as e:
             logger.error(f"Error loading preload tasks: {e}", exc_info=True)
 
+    def _mark_first_work_round(self) -> None:
+        """Report the first completed WORK round to the InitializationService (cold-start metric)."""
+        if self._first_work_round_marked:
+            return
+        self._first_work_round_marked = True
+        init_service = getattr(self.runtime, "initialization_service", None) if self.runtime else None
+        if init_service and hasattr(init_service, "mark_first_work_round"):
+            try:
+                init_service.mark_first_work_round()
+            except Exception as e:
+                logger.warning(f"Failed to record first WORK round: {e}")
+
     def _ensure_stop_event(self) -> None:
         """Ensure stop event is created when needed in async context."""
         if self._stop_event is None:
@@ -245,6 +275,7 @@ class AgentProcessor:
                 return
 
         self.wakeup_processor.initialize()
+        persistence.add_work_listener(self.thought_scheduler.notify)
 
         wakeup_complete = False
         wakeup_round = 0
@@ -268,15 +299,17 @@ class AgentProcessor:
                 return
 
             if not wakeup_complete:
-                _thoughts_processed = await self._process_pending_thoughts_async()
+                thoughts_processed = await self._process_pending_thoughts_async()
 
                 logger.info(f"Wakeup round {wakeup_round}: {wakeup_result.thoughts_processed} thoughts processed")
 
-                # Use shorter delay for mock LLM
-                llm_service = self.services.get("llm_service")
-                is_mock_llm = llm_service and type(llm_service).__name__ == "MockLLMService"
-                round_delay = 0.1 if is_mock_llm else 5.0
-                await asyncio.sleep(round_delay)
+                # Go straight on while rounds make progress, otherwise wait for new work
+                # (use shorter delay for mock LLM)
+                if not thoughts_processed:
+                    llm_service = self.services.get("llm_service")
+                    is_mock_llm = llm_service and type(llm_service).__name__ == "MockLLMService"
+                    round_delay = 0.1 if is_mock_llm else 5.0
+                    await self.thought_scheduler.wait_for_work(round_delay, self._stop_event)
             else:
                 logger.info("✓ Wakeup sequence completed successfully!")
 
@@ -332,6 +365,7 @@ class AgentProcessor:
         except Exception as e:
             logger.error(f"Processing loop error: {e}", exc_info=True)
         finally:
+            persistence.remove_work_listener(self.thought_scheduler.notify)
             if self._stop_event is not None:
                 self._stop_event.set()
 
@@ -355,116 +389,89 @@ class AgentProcessor:
                 pending_thoughts = shutdown_thoughts
                 logger.info(f"In SHUTDOWN state - filtering to {len(shutdown_thoughts)} shutdown-related thoughts only")
 
-            max_active = 10
-            if hasattr(self.app_config, "workflow") and self.app_config.workflow:
-                max_active = getattr(self.app_config.workflow, "max_active_thoughts", 10)
+            if not pending_thoughts:
+                return 0
 
-            limited_thoughts = pending_thoughts[:max_active]
+            scheduler = self.thought_scheduler
+            task_priorities: Dict[str, int] = {}
+            if len(pending_thoughts) > scheduler.concurrency_limit:
+                # Only worth a lookup when not every pending thought fits in this round
+                task_priorities = {
+                    task.task_id: task.priority for task in persistence.get_tasks_by_status(TaskStatus.ACTIVE)
+                }
+            selected = scheduler.select(pending_thoughts, task_priorities, self._time_service.now())
 
             logger.info(
-                f"Found {len(pending_thoughts)} PENDING thoughts, processing {len(limited_thoughts)} (max_active_thoughts: {max_active})"
+                f"Found {len(pending_thoughts)} PENDING thoughts, processing {len(selected)} "
+                f"(concurrency limit: {scheduler.concurrency_limit})"
             )
 
-            if not limited_thoughts:
-                return 0
-
             processed_count = 0
             failed_count = 0
 
-            batch_size = 5
-
-            for i in range(0, len(limited_thoughts), batch_size):
-                try:
-                    batch = limited_thoughts[i : i + batch_size]
-
-                    # Pre-fetch all thoughts in the batch to avoid serialization
-                    thought_ids = [t.thought_id for t in batch]
-                    logger.info(f"[DEBUG TIMING] Pre-fetching {len(thought_ids)} thoughts in batch")
-                    prefetched_thoughts = await persistence.async_get_thoughts_by_ids(thought_ids)
-                    logger.info(f"[DEBUG TIMING] Pre-fetched {len(prefetched_thoughts)} thoughts")
-
-                    # Pre-fetch batch context data (same for all thoughts)
-                    logger.info("[DEBUG TIMING] Pre-fetching batch context data")
-                    from ciris_engine.logic.context.batch_context import prefetch_batch_context
-
-                    batch_context_data = await prefetch_batch_context(
-                        memory_service=(
-                            self.services.get("memory_service")
-                            if isinstance(self.services, dict)
-                            else getattr(self.services, "memory_service", None)
-                        ),
-                        secrets_service=(
-                            self.services.get("secrets_service")
-                            if isinstance(self.services, dict)
-                            else getattr(self.services, "secrets_service", None)
-                        ),
-                        service_registry=(
-                            self.services.get("service_registry")
-                            if isinstance(self.services, dict)
-                            else getattr(self.services, "service_registry", None)
-                        ),
-                        resource_monitor=(
-                            self.services.get("resource_monitor")
-                            if isinstance(self.services, dict)
-                            else getattr(self.services, "resource_monitor", None)
-                        ),
-                        telemetry_service=(
-                            self.services.get("telemetry_service")
-                            if isinstance(self.services, dict)
-                            else getattr(self.services, "telemetry_service", None)
-                        ),
-                        runtime=self.runtime,
-                    )
-                    logger.info("[DEBUG TIMING] Pre-fetched batch context data")
-
-                    tasks: List[Any] = []
-                    for thought in batch:
-                        try:
+            try:
+                # Pre-fetch all thoughts in the round to avoid serialization
+                thought_ids = [t.thought_id for t in selected]
+                logger.info(f"[DEBUG TIMING] Pre-fetching {len(thought_ids)} thoughts in batch")
+                prefetched_thoughts = await persistence.async_get_thoughts_by_ids(thought_ids)
+                logger.info(f"[DEBUG TIMING] Pre-fetched {len(prefetched_thoughts)} thoughts")
+
+                # Pre-fetch batch context data (same for all thoughts)
+                logger.info("[DEBUG TIMING] Pre-fetching batch context data")
+                from ciris_engine.logic.context.batch_context import prefetch_batch_context
+
+                batch_context_data = await prefetch_batch_context(
+                    memory_service=self._get_service("memory_service"),
+                    secrets_service=self._get_service("secrets_service"),
+                    service_registry=self._get_service("service_registry"),
+                    resource_monitor=self._get_service("resource_monitor"),
+                    telemetry_service=self._get_service("telemetry_service"),
+                    runtime=self.runtime,
+                    thoughts=[prefetched_thoughts.get(t.thought_id, t) for t in selected],
+                )
+                logger.info("[DEBUG TIMING] Pre-fetched batch context data")
+
+                tasks: List[Any] = []
+                dispatched: List[Thought] = []
+                for thought in selected:
+                    try:
+                        persistence.update_thought_status(thought_id=thought.thought_id, status=ThoughtStatus.PROCESSING)
+
+                        # Use prefetched thought if available
+                        full_thought = prefetched_thoughts.get(thought.thought_id, thought)
+                        tasks.append(self._timed_single_thought(full_thought, batch_context_data))
+                        dispatched.append(thought)
+                    except Exception as e:
+                        logger.error(f"Error preparing thought {thought.thought_id} for processing: {e}", exc_info=True)
+                        failed_count += 1
+
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+
+                for result, thought in zip(results, dispatched):
+                    try:
+                        if isinstance(result, Exception):
+                            logger.error(f"Error processing thought {thought.thought_id}: {result}")
                             persistence.update_thought_status(
-                                thought_id=thought.thought_id, status=ThoughtStatus.PROCESSING
-                            )
-
-                            # Use prefetched thought if available
-                            full_thought = prefetched_thoughts.get(thought.thought_id, thought)
-                            task = self._process_single_thought(
-                                full_thought, prefetched=True, batch_context=batch_context_data
+                                thought_id=thought.thought_id,
+                                status=ThoughtStatus.FAILED,
+                                final_action={"error": str(result)},
                             )
-                            tasks.append(task)
-                        except Exception as e:
-                            logger.error(
-                                f"Error preparing thought {thought.thought_id} for processing: {e}", exc_info=True
-                            )
-                            failed_count += 1
-                            continue
-
-                    if not tasks:
-                        continue
-
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                    for result, thought in zip(results, batch):
-                        try:
-                            if isinstance(result, Exception):
-                                logger.error(f"Error processing thought {thought.thought_id}: {result}")
-                                persistence.update_thought_status(
-                                    thought_id=thought.thought_id,
-                                    status=ThoughtStatus.FAILED,
-                                    final_action={"error": str(result)},
-                                )
-                                failed_count += 1
-                            else:
-                                processed_count += 1
-                        except Exception as e:
-                            logger.error(f"Error handling result for thought {thought.thought_id}: {e}", exc_info=True)
                             failed_count += 1
+                        else:
+                            processed_count += 1
+                    except Exception as e:
+                        logger.error(f"Error handling result for thought {thought.thought_id}: {e}", exc_info=True)
+                        failed_count += 1
 
-                except Exception as e:
-                    logger.error(f"Error processing thought batch {i//batch_size + 1}: {e}", exc_info=True)
-                    failed_count += len(batch) if "batch" in locals() else batch_size
+            except Exception as e:
+                logger.error(f"Error processing thought round: {e}", exc_info=True)
+                failed_count += len(selected) - processed_count
+            finally:
+                scheduler.end_round()
 
             if failed_count > 0:
                 logger.warning(
-                    f"Thought processing completed with {failed_count} failures out of {len(limited_thoughts)} attempts"
+                    f"Thought processing completed with {failed_count} failures out of {len(selected)} attempts"
                 )
 
             return processed_count
@@ -473,6 +480,22 @@ class AgentProcessor:
             logger.error(f"CRITICAL: Error in _process_pending_thoughts_async: {e}", exc_info=True)
             return 0
 
+    async def _timed_single_thought(self, thought: Thought, batch_context: Optional[Any]) -> bool:
+        """Process one thought and report its latency and outcome to the thought scheduler."""
+        started = time.monotonic()
+        success = False
+        try:
+            success = await self._process_single_thought(thought, prefetched=True, batch_context=batch_context)
+            return success
+        finally:
+            self.thought_scheduler.record_result(time.monotonic() - started, bool(success))
+
+    def _get_service(self, name: str) -> Any:
+        """Look up a service whether services is a dict or an object."""
+        if isinstance(self.services, dict):
+            return self.services.get(name)
+        return getattr(self.services, name, None)
+
     async def _process_single_thought(
         self, thought: Thought, prefetched: bool = False, batch_context: Optional[Any] = None
     ) -> bool:
@@ -728,6 +751,7 @@ class AgentProcessor:
 
     async def stop_processing(self) -> None:
         """Stop the processing loop gracefully."""
+        persistence.remove_work_listener(self.thought_scheduler.notify)
         if self._processing_task is None or self._processing_task.done():
             logger.info("Processing loop is not running")
             return
@@ -830,6 +854,7 @@ class AgentProcessor:
 
                             # Check for state transition recommendations
                             if current_state == AgentState.WORK:
+                                self._mark_first_work_round()
                                 # Check for scheduled dream tasks
                                 if await self._check_scheduled_dream():
                                     logger.info("Scheduled dream time has arrived")
@@ -931,15 +956,11 @@ class AgentProcessor:
                         elif current_state == AgentState.DREAM:
                             delay = 5.0  # Check dream state periodically
 
+                    # The delay bounds the wait; committed work starts the next round early
                     if delay > 0 and not (self._stop_event is not None and self._stop_event.is_set()):
-                        try:
-                            if self._stop_event is not None:
-                                await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
-                                break  # Stop event was set
-                            else:
-                                await asyncio.sleep(delay)
-                        except asyncio.TimeoutError:
-                            pass  # Continue processing
+                        await self.thought_scheduler.wait_for_work(delay, self._stop_event)
+                        if self._stop_event is not None and self._stop_event.is_set():
+                            break  # Stop event was set
 
                 except Exception as e:
                     consecutive_errors += 1
@@ -1063,6 +1084,10 @@ class AgentProcessor:
             status["processor_metrics"][state.value] = processor.get_metrics()
 
         status["queue_status"] = self._get_detailed_queue_status()
+        status["thought_scheduler"] = self.thought_scheduler.get_stats()
+        service_registry = self.services.get("service_registry")
+        if service_registry is not None:
+            status["tool_catalog"] = get_tool_catalog(service_registry).get_metrics()
 
         return status
 
@@ -4,22 +4,24 @@ Coordinates DMA orchestration, context building, consciences, and pondering.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from ciris_engine.logic import persistence
 from ciris_engine.logic.config import ConfigAccessor
+from ciris_engine.logic.conscience.executor import run_consciences
 from ciris_engine.logic.dma.exceptions import DMAFailure
 from ciris_engine.logic.handlers.control.ponder_handler import PonderHandler
 from ciris_engine.logic.infrastructure.handlers.base_handler import ActionHandlerDependencies
 from ciris_engine.logic.processors.support.processing_queue import ProcessingQueueItem
-from ciris_engine.logic.registries.circuit_breaker import CircuitBreakerError
 from ciris_engine.logic.utils.channel_utils import create_channel_context
 from ciris_engine.protocols.services.graph.telemetry import TelemetryServiceProtocol
 from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
 from ciris_engine.schemas.actions.parameters import DeferParams, PonderParams
 from ciris_engine.schemas.dma.results import ActionSelectionDMAResult
 from ciris_engine.schemas.runtime.enums import HandlerActionType
-from ciris_engine.schemas.runtime.models import Thought, ThoughtStatus
+from ciris_engine.schemas.runtime.models import Task, Thought, ThoughtStatus
 from ciris_engine.schemas.telemetry.core import (
     CorrelationType,
     ServiceCorrelation,
@@ -29,6 +31,9 @@ from ciris_engine.schemas.telemetry.core import (
 
 logger = logging.getLogger(__name__)
 
+# Bound on cached task authorization verdicts (LRU)
+TASK_AUTH_CACHE_SIZE = 1024
+
 
 class ThoughtProcessor:
     def __init__(
@@ -41,6 +46,7 @@ class ThoughtProcessor:
         time_service: TimeServiceProtocol,
         telemetry_service: Optional[TelemetryServiceProtocol] = None,
         auth_service: Optional[Any] = None,
+        conscience_early_cancel: bool = False,
     ) -> None:
         self.dma_orchestrator = dma_orchestrator
         self.context_builder = context_builder
@@ -51,6 +57,10 @@ class ThoughtProcessor:
         self.telemetry_service = telemetry_service
         self._time_service = time_service
         self.auth_service = auth_service
+        # Cancel remaining conscience checks once a higher priority override is decisive
+        self.conscience_early_cancel = conscience_early_cancel
+        # (task_id, signature, signer, status) -> (verdict, auth service wa_cache_version)
+        self._task_auth_cache: "OrderedDict[Tuple[str, str, str, str], Tuple[bool, Optional[int]]]" = OrderedDict()
 
     async def process_thought(
         self, thought_item: ProcessingQueueItem, context: Optional[dict] = None
@@ -206,6 +216,7 @@ class ThoughtProcessor:
 
         # 2. Build context (always build proper ThoughtContext for DMA orchestrator)
         batch_context_data = context.get("batch_context") if context else None
+        context_start = time.perf_counter()
         if batch_context_data:
             logger.debug(f"Using batch context for thought {thought_item.thought_id}")
             # Use optimized batch context building
@@ -223,6 +234,9 @@ class ThoughtProcessor:
         else:
             logger.debug(f"Building full context for thought {thought_item.thought_id} (no batch context)")
             thought_context = await self.context_builder.build_thought_context(thought)
+        await self._record_context_build_time(
+            (time.perf_counter() - context_start) * 1000, batched=batch_context_data is not None
+        )
         # Store the fresh context on the queue item so DMA executor can use it
         if hasattr(thought_context, "model_dump"):
             thought_item.initial_context = thought_context.model_dump()
@@ -566,7 +580,7 @@ class ThoughtProcessor:
         self,
         action_result: ActionSelectionDMAResult,
         thought: Thought,
-        dma_results_dict: dict,
+        dma_results_dict: Dict[str, Any],
         processing_context: Optional[Any] = None,
     ) -> Any:
         """Simple conscience application without orchestrator."""
@@ -603,64 +617,46 @@ class ThoughtProcessor:
         override_reason = None
         epistemic_data: Dict[str, str] = {}
 
-        # Get consciences from registry
-        for entry in self.conscience_registry.get_consciences():
-            conscience = entry.conscience
-            cb = entry.circuit_breaker
+        # Every conscience checks the original action, so they run concurrently;
+        # outcomes come back in priority order and the first override wins
+        entries = self.conscience_registry.get_consciences()
+        wall_start = time.perf_counter()
+        outcomes = await run_consciences(entries, action_result, context, early_cancel=self.conscience_early_cancel)
+        await self._record_conscience_latency(outcomes, (time.perf_counter() - wall_start) * 1000)
 
-            try:
-                if cb:
-                    cb.check_and_raise()
-                result = await conscience.check(final_action, context)
-                if cb:
-                    cb.record_success()
-            except CircuitBreakerError as e:
-                logger.warning(f"conscience {entry.name} unavailable: {e}")
-                continue
-            except Exception as e:  # noqa: BLE001
-                logger.error(f"conscience {entry.name} error: {e}", exc_info=True)
-                if cb:
-                    cb.record_failure()
+        for outcome in outcomes:
+            check_result = outcome.result
+            if check_result is None:
                 continue
 
             # Store epistemic data if available
-            if result.epistemic_data:
-                epistemic_data[entry.name] = result.epistemic_data.model_dump()
+            if check_result.epistemic_data is not None:
+                epistemic_data[outcome.name] = check_result.epistemic_data.model_dump_json()
 
-            if not result.passed:
+            if not check_result.passed:
                 overridden = True
-                override_reason = result.reason
-
-                # Check if the conscience provides a replacement action
-                if (
-                    result.epistemic_data
-                    and hasattr(result.epistemic_data, "get")
-                    and "replacement_action" in result.epistemic_data
-                ):
-                    # Use the conscience's suggested replacement action
-                    replacement_data = result.epistemic_data["replacement_action"]
-                    final_action = ActionSelectionDMAResult.model_validate(replacement_data)
-                else:
-                    # Default behavior: create a PONDER action
-                    attempted_action_desc = self._describe_action(action_result)
-                    questions = [
-                        f"I attempted to {attempted_action_desc}",
-                        result.reason or "conscience failed",
-                        "What alternative approach would better align with my principles?",
-                    ]
-
-                    ponder_params = PonderParams(questions=questions)
-
-                    # Create PONDER action with required fields
-                    final_action = ActionSelectionDMAResult(
-                        selected_action=HandlerActionType.PONDER,
-                        action_parameters=ponder_params,
-                        rationale=f"Overridden by {entry.name}: Need to reconsider {attempted_action_desc}",
-                        raw_llm_response=None,
-                        reasoning=None,
-                        evaluation_time_ms=None,
-                        resource_usage=None,
-                    )
+                override_reason = check_result.reason
+
+                # EpistemicData carries no replacement action, so an override becomes a PONDER
+                attempted_action_desc = self._describe_action(action_result)
+                questions = [
+                    f"I attempted to {attempted_action_desc}",
+                    check_result.reason or "conscience failed",
+                    "What alternative approach would better align with my principles?",
+                ]
+
+                ponder_params = PonderParams(questions=questions)
+
+                # Create PONDER action with required fields
+                final_action = ActionSelectionDMAResult(
+                    selected_action=HandlerActionType.PONDER,
+                    action_parameters=ponder_params,
+                    rationale=f"Overridden by {outcome.name}: Need to reconsider {attempted_action_desc}",
+                    raw_llm_response=None,
+                    reasoning=None,
+                    evaluation_time_ms=None,
+                    resource_usage=None,
+                )
                 break
 
         # If this was a conscience retry and we didn't override, force PONDER
@@ -668,8 +664,7 @@ class ThoughtProcessor:
         if is_conscience_retry and not overridden:
             # Check if any conscience that ran was the depth guardrail
             has_depth_guardrail = any(
-                "ThoughtDepthGuardrail" in entry.conscience.__class__.__name__
-                for entry in self.conscience_registry.get_consciences()
+                "ThoughtDepthGuardrail" in entry.conscience.__class__.__name__ for entry in entries
             )
 
             if not has_depth_guardrail:
@@ -686,15 +681,51 @@ class ThoughtProcessor:
                 overridden = True
                 override_reason = "Conscience retry - forcing PONDER to prevent loops"
 
-        result = ConscienceApplicationResult(
+        return ConscienceApplicationResult(
             original_action=action_result,
             final_action=final_action,
             overridden=overridden,
             override_reason=override_reason,
+            epistemic_data=epistemic_data,
+        )
+
+    async def _record_context_build_time(self, elapsed_ms: float, batched: bool) -> None:
+        """Record how long building the thought context took."""
+        logger.debug(f"Built thought context in {elapsed_ms:.0f}ms (batched={batched})")
+        if not self.telemetry_service:
+            return
+        await self.telemetry_service.record_metric(
+            "thought_context_build_ms",
+            value=elapsed_ms,
+            tags={"batched": str(batched).lower(), "path_type": "hot", "source_module": "thought_processor"},
         )
-        if epistemic_data:
-            result.epistemic_data = epistemic_data
-        return result
+
+    async def _record_conscience_latency(self, outcomes: List[Any], wall_ms: float) -> None:
+        """Record per-conscience and overall conscience latency."""
+        if not outcomes:
+            return
+        logger.debug(
+            f"Consciences finished in {wall_ms:.0f}ms: "
+            + ", ".join(f"{o.name}={o.latency_ms:.0f}ms ({o.status})" for o in outcomes)
+        )
+        if not self.telemetry_service:
+            return
+        await self.telemetry_service.record_metric(
+            "conscience_wall_time_ms",
+            value=wall_ms,
+            tags={"path_type": "hot", "source_module": "thought_processor"},
+        )
+        for outcome in outcomes:
+            await self.telemetry_service.record_metric(
+                "conscience_latency_ms",
+                value=outcome.latency_ms,
+                tags={
+                    "conscience": outcome.name,
+                    "status": outcome.status,
+                    "path_type": "hot",
+                    "source_module": "thought_processor",
+                },
+            )
 
     async def _fetch_thought(self, thought_id: str) -> Optional[Thought]:
         # Import here to avoid circular import
@@ -723,6 +754,28 @@ class ThoughtProcessor:
             logger.error(f"Task {task.task_id} is not signed")
             return False
 
+        # Signatures are immutable, so the verdict only changes when a WA is
+        # created, updated or revoked (tracked by the auth service's cache version).
+        # Status is part of the signed payload, so it is part of the key.
+        status = task.status.value if hasattr(task.status, "value") else str(task.status)
+        cache_key = (task.task_id, task.signature or "", task.signed_by, status)
+        wa_version = getattr(self.auth_service, "wa_cache_version", None)
+        wa_version = wa_version if isinstance(wa_version, int) else None
+        cached = self._task_auth_cache.get(cache_key)
+        if cached is not None and wa_version is not None and cached[1] == wa_version:
+            self._task_auth_cache.move_to_end(cache_key)
+            return cached[0]
+
+        verdict = await self._check_task_signer(task)
+        if wa_version is not None:
+            self._task_auth_cache[cache_key] = (verdict, wa_version)
+            self._task_auth_cache.move_to_end(cache_key)
+            while len(self._task_auth_cache) > TASK_AUTH_CACHE_SIZE:
+                self._task_auth_cache.popitem(last=False)
+        return verdict
+
+    async def _check_task_signer(self, task: Task) -> bool:
+        """Verify the task signature and that the signer is at least an observer."""
         # Verify the signature
         is_valid = await self.auth_service.verify_task_signature(task)
         if not is_valid:
@@ -41,10 +41,11 @@ def generate_seed_thought_enhanced(self: Any, task: Task, round_number: int = 0)
             channel_name = match.group(3)  # This is the channel name from description
             message_content = match.group(4)
 
-            # Get conversation history from correlations using the task's channel_id
-            from ciris_engine.logic.persistence import get_correlations_by_channel
+            # Get conversation history from correlations using the task's channel_id,
+            # including replies whose correlations are still queued for writing
+            from ciris_engine.logic.adapters.side_effects import get_channel_correlations
 
-            correlations = get_correlations_by_channel(
+            correlations = get_channel_correlations(
                 channel_id=task.channel_id,  # Use task's channel_id, not the extracted channel name
                 limit=10,  # Last 10 messages
             )
@@ -0,0 +1,218 @@
+"""
+Adaptive scheduling of pending thoughts for the agent processor.
+
+Decides how many thoughts run concurrently in a round, which ones go first
+and when the next round starts. Concurrency is tuned from the observed
+per-thought latency (DMA and LLM calls dominate it) and error rate: it grows
+while the backlog exceeds the limit and latency stays under target, and
+backs off when latency climbs or thoughts start failing. Rounds are started
+by new-work notifications rather than fixed sleeps.
+"""
+
+import asyncio
+import collections
+import logging
+from datetime import datetime, timezone
+from typing import Deque, Dict, List, Mapping, Optional, Sequence
+
+from ciris_engine.schemas.runtime.models import Thought
+
+logger = logging.getLogger(__name__)
+
+_WINDOW = 100  # Queue wait samples kept for the metrics
+
+
+def _created_at(thought: Thought) -> datetime:
+    """Creation time of a thought; unparseable timestamps sort as newest."""
+    try:
+        created = datetime.fromisoformat(thought.created_at.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return datetime.max.replace(tzinfo=timezone.utc)
+    return created if created.tzinfo else created.replace(tzinfo=timezone.utc)
+
+
+class AdaptiveThoughtScheduler:
+    """
+    Sizes and orders thought rounds, and wakes the processor when work arrives.
+
+    Concurrency follows additive-increase / multiplicative-decrease: +1 after a
+    saturated round under the latency target, -1 when the latency average is
+    over target, halved when the round's error rate exceeds the threshold.
+    """
+
+    def __init__(
+        self,
+        min_concurrency: int = 1,
+        max_concurrency: int = 10,
+        initial_concurrency: int = 5,
+        target_latency_seconds: float = 30.0,
+        error_rate_threshold: float = 0.2,
+        latency_smoothing: float = 0.3,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            min_concurrency: Lowest number of thoughts run at once
+            max_concurrency: Highest number of thoughts run at once
+            initial_concurrency: Starting limit, clamped to the bounds
+            target_latency_seconds: Per-thought latency above which concurrency is reduced
+            error_rate_threshold: Fraction of failed thoughts in a round that halves concurrency
+            latency_smoothing: Weight of the newest sample in the latency average
+        """
+        self.min_concurrency = max(1, min_concurrency)
+        self.max_concurrency = max(self.min_concurrency, max_concurrency)
+        self.concurrency_limit = min(max(initial_concurrency, self.min_concurrency), self.max_concurrency)
+        self.target_latency_seconds = target_latency_seconds
+        self.error_rate_threshold = error_rate_threshold
+        self._smoothing = latency_smoothing
+
+        # Wakeup state; the event belongs to the loop that first waits on it
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake_event: Optional[asyncio.Event] = None
+        self._work_pending = False
+
+        # Current round
+        self._round_limit = self.concurrency_limit
+        self._round_dispatched = 0
+        self._round_backlogged = False
+        self._round_results = 0
+        self._round_errors = 0
+
+        # Statistics
+        self._queue_waits: Deque[float] = collections.deque(maxlen=_WINDOW)
+        self._latency_ewma: Optional[float] = None
+        self._last_utilization = 0.0
+        self._last_error_rate = 0.0
+        self._rounds = 0
+        self._wakeups = 0
+        self._limit_increases = 0
+        self._limit_decreases = 0
+
+    def notify(self, kind: str = "thought") -> None:
+        """Signal that new work was committed; safe to call from any thread."""
+        self._work_pending = True
+        loop = self._loop
+        if loop is None or loop.is_closed() or self._wake_event is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._wake_event.set)
+        except RuntimeError:
+            pass  # Loop shutting down
+
+    async def wait_for_work(self, timeout: float, stop_event: Optional[asyncio.Event] = None) -> bool:
+        """
+        Wait until work is notified, the stop event is set or the timeout passes.
+
+        Args:
+            timeout: Longest time to wait, in seconds
+            stop_event: Optional event that also ends the wait
+
+        Returns:
+            True if the wait ended because of new work
+        """
+        if self._wake_event is None or self._loop is not asyncio.get_running_loop():
+            self._loop = asyncio.get_running_loop()
+            self._wake_event = asyncio.Event()
+        wake_event = self._wake_event
+
+        if not self._work_pending and timeout > 0:
+            waiters = [asyncio.ensure_future(wake_event.wait())]
+            if stop_event is not None:
+                waiters.append(asyncio.ensure_future(stop_event.wait()))
+            try:
+                await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for waiter in waiters:
+                    waiter.cancel()
+
+        woken = self._work_pending
+        self._work_pending = False
+        wake_event.clear()
+        if woken:
+            self._wakeups += 1
+        return woken
+
+    def select(self, pending: Sequence[Thought], task_priorities: Mapping[str, int], now: datetime) -> List[Thought]:
+        """
+        Pick the thoughts for this round: highest task priority first, then oldest.
+
+        Args:
+            pending: Thoughts waiting to be processed
+            task_priorities: Priority of each active task by task ID
+            now: Current time, for queue wait
+
+        Returns:
+            At most concurrency_limit thoughts, in dispatch order
+        """
+        ordered = sorted(
+            pending,
+            key=lambda thought: (-task_priorities.get(thought.source_task_id, 0), _created_at(thought)),
+        )
+        selected = ordered[: self.concurrency_limit]
+
+        self._round_limit = self.concurrency_limit
+        self._round_dispatched = len(selected)
+        self._round_backlogged = len(ordered) > len(selected)
+        self._round_results = 0
+        self._round_errors = 0
+        for thought in selected:
+            self._queue_waits.append(max(0.0, (now - _created_at(thought)).total_seconds()))
+        return selected
+
+    def record_result(self, latency_seconds: float, success: bool) -> None:
+        """Record how long one thought took and whether it succeeded."""
+        self._round_results += 1
+        if not success:
+            self._round_errors += 1
+        if self._latency_ewma is None:
+            self._latency_ewma = latency_seconds
+        else:
+            self._latency_ewma += self._smoothing * (latency_seconds - self._latency_ewma)
+
+    def end_round(self) -> None:
+        """Close the round and adjust the concurrency limit from what it observed."""
+        if not self._round_dispatched:
+            return
+        self._rounds += 1
+        self._last_utilization = self._round_dispatched / self._round_limit
+        self._last_error_rate = self._round_errors / self._round_results if self._round_results else 0.0
+
+        previous = self.concurrency_limit
+        latency = self._latency_ewma or 0.0
+        if self._last_error_rate > self.error_rate_threshold:
+            self.concurrency_limit = max(self.min_concurrency, self.concurrency_limit // 2)
+        elif latency > self.target_latency_seconds:
+            self.concurrency_limit = max(self.min_concurrency, self.concurrency_limit - 1)
+        elif self._round_backlogged:
+            self.concurrency_limit = min(self.max_concurrency, self.concurrency_limit + 1)
+
+        if self.concurrency_limit > previous:
+            self._limit_increases += 1
+        elif self.concurrency_limit < previous:
+            self._limit_decreases += 1
+            logger.info(
+                f"Thought concurrency reduced {previous} -> {self.concurrency_limit} "
+                f"(error rate {self._last_error_rate:.0%}, latency {latency:.1f}s)"
+            )
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Statistics dictionary
+        """
+        waits = list(self._queue_waits)
+        return {
+            "thought_concurrency_limit": float(self.concurrency_limit),
+            "thought_queue_wait_avg_ms": (sum(waits) / len(waits) * 1000) if waits else 0.0,
+            "thought_queue_wait_max_ms": max(waits) * 1000 if waits else 0.0,
+            "thought_round_utilization": self._last_utilization,
+            "thought_latency_avg_seconds": self._latency_ewma or 0.0,
+            "thought_error_rate": self._last_error_rate,
+            "thought_rounds": float(self._rounds),
+            "thought_work_wakeups": float(self._wakeups),
+            "thought_concurrency_increases": float(self._limit_increases),
+            "thought_concurrency_decreases": float(self._limit_decreases),
+        }
@@ -19,6 +19,7 @@ from datetime import datetime
 
 from ciris_engine.logic.adapters import load_adapter
 from ciris_engine.logic.config import ConfigBootstrap
+from ciris_engine.logic.context.tool_catalog import get_tool_catalog
 from ciris_engine.logic.registries.base import Priority, SelectionStrategy
 from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
 from ciris_engine.schemas.adapters.registration import AdapterServiceRegistration
@@ -666,6 +667,8 @@ class RuntimeAdapterManager(AdapterManagerInterface):
 
                 logger.info(f"Registered {service_key} from adapter {instance.adapter_id}")
 
+            get_tool_catalog(self.runtime.service_registry).invalidate()
+
         except Exception as e:
             logger.error(f"Error registering services for adapter {instance.adapter_id}: {e}", exc_info=True)
 
@@ -680,6 +683,7 @@ class RuntimeAdapterManager(AdapterManagerInterface):
                 logger.info(f"Would unregister service: {service_key} from adapter {instance.adapter_id}")
 
             instance.services_registered.clear()
+            get_tool_catalog(self.runtime.service_registry).invalidate()
 
         except Exception as e:
             logger.error(f"Error unregistering services for adapter {instance.adapter_id}: {e}", exc_info=True)
@@ -248,6 +248,7 @@ class ComponentBuilder:
             dependencies,
             telemetry_service=self.runtime.telemetry_service,
             time_service=self.runtime.time_service,
+            conscience_early_cancel=self.runtime.essential_config.workflow.conscience_early_cancel,
         )
 
         # Build action dispatcher
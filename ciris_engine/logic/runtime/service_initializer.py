@@ -7,8 +7,9 @@ Handles the initialization of all core services.
 import json
 import logging
 import os
+import sys
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
 import aiofiles
 
@@ -16,6 +17,7 @@ from ciris_engine.logic.buses import BusManager
 from ciris_engine.logic.config.config_accessor import ConfigAccessor
 from ciris_engine.logic.persistence.maintenance import DatabaseMaintenanceService
 from ciris_engine.logic.registries.base import Priority, ServiceRegistry
+from ciris_engine.logic.runtime.startup_scheduler import StartupScheduler
 
 # CoreToolService removed - SELF_HELP moved to memory per user request
 # BasicTelemetryCollector removed - using GraphTelemetryService instead
@@ -31,16 +33,36 @@ from ciris_engine.logic.services.lifecycle.shutdown import ShutdownService
 
 # Import new infrastructure services
 from ciris_engine.logic.services.lifecycle.time import TimeService
-from ciris_engine.logic.services.runtime.llm_service import OpenAICompatibleClient
 from ciris_engine.protocols.services import LLMService, TelemetryService
 from ciris_engine.schemas.config.essential import EssentialConfig
 from ciris_engine.schemas.runtime.enums import ServiceType
 from ciris_engine.schemas.runtime.manifest import ServiceManifest
+from ciris_engine.schemas.services.lifecycle.initialization import ServiceStartupRecord
 from ciris_engine.schemas.services.capabilities import LLMCapabilities
 
+if TYPE_CHECKING:
+    from ciris_engine.logic.services.runtime.llm_service import OpenAICompatibleClient
+
 logger = logging.getLogger(__name__)
 
 
+def __getattr__(name: str) -> Any:
+    # The OpenAI client pulls in openai + instructor (the heaviest imports in the
+    # runtime); load it only when a real LLM service is actually created.
+    if name == "OpenAICompatibleClient":
+        from ciris_engine.logic.services.runtime.llm_service import OpenAICompatibleClient
+
+        globals()["OpenAICompatibleClient"] = OpenAICompatibleClient
+        return OpenAICompatibleClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _llm_client_class() -> "type[OpenAICompatibleClient]":
+    """Resolve the LLM client class through the module so it can be patched in tests."""
+    client_class: "type[OpenAICompatibleClient]" = getattr(sys.modules[__name__], "OpenAICompatibleClient")
+    return client_class
+
+
 class ServiceInitializer:
     """Manages initialization of all core services."""
 
@@ -85,32 +107,45 @@ class ServiceInitializer:
         self.loaded_modules: List[str] = []
         self._skip_llm_init: bool = False  # Set to True if MOCK LLM module detected
 
+        # Per-service startup timeline across all scheduler phases
+        self.startup_timeline: List[ServiceStartupRecord] = []
+        self._secrets_master_key: Optional[bytes] = None
+
     async def initialize_infrastructure_services(self) -> None:
         """Initialize infrastructure services that all other services depend on."""
-        # Initialize TimeService first - everyone needs time
-        self.time_service = TimeService()
-        await self.time_service.start()
-        logger.info("TimeService initialized")
-        assert self.time_service is not None  # For type checker
+        scheduler = StartupScheduler("infrastructure")
+        # TimeService first - everyone needs time
+        scheduler.add("TimeService", self._start_time_service)
+        scheduler.add("ShutdownService", self._start_shutdown_service)
+        scheduler.add("InitializationService", self._start_initialization_service, depends_on=["TimeService"])
+        scheduler.add("ResourceMonitorService", self._start_resource_monitor_service, depends_on=["TimeService"])
+        await self._run_startup(scheduler)
 
         # Note: TimeService will be registered in ServiceRegistry later
         # when the registry is created in initialize_all_services()
 
-        # Initialize ShutdownService
+    async def _start_time_service(self) -> None:
+        self.time_service = TimeService()
+        await self.time_service.start()
+        logger.info("TimeService initialized")
+
+    async def _start_shutdown_service(self) -> None:
         self.shutdown_service = ShutdownService()
         await self.shutdown_service.start()
         logger.info("ShutdownService initialized")
 
-        # Initialize InitializationService with TimeService
+    async def _start_initialization_service(self) -> None:
+        assert self.time_service is not None
         self.initialization_service = InitializationService(self.time_service)
         await self.initialization_service.start()
         logger.info("InitializationService initialized")
 
-        # Initialize ResourceMonitorService
+    async def _start_resource_monitor_service(self) -> None:
         from ciris_engine.logic.persistence import get_sqlite_db_full_path
         from ciris_engine.logic.services.infrastructure.resource_monitor import ResourceMonitorService
         from ciris_engine.schemas.services.resources_core import ResourceBudget
 
+        assert self.time_service is not None
         # Create default resource budget
         budget = ResourceBudget()  # Uses defaults from schema
         self.resource_monitor_service = ResourceMonitorService(
@@ -119,14 +154,23 @@ class ServiceInitializer:
         await self.resource_monitor_service.start()
         logger.info("ResourceMonitorService initialized")
 
+    async def _run_startup(self, scheduler: StartupScheduler) -> None:
+        """Run a startup scheduler and record its timeline with the InitializationService."""
+        try:
+            await scheduler.run()
+        finally:
+            # Keep the partial timeline on failure - it shows which service broke startup
+            records = scheduler.records
+            self.startup_timeline.extend(records)
+            if self.initialization_service is not None:
+                self.initialization_service.record_service_startup(records)
+
     async def initialize_memory_service(self, config: Any) -> None:
         """Initialize the memory service."""
         # Initialize secrets service first (memory service depends on it)
         import os
         from pathlib import Path
 
-        from ciris_engine.logic.persistence import get_sqlite_db_full_path
-
         # Ensure .ciris_keys directory exists
         keys_dir = Path(".ciris_keys")
         keys_dir.mkdir(exist_ok=True)
@@ -195,6 +239,24 @@ This directory contains critical cryptographic keys for the CIRIS system.
                 await f.write(readme_content)
             logger.info("Created .ciris_keys/README.md")
 
+        self._secrets_master_key = master_key
+
+        scheduler = StartupScheduler("memory")
+        scheduler.add("SecretsService", self._start_secrets_service)
+        scheduler.add("SecretsToolService", self._start_secrets_tool_service, depends_on=["SecretsService"])
+        scheduler.add("LocalGraphMemoryService", self._start_memory_service, depends_on=["SecretsService"])
+        scheduler.add("GraphConfigService", self._start_config_service, depends_on=["LocalGraphMemoryService"])
+        await self._run_startup(scheduler)
+
+        # Create config accessor with graph service
+        self.config_accessor = ConfigAccessor(self.config_service, self.essential_config)
+
+        # Migrate essential config to graph
+        await self._migrate_config_to_graph()
+
+    async def _start_secrets_service(self) -> None:
+        from ciris_engine.logic.persistence import get_sqlite_db_full_path
+
         db_path = get_sqlite_db_full_path()
         secrets_db_path = db_path.replace(".db", "_secrets.db")
 
@@ -202,20 +264,23 @@ This directory contains critical cryptographic keys for the CIRIS system.
             raise RuntimeError("TimeService must be initialized before SecretsService")
 
         self.secrets_service = SecretsService(
-            db_path=secrets_db_path, time_service=self.time_service, master_key=master_key
+            db_path=secrets_db_path, time_service=self.time_service, master_key=self._secrets_master_key
         )
         await self.secrets_service.start()
         logger.info("SecretsService initialized")
 
+    async def _start_secrets_tool_service(self) -> None:
         # Create and register SecretsToolService
         from ciris_engine.logic.services.tools import SecretsToolService
 
+        assert self.secrets_service is not None and self.time_service is not None
         self.core_tool_service = SecretsToolService(
             secrets_service=self.secrets_service, time_service=self.time_service
         )
         await self.core_tool_service.start()
         logger.info("SecretsToolService created and started")
 
+    async def _start_memory_service(self) -> None:
         # LocalGraphMemoryService uses SQLite by default
         self.memory_service = LocalGraphMemoryService(
             time_service=self.time_service, secrets_service=self.secrets_service
@@ -224,21 +289,17 @@ This directory contains critical cryptographic keys for the CIRIS system.
 
         logger.info("Memory service initialized")
 
+    async def _start_config_service(self) -> None:
         # Initialize GraphConfigService now that memory service is ready
         from ciris_engine.logic.services.graph.config_service import GraphConfigService
 
         if self.time_service is None:
             raise RuntimeError("TimeService must be initialized before GraphConfigService")
+        assert self.memory_service is not None
         self.config_service = GraphConfigService(self.memory_service, self.time_service)
         await self.config_service.start()
         logger.info("GraphConfigService initialized")
 
-        # Create config accessor with graph service
-        self.config_accessor = ConfigAccessor(self.config_service, self.essential_config)
-
-        # Migrate essential config to graph
-        await self._migrate_config_to_graph()
-
     async def verify_memory_service(self) -> bool:
         """Verify memory service is operational."""
         if not self.memory_service:
@@ -447,6 +508,31 @@ This directory contains critical cryptographic keys for the CIRIS system.
             None,  # audit_service will be set later
         )
 
+        # Start the remaining core services in dependency waves. Each entry names
+        # the services it needs; independent services start concurrently.
+        scheduler = StartupScheduler("core")
+        scheduler.add("GraphTelemetryService", self._start_telemetry_service)
+        scheduler.add(
+            "LLMService",
+            lambda: self._initialize_llm_services(config, modules_to_load),
+            depends_on=["GraphTelemetryService"],
+        )
+        scheduler.add("GraphAuditService", lambda: self._initialize_audit_services(config, agent_id))
+        scheduler.add("AdaptiveFilterService", self._start_adaptive_filter_service, depends_on=["LLMService"])
+        scheduler.add("TaskSchedulerService", lambda: self._start_task_scheduler_service(config))
+        scheduler.add("TSDBConsolidationService", self._start_tsdb_consolidation_service)
+        # Maintenance runs AFTER consolidation so missed windows are consolidated before cleanup
+        scheduler.add(
+            "DatabaseMaintenanceService",
+            self._start_maintenance_service,
+            depends_on=["TSDBConsolidationService"],
+        )
+        scheduler.add("SelfObservationService", self._start_self_observation_service)
+        scheduler.add("VisibilityService", self._start_visibility_service)
+        scheduler.add("RuntimeControlService", self._start_runtime_control_service)
+        await self._run_startup(scheduler)
+
+    async def _start_telemetry_service(self) -> None:
         # Initialize telemetry service using GraphTelemetryService
         # This implements the "Graph Memory as Identity Architecture" patent
         # where telemetry IS memory stored in the agent's identity graph
@@ -464,14 +550,7 @@ This directory contains critical cryptographic keys for the CIRIS system.
         self.bus_manager.telemetry_service = self.telemetry_service
         self.bus_manager.llm.telemetry_service = self.telemetry_service
 
-        # Initialize LLM service(s) based on configuration
-        await self._initialize_llm_services(config, modules_to_load)
-
-        # Secrets service no longer needs LLM service reference
-
-        # Initialize ALL THREE REQUIRED audit services
-        await self._initialize_audit_services(config, agent_id)
-
+    async def _start_adaptive_filter_service(self) -> None:
         # Initialize adaptive filter service
         assert self.memory_service is not None
         assert self.time_service is not None
@@ -493,15 +572,18 @@ This directory contains critical cryptographic keys for the CIRIS system.
         # CoreToolService removed - tools are adapter-only per user request
         # SELF_HELP moved to memory service
 
+    async def _start_task_scheduler_service(self, config: Any) -> None:
         # Initialize task scheduler service
         from ciris_engine.logic.services.lifecycle.scheduler import TaskSchedulerService
 
+        assert self.time_service is not None
         self.task_scheduler_service = TaskSchedulerService(
             db_path=getattr(config, "database_path", "data/ciris_engine.db"), time_service=self.time_service
         )
         await self.task_scheduler_service.start()
         logger.info("Task scheduler service initialized")
 
+    async def _start_tsdb_consolidation_service(self) -> None:
         # Initialize TSDB consolidation service BEFORE maintenance
         # This ensures we consolidate any missed windows before maintenance runs
         from ciris_engine.logic.services.graph.tsdb_consolidation import TSDBConsolidationService
@@ -524,7 +606,9 @@ This directory contains critical cryptographic keys for the CIRIS system.
             "TSDB consolidation service initialized - consolidating missed windows and starting periodic consolidation"
         )
 
+    async def _start_maintenance_service(self) -> None:
         # Initialize maintenance service AFTER consolidation
+        config = self.essential_config
         archive_dir = getattr(config, "data_archive_dir", "data_archive")
         archive_hours = getattr(config, "archive_older_than_hours", 24)
         assert self.time_service is not None
@@ -538,6 +622,7 @@ This directory contains critical cryptographic keys for the CIRIS system.
         await self.maintenance_service.start()
         logger.info("Database maintenance service initialized and started")
 
+    async def _start_self_observation_service(self) -> None:
         # Initialize self observation service
         from ciris_engine.logic.services.adaptation.self_observation import SelfObservationService
 
@@ -556,6 +641,7 @@ This directory contains critical cryptographic keys for the CIRIS system.
         await self.self_observation_service.start()
         logger.info("Self observation service initialized and started")
 
+    async def _start_visibility_service(self) -> None:
         # Initialize visibility service
         from ciris_engine.logic.persistence import get_sqlite_db_full_path
         from ciris_engine.logic.services.governance.visibility import VisibilityService
@@ -568,6 +654,7 @@ This directory contains critical cryptographic keys for the CIRIS system.
         await self.visibility_service.start()
         logger.info("Visibility service initialized - providing reasoning transparency")
 
+    async def _start_runtime_control_service(self) -> None:
         # Initialize runtime control service
         from ciris_engine.logic.services.runtime.control_service import RuntimeControlService
 
@@ -626,7 +713,7 @@ This directory contains critical cryptographic keys for the CIRIS system.
         )
 
         # Create and start service
-        openai_service = OpenAICompatibleClient(
+        openai_service = _llm_client_class()(
             config=llm_config, telemetry_service=self.telemetry_service, time_service=self.time_service
         )
         await openai_service.start()
@@ -684,7 +771,7 @@ This directory contains critical cryptographic keys for the CIRIS system.
         )
 
         # Create and start service
-        service = OpenAICompatibleClient(
+        service = _llm_client_class()(
             config=llm_config, telemetry_service=self.telemetry_service, time_service=self.time_service
         )
         await service.start()
@@ -718,6 +805,9 @@ This directory contains critical cryptographic keys for the CIRIS system.
         audit_db_path = await self.config_accessor.get_path("database.audit_db", Path("data/ciris_audit.db"))
         audit_key_path = await self.config_accessor.get_path("security.audit_key_path", Path(".ciris_keys"))
         retention_days = await self.config_accessor.get_int("security.audit_retention_days", 90)
+        batch_signing = await self.config_accessor.get_bool("security.audit_batch_signing", False)
+        batch_max_entries = await self.config_accessor.get_int("security.audit_batch_max_entries", 256)
+        batch_interval_ms = await self.config_accessor.get_int("security.audit_batch_interval_ms", 50)
 
         from ciris_engine.logic.services.graph.audit_service import GraphAuditService
 
@@ -729,6 +819,9 @@ This directory contains critical cryptographic keys for the CIRIS system.
             enable_hash_chain=True,
             db_path=str(audit_db_path),
             key_path=str(audit_key_path),
+            batch_signing=batch_signing,
+            batch_max_entries=batch_max_entries,
+            batch_interval_ms=batch_interval_ms,
             retention_days=retention_days,
         )
         # Set service registry so it can access memory bus
@@ -0,0 +1,116 @@
+"""
+Dependency-aware service startup for CIRIS Agent runtime.
+
+Services are registered with the names of the services they depend on and are
+started in topological waves: every service whose dependencies have completed
+is started concurrently with the rest of its wave.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from ciris_engine.schemas.services.lifecycle.initialization import ServiceStartupRecord
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StartupNode:
+    """A service start action and the services it depends on."""
+
+    name: str
+    start: Callable[[], Awaitable[None]]
+    depends_on: List[str] = field(default_factory=list)
+
+
+class StartupScheduler:
+    """Starts registered services in dependency order, running independent services concurrently."""
+
+    def __init__(self, phase: str) -> None:
+        self.phase = phase
+        self._nodes: Dict[str, StartupNode] = {}
+        self._errors: Dict[str, Exception] = {}
+        self.records: List[ServiceStartupRecord] = []
+
+    def add(self, name: str, start: Callable[[], Awaitable[None]], depends_on: Optional[List[str]] = None) -> None:
+        """Register a service start action."""
+        if name in self._nodes:
+            raise ValueError(f"Service '{name}' already registered with startup scheduler")
+        self._nodes[name] = StartupNode(name=name, start=start, depends_on=list(depends_on or []))
+
+    def compute_waves(self) -> List[List[str]]:
+        """Group services into waves where each wave only depends on earlier waves.
+
+        Registration order is preserved within a wave so startup logs stay stable.
+        """
+        for node in self._nodes.values():
+            for dep in node.depends_on:
+                if dep not in self._nodes:
+                    raise ValueError(f"Service '{node.name}' depends on unknown service '{dep}'")
+
+        remaining = dict(self._nodes)
+        done: Set[str] = set()
+        waves: List[List[str]] = []
+        while remaining:
+            wave = [name for name, node in remaining.items() if all(dep in done for dep in node.depends_on)]
+            if not wave:
+                raise ValueError(f"Dependency cycle between services: {', '.join(sorted(remaining))}")
+            waves.append(wave)
+            for name in wave:
+                done.add(name)
+                del remaining[name]
+        return waves
+
+    async def run(self) -> List[ServiceStartupRecord]:
+        """Start all registered services and return their timeline.
+
+        Raises the first failure after the failing wave has settled, so services
+        that were already starting are not left half-initialized. Records for
+        every attempted service remain available in ``records`` either way.
+        """
+        waves = self.compute_waves()
+        self.records = []
+        self._errors = {}
+        phase_start = time.perf_counter()
+
+        for wave_index, wave in enumerate(waves):
+            logger.info(f"[{self.phase}] Starting wave {wave_index}: {', '.join(wave)}")
+            results = await asyncio.gather(*(self._start_node(self._nodes[name], wave_index) for name in wave))
+            self.records.extend(results)
+            failures = [r for r in results if not r.success]
+            if failures:
+                raise self._errors[failures[0].service_name]
+
+        elapsed_ms = (time.perf_counter() - phase_start) * 1000
+        serial_ms = sum(r.duration_ms for r in self.records)
+        logger.info(
+            f"[{self.phase}] Started {len(self.records)} services in {len(waves)} waves "
+            f"({elapsed_ms:.0f}ms wall, {serial_ms:.0f}ms serial)"
+        )
+        return self.records
+
+    async def _start_node(self, node: StartupNode, wave: int) -> ServiceStartupRecord:
+        # Wall-clock timestamps: TimeService may not exist yet (infrastructure phase creates it)
+        started_at = datetime.now(timezone.utc)
+        start = time.perf_counter()
+        error: Optional[str] = None
+        try:
+            await node.start()
+        except Exception as e:
+            logger.error(f"[{self.phase}] {node.name} failed to start: {e}", exc_info=True)
+            error = str(e) or type(e).__name__
+            self._errors[node.name] = e
+        return ServiceStartupRecord(
+            service_name=node.name,
+            phase=self.phase,
+            wave=wave,
+            depends_on=node.depends_on,
+            started_at=started_at,
+            duration_ms=(time.perf_counter() - start) * 1000,
+            success=error is None,
+            error=error,
+        )
@@ -26,6 +26,7 @@ from enum import Enum
 from ciris_engine.logic.buses.memory_bus import MemoryBus
 from ciris_engine.logic.infrastructure.sub_services.identity_variance_monitor import IdentityVarianceMonitor
 from ciris_engine.logic.infrastructure.sub_services.pattern_analysis_loop import PatternAnalysisLoop
+from ciris_engine.logic.infrastructure.sub_services.timeseries_window_cache import TimeSeriesWindowCache
 from ciris_engine.logic.services.base_scheduled_service import BaseScheduledService
 from ciris_engine.logic.services.graph.telemetry_service import GraphTelemetryService
 from ciris_engine.protocols.runtime.base import ServiceProtocol
@@ -114,6 +115,7 @@ class SelfObservationService(BaseScheduledService, SelfObservationServiceProtoco
         self._variance_monitor: Optional[IdentityVarianceMonitor] = None
         self._pattern_loop: Optional[PatternAnalysisLoop] = None
         self._telemetry_service: Optional[GraphTelemetryService] = None
+        self._timeseries_cache: Optional[TimeSeriesWindowCache] = None
 
         # State tracking
         self._current_state = ObservationState.LEARNING
@@ -155,11 +157,19 @@ class SelfObservationService(BaseScheduledService, SelfObservationServiceProtoco
     def _initialize_components(self) -> None:
         """Initialize the component services."""
         try:
-            # Create variance monitor
             time_service = self._time_service
+
+            # Shared history window so the monitor and the pattern loop only read new data each cycle
+            if time_service is not None and self._memory_bus:
+                self._timeseries_cache = TimeSeriesWindowCache(memory_bus=self._memory_bus, time_service=time_service)
+
+            # Create variance monitor
             if time_service is not None:
                 self._variance_monitor = IdentityVarianceMonitor(
-                    time_service=time_service, memory_bus=self._memory_bus, variance_threshold=self._variance_threshold
+                    time_service=time_service,
+                    memory_bus=self._memory_bus,
+                    variance_threshold=self._variance_threshold,
+                    timeseries_cache=self._timeseries_cache,
                 )
             if self._service_registry and self._variance_monitor:
                 self._variance_monitor.set_service_registry(self._service_registry)
@@ -170,6 +180,7 @@ class SelfObservationService(BaseScheduledService, SelfObservationServiceProtoco
                     time_service=time_service,
                     memory_bus=self._memory_bus,
                     analysis_interval_hours=int(self._observation_interval.total_seconds() / 3600),
+                    timeseries_cache=self._timeseries_cache,
                 )
             if self._service_registry and self._pattern_loop:
                 self._pattern_loop.set_service_registry(self._service_registry)
@@ -573,6 +584,8 @@ class SelfObservationService(BaseScheduledService, SelfObservationServiceProtoco
                     "current_variance": self._last_variance_report,
                 }
             )
+            if self._timeseries_cache:
+                status.custom_metrics.update(self._timeseries_cache.get_stats())
 
         return status
 
@@ -85,13 +85,22 @@ class BaseScheduledService(BaseService):
                 self._track_error(e)
                 self._logger.error(f"{self.service_name}: Error in scheduled task: {e}", exc_info=True)
 
-            # Wait for next interval
+            # Wait for next run
             try:
-                await asyncio.sleep(self._run_interval)
+                await self._wait_for_next_run()
             except asyncio.CancelledError:
                 self._logger.debug(f"{self.service_name}: Sleep cancelled, exiting loop")
                 raise  # Re-raise to properly exit the task
 
+    async def _wait_for_next_run(self) -> None:
+        """
+        Wait until the scheduled task should run again.
+
+        Sleeps for run_interval_seconds by default. Subclasses that know when
+        their next piece of work is due can override this to wake up exactly then.
+        """
+        await asyncio.sleep(self._run_interval)
+
     @abstractmethod
     async def _run_scheduled_task(self) -> None:
         """
@@ -14,13 +14,14 @@ This service provides:
 """
 
 import asyncio
+import base64
 import json
 import logging
 import sqlite3
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
 # Optional import for psutil
@@ -36,16 +37,19 @@ if TYPE_CHECKING:
     from ciris_engine.logic.registries.base import ServiceRegistry
 
 from ciris_engine.constants import UTC_TIMEZONE_SUFFIX
+from ciris_engine.logic.audit.export_stream import stream_audit_export, validate_export_options
 from ciris_engine.logic.audit.hash_chain import AuditHashChain
+from ciris_engine.logic.audit.merkle import encode_proof, merkle_proofs, merkle_root
 from ciris_engine.logic.audit.verifier import AuditVerifier
 from ciris_engine.logic.buses.memory_bus import MemoryBus
+from ciris_engine.logic.persistence.models.graph import count_audit_entry_nodes, get_audit_entry_nodes
 from ciris_engine.logic.services.base_graph_service import BaseGraphService
 from ciris_engine.protocols.services import AuditService as AuditServiceProtocol
 from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
 from ciris_engine.schemas.runtime.audit import AuditActionContext, AuditRequest
 from ciris_engine.schemas.runtime.enums import HandlerActionType, ServiceType
 from ciris_engine.schemas.runtime.memory import TimeSeriesDataPoint
-from ciris_engine.schemas.services.graph.audit import AuditEventData, AuditQuery, VerificationReport
+from ciris_engine.schemas.services.graph.audit import AuditEntryPage, AuditEventData, AuditQuery, VerificationReport
 
 # TSDB functionality integrated into graph nodes
 from ciris_engine.schemas.services.graph_core import GraphNode, GraphScope, NodeType
@@ -58,6 +62,9 @@ AuditEntry = AuditEntryNode
 
 logger = logging.getLogger(__name__)
 
+# Consecutive failed batch commits before flushes start raising instead of logging
+CHAIN_FLUSH_FAILURE_LIMIT = 3
+
 try:
     from ciris_engine.logic.audit.signature_manager import AuditSignatureManager
 except ImportError as e:
@@ -88,6 +95,10 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
         enable_hash_chain: bool = True,
         db_path: str = "ciris_audit.db",
         key_path: str = "audit_keys",
+        # Batched signing options
+        batch_signing: bool = False,
+        batch_max_entries: int = 256,
+        batch_interval_ms: int = 50,
         # Retention options
         retention_days: int = 90,
         cache_size: int = 1000,
@@ -103,6 +114,9 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
             enable_hash_chain: Whether to maintain cryptographic hash chain
             db_path: Path for hash chain database
             key_path: Directory for signing keys
+            batch_signing: Group-commit hash chain entries and sign one Merkle root per batch
+            batch_max_entries: Flush a batch once it holds this many entries
+            batch_interval_ms: Flush pending entries at least this often
             retention_days: How long to retain audit data
             cache_size: Size of in-memory cache
         """
@@ -149,6 +163,16 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
         # Lock for hash chain operations
         self._hash_chain_lock = asyncio.Lock()
 
+        # Batched signing: entries wait here until the next group commit
+        self.batch_signing = batch_signing
+        self.batch_max_entries = max(1, batch_max_entries)
+        self.batch_interval_ms = batch_interval_ms
+        self._pending_chain_entries: List[AuditRequest] = []
+        self._chain_flush_task: Optional["asyncio.Task[None]"] = None
+        self._chain_batches_committed = 0
+        self._chain_entries_committed = 0
+        self._chain_flush_failures = 0
+
     def _set_service_registry(self, registry: object) -> None:
         """Set the service registry for accessing memory bus."""
         from ciris_engine.logic.registries.base import ServiceRegistry
@@ -182,6 +206,9 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
         if self.enable_hash_chain:
             await self._initialize_hash_chain()
 
+        if self.enable_hash_chain and self.batch_signing:
+            self._chain_flush_task = asyncio.create_task(self._chain_flush_worker())
+
         # Create export directory if needed
         if self.export_path:
             self.export_path.parent.mkdir(parents=True, exist_ok=True)
@@ -224,6 +251,18 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
         except Exception as e:
             logger.warning(f"Failed to log shutdown event: {e}")
 
+        # Commit any batched hash chain entries, including the shutdown event
+        if self._chain_flush_task:
+            self._chain_flush_task.cancel()
+            try:
+                await self._chain_flush_task
+            except asyncio.CancelledError:
+                pass  # NOSONAR - Expected when stopping the service in stop()
+        try:
+            await self._flush_hash_chain_batch()
+        except Exception as e:
+            logger.error(f"Hash chain entries still pending at shutdown: {e}")
+
         # Close database connection AFTER logging
         if self._db_connection:
             self._db_connection.close()
@@ -467,64 +506,10 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
         # Convert GraphNode to AuditEntry
         audit_entries = []
         for node in nodes:
-            # Extract audit data from node attributes
-            if isinstance(node.attributes, dict):
-                attrs = node.attributes
-            elif hasattr(node.attributes, "model_dump"):
-                attrs = node.attributes.model_dump()
-            else:
+            entry = self._graph_node_to_audit_entry(node)
+            if entry is None:
                 continue
 
-            # Parse timestamp if it's a string
-            timestamp = attrs.get("timestamp", self._time_service.now() if self._time_service else datetime.now())
-            if isinstance(timestamp, str):
-                try:
-                    timestamp = datetime.fromisoformat(timestamp.replace("Z", UTC_TIMEZONE_SUFFIX))
-                except (ValueError, TypeError):
-                    timestamp = self._time_service.now() if self._time_service else datetime.now()
-
-            # Extract context data - handle both dict and nested structures
-            context_data = attrs.get("context", {})
-            if isinstance(context_data, dict):
-                # Extract service_name from nested structure or top level
-                service_name = context_data.get("service_name", attrs.get("service_name", ""))
-                correlation_id = context_data.get("correlation_id", attrs.get("correlation_id", ""))
-
-                # Get additional_data and flatten it to primitives only
-                additional_data = context_data.get("additional_data", {})
-                if isinstance(additional_data, dict):
-                    # Filter out non-primitive values
-                    flat_data: Dict[str, Union[str, int, float, bool]] = {}
-                    for k, v in additional_data.items():
-                        if isinstance(v, (str, int, float, bool)):
-                            flat_data[k] = v
-                        elif v is None:
-                            # Skip None values
-                            continue
-                        else:
-                            # Convert complex types to string
-                            flat_data[k] = str(v)
-                    additional_data = flat_data
-            else:
-                service_name = attrs.get("service_name", "")
-                correlation_id = attrs.get("correlation_id", "")
-                additional_data = {}
-
-            # Create AuditEntryNode from graph data
-            entry = AuditEntryNode(
-                id=node.id,
-                action=attrs.get("action", ""),
-                actor=attrs.get("actor", ""),
-                timestamp=timestamp,
-                context=AuditEntryContext(
-                    service_name=service_name, correlation_id=correlation_id, additional_data=additional_data
-                ),
-                signature=attrs.get("signature"),
-                hash_chain=attrs.get("hash_chain"),
-                scope=node.scope,
-                attributes={},
-            )
-
             # Apply filters from query
             if query.start_time and entry.timestamp < query.start_time:
                 continue
@@ -553,8 +538,56 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
 
         return audit_entries[start:end]
 
-    async def verify_audit_integrity(self) -> VerificationReport:
-        """Verify the integrity of the audit trail."""
+    async def query_audit_page(self, query: AuditQuery, cursor: Optional[str] = None) -> AuditEntryPage:
+        """Query one page of the audit trail with keyset pagination.
+
+        Reads the indexed graph table directly, so a page deep into the trail
+        costs the same as the first one and ``total`` is an exact count.
+        ``cursor`` resumes after the last entry of the previous page.
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after = self._decode_cursor(cursor)
+        limit = query.limit
+        # Fetch one extra entry to learn whether another page follows
+        fetch = query.model_copy(update={"limit": limit + 1}) if limit else query
+        nodes = await asyncio.to_thread(get_audit_entry_nodes, fetch, after)
+        total = await asyncio.to_thread(count_audit_entry_nodes, query)
+
+        has_more = False
+        if limit:
+            has_more = len(nodes) > limit
+            nodes = nodes[:limit]
+        entries = [entry for entry in map(self._graph_node_to_audit_entry, nodes) if entry is not None]
+
+        next_cursor = None
+        if has_more:
+            last = nodes[-1]
+            timestamp = last.attributes.get("timestamp") if isinstance(last.attributes, dict) else None
+            next_cursor = self._encode_cursor(str(timestamp), last.id)
+        return AuditEntryPage(entries=entries, total=total, next_cursor=next_cursor)
+
+    @staticmethod
+    def _encode_cursor(timestamp: str, node_id: str) -> str:
+        payload = {"v": 1, "t": timestamp, "id": node_id}
+        return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: Optional[str]) -> Optional[Tuple[str, str]]:
+        if not cursor:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            return str(payload["t"]), str(payload["id"])
+        except (ValueError, TypeError, KeyError) as e:
+            raise ValueError(f"Invalid audit cursor: {e}") from e
+
+    async def verify_audit_integrity(self, full: bool = False) -> VerificationReport:
+        """Verify the integrity of the audit trail.
+
+        Resumes from the last verified checkpoint unless ``full`` is set.
+        """
         start_time = self._time_service.now() if self._time_service else datetime.now()
 
         if not self.enable_hash_chain or not self.verifier:
@@ -571,7 +604,8 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
             )
 
         try:
-            result = await asyncio.to_thread(self.verifier.verify_complete_chain)
+            await self._flush_hash_chain_batch()
+            result = await asyncio.to_thread(self.verifier.verify_complete_chain, full)
             end_time = self._time_service.now() if self._time_service else datetime.now()
 
             # Extract all errors
@@ -593,7 +627,13 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
                 verification_completed=end_time,
                 duration_ms=(end_time - start_time).total_seconds() * 1000,
                 errors=all_errors,
-                warnings=[],  # No warnings in CompleteVerificationResult
+                warnings=(
+                    []
+                    if result.full_verification
+                    else [f"Incremental verification from checkpoint at sequence {result.checkpoint_sequence}"]
+                ),
+                full_verification=result.full_verification,
+                checkpoint_sequence=result.checkpoint_sequence,
             )
         except Exception as e:
             logger.error(f"Audit verification failed: {e}")
@@ -610,7 +650,7 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
                 errors=[str(e)],
             )
 
-    async def get_verification_report(self) -> VerificationReport:
+    async def get_verification_report(self, full: bool = False) -> VerificationReport:
         """Generate a comprehensive audit verification report."""
         start_time = self._time_service.now() if self._time_service else datetime.now()
 
@@ -629,7 +669,7 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
 
         try:
             # Delegate to verify_audit_integrity which already returns VerificationReport
-            return await self.verify_audit_integrity()
+            return await self.verify_audit_integrity(full=full)
         except Exception as e:
             logger.error(f"Failed to generate verification report: {e}")
             end_time = self._time_service.now() if self._time_service else datetime.now()
@@ -699,6 +739,28 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
 
         return str(filename)
 
+    async def stream_audit_export(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        format: str = "ndjson",
+        compression: str = "none",
+    ) -> AsyncIterator[bytes]:
+        """Stream the signed audit log as encoded chunks.
+
+        Reads ``audit_log`` directly in sequence order, so memory use does not
+        depend on the size of the requested range.
+        """
+        if not self.enable_hash_chain:
+            raise ValueError("Hash chain not enabled - no signed audit log to export")
+        validate_export_options(format, compression)
+
+        # Make batched entries visible to the export
+        await self._flush_hash_chain_batch()
+
+        async for chunk in stream_audit_export(str(self.db_path), format, compression, start_time, end_time):
+            yield chunk
+
     # ========== GraphServiceProtocol Implementation ==========
 
     def get_node_type(self) -> str:
@@ -725,6 +787,10 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
                 "cached_entries": float(len(self._recent_entries)),
                 "pending_exports": float(len(self._export_buffer)),
                 "hash_chain_enabled": float(self.enable_hash_chain),
+                "hash_chain_batches_committed": float(self._chain_batches_committed),
+                "hash_chain_batched_entries": float(self._chain_entries_committed),
+                "hash_chain_pending_entries": float(len(self._pending_chain_entries)),
+                "hash_chain_flush_failures": float(self._chain_flush_failures),
                 "cache_size_mb": cache_size_mb,
             }
         )
@@ -769,6 +835,66 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
         if result.status != MemoryOpStatus.OK:
             logger.error(f"Failed to store audit entry in graph: {result}")
 
+    def _graph_node_to_audit_entry(self, node: GraphNode) -> Optional[AuditEntryNode]:
+        """Rebuild an audit entry from its graph node; None if the attributes are unusable."""
+        # Extract audit data from node attributes
+        if isinstance(node.attributes, dict):
+            attrs = node.attributes
+        elif hasattr(node.attributes, "model_dump"):
+            attrs = node.attributes.model_dump()
+        else:
+            return None
+
+        # Parse timestamp if it's a string
+        timestamp = attrs.get("timestamp", self._time_service.now() if self._time_service else datetime.now())
+        if isinstance(timestamp, str):
+            try:
+                timestamp = datetime.fromisoformat(timestamp.replace("Z", UTC_TIMEZONE_SUFFIX))
+            except (ValueError, TypeError):
+                timestamp = self._time_service.now() if self._time_service else datetime.now()
+
+        # Extract context data - handle both dict and nested structures
+        context_data = attrs.get("context", {})
+        if isinstance(context_data, dict):
+            # Extract service_name from nested structure or top level
+            service_name = context_data.get("service_name", attrs.get("service_name", ""))
+            correlation_id = context_data.get("correlation_id", attrs.get("correlation_id", ""))
+
+            # Get additional_data and flatten it to primitives only
+            additional_data = context_data.get("additional_data", {})
+            if isinstance(additional_data, dict):
+                # Filter out non-primitive values
+                flat_data: Dict[str, Union[str, int, float, bool]] = {}
+                for k, v in additional_data.items():
+                    if isinstance(v, (str, int, float, bool)):
+                        flat_data[k] = v
+                    elif v is None:
+                        # Skip None values
+                        continue
+                    else:
+                        # Convert complex types to string
+                        flat_data[k] = str(v)
+                additional_data = flat_data
+        else:
+            service_name = attrs.get("service_name", "")
+            correlation_id = attrs.get("correlation_id", "")
+            additional_data = {}
+
+        # Create AuditEntryNode from graph data
+        return AuditEntryNode(
+            id=node.id,
+            action=attrs.get("action", ""),
+            actor=attrs.get("actor", ""),
+            timestamp=timestamp,
+            context=AuditEntryContext(
+                service_name=service_name, correlation_id=correlation_id, additional_data=additional_data
+            ),
+            signature=attrs.get("signature"),
+            hash_chain=attrs.get("hash_chain"),
+            scope=node.scope,
+            attributes={},
+        )
+
     async def _initialize_hash_chain(self) -> None:
         """Initialize hash chain components."""
         try:
@@ -876,6 +1002,38 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
             """
             )
 
+            # Signed Merkle roots for batched entries
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS audit_roots (
+                    root_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    sequence_start INTEGER NOT NULL,
+                    sequence_end INTEGER NOT NULL,
+                    root_hash TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    external_anchor TEXT,
+                    signature TEXT,
+                    signing_key_id TEXT,
+                    UNIQUE(sequence_start, sequence_end)
+                )
+            """
+            )
+
+            # Older databases predate batched signing - add the batch columns in place
+            cursor.execute("PRAGMA table_info(audit_log)")
+            log_columns = {row[1] for row in cursor.fetchall()}
+            if "merkle_root_id" not in log_columns:
+                cursor.execute("ALTER TABLE audit_log ADD COLUMN merkle_root_id INTEGER")
+            if "merkle_proof" not in log_columns:
+                cursor.execute("ALTER TABLE audit_log ADD COLUMN merkle_proof TEXT")
+
+            cursor.execute("PRAGMA table_info(audit_roots)")
+            root_columns = {row[1] for row in cursor.fetchall()}
+            if "signature" not in root_columns:
+                cursor.execute("ALTER TABLE audit_roots ADD COLUMN signature TEXT")
+            if "signing_key_id" not in root_columns:
+                cursor.execute("ALTER TABLE audit_roots ADD COLUMN signing_key_id TEXT")
+
             conn.commit()
             conn.close()
 
@@ -887,6 +1045,12 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
         if not self.enable_hash_chain:
             return
 
+        if self.batch_signing:
+            self._pending_chain_entries.append(entry)
+            if len(self._pending_chain_entries) >= self.batch_max_entries:
+                await self._flush_hash_chain_batch()
+            return
+
         async with self._hash_chain_lock:
 
             def _write_to_chain() -> None:
@@ -940,6 +1104,130 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
             except Exception as e:
                 logger.error(f"Failed to add to hash chain: {e}", exc_info=True)
 
+    async def _chain_flush_worker(self) -> None:
+        """Background task that group-commits batched hash chain entries."""
+        interval = max(self.batch_interval_ms, 1) / 1000
+        while True:
+            try:
+                await asyncio.sleep(interval)
+                if self._pending_chain_entries:
+                    await self._flush_hash_chain_batch()
+            except asyncio.CancelledError:
+                logger.debug("Hash chain flush worker cancelled")
+                raise
+            except Exception as e:
+                logger.error(f"Hash chain flush worker error: {e}")
+
+    async def _flush_hash_chain_batch(self) -> None:
+        """
+        Append pending entries in one transaction signed by a single Merkle root.
+
+        A batch that fails to commit goes back on the queue for the next flush.
+        Once CHAIN_FLUSH_FAILURE_LIMIT flushes in a row have failed, the flush
+        raises so callers see that signed entries are piling up.
+        """
+        async with self._hash_chain_lock:
+            if not self._pending_chain_entries or not self.enable_hash_chain:
+                return
+            batch = self._pending_chain_entries
+            self._pending_chain_entries = []
+
+            def _write_batch() -> None:
+                if not self.hash_chain or not self.signature_manager:
+                    raise RuntimeError("Hash chain not available")
+                if not self._db_connection:
+                    raise RuntimeError("Database connection not available")
+
+                prepared = self.hash_chain.prepare_entries(
+                    [
+                        {
+                            "event_id": entry.entry_id,
+                            "event_timestamp": entry.timestamp.isoformat(),
+                            "event_type": entry.event_type,
+                            "originator_id": entry.entity_id,
+                            "event_payload": json.dumps(entry.details),
+                        }
+                        for entry in batch
+                    ]
+                )
+                try:
+                    leaves = [p["entry_hash"] for p in prepared]
+                    root_hash = merkle_root(leaves)
+                    proofs = merkle_proofs(leaves)
+                    signature = self.signature_manager.sign_entry(root_hash)
+                    key_id = self.signature_manager.key_id or "unknown"
+
+                    cursor = self._db_connection.cursor()
+                    cursor.execute(
+                        """
+                        INSERT INTO audit_roots
+                        (sequence_start, sequence_end, root_hash, timestamp, signature, signing_key_id)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                        (
+                            prepared[0]["sequence_number"],
+                            prepared[-1]["sequence_number"],
+                            root_hash,
+                            batch[-1].timestamp.isoformat(),
+                            signature,
+                            key_id,
+                        ),
+                    )
+                    root_id = cursor.lastrowid
+                    # signature stays empty: batched entries are covered by the root signature
+                    cursor.executemany(
+                        """
+                        INSERT INTO audit_log
+                        (event_id, event_timestamp, event_type, originator_id,
+                         event_summary, event_payload, sequence_number, previous_hash,
+                         entry_hash, signature, signing_key_id, merkle_root_id, merkle_proof)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                        [
+                            (
+                                entry.entry_id,
+                                p["event_timestamp"],
+                                entry.event_type,
+                                entry.entity_id,
+                                f"{entry.event_type} by {entry.actor}",
+                                p["event_payload"],
+                                p["sequence_number"],
+                                p["previous_hash"],
+                                p["entry_hash"],
+                                "",
+                                key_id,
+                                root_id,
+                                encode_proof(proof),
+                            )
+                            for entry, p, proof in zip(batch, prepared, proofs)
+                        ],
+                    )
+                    self._db_connection.commit()
+                except Exception:
+                    self._db_connection.rollback()
+                    # The in-memory chain head advanced past rows that were never written
+                    self.hash_chain.initialize(force=True)
+                    raise
+
+            try:
+                await asyncio.to_thread(_write_batch)
+            except Exception as e:
+                # Requeue ahead of anything logged meanwhile so the next flush retries in order
+                self._pending_chain_entries[:0] = batch
+                self._chain_flush_failures += 1
+                logger.error(f"Failed to commit hash chain batch of {len(batch)} entries: {e}", exc_info=True)
+                if self._chain_flush_failures >= CHAIN_FLUSH_FAILURE_LIMIT:
+                    raise RuntimeError(
+                        f"Hash chain batch commit failed {self._chain_flush_failures} times in a row; "
+                        f"{len(self._pending_chain_entries)} entries pending"
+                    ) from e
+                return
+
+            self._chain_flush_failures = 0
+            self._chain_batches_committed += 1
+            self._chain_entries_committed += len(batch)
+            logger.debug(f"Committed hash chain batch of {len(batch)} entries")
+
     def _cache_entry(self, entry: AuditRequest) -> None:
         """Add entry to cache."""
         self._recent_entries.append(entry)
@@ -1314,6 +1602,7 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
             "log_request",
             "get_audit_trail",
             "query_audit_trail",
+            "query_audit_page",
             "query_by_actor",
             "query_by_time_range",
             "export_audit_log",
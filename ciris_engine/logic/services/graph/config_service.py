@@ -8,7 +8,7 @@ This replaces the old config_manager_service and agent_config_service.
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Union, cast
+from typing import Callable, Dict, List, Optional, Tuple, Union, cast
 
 # Optional import for psutil
 try:
@@ -19,12 +19,13 @@ except ImportError:
     psutil = None  # type: ignore
     PSUTIL_AVAILABLE = False
 
+from ciris_engine.logic import persistence
 from ciris_engine.logic.services.base_graph_service import BaseGraphService, GraphNodeConvertible
 from ciris_engine.logic.services.graph.memory_service import LocalGraphMemoryService
 from ciris_engine.protocols.services.graph.config import GraphConfigServiceProtocol
 from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
 from ciris_engine.schemas.runtime.enums import ServiceType
-from ciris_engine.schemas.services.graph_core import GraphNode
+from ciris_engine.schemas.services.graph_core import GraphNode, GraphScope
 from ciris_engine.schemas.services.nodes import ConfigNode, ConfigValue
 from ciris_engine.schemas.services.operations import MemoryQuery
 
@@ -43,8 +44,12 @@ class GraphConfigService(BaseGraphService, GraphConfigServiceProtocol):
         self._running = False
         self._start_time: Optional[datetime] = None
         self._process = psutil.Process() if PSUTIL_AVAILABLE else None  # For memory tracking
-        self._config_cache: Dict[str, ConfigNode] = {}  # Cache for config nodes
+        self._config_cache: Dict[str, ConfigNode] = {}  # Read-through cache: key -> latest ConfigNode
+        # Materialized index: key -> (node_id, version) of the latest version, built on first use
+        self._config_index: Optional[Dict[str, Tuple[str, int]]] = None
         self._config_listeners: Dict[str, List[Callable]] = {}  # key_pattern -> [callbacks]
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     async def start(self) -> None:
         """Start the service."""
@@ -64,7 +69,13 @@ class GraphConfigService(BaseGraphService, GraphConfigServiceProtocol):
 
         # Add config-specific metrics
         metrics.update(
-            {"total_configs": float(len(self._config_cache)), "config_listeners": float(len(self._config_listeners))}
+            {
+                "total_configs": float(len(self._config_index or self._config_cache)),
+                "config_listeners": float(len(self._config_listeners)),
+                "config_cache_size": float(len(self._config_cache)),
+                "config_cache_hits": float(self._cache_hits),
+                "config_cache_misses": float(self._cache_misses),
+            }
         )
 
         return metrics
@@ -97,24 +108,36 @@ class GraphConfigService(BaseGraphService, GraphConfigServiceProtocol):
         return nodes
 
     async def _query_config_by_key(self, key: str) -> List[GraphNode]:
-        """Query config nodes by key."""
-        # Get all config nodes
-        nodes = await self.graph.search("type:config")
-
-        # Filter by key
-        filtered_nodes = []
-        for node in nodes:
-            try:
-                # Convert to ConfigNode to check key
-                config_node = ConfigNode.from_graph_node(node)
-                if config_node.key == key:
-                    filtered_nodes.append(node)
-            except Exception as e:
-                # Skip nodes that can't be converted (might be old format)
-                logger.warning(f"Failed to convert node {node.id} to ConfigNode: {e}")
-                continue
-
-        return filtered_nodes
+        """Query the latest config node for a key through the key index."""
+        entry = self._get_config_index().get(key)
+        if entry is None:
+            return []
+        node = persistence.get_graph_node(entry[0], GraphScope.LOCAL, db_path=self.graph.db_path)
+        return [node] if node else []
+
+    def _get_config_index(self) -> Dict[str, Tuple[str, int]]:
+        """Return the key -> latest node index, building it with one full scan on first use.
+
+        The scan is unbounded (graph searches stop at 100 nodes) and also picks up
+        config nodes stored under legacy ids.
+        """
+        if self._config_index is None:
+            index: Dict[str, Tuple[str, int]] = {}
+            nodes = persistence.get_nodes_by_type("config", scope=GraphScope.LOCAL, db_path=self.graph.db_path)
+            for node in nodes:
+                try:
+                    config_node = ConfigNode.from_graph_node(node)
+                except Exception as e:
+                    # Skip nodes that can't be converted (might be old format)
+                    logger.warning(f"Failed to convert node {node.id} to ConfigNode: {e}")
+                    continue
+                current = index.get(config_node.key)
+                if current is None or config_node.version > current[1]:
+                    index[config_node.key] = (node.id, config_node.version)
+                    self._config_cache[config_node.key] = config_node
+            self._config_index = index
+            logger.debug(f"Built config key index with {len(index)} keys from {len(nodes)} nodes")
+        return self._config_index
 
     def get_node_type(self) -> str:
         """Get the node type this service manages."""
@@ -122,27 +145,25 @@ class GraphConfigService(BaseGraphService, GraphConfigServiceProtocol):
 
     async def get_config(self, key: str) -> Optional[ConfigNode]:
         """Get current configuration value."""
-        # Query config nodes by key
+        cached = self._config_cache.get(key)
+        if cached is not None:
+            self._cache_hits += 1
+            return cached
+        self._cache_misses += 1
+
+        # Unknown keys are answered by the index without touching the database
         graph_nodes = await self._query_config_by_key(key)
         if not graph_nodes:
             return None
 
-        # Convert GraphNodes to ConfigNodes and sort by version
-        config_nodes = []
-        for node in graph_nodes:
-            try:
-                config_node = ConfigNode.from_graph_node(node)
-                config_nodes.append(config_node)
-            except Exception as e:
-                logger.warning(f"Failed to convert node to ConfigNode: {e}")
-                continue
-
-        if not config_nodes:
+        try:
+            config_node = ConfigNode.from_graph_node(graph_nodes[0])
+        except Exception as e:
+            logger.warning(f"Failed to convert node to ConfigNode: {e}")
             return None
 
-        # Sort by version, get latest
-        config_nodes.sort(key=lambda n: n.version, reverse=True)
-        return config_nodes[0]
+        self._config_cache[key] = config_node
+        return config_node
 
     async def set_config(
         self, key: str, value: Union[str, int, float, bool, List, Dict, Path], updated_by: str
@@ -205,28 +226,39 @@ class GraphConfigService(BaseGraphService, GraphConfigServiceProtocol):
         )
 
         # Store in graph (base class will handle conversion)
-        await self.store_in_graph(new_config)
+        node_id = await self.store_in_graph(new_config)
+
+        # Keep the index on the latest version and drop the stale cache entry
+        self._get_config_index()[key] = (node_id or new_config.to_graph_node().id, new_config.version)
+        self._config_cache.pop(key, None)
 
         # Notify listeners of the change
         await self._notify_listeners(key, current.value if current else None, config_value)
 
     async def list_configs(self, prefix: Optional[str] = None) -> Dict[str, Union[str, int, float, bool, List, Dict]]:
         """List all configurations with optional prefix filter."""
-        # Get all config nodes
-        all_nodes = await self.graph.search("type:config")
+        index = self._get_config_index()
+        keys = [key for key in index if not prefix or key.startswith(prefix)]
 
-        # Convert to ConfigNodes and group by key to get latest version of each
+        # Only the latest version of each key is loaded, in one batch for cache misses
         config_map: Dict[str, ConfigNode] = {}
-        for node in all_nodes:
-            try:
-                config_node = ConfigNode.from_graph_node(node)
-                if prefix and not config_node.key.startswith(prefix):
+        missing: Dict[str, str] = {}
+        for key in keys:
+            cached = self._config_cache.get(key)
+            if cached is not None:
+                config_map[key] = cached
+            else:
+                missing[index[key][0]] = key
+        if missing:
+            nodes = persistence.get_graph_nodes_by_ids(list(missing), GraphScope.LOCAL, db_path=self.graph.db_path)
+            for node in nodes:
+                try:
+                    config_node = ConfigNode.from_graph_node(node)
+                except Exception as e:
+                    logger.warning(f"Failed to convert node to ConfigNode: {e}")
                     continue
-                if config_node.key not in config_map or config_node.version > config_map[config_node.key].version:
-                    config_map[config_node.key] = config_node
-            except Exception as e:
-                logger.warning(f"Failed to convert node to ConfigNode: {e}")
-                continue
+                config_map[missing[node.id]] = config_node
+                self._config_cache[missing[node.id]] = config_node
 
         # Return key->value mapping (extract actual value from ConfigValue)
         result: Dict[str, Union[str, int, float, bool, List, Dict]] = {}
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import json
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple, Union
 from uuid import uuid4
 
 # Optional import for psutil
@@ -29,12 +31,15 @@ from ciris_engine.schemas.runtime.enums import ServiceType
 from ciris_engine.schemas.runtime.memory import TimeSeriesDataPoint
 from ciris_engine.schemas.secrets.service import DecapsulationContext
 from ciris_engine.schemas.services.graph.attributes import AnyNodeAttributes, NodeAttributes, TelemetryNodeAttributes
-from ciris_engine.schemas.services.graph.memory import MemorySearchFilter
+from ciris_engine.schemas.services.graph.memory import ConnectedNodeInfo, MemorySearchFilter, UserGraphProfile
 from ciris_engine.schemas.services.graph_core import GraphEdge, GraphNode, GraphNodeAttributes, GraphScope, NodeType
 from ciris_engine.schemas.services.operations import MemoryOpResult, MemoryOpStatus, MemoryQuery
 
 logger = logging.getLogger(__name__)
 
+USER_PROFILE_CACHE_TTL_SECONDS = 300.0  # Bounds staleness from writes that bypass this service
+USER_PROFILE_CACHE_MAX_ENTRIES = 1024
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """Custom JSON encoder that handles datetime objects and Pydantic models."""
@@ -74,6 +79,16 @@ class LocalGraphMemoryService(BaseGraphService, MemoryService, GraphMemoryServic
             except Exception:
                 pass  # Failed to create process object
 
+        # user_id -> (cached_at, profile or None when the user has no node)
+        self._user_profile_cache: OrderedDict[str, Tuple[float, Optional[UserGraphProfile]]] = OrderedDict()
+        # node_id -> user_ids whose cached profile was built from that node
+        self._user_profile_dependents: Dict[str, Set[str]] = {}
+        # Bumped on every write so a fill racing a write is not cached
+        self._user_profile_generation = 0
+        self._user_profile_cache_hits = 0
+        self._user_profile_cache_misses = 0
+        self._user_profile_invalidations = 0
+
     async def memorize(self, node: GraphNode) -> MemoryOpResult:
         """Store a node with automatic secrets detection and processing."""
         try:
@@ -86,6 +101,7 @@ class LocalGraphMemoryService(BaseGraphService, MemoryService, GraphMemoryServic
                 persistence.add_graph_node(processed_node, db_path=self.db_path, time_service=self._time_service)
             else:
                 raise RuntimeError("TimeService is required for adding graph nodes")
+            self._invalidate_user_profiles([node.id])
             return MemoryOpResult(status=MemoryOpStatus.OK)
         except Exception as e:
             logger.exception("Error storing node %s: %s", node.id, e)
@@ -329,11 +345,154 @@ class LocalGraphMemoryService(BaseGraphService, MemoryService, GraphMemoryServic
             from ciris_engine.logic.persistence.models import graph as persistence
 
             persistence.delete_graph_node(node.id, node.scope, db_path=self.db_path)
+            self._invalidate_user_profiles([node.id])
             return MemoryOpResult(status=MemoryOpStatus.OK)
         except Exception as e:
             logger.exception("Error forgetting node %s: %s", node.id, e)
             return MemoryOpResult(status=MemoryOpStatus.DENIED, error=str(e))
 
+    async def recall_user_profiles(self, user_ids: Iterable[str]) -> Dict[str, UserGraphProfile]:
+        """Recall user nodes and their directly connected nodes for many users at once.
+
+        Uncached users are loaded together: one query for the user nodes, one for
+        their edges and one for the connected nodes. Cached profiles are dropped
+        when the user node, one of its edges or a connected node changes through
+        this service. Users without a node are omitted from the result.
+        """
+        now = time.monotonic()
+        profiles: Dict[str, UserGraphProfile] = {}
+        missing: List[str] = []
+        for user_id in dict.fromkeys(user_ids):
+            cached = self._user_profile_cache.get(user_id)
+            if cached is not None and now - cached[0] < USER_PROFILE_CACHE_TTL_SECONDS:
+                self._user_profile_cache.move_to_end(user_id)
+                self._user_profile_cache_hits += 1
+                if cached[1] is not None:
+                    profiles[user_id] = cached[1]
+                continue
+            if cached is not None:
+                self._drop_user_profile(user_id)
+            self._user_profile_cache_misses += 1
+            missing.append(user_id)
+
+        if not missing:
+            return profiles
+
+        from ciris_engine.logic.persistence.models import graph as persistence
+
+        generation = self._user_profile_generation
+        user_nodes = {
+            node.id: node
+            for node in persistence.get_graph_nodes_by_ids(
+                [f"user/{user_id}" for user_id in missing], GraphScope.LOCAL, db_path=self.db_path
+            )
+        }
+        edges = (
+            persistence.get_edges_for_nodes(list(user_nodes), GraphScope.LOCAL, db_path=self.db_path)
+            if user_nodes
+            else []
+        )
+
+        # user node id -> [(connected node id, edge)]
+        links: Dict[str, List[Tuple[str, GraphEdge]]] = {node_id: [] for node_id in user_nodes}
+        for edge in edges:
+            if edge.source in links:
+                links[edge.source].append((edge.target, edge))
+            if edge.target in links and edge.target != edge.source:
+                links[edge.target].append((edge.source, edge))
+
+        connected_ids = {other for pairs in links.values() for other, _ in pairs}
+        connected_nodes = {
+            node.id: node
+            for node in persistence.get_graph_nodes_by_ids(list(connected_ids), GraphScope.LOCAL, db_path=self.db_path)
+        }
+        connected_attrs: Dict[str, dict] = {}
+        for node_id, node in connected_nodes.items():
+            connected_attrs[node_id] = (
+                await self._process_secrets_for_recall(node.attributes, "recall") if node.attributes else {}
+            )
+
+        loaded: Dict[str, Optional[UserGraphProfile]] = {}
+        for user_id in missing:
+            user_node = user_nodes.get(f"user/{user_id}")
+            if user_node is None:
+                loaded[user_id] = None
+                continue
+
+            attrs: dict = {}
+            if user_node.attributes:
+                attrs = await self._process_secrets_for_recall(user_node.attributes, "recall")
+            pairs = links[user_node.id]
+            if pairs:
+                # Same shape recall() adds for include_edges queries
+                attrs["_edges"] = [self._edge_to_dict(edge) for _, edge in pairs]
+
+            connected: List[ConnectedNodeInfo] = []
+            for other_id, edge in pairs:
+                other = connected_nodes.get(other_id)
+                if other is None:
+                    continue
+                connected.append(
+                    ConnectedNodeInfo(
+                        node_id=other.id,
+                        node_type=str(other.type.value if hasattr(other.type, "value") else other.type),
+                        relationship=edge.relationship,
+                        attributes=connected_attrs[other_id],
+                    )
+                )
+            loaded[user_id] = UserGraphProfile(user_id=user_id, attributes=attrs, connected_nodes=connected)
+
+        if generation == self._user_profile_generation:
+            for user_id, profile in loaded.items():
+                self._cache_user_profile(user_id, profile, now)
+
+        profiles.update({user_id: profile for user_id, profile in loaded.items() if profile is not None})
+        return profiles
+
+    @staticmethod
+    def _edge_to_dict(edge: GraphEdge) -> dict:
+        return {
+            "source": edge.source,
+            "target": edge.target,
+            "relationship": edge.relationship,
+            "weight": edge.weight,
+            "attributes": edge.attributes.model_dump() if hasattr(edge.attributes, "model_dump") else edge.attributes,
+        }
+
+    def _cache_user_profile(self, user_id: str, profile: Optional[UserGraphProfile], cached_at: float) -> None:
+        self._drop_user_profile(user_id)
+        self._user_profile_cache[user_id] = (cached_at, profile)
+        node_ids = [f"user/{user_id}"]
+        if profile is not None:
+            node_ids.extend(info.node_id for info in profile.connected_nodes)
+        for node_id in node_ids:
+            self._user_profile_dependents.setdefault(node_id, set()).add(user_id)
+
+        while len(self._user_profile_cache) > USER_PROFILE_CACHE_MAX_ENTRIES:
+            self._drop_user_profile(next(iter(self._user_profile_cache)))
+
+    def _drop_user_profile(self, user_id: str) -> None:
+        entry = self._user_profile_cache.pop(user_id, None)
+        if entry is None:
+            return
+        node_ids = [f"user/{user_id}"]
+        if entry[1] is not None:
+            node_ids.extend(info.node_id for info in entry[1].connected_nodes)
+        for node_id in node_ids:
+            dependents = self._user_profile_dependents.get(node_id)
+            if dependents is not None:
+                dependents.discard(user_id)
+                if not dependents:
+                    del self._user_profile_dependents[node_id]
+
+    def _invalidate_user_profiles(self, node_ids: Iterable[str]) -> None:
+        """Drop cached user profiles built from any of ``node_ids``."""
+        self._user_profile_generation += 1
+        for node_id in node_ids:
+            for user_id in list(self._user_profile_dependents.get(node_id, ())):
+                self._drop_user_profile(user_id)
+                self._user_profile_invalidations += 1
+
     def export_identity_context(self) -> str:
         lines: List[str] = []
         with get_db_connection(db_path=self.db_path) as conn:
@@ -464,6 +623,7 @@ class LocalGraphMemoryService(BaseGraphService, MemoryService, GraphMemoryServic
         correlation_types: Optional[List[str]] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
+        limit: Optional[int] = 1000,
     ) -> List[TimeSeriesDataPoint]:
         """
         Recall time-series data from TSDB graph nodes.
@@ -474,6 +634,7 @@ class LocalGraphMemoryService(BaseGraphService, MemoryService, GraphMemoryServic
             correlation_types: Optional filter by correlation types (for compatibility)
             start_time: Specific start time for the query (overrides hours)
             end_time: Specific end time for the query (defaults to now if not provided)
+            limit: Maximum number of most recent points to return, None for the whole range
 
         Returns:
             List of time-series data points from graph nodes
@@ -518,9 +679,9 @@ class LocalGraphMemoryService(BaseGraphService, MemoryService, GraphMemoryServic
                           AND datetime(created_at) >= datetime(?)
                           AND datetime(created_at) <= datetime(?)
                         ORDER BY created_at DESC
-                        LIMIT 1000
+                        LIMIT ?
                     """,
-                        (scope, start_time.isoformat(), end_time.isoformat()),
+                        (scope, start_time.isoformat(), end_time.isoformat(), -1 if limit is None else limit),
                     )
 
                     return cursor.fetchall()
@@ -649,6 +810,7 @@ class LocalGraphMemoryService(BaseGraphService, MemoryService, GraphMemoryServic
             from ciris_engine.logic.persistence.models.graph import add_graph_edge
 
             edge_id = add_graph_edge(edge, db_path=self.db_path)
+            self._invalidate_user_profiles([edge.source, edge.target])
             logger.info(f"Created edge {edge_id}: {edge.source} -{edge.relationship}-> {edge.target}")
 
             return MemoryOpResult(status=MemoryOpStatus.OK)
@@ -872,6 +1034,10 @@ class LocalGraphMemoryService(BaseGraphService, MemoryService, GraphMemoryServic
                 "secrets_enabled": 1.0 if self.secrets_service else 0.0,
                 "graph_node_count": float(node_count),
                 "storage_backend": 1.0,  # 1.0 = sqlite
+                "user_profile_cache_size": float(len(self._user_profile_cache)),
+                "user_profile_cache_hits": float(self._user_profile_cache_hits),
+                "user_profile_cache_misses": float(self._user_profile_cache_misses),
+                "user_profile_cache_invalidations": float(self._user_profile_invalidations),
             }
         )
 
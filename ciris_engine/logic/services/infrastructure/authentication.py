@@ -10,6 +10,9 @@ import logging
 import os
 import secrets
 import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
@@ -46,6 +49,20 @@ logger = logging.getLogger(__name__)
 # Type variable for decorators
 F = TypeVar("F", bound=Callable)
 
+# How long a verified token is trusted without re-checking its signature
+TOKEN_CACHE_TTL_SECONDS = 60.0
+TOKEN_CACHE_MAX_ENTRIES = 4096
+
+
+@dataclass
+class _VerifiedToken:
+    """A token that passed signature verification."""
+
+    context: AuthorizationContext
+    expiration: Optional[datetime]
+    wa_cache_version: int
+    verified_at: float
+
 
 class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProtocol):
     """Infrastructure service for WA authentication and identity management."""
@@ -69,10 +86,20 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
         # Initialize gateway secret
         self.gateway_secret = self._get_or_create_gateway_secret()
 
-        # Cache for tokens and WAs
-        self._token_cache: Dict[str, AuthorizationContext] = {}
+        # Verified tokens by SHA-256 of the token, oldest first
+        self._token_cache: "OrderedDict[str, _VerifiedToken]" = OrderedDict()
         self._channel_token_cache: Dict[str, str] = {}
 
+        # Active WA certificates by wa_id, plus secondary lookups (jwt kid,
+        # OAuth identity, adapter id) mapping to the wa_id. Every write to
+        # wa_cert goes through _store_wa_certificate/update_wa, which
+        # invalidate the entry and bump the version so callers caching
+        # authorization verdicts (and the token cache) can detect changes.
+        self._wa_cache: Dict[str, WACertificate] = {}
+        self._wa_index: Dict[Tuple[str, ...], str] = {}
+        self._wa_list_cache: Optional[List[WACertificate]] = None
+        self._wa_cache_version = 0
+
         # Initialize database
         self._init_database()
 
@@ -271,146 +298,101 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
             conn.executescript(WA_CERT_TABLE_V1)
             conn.commit()
 
+    @property
+    def wa_cache_version(self) -> int:
+        """Incremented whenever a WA certificate is created, changed or revoked."""
+        return self._wa_cache_version
+
+    def _invalidate_wa_cache(self, wa_id: Optional[str] = None, bump_version: bool = True) -> None:
+        """Drop cached WA certificates after a write.
+
+        Bumping the version also invalidates every verified token, so a
+        revoked or re-scoped WA cannot keep using a cached token.
+        """
+        if wa_id is None:
+            self._wa_cache.clear()
+            self._wa_index.clear()
+        else:
+            self._wa_cache.pop(wa_id, None)
+            for key in [key for key, cached_id in self._wa_index.items() if cached_id == wa_id]:
+                del self._wa_index[key]
+        self._wa_list_cache = None
+        if bump_version:
+            self._wa_cache_version += 1
+
+    def _cache_wa(self, wa: WACertificate) -> WACertificate:
+        """Index an active WA certificate by every identity it can be looked up by."""
+        self._wa_cache[wa.wa_id] = wa
+        self._wa_index[("kid", wa.jwt_kid)] = wa.wa_id
+        if wa.oauth_provider and wa.oauth_external_id:
+            self._wa_index[("oauth", wa.oauth_provider, wa.oauth_external_id)] = wa.wa_id
+        if wa.adapter_id:
+            self._wa_index[("adapter", wa.adapter_id)] = wa.wa_id
+        return wa
+
+    def _cached_wa(self, key: Tuple[str, ...]) -> Optional[WACertificate]:
+        wa_id = self._wa_index.get(key)
+        return self._wa_cache.get(wa_id) if wa_id else None
+
+    @staticmethod
+    def _row_to_wa(row: sqlite3.Row) -> WACertificate:
+        """Map a wa_cert row to the schema."""
+        row_dict = dict(row)
+        return WACertificate(
+            wa_id=row_dict["wa_id"],
+            name=row_dict["name"],
+            role=row_dict["role"],
+            pubkey=row_dict["pubkey"],
+            jwt_kid=row_dict["jwt_kid"],
+            password_hash=row_dict.get("password_hash"),
+            api_key_hash=row_dict.get("api_key_hash"),
+            oauth_provider=row_dict.get("oauth_provider"),
+            oauth_external_id=row_dict.get("oauth_external_id"),
+            auto_minted=bool(row_dict.get("auto_minted", 0)),
+            veilid_id=row_dict.get("veilid_id"),
+            parent_wa_id=row_dict.get("parent_wa_id"),
+            parent_signature=row_dict.get("parent_signature"),
+            scopes_json=row_dict["scopes_json"],
+            adapter_id=row_dict.get("adapter_id"),
+            adapter_name=row_dict.get("adapter_name"),
+            adapter_metadata_json=row_dict.get("adapter_metadata_json"),
+            created_at=row_dict["created"],
+            last_auth=row_dict.get("last_login"),
+        )
+
+    def _load_active_wa(self, where: str, params: Tuple[str, ...]) -> Optional[WACertificate]:
+        """Read one active WA certificate from the database and cache it."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute(f"SELECT * FROM wa_cert WHERE {where} AND active = 1", params).fetchone()
+        return self._cache_wa(self._row_to_wa(row)) if row else None
+
     # WAStore Protocol Implementation
 
     async def get_wa(self, wa_id: str) -> Optional[WACertificate]:
         """Get WA certificate by ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM wa_cert WHERE wa_id = ? AND active = 1", (wa_id,))
-            row = cursor.fetchone()
-
-            if row:
-                # Map database fields to schema fields
-                row_dict = dict(row)
-                wa_dict = {
-                    "wa_id": row_dict["wa_id"],
-                    "name": row_dict["name"],
-                    "role": row_dict["role"],
-                    "pubkey": row_dict["pubkey"],
-                    "jwt_kid": row_dict["jwt_kid"],
-                    "password_hash": row_dict.get("password_hash"),
-                    "api_key_hash": row_dict.get("api_key_hash"),
-                    "oauth_provider": row_dict.get("oauth_provider"),
-                    "oauth_external_id": row_dict.get("oauth_external_id"),
-                    "auto_minted": bool(row_dict.get("auto_minted", 0)),
-                    "veilid_id": row_dict.get("veilid_id"),
-                    "parent_wa_id": row_dict.get("parent_wa_id"),
-                    "parent_signature": row_dict.get("parent_signature"),
-                    "scopes_json": row_dict["scopes_json"],
-                    "adapter_id": row_dict.get("adapter_id"),
-                    "adapter_name": row_dict.get("adapter_name"),
-                    "adapter_metadata_json": row_dict.get("adapter_metadata_json"),
-                    "created_at": row_dict["created"],
-                    "last_auth": row_dict.get("last_login"),
-                }
-                return WACertificate(**wa_dict)
-            return None
+        cached = self._wa_cache.get(wa_id)
+        if cached is not None:
+            return cached
+        return self._load_wa(wa_id)
+
+    def _load_wa(self, wa_id: str) -> Optional[WACertificate]:
+        """Read an active WA certificate from the database."""
+        return self._load_active_wa("wa_id = ?", (wa_id,))
 
     async def _get_wa_by_kid(self, jwt_kid: str) -> Optional[WACertificate]:
         """Get WA certificate by JWT key ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM wa_cert WHERE jwt_kid = ? AND active = 1", (jwt_kid,))
-            row = cursor.fetchone()
-
-            if row:
-                # Map database fields to schema fields
-                row_dict = dict(row)
-                wa_dict = {
-                    "wa_id": row_dict["wa_id"],
-                    "name": row_dict["name"],
-                    "role": row_dict["role"],
-                    "pubkey": row_dict["pubkey"],
-                    "jwt_kid": row_dict["jwt_kid"],
-                    "password_hash": row_dict.get("password_hash"),
-                    "api_key_hash": row_dict.get("api_key_hash"),
-                    "oauth_provider": row_dict.get("oauth_provider"),
-                    "oauth_external_id": row_dict.get("oauth_external_id"),
-                    "auto_minted": bool(row_dict.get("auto_minted", 0)),
-                    "veilid_id": row_dict.get("veilid_id"),
-                    "parent_wa_id": row_dict.get("parent_wa_id"),
-                    "parent_signature": row_dict.get("parent_signature"),
-                    "scopes_json": row_dict["scopes_json"],
-                    "adapter_id": row_dict.get("adapter_id"),
-                    "adapter_name": row_dict.get("adapter_name"),
-                    "adapter_metadata_json": row_dict.get("adapter_metadata_json"),
-                    "created_at": row_dict["created"],
-                    "last_auth": row_dict.get("last_login"),
-                }
-                return WACertificate(**wa_dict)
-            return None
+        return self._cached_wa(("kid", jwt_kid)) or self._load_active_wa("jwt_kid = ?", (jwt_kid,))
 
     async def get_wa_by_oauth(self, provider: str, external_id: str) -> Optional[WACertificate]:
         """Get WA certificate by OAuth identity."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM wa_cert WHERE oauth_provider = ? AND oauth_external_id = ? AND active = 1",
-                (provider, external_id),
-            )
-            row = cursor.fetchone()
-
-            if row:
-                # Map database fields to schema fields
-                row_dict = dict(row)
-                wa_dict = {
-                    "wa_id": row_dict["wa_id"],
-                    "name": row_dict["name"],
-                    "role": row_dict["role"],
-                    "pubkey": row_dict["pubkey"],
-                    "jwt_kid": row_dict["jwt_kid"],
-                    "password_hash": row_dict.get("password_hash"),
-                    "api_key_hash": row_dict.get("api_key_hash"),
-                    "oauth_provider": row_dict.get("oauth_provider"),
-                    "oauth_external_id": row_dict.get("oauth_external_id"),
-                    "auto_minted": bool(row_dict.get("auto_minted", 0)),
-                    "veilid_id": row_dict.get("veilid_id"),
-                    "parent_wa_id": row_dict.get("parent_wa_id"),
-                    "parent_signature": row_dict.get("parent_signature"),
-                    "scopes_json": row_dict["scopes_json"],
-                    "adapter_id": row_dict.get("adapter_id"),
-                    "adapter_name": row_dict.get("adapter_name"),
-                    "adapter_metadata_json": row_dict.get("adapter_metadata_json"),
-                    "created_at": row_dict["created"],
-                    "last_auth": row_dict.get("last_login"),
-                }
-                return WACertificate(**wa_dict)
-            return None
+        return self._cached_wa(("oauth", provider, external_id)) or self._load_active_wa(
+            "oauth_provider = ? AND oauth_external_id = ?", (provider, external_id)
+        )
 
     async def _get_wa_by_adapter(self, adapter_id: str) -> Optional[WACertificate]:
         """Get WA certificate by adapter ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM wa_cert WHERE adapter_id = ? AND active = 1", (adapter_id,))
-            row = cursor.fetchone()
-
-            if row:
-                # Map database fields to schema fields
-                row_dict = dict(row)
-                wa_dict = {
-                    "wa_id": row_dict["wa_id"],
-                    "name": row_dict["name"],
-                    "role": row_dict["role"],
-                    "pubkey": row_dict["pubkey"],
-                    "jwt_kid": row_dict["jwt_kid"],
-                    "password_hash": row_dict.get("password_hash"),
-                    "api_key_hash": row_dict.get("api_key_hash"),
-                    "oauth_provider": row_dict.get("oauth_provider"),
-                    "oauth_external_id": row_dict.get("oauth_external_id"),
-                    "auto_minted": bool(row_dict.get("auto_minted", 0)),
-                    "veilid_id": row_dict.get("veilid_id"),
-                    "parent_wa_id": row_dict.get("parent_wa_id"),
-                    "parent_signature": row_dict.get("parent_signature"),
-                    "scopes_json": row_dict["scopes_json"],
-                    "adapter_id": row_dict.get("adapter_id"),
-                    "adapter_name": row_dict.get("adapter_name"),
-                    "adapter_metadata_json": row_dict.get("adapter_metadata_json"),
-                    "created_at": row_dict["created"],
-                    "last_auth": row_dict.get("last_login"),
-                }
-                return WACertificate(**wa_dict)
-            return None
+        return self._cached_wa(("adapter", adapter_id)) or self._load_active_wa("adapter_id = ?", (adapter_id,))
 
     async def _store_wa_certificate(self, wa: WACertificate) -> None:
         """Store a WA certificate in the database."""
@@ -455,6 +437,8 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
             conn.execute(f"INSERT INTO wa_cert ({columns}) VALUES ({placeholders})", list(db_dict.values()))
             conn.commit()
 
+        self._invalidate_wa_cache(wa.wa_id)
+
     async def _create_adapter_observer(self, adapter_id: str, name: str) -> WACertificate:
         """Create or reactivate adapter observer WA."""
         # Check if observer already exists
@@ -516,6 +500,9 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
             conn.execute(f"UPDATE wa_cert SET {set_clause} WHERE wa_id = ?", values)
             conn.commit()
 
+        # A login timestamp does not change what the WA is authorized to do
+        self._invalidate_wa_cache(wa_id, bump_version=set(kwargs) != {"last_login"})
+
         # Return updated WA
         return await self.get_wa(wa_id)
 
@@ -534,6 +521,9 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
 
     async def _list_all_was(self, active_only: bool = True) -> List[WACertificate]:
         """List all WA certificates."""
+        if active_only and self._wa_list_cache is not None:
+            return list(self._wa_list_cache)
+
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
 
@@ -542,37 +532,18 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
             else:
                 query = "SELECT * FROM wa_cert ORDER BY created DESC"
 
-            cursor = conn.execute(query)
-            rows = cursor.fetchall()
-
-            result = []
-            for row in rows:
-                # Map database fields to schema fields
-                row_dict = dict(row)
-                wa_dict = {
-                    "wa_id": row_dict["wa_id"],
-                    "name": row_dict["name"],
-                    "role": row_dict["role"],
-                    "pubkey": row_dict["pubkey"],
-                    "jwt_kid": row_dict["jwt_kid"],
-                    "password_hash": row_dict.get("password_hash"),
-                    "api_key_hash": row_dict.get("api_key_hash"),
-                    "oauth_provider": row_dict.get("oauth_provider"),
-                    "oauth_external_id": row_dict.get("oauth_external_id"),
-                    "auto_minted": bool(row_dict.get("auto_minted", 0)),
-                    "veilid_id": row_dict.get("veilid_id"),
-                    "parent_wa_id": row_dict.get("parent_wa_id"),
-                    "parent_signature": row_dict.get("parent_signature"),
-                    "scopes_json": row_dict["scopes_json"],
-                    "adapter_id": row_dict.get("adapter_id"),
-                    "adapter_name": row_dict.get("adapter_name"),
-                    "adapter_metadata_json": row_dict.get("adapter_metadata_json"),
-                    "created_at": row_dict["created"],
-                    "last_auth": row_dict.get("last_login"),
-                }
-                result.append(WACertificate(**wa_dict))
-
-            return result
+            rows = conn.execute(query).fetchall()
+
+        result = []
+        for row in rows:
+            wa = self._row_to_wa(row)
+            if row["active"]:
+                self._cache_wa(wa)
+            result.append(wa)
+
+        if active_only:
+            self._wa_list_cache = list(result)
+        return result
 
     async def update_last_login(self, wa_id: str) -> None:
         """Update last login timestamp."""
@@ -657,10 +628,48 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
 
         return jwt.encode(payload, signing_key, algorithm="EdDSA", headers={"kid": wa.jwt_kid})
 
+    @staticmethod
+    def _token_key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def _get_verified_token(self, token_key: str) -> Optional[_VerifiedToken]:
+        """Return a cached verification that is still within TTL, unexpired and unrevoked."""
+        cached = self._token_cache.get(token_key)
+        if cached is None:
+            return None
+
+        now = self._time_service.now() if self._time_service else datetime.now(timezone.utc)
+        if (
+            cached.wa_cache_version != self._wa_cache_version
+            or time.monotonic() - cached.verified_at > TOKEN_CACHE_TTL_SECONDS
+            or (cached.expiration is not None and cached.expiration <= now)
+        ):
+            del self._token_cache[token_key]
+            return None
+        return cached
+
+    def _cache_verified_token(
+        self, token_key: str, context: AuthorizationContext, expiration: Optional[datetime]
+    ) -> None:
+        self._token_cache[token_key] = _VerifiedToken(context, expiration, self._wa_cache_version, time.monotonic())
+        self._token_cache.move_to_end(token_key)
+        while len(self._token_cache) > TOKEN_CACHE_MAX_ENTRIES:
+            self._token_cache.popitem(last=False)
+
     async def _verify_jwt_and_get_context(
         self, token: str
     ) -> Optional[Tuple[AuthorizationContext, Optional[datetime]]]:
-        """Verify any JWT token and return auth context and expiration (internal method)."""
+        """Verify any JWT token and return auth context and expiration (internal method).
+
+        Successful verifications are cached by token hash for
+        TOKEN_CACHE_TTL_SECONDS; the entry is dropped once the token expires or
+        any WA certificate changes.
+        """
+        token_key = self._token_key(token)
+        cached = self._get_verified_token(token_key)
+        if cached is not None:
+            return (cached.context, cached.expiration)
+
         try:
             # Decode header to get kid
             header = jwt.get_unverified_header(token)
@@ -674,12 +683,16 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
             if not wa:
                 return None
 
-            # Try to verify with different keys/algorithms based on the issuer (kid)
+            # Try to verify with different keys/algorithms based on the issuer (kid),
+            # remembering which key actually verified the token
             decoded = None
+            verified_with_gateway = False
+            verified_with_wa_key = False
 
             # First try gateway-signed tokens (most common)
             try:
                 decoded = jwt.decode(token, self.gateway_secret, algorithms=["HS256"])
+                verified_with_gateway = True
             except jwt.InvalidTokenError:
                 pass
 
@@ -689,6 +702,7 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
                     public_key_bytes = self._decode_public_key(wa.pubkey)
                     public_key = ed25519.Ed25519PublicKey.from_public_bytes(public_key_bytes)
                     decoded = jwt.decode(token, public_key, algorithms=["EdDSA"])
+                    verified_with_wa_key = True
                 except jwt.InvalidTokenError:
                     pass
 
@@ -701,26 +715,6 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
             # to prevent algorithm confusion attacks
             sub_type = decoded.get("sub_type")
 
-            # Determine which verification succeeded based on the algorithm
-            verified_with_gateway = False
-            verified_with_wa_key = False
-
-            # Re-verify to determine which key actually verified the token
-            try:
-                jwt.decode(token, self.gateway_secret, algorithms=["HS256"])
-                verified_with_gateway = True
-            except jwt.InvalidTokenError:
-                pass
-
-            if not verified_with_gateway:
-                try:
-                    public_key_bytes = self._decode_public_key(wa.pubkey)
-                    public_key = ed25519.Ed25519PublicKey.from_public_bytes(public_key_bytes)
-                    jwt.decode(token, public_key, algorithms=["EdDSA"])
-                    verified_with_wa_key = True
-                except jwt.InvalidTokenError:
-                    pass
-
             # Validate that the token type matches the verification method
             if sub_type == JWTSubType.AUTHORITY.value:
                 # Authority tokens must be verified with WA key (EdDSA)
@@ -751,7 +745,7 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
                 channel_id=decoded.get("channel"),
             )
 
-            # Update last login
+            # Update last login (once per verification, not on every cached hit)
             await self.update_last_login(wa.wa_id)
 
             # Extract expiration if present
@@ -760,6 +754,7 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
             if exp_timestamp:
                 expiration = datetime.fromtimestamp(exp_timestamp, tz=timezone.utc)
 
+            self._cache_verified_token(token_key, context, expiration)
             return (context, expiration)
 
         except jwt.InvalidTokenError:
@@ -1012,17 +1007,10 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
         if not token:
             return None
 
-        # Check cache first
-        if token in self._token_cache:
-            return self._token_cache[token]
-
-        # Verify token
+        # Verified tokens are cached by _verify_jwt_and_get_context
         result = await self._verify_jwt_and_get_context(token)
-
         if result:
             context, _ = result  # We don't need expiration here
-            # Cache valid tokens
-            self._token_cache[token] = context
             return context
 
         return None
@@ -1504,6 +1492,8 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
             "auth_contexts_cached": float(auth_context_cached),
             "channel_tokens_cached": float(channel_tokens_cached),
             "total_tokens_cached": float(auth_context_cached + channel_tokens_cached),
+            "wa_certificates_cached": float(len(self._wa_cache)),
+            "wa_cache_version": float(self._wa_cache_version),
         }
 
         return ServiceStatus(
@@ -1535,6 +1525,7 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
         # Clear caches
         self._token_cache.clear()
         self._channel_token_cache.clear()
+        self._invalidate_wa_cache(bump_version=False)
         logger.info("AuthenticationService stopped")
 
     async def is_healthy(self) -> bool:
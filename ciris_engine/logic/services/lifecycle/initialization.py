@@ -7,6 +7,7 @@ This replaces the initialization_manager.py utility with a proper service.
 
 import asyncio
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Awaitable, Callable, Dict, List, Optional
@@ -16,7 +17,12 @@ from ciris_engine.protocols.services import InitializationServiceProtocol
 from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
 from ciris_engine.schemas.runtime.enums import ServiceType
 from ciris_engine.schemas.services.core import ServiceCapabilities
-from ciris_engine.schemas.services.lifecycle.initialization import InitializationStatus, InitializationVerification
+from ciris_engine.schemas.services.lifecycle.initialization import (
+    InitializationStatus,
+    InitializationVerification,
+    ServiceStartupRecord,
+    StartupTimeline,
+)
 from ciris_engine.schemas.services.metadata import ServiceMetadata
 from ciris_engine.schemas.services.operations import InitializationPhase
 
@@ -49,11 +55,17 @@ class InitializationService(BaseInfrastructureService, InitializationServiceProt
         # Initialization-specific attributes
         self._steps: List[InitializationStep] = []
         self._completed_steps: List[str] = []
+        self._step_durations: Dict[str, float] = {}
         self._phase_status: Dict[InitializationPhase, str] = {}
         self._start_time: Optional[datetime] = None
         self._initialization_complete = False
         self._error: Optional[Exception] = None
 
+        # Startup timeline (populated by ServiceInitializer's startup scheduler)
+        self._service_timeline: List[ServiceStartupRecord] = []
+        self._first_work_round_at: Optional[datetime] = None
+        self._initialization_duration: Optional[float] = None
+
     # Required abstract methods from BaseService
 
     def get_service_type(self) -> ServiceType:
@@ -62,7 +74,16 @@ class InitializationService(BaseInfrastructureService, InitializationServiceProt
 
     def _get_actions(self) -> List[str]:
         """Get list of actions this service provides."""
-        return ["register_step", "initialize", "is_initialized", "get_initialization_status", "verify_initialization"]
+        return [
+            "register_step",
+            "initialize",
+            "is_initialized",
+            "get_initialization_status",
+            "verify_initialization",
+            "record_service_startup",
+            "mark_first_work_round",
+            "get_startup_timeline",
+        ]
 
     def _check_dependencies(self) -> bool:
         """Check if all required dependencies are available."""
@@ -109,6 +130,8 @@ class InitializationService(BaseInfrastructureService, InitializationServiceProt
                 "completed_steps": float(len(self._completed_steps)),
                 "total_steps": float(len(self._steps)),
                 "initialization_duration": duration or 0.0,
+                "services_timed": float(len(self._service_timeline)),
+                "cold_start_seconds": self._cold_start_seconds() or 0.0,
             }
         )
 
@@ -175,6 +198,7 @@ class InitializationService(BaseInfrastructureService, InitializationServiceProt
             # Set initialization complete
             self._initialization_complete = True
             duration = (self.time_service.now() - self._start_time).total_seconds()
+            self._initialization_duration = duration
 
             logger.info("=" * 60)
             logger.info(f"✓ CIRIS Agent Initialization Complete ({duration:.1f}s)")
@@ -227,8 +251,45 @@ class InitializationService(BaseInfrastructureService, InitializationServiceProt
             phase_status={phase.value: status for phase, status in self._phase_status.items()},
             error=str(self._error) if self._error else None,
             total_steps=len(self._steps),
+            step_durations_ms=dict(self._step_durations),
+        )
+
+    def record_service_startup(self, records: List[ServiceStartupRecord]) -> None:
+        """Append service start records produced by the startup scheduler."""
+        self._service_timeline.extend(records)
+
+    def mark_first_work_round(self) -> None:
+        """Record completion of the first WORK round (cold-start end). Later calls are ignored."""
+        if self._first_work_round_at is not None:
+            return
+        self._first_work_round_at = self.time_service.now()
+        cold_start = self._cold_start_seconds()
+        if cold_start is not None:
+            logger.info(f"Cold start complete: first WORK round {cold_start:.2f}s after startup began")
+
+    def get_startup_timeline(self) -> StartupTimeline:
+        """Get the per-service startup timeline and cold-start time."""
+        return StartupTimeline(
+            services=list(self._service_timeline),
+            initialization_started_at=self._startup_began_at(),
+            initialization_duration_seconds=self._initialization_duration,
+            first_work_round_at=self._first_work_round_at,
+            cold_start_seconds=self._cold_start_seconds(),
         )
 
+    def _startup_began_at(self) -> Optional[datetime]:
+        """Earliest known startup instant (infrastructure services start before initialize())."""
+        candidates = [r.started_at for r in self._service_timeline]
+        if self._start_time:
+            candidates.append(self._start_time)
+        return min(candidates) if candidates else None
+
+    def _cold_start_seconds(self) -> Optional[float]:
+        began = self._startup_began_at()
+        if began is None or self._first_work_round_at is None:
+            return None
+        return (self._first_work_round_at - began).total_seconds()
+
     async def _execute_phase(self, phase: InitializationPhase, steps: List[InitializationStep]) -> None:
         """Execute all steps in a phase."""
         logger.info("-" * 60)
@@ -253,6 +314,7 @@ class InitializationService(BaseInfrastructureService, InitializationServiceProt
         """Execute a single initialization step with timeout and verification."""
         step_name = f"{step.phase.value}/{step.name}"
         logger.info(f"→ {step.name}...")
+        step_start = time.perf_counter()
 
         try:
             # Execute the step with timeout
@@ -267,7 +329,7 @@ class InitializationService(BaseInfrastructureService, InitializationServiceProt
                     raise Exception(f"Verification failed for {step.name}")
 
             self._completed_steps.append(step_name)
-            logger.info(f"  ✓ {step.name} initialized")
+            logger.info(f"  ✓ {step.name} initialized ({(time.perf_counter() - step_start) * 1000:.0f}ms)")
 
         except asyncio.TimeoutError:
             error_msg = f"{step.name} timed out after {step.timeout}s"
@@ -283,3 +345,6 @@ class InitializationService(BaseInfrastructureService, InitializationServiceProt
             if step.critical:
                 self._error = e
                 raise
+
+        finally:
+            self._step_durations[step_name] = (time.perf_counter() - step_start) * 1000
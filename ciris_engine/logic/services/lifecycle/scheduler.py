@@ -9,9 +9,11 @@ their own future actions with human approval.
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ciris_engine.logic.persistence import add_thought, get_db_connection
 from ciris_engine.logic.services.base_scheduled_service import BaseScheduledService
@@ -40,6 +42,12 @@ class TaskSchedulerService(BaseScheduledService, TaskSchedulerServiceProtocol):
 
     This service enables agents to be proactive by scheduling future actions,
     either through one-time deferrals or recurring schedules.
+
+    Each task's next fire time is computed once, when it is scheduled or fires,
+    and kept in a min-heap. The loop sleeps until the earliest deadline and is
+    woken early when the schedule changes. A recurring task that missed several
+    occurrences (e.g. while the host was suspended) fires once and then resumes
+    at its next occurrence after now.
     """
 
     def __init__(self, db_path: str, time_service: TimeServiceProtocol, check_interval_seconds: int = 60) -> None:
@@ -50,6 +58,19 @@ class TaskSchedulerService(BaseScheduledService, TaskSchedulerServiceProtocol):
         self._active_tasks: Dict[str, ScheduledTask] = {}
         self._shutdown_event = asyncio.Event()
 
+        # Deadline heap; entries whose time no longer matches _next_fire are stale and skipped
+        self._deadlines: List[Tuple[datetime, int, str]] = []
+        self._next_fire: Dict[str, datetime] = {}
+        self._sequence = itertools.count()
+        self._schedule_changed = asyncio.Event()
+
+        # Schedule lag tracking
+        self._fire_count = 0
+        self._coalesced_fire_count = 0
+        self._last_lag_seconds = 0.0
+        self._max_lag_seconds = 0.0
+        self._total_lag_seconds = 0.0
+
     def get_service_type(self) -> ServiceType:
         """Get service type."""
         return ServiceType.MAINTENANCE
@@ -115,66 +136,122 @@ class TaskSchedulerService(BaseScheduledService, TaskSchedulerServiceProtocol):
             deferral_history=[],
         )
 
+    @staticmethod
+    def _as_utc(value: datetime) -> datetime:
+        """Timestamps without a timezone are taken to be UTC."""
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
     async def _run_scheduled_task(self) -> None:
-        """Check for due tasks and trigger them."""
-        # Check for due tasks
-        now = self._time_service.now() if self._time_service else datetime.now(timezone.utc)
-        due_tasks = self._get_due_tasks(now)
+        """Trigger every task whose deadline has passed."""
+        now = self._now()
 
-        for task in due_tasks:
+        for task, deadline in self._get_due_tasks(now):
+            self._record_lag(now, deadline)
             await self._trigger_task(task)
 
-    def _get_due_tasks(self, current_time: datetime) -> List[ScheduledTask]:
-        """Get all tasks that are due for execution."""
+            # Recurring tasks, and one-time tasks whose trigger failed, stay active
+            if task.task_id in self._active_tasks:
+                self._push_deadline(task.task_id, self._compute_next_fire(task, now, deadline))
+
+    async def _wait_for_next_run(self) -> None:
+        """Sleep until the earliest deadline, or until the schedule changes."""
+        self._schedule_changed.clear()
+        # Capped at the check interval so wall-clock jumps (suspend, clock changes) are picked up
+        timeout = float(self.check_interval)
+        deadline = self._peek_deadline()
+        if deadline is not None:
+            timeout = min(timeout, max(0.0, (deadline - self._now()).total_seconds()))
+        try:
+            await asyncio.wait_for(self._schedule_changed.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _get_due_tasks(self, current_time: datetime) -> List[Tuple[ScheduledTask, datetime]]:
+        """Pop all tasks whose deadline has passed, with the deadline they were due at."""
         due_tasks = []
 
-        for task in self._active_tasks.values():
-            if self._is_task_due(task, current_time):
-                due_tasks.append(task)
+        while self._deadlines and self._deadlines[0][0] <= current_time:
+            deadline, _, task_id = heapq.heappop(self._deadlines)
+            if self._next_fire.get(task_id) != deadline:
+                continue  # Cancelled or rescheduled
+            del self._next_fire[task_id]
+            task = self._active_tasks.get(task_id)
+            if task is not None:
+                due_tasks.append((task, deadline))
 
         return due_tasks
 
-    def _is_task_due(self, task: ScheduledTask, current_time: datetime) -> bool:
-        """Check if a task is due for execution."""
-        # One-time deferred task
-        if task.defer_until:
-            # defer_until is always a datetime per the type annotation
-            return current_time >= task.defer_until
-
-        # Cron-style recurring task
-        if task.schedule_cron:
-            return self._should_trigger_cron(task, current_time)
+    def _peek_deadline(self) -> Optional[datetime]:
+        """Earliest live deadline, dropping stale heap entries on the way."""
+        while self._deadlines:
+            deadline, _, task_id = self._deadlines[0]
+            if self._next_fire.get(task_id) == deadline:
+                return deadline
+            heapq.heappop(self._deadlines)
+        return None
+
+    def _push_deadline(self, task_id: str, deadline: Optional[datetime]) -> None:
+        """Set (or clear, with None) a task's next fire time and wake the loop."""
+        if deadline is None:
+            self._next_fire.pop(task_id, None)
+        else:
+            self._next_fire[task_id] = deadline
+            heapq.heappush(self._deadlines, (deadline, next(self._sequence), task_id))
 
-        return False
+        # Rebuild once stale entries dominate, so cancelled tasks don't accumulate
+        if len(self._deadlines) > 2 * len(self._next_fire) + 64:
+            self._deadlines = [entry for entry in self._deadlines if self._next_fire.get(entry[2]) == entry[0]]
+            heapq.heapify(self._deadlines)
 
-    def _should_trigger_cron(self, task: ScheduledTask, current_time: datetime) -> bool:
-        """Check if a cron-scheduled task should trigger."""
-        if not CRONITER_AVAILABLE:
-            logger.warning(f"Cron scheduling requested for task {task.task_id} but croniter not installed")
-            return False
+        self._schedule_changed.set()
 
-        try:
-            # If never triggered, use creation time as base
-            if not task.last_triggered_at:
-                # created_at is always a datetime per the type annotation
-                base_time = task.created_at
-            else:
-                # last_triggered_at is always a datetime per the type annotation
-                base_time = task.last_triggered_at
-
-            # Create croniter instance
-            cron = croniter(task.schedule_cron, base_time)
+    def _compute_next_fire(
+        self, task: ScheduledTask, now: datetime, fired_at: Optional[datetime] = None
+    ) -> Optional[datetime]:
+        """
+        Compute when a task should fire next.
 
-            # Get next scheduled time
-            next_time = cron.get_next(datetime)
+        Args:
+            task: The task
+            now: Current time
+            fired_at: Deadline the task just fired for, None if it has not fired yet
 
-            # Check if we've passed the next scheduled time
-            # Add a small buffer (1 second) to avoid missing triggers due to timing
-            return bool(current_time >= next_time - timedelta(seconds=1))
+        Returns:
+            The next fire time, or None if the task will not fire again
+        """
+        if fired_at is None and task.defer_until:
+            return self._as_utc(task.defer_until)
 
-        except Exception as e:
-            logger.error(f"Invalid cron expression '{task.schedule_cron}' for task {task.task_id}: {e}")
-            return False
+        if task.schedule_cron:
+            if not CRONITER_AVAILABLE:
+                logger.warning(f"Cron scheduling requested for task {task.task_id} but croniter not installed")
+                return None
+            try:
+                if fired_at is None:
+                    return self._as_utc(croniter(task.schedule_cron, self._as_utc(task.created_at)).get_next(datetime))
+                next_time = self._as_utc(croniter(task.schedule_cron, fired_at).get_next(datetime))
+                if next_time <= now:
+                    # Occurrences were missed: they are covered by this fire, resume after now
+                    self._coalesced_fire_count += 1
+                    logger.info(f"Task {task.name} missed occurrences since {fired_at.isoformat()}, fired once")
+                    next_time = self._as_utc(croniter(task.schedule_cron, now).get_next(datetime))
+                return next_time
+            except Exception as e:
+                logger.error(f"Invalid cron expression '{task.schedule_cron}' for task {task.task_id}: {e}")
+                return None
+
+        if fired_at is not None:
+            # One-time task whose trigger failed; retry on the next check
+            return now + timedelta(seconds=self.check_interval)
+        return None
+
+    def _record_lag(self, now: datetime, deadline: datetime) -> None:
+        """Track how late a task fired relative to its deadline."""
+        lag = max(0.0, (now - deadline).total_seconds())
+        self._fire_count += 1
+        self._last_lag_seconds = lag
+        self._max_lag_seconds = max(self._max_lag_seconds, lag)
+        self._total_lag_seconds += lag
 
     async def _trigger_task(self, task: ScheduledTask) -> None:
         """Trigger a scheduled task by creating a new thought or reactivating a deferred task."""
@@ -247,14 +324,6 @@ class TaskSchedulerService(BaseScheduledService, TaskSchedulerServiceProtocol):
         task.last_triggered_at = now
         if task.schedule_cron:
             task.status = "ACTIVE"
-            # Calculate and log next trigger time for recurring tasks
-            if CRONITER_AVAILABLE:
-                try:
-                    cron = croniter(task.schedule_cron, now)
-                    next_time = cron.get_next(datetime)
-                    logger.info(f"Task {task.name} will next trigger at {next_time.isoformat()}")
-                except Exception as e:
-                    logger.error(f"Failed to calculate next trigger time: {e}")
 
     async def _complete_task(self, task: ScheduledTask) -> None:
         """Mark a task as complete."""
@@ -262,6 +331,7 @@ class TaskSchedulerService(BaseScheduledService, TaskSchedulerServiceProtocol):
         # Remove from active tasks
         if task.task_id in self._active_tasks:
             del self._active_tasks[task.task_id]
+        self._push_deadline(task.task_id, None)
 
     async def schedule_task(
         self,
@@ -305,14 +375,16 @@ class TaskSchedulerService(BaseScheduledService, TaskSchedulerServiceProtocol):
 
         # Add to active tasks
         self._active_tasks[task_id] = task
+        next_run = self._compute_next_fire(task, self._now())
+        self._push_deadline(task_id, next_run)
 
         # Log scheduling details
         if defer_until:
             logger.info(f"Scheduled one-time task: {name} ({task_id}) for {defer_until}")
         elif schedule_cron:
-            next_run = self._get_next_cron_time(schedule_cron)
             logger.info(
-                f"Scheduled recurring task: {name} ({task_id}) with cron '{schedule_cron}'. " f"Next run: {next_run}"
+                f"Scheduled recurring task: {name} ({task_id}) with cron '{schedule_cron}'. "
+                f"Next run: {next_run.isoformat() if next_run else 'unknown'}"
             )
         else:
             logger.info(f"Scheduled task: {name} ({task_id})")
@@ -380,6 +452,7 @@ class TaskSchedulerService(BaseScheduledService, TaskSchedulerServiceProtocol):
             task = self._active_tasks[task_id]
             task.status = "CANCELLED"
             del self._active_tasks[task_id]
+            self._push_deadline(task_id, None)
             logger.info(f"Cancelled task: {task.name} ({task_id})")
             return True
 
@@ -438,6 +511,7 @@ class TaskSchedulerService(BaseScheduledService, TaskSchedulerServiceProtocol):
                     "reason": reason,
                 }
             )
+            self._push_deadline(task_id, self._as_utc(task.defer_until))
             logger.info(f"Deferred task: {task.name} ({task_id}) until {defer_until}")
             return True
 
@@ -480,7 +554,20 @@ class TaskSchedulerService(BaseScheduledService, TaskSchedulerServiceProtocol):
 
     def _collect_custom_metrics(self) -> Dict[str, float]:
         """Collect service-specific metrics."""
-        return {"active_tasks": float(len(self._active_tasks)), "check_interval": float(self.check_interval)}
+        next_deadline = self._peek_deadline()
+        return {
+            "active_tasks": float(len(self._active_tasks)),
+            "check_interval": float(self.check_interval),
+            "scheduled_deadlines": float(len(self._next_fire)),
+            "seconds_until_next_fire": (
+                max(0.0, (next_deadline - self._now()).total_seconds()) if next_deadline else -1.0
+            ),
+            "schedule_fires": float(self._fire_count),
+            "schedule_coalesced_fires": float(self._coalesced_fire_count),
+            "schedule_lag_seconds": self._last_lag_seconds,
+            "schedule_lag_max_seconds": self._max_lag_seconds,
+            "schedule_lag_avg_seconds": self._total_lag_seconds / self._fire_count if self._fire_count else 0.0,
+        }
 
     def _validate_cron_expression(self, cron_expr: str) -> bool:
         """
@@ -504,28 +591,6 @@ class TaskSchedulerService(BaseScheduledService, TaskSchedulerServiceProtocol):
             logger.debug(f"Invalid cron expression '{cron_expr}': {e}")
             return False
 
-    def _get_next_cron_time(self, cron_expr: str) -> str:
-        """
-        Get the next scheduled time for a cron expression.
-
-        Args:
-            cron_expr: Cron expression
-
-        Returns:
-            ISO timestamp of next scheduled time, or 'unknown' if error
-        """
-        if not CRONITER_AVAILABLE:
-            return "unknown (croniter not installed)"
-
-        try:
-            now = self._time_service.now() if self._time_service else datetime.now(timezone.utc)
-            cron = croniter(cron_expr, now)
-            next_time = cron.get_next(datetime)
-            return str(next_time.isoformat())
-        except Exception as e:
-            logger.error(f"Failed to calculate next cron time: {e}")
-            return "unknown"
-
     async def is_healthy(self) -> bool:
         """Check if the service is healthy."""
         return bool(self._task and not self._shutdown_event.is_set())
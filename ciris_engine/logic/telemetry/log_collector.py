@@ -7,90 +7,309 @@ enabling time-series queries and agent introspection of log data.
 
 import asyncio
 import logging
+import queue
+import threading
+import time
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import uuid4
 
-from ciris_engine.logic.persistence.models.correlations import add_correlation
+from ciris_engine.logic.persistence.models.correlations import add_correlations
 from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
-from ciris_engine.schemas.telemetry.core import CorrelationType, ServiceCorrelation, ServiceCorrelationStatus
+from ciris_engine.schemas.telemetry.core import CorrelationType, LogData, ServiceCorrelation, ServiceCorrelationStatus
+
+LOG_QUEUE_MAX_RECORDS = 10000
+LOG_BATCH_SIZE = 200
+LOG_FLUSH_INTERVAL_SECONDS = 1.0
+LOG_RATE_PER_LOGGER = 20.0  # Records per second each logger may store
+LOG_BURST_PER_LOGGER = 100  # Records a logger may store at once before rate limiting
+LOG_SAMPLE_EVERY = 50  # While rate limited, still store every Nth record
+
+
+class _PendingLog:
+    """A captured log record waiting for the writer; repeats of it only bump the count."""
+
+    __slots__ = ("key", "record", "message", "count", "last_created")
+
+    def __init__(self, key: Tuple[str, int, str], record: logging.LogRecord, message: str) -> None:
+        self.key = key
+        self.record = record
+        self.message = message
+        self.count = 1
+        self.last_created = record.created
+
+
+class _LoggerBudget:
+    """Token bucket limiting how many records one logger stores."""
+
+    __slots__ = ("tokens", "updated", "seen_while_limited")
+
+    def __init__(self, burst: int) -> None:
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.seen_while_limited = 0
 
 
 class TSDBLogHandler(logging.Handler):
-    """Logging handler that stores logs as TSDB correlations."""
+    """Logging handler that stores logs as TSDB correlations.
+
+    emit() only formats the record and puts it on a bounded queue; a background
+    thread writes queued records in batches, one transaction per batch. Logging
+    therefore never waits on SQLite. Repeats of a record still waiting in the
+    queue are folded into it with a count, each logger is rate limited (with
+    sampling while limited), and records that do not fit in the queue are
+    dropped and counted.
+    """
 
-    def __init__(self, tags: Optional[Dict[str, str]] = None, time_service: Optional[TimeServiceProtocol] = None):
+    def __init__(
+        self,
+        tags: Optional[Dict[str, str]] = None,
+        time_service: Optional[TimeServiceProtocol] = None,
+        max_queue: int = LOG_QUEUE_MAX_RECORDS,
+        batch_size: int = LOG_BATCH_SIZE,
+        flush_interval: float = LOG_FLUSH_INTERVAL_SECONDS,
+        rate_per_logger: float = LOG_RATE_PER_LOGGER,
+        burst_per_logger: int = LOG_BURST_PER_LOGGER,
+        sample_every: int = LOG_SAMPLE_EVERY,
+        db_path: Optional[str] = None,
+    ):
         super().__init__()
         self.tags = tags or {}
         self._async_loop: Optional[asyncio.AbstractEventLoop] = None
         self._time_service = time_service
+        self._db_path = db_path
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval
+        self._rate_per_logger = rate_per_logger
+        self._burst_per_logger = burst_per_logger
+        self._sample_every = max(1, sample_every)
+
+        self._queue: "queue.Queue[Optional[_PendingLog]]" = queue.Queue(maxsize=max_queue)
+        self._state_lock = threading.Lock()
+        self._waiting: Dict[Tuple[str, int, str], _PendingLog] = {}  # Queued, not yet taken by the writer
+        self._budgets: Dict[str, _LoggerBudget] = {}
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+
+        # Statistics
+        self._stats = {
+            "captured": 0,
+            "written": 0,
+            "deduplicated": 0,
+            "rate_limited": 0,
+            "dropped": 0,
+            "write_failures": 0,
+            "batches": 0,
+        }
+        self._dropped_reported = 0
 
     def emit(self, record: logging.LogRecord) -> None:
-        """Process log record and store as correlation."""
+        """Queue the log record for the background writer."""
+        if self._closed or threading.current_thread() is self._writer:
+            # Never capture what the writer itself logs (e.g. a failed insert)
+            return
         try:
-            from ciris_engine.schemas.telemetry.core import LogData
-
-            # Create LogData for the log entry
-            log_data = LogData(
-                log_level=record.levelname,
-                log_message=self.format(record),
-                logger_name=record.name,
-                module_name=record.module or "unknown",
-                function_name=record.funcName or "unknown",
-                line_number=record.lineno,
-                extra_fields={
-                    "pathname": record.pathname,
-                    "thread": str(record.thread),
-                    "process": str(record.process),
-                },
-            )
-
-            # Create the correlation with log data
-            timestamp = datetime.fromtimestamp(record.created, timezone.utc)
-            log_correlation = ServiceCorrelation(
-                correlation_id=str(uuid4()),
-                service_type="logging",
-                handler_name="log_collector",
-                action_type="log_entry",
-                correlation_type=CorrelationType.LOG_ENTRY,
-                timestamp=timestamp,
-                created_at=timestamp,
-                updated_at=timestamp,
-                log_data=log_data,
-                tags={
-                    **self.tags,
-                    "logger": record.name,
-                    "level": record.levelname,
-                    "module": record.module or "unknown",
-                },
-                status=ServiceCorrelationStatus.COMPLETED,
-                retention_policy="raw",
-            )
-
-            if self._async_loop and self._async_loop.is_running():
-                self._async_loop.create_task(self._store_log_correlation(log_correlation))
-            else:
-                if self._time_service:
-                    add_correlation(log_correlation, self._time_service)
+            # Repeats are matched on the unformatted message, which has no timestamp
+            key = (record.name, record.levelno, record.getMessage())
+            with self._state_lock:
+                self._stats["captured"] += 1
+                waiting = self._waiting.get(key)
+                if waiting is not None:
+                    waiting.count += 1
+                    waiting.last_created = record.created
+                    self._stats["deduplicated"] += 1
+                    return
+                if not self._within_budget(record):
+                    self._stats["rate_limited"] += 1
+                    return
+                pending = _PendingLog(key, record, self.format(record))
+                try:
+                    self._queue.put_nowait(pending)
+                except queue.Full:
+                    self._stats["dropped"] += 1
+                    return
+                self._waiting[key] = pending
+            self._ensure_writer()
+        except Exception:
+            self.handleError(record)
+
+    def _within_budget(self, record: logging.LogRecord) -> bool:
+        """Apply the per-logger token bucket; called with the state lock held."""
+        if record.levelno >= logging.CRITICAL:
+            return True
+        budget = self._budgets.get(record.name)
+        if budget is None:
+            budget = self._budgets[record.name] = _LoggerBudget(self._burst_per_logger)
+        now = time.monotonic()
+        budget.tokens = min(
+            float(self._burst_per_logger), budget.tokens + (now - budget.updated) * self._rate_per_logger
+        )
+        budget.updated = now
+        if budget.tokens >= 1.0:
+            budget.tokens -= 1.0
+            budget.seen_while_limited = 0
+            return True
+        # Over budget: keep a sample so a storm stays visible
+        budget.seen_while_limited += 1
+        return budget.seen_while_limited % self._sample_every == 0
+
+    def _ensure_writer(self) -> None:
+        if self._writer is None or not self._writer.is_alive():
+            with self._state_lock:
+                if self._writer is None or not self._writer.is_alive():
+                    self._writer = threading.Thread(target=self._run_writer, name="tsdb-log-writer", daemon=True)
+                    self._writer.start()
+
+    def _run_writer(self) -> None:
+        """Drain the queue in batches until close() sends the stop marker."""
+        while True:
+            try:
+                first = self._queue.get(timeout=self._flush_interval)
+            except queue.Empty:
+                continue
+            batch: List[_PendingLog] = []
+            stop = first is None
+            if first is not None:
+                batch.append(first)
+            while not stop and len(batch) < self._batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
                 else:
-                    # Skip if no time service available
-                    print("Warning: TSDBLogHandler requires time_service to store correlations")
-
-        except Exception as e:
-            print(f"Failed to store log correlation: {e}")
-
-    async def _store_log_correlation(self, correlation: ServiceCorrelation) -> None:
-        """Store log correlation asynchronously."""
+                    batch.append(item)
+            try:
+                self._write_batch(batch)
+            finally:
+                for _ in range(len(batch) + (1 if stop else 0)):
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _write_batch(self, batch: List[_PendingLog]) -> None:
+        with self._state_lock:
+            # Later repeats start a new entry instead of bumping one being written
+            for pending in batch:
+                if self._waiting.get(pending.key) is pending:
+                    del self._waiting[pending.key]
+            counts = [(pending, pending.count, pending.last_created) for pending in batch]
+            dropped = self._stats["dropped"] - self._dropped_reported
+            self._dropped_reported = self._stats["dropped"]
+
+        correlations = [self._to_correlation(pending, count, last) for pending, count, last in counts]
+        if dropped:
+            correlations.append(self._dropped_correlation(dropped))
+        if not correlations:
+            return
+        if not self._time_service:
+            # Skip if no time service available
+            return
         try:
-            if self._time_service:
-                add_correlation(correlation, self._time_service)
-            else:
-                print("Warning: TSDBLogHandler requires time_service to store correlations")
+            add_correlations(correlations, self._time_service, self._db_path)
         except Exception as e:
-            print(f"Failed to store log correlation in TSDB: {e}")
+            with self._state_lock:
+                self._stats["write_failures"] += len(correlations)
+            print(f"Failed to store {len(correlations)} log correlations in TSDB: {e}")
+            return
+        with self._state_lock:
+            self._stats["written"] += len(correlations)
+            self._stats["batches"] += 1
+
+    def _to_correlation(self, pending: _PendingLog, count: int, last_created: float) -> ServiceCorrelation:
+        record = pending.record
+        extra_fields = {
+            "pathname": record.pathname,
+            "thread": str(record.thread),
+            "process": str(record.process),
+        }
+        tags = {
+            **self.tags,
+            "logger": record.name,
+            "level": record.levelname,
+            "module": record.module or "unknown",
+        }
+        if count > 1:
+            extra_fields["repeat_count"] = str(count)
+            extra_fields["last_seen"] = datetime.fromtimestamp(last_created, timezone.utc).isoformat()
+            tags["repeat_count"] = str(count)
+
+        # Create LogData for the log entry
+        log_data = LogData(
+            log_level=record.levelname,
+            log_message=pending.message,
+            logger_name=record.name,
+            module_name=record.module or "unknown",
+            function_name=record.funcName or "unknown",
+            line_number=record.lineno,
+            extra_fields=extra_fields,
+        )
+
+        # Create the correlation with log data
+        timestamp = datetime.fromtimestamp(record.created, timezone.utc)
+        return ServiceCorrelation(
+            correlation_id=str(uuid4()),
+            service_type="logging",
+            handler_name="log_collector",
+            action_type="log_entry",
+            correlation_type=CorrelationType.LOG_ENTRY,
+            timestamp=timestamp,
+            created_at=timestamp,
+            updated_at=timestamp,
+            log_data=log_data,
+            tags=tags,
+            status=ServiceCorrelationStatus.COMPLETED,
+            retention_policy="raw",
+        )
+
+    def _dropped_correlation(self, dropped: int) -> ServiceCorrelation:
+        """Marks a gap in the stored logs caused by queue overflow."""
+        now = datetime.now(timezone.utc)
+        return ServiceCorrelation(
+            correlation_id=str(uuid4()),
+            service_type="logging",
+            handler_name="log_collector",
+            action_type="log_entry",
+            correlation_type=CorrelationType.LOG_ENTRY,
+            timestamp=now,
+            created_at=now,
+            updated_at=now,
+            log_data=LogData(
+                log_level="WARNING",
+                log_message=f"Log collector queue overflowed; {dropped} log records were dropped",
+                logger_name=__name__,
+                module_name="log_collector",
+                function_name="emit",
+                line_number=0,
+                extra_fields={"dropped_records": str(dropped)},
+            ),
+            tags={**self.tags, "logger": __name__, "level": "WARNING", "dropped_records": str(dropped)},
+            status=ServiceCorrelationStatus.COMPLETED,
+            retention_policy="raw",
+        )
+
+    def flush(self) -> None:
+        """Block until every record queued so far has been written."""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        """Write what is queued and stop the writer thread."""
+        if not self._closed:
+            self._closed = True
+            if self._writer is not None and self._writer.is_alive():
+                self._queue.put(None)
+                self._writer.join(timeout=5.0)
+        super().close()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Counters for captured, written, deduplicated, rate limited and dropped records."""
+        with self._state_lock:
+            return {**self._stats, "queued": self._queue.qsize()}
 
     def set_async_loop(self, loop: asyncio.AbstractEventLoop) -> None:
-        """Set the async event loop for asynchronous storage."""
+        """Set the async event loop; records are written by the handler's own thread regardless."""
         self._async_loop = loop
 
 
@@ -107,6 +326,7 @@ class LogCorrelationCollector:
         log_levels: Optional[List[str]] = None,
         tags: Optional[Dict[str, str]] = None,
         loggers: Optional[List[str]] = None,
+        time_service: Optional[TimeServiceProtocol] = None,
     ):
         """
         Initialize the log collector.
@@ -115,11 +335,13 @@ class LogCorrelationCollector:
             log_levels: Log levels to capture (default: WARNING and above)
             tags: Global tags to add to all log correlations
             loggers: Specific logger names to attach to (default: root logger)
+            time_service: Time service passed to correlation storage; without it nothing is stored
         """
         self.log_levels = log_levels or ["WARNING", "ERROR", "CRITICAL"]
         self.tags = tags or {"source": "ciris_agent"}
         self.loggers: List[Optional[str]] = list(loggers) if loggers is not None else [None]  # None means root logger
         self.handlers: List[TSDBLogHandler] = []
+        self.time_service = time_service
 
     async def start(self) -> None:
         """Start collecting logs."""
@@ -128,7 +350,7 @@ class LogCorrelationCollector:
 
         # Create handlers for each logger
         for logger_name in self.loggers:
-            handler = TSDBLogHandler(tags=self.tags)
+            handler = TSDBLogHandler(tags=self.tags, time_service=self.time_service)
             handler.set_async_loop(loop)
 
             # Set formatter
@@ -176,7 +398,7 @@ class LogCorrelationCollector:
             # If already started, add handler now
             if self.handlers:
                 loop = asyncio.get_event_loop()
-                handler = TSDBLogHandler(tags=self.tags)
+                handler = TSDBLogHandler(tags=self.tags, time_service=self.time_service)
                 handler.set_async_loop(loop)
 
                 formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -0,0 +1,66 @@
+"""
+Run password hashing off the event loop.
+
+bcrypt and PBKDF2 deliberately take tens to hundreds of milliseconds. Called
+inline from an async route they stall every other request, so they run on a
+small dedicated thread pool instead. A per-loop semaphore caps how many hashes
+may be in flight, so a burst of logins queues on the semaphore rather than
+piling work onto the pool.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+PASSWORD_HASH_WORKERS = min(4, os.cpu_count() or 1)
+PASSWORD_HASH_MAX_IN_FLIGHT = 2 * PASSWORD_HASH_WORKERS
+
+
+class PasswordHashPool:
+    """Bounded worker pool for CPU-heavy password operations."""
+
+    def __init__(self, max_workers: int = PASSWORD_HASH_WORKERS, max_in_flight: int = PASSWORD_HASH_MAX_IN_FLIGHT):
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # asyncio primitives belong to one loop; services can be used from
+        # asyncio.run() during startup and from the main loop afterwards
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def run(self, func: Callable[..., T], *args: object) -> T:
+        """Run ``func(*args)`` on the pool once an in-flight slot is free."""
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+_default_pool: Optional[PasswordHashPool] = None
+
+
+def get_password_hash_pool() -> PasswordHashPool:
+    """Return the process-wide password hashing pool."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = PasswordHashPool()
+    return _default_pool
@@ -6,7 +6,7 @@ from typing import List, Optional, Protocol
 
 from ciris_engine.schemas.runtime.audit import AuditActionContext
 from ciris_engine.schemas.runtime.enums import HandlerActionType
-from ciris_engine.schemas.services.graph.audit import AuditQuery, VerificationReport
+from ciris_engine.schemas.services.graph.audit import AuditEntryPage, AuditQuery, VerificationReport
 from ciris_engine.schemas.services.nodes import AuditEntry
 
 from ...runtime.base import GraphServiceProtocol
@@ -47,12 +47,17 @@ class AuditServiceProtocol(GraphServiceProtocol, Protocol):
         ...
 
     @abstractmethod
-    async def verify_audit_integrity(self) -> VerificationReport:
+    async def query_audit_page(self, query: AuditQuery, cursor: Optional[str] = None) -> AuditEntryPage:
+        """Query one page of the audit trail, resuming after the cursor, with an exact total."""
+        ...
+
+    @abstractmethod
+    async def verify_audit_integrity(self, full: bool = False) -> VerificationReport:
         """Verify audit trail integrity."""
         ...
 
     @abstractmethod
-    async def get_verification_report(self) -> VerificationReport:
+    async def get_verification_report(self, full: bool = False) -> VerificationReport:
         """Get detailed verification report."""
         ...
 
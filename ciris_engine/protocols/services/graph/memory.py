@@ -52,8 +52,9 @@ class MemoryServiceProtocol(GraphServiceProtocol, Protocol):
         correlation_types: Optional[List[str]] = None,
         start_time: Optional["datetime"] = None,
         end_time: Optional["datetime"] = None,
+        limit: Optional[int] = 1000,
     ) -> List[TimeSeriesDataPoint]:
-        """Recall time-series data."""
+        """Recall time-series data, capped at limit points unless limit is None."""
         ...
 
     @abstractmethod
@@ -34,6 +34,7 @@ class CompleteVerificationResult(BaseModel):
 
     valid: bool = Field(..., description="Overall validity")
     entries_verified: int = Field(0, description="Total entries verified")
+    entries_checked: Optional[int] = Field(None, description="Entries re-checked in this run (new since checkpoint)")
     hash_chain_valid: bool = Field(..., description="Hash chain validity")
     signatures_valid: bool = Field(..., description="Signatures validity")
     verification_time_ms: int = Field(..., description="Verification time in milliseconds")
@@ -42,6 +43,8 @@ class CompleteVerificationResult(BaseModel):
     chain_summary: Optional[dict] = Field(None, description="Chain summary information")
     summary: Optional[str] = Field(None, description="Summary message")
     error: Optional[str] = Field(None, description="Error message if verification failed")
+    checkpoint_sequence: Optional[int] = Field(None, description="Checkpoint sequence verification resumed from")
+    full_verification: bool = Field(True, description="Whether the whole chain was verified from genesis")
 
 
 class EntryVerificationResult(BaseModel):
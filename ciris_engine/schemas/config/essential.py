@@ -41,6 +41,11 @@ class SecurityConfig(BaseModel):
     )
     audit_key_path: Path = Field(Path("audit_keys"), description="Directory containing audit signing keys")
     enable_signed_audit: bool = Field(True, description="Enable cryptographic signing of audit entries")
+    audit_batch_signing: bool = Field(
+        False, description="Group-commit audit entries and sign one Merkle root per batch instead of every entry"
+    )
+    audit_batch_max_entries: int = Field(256, description="Maximum audit entries per signed batch")
+    audit_batch_interval_ms: int = Field(50, description="Maximum time an audit entry waits for its batch commit")
     max_thought_depth: int = Field(7, description="Maximum thought chain depth before auto-defer")
 
     model_config = ConfigDict(extra="forbid")
@@ -76,6 +81,14 @@ class WorkflowConfig(BaseModel):
     max_rounds: int = Field(10, description="Maximum rounds of processing before automatic pause")
     round_timeout_seconds: float = Field(300.0, description="Timeout for each processing round")
     enable_auto_defer: bool = Field(True, description="Automatically defer when hitting limits")
+    conscience_early_cancel: bool = Field(
+        False, description="Cancel remaining conscience checks once a higher priority override is decisive"
+    )
+    min_concurrent_thoughts: int = Field(1, description="Lower bound for thoughts processed concurrently")
+    max_concurrent_thoughts: int = Field(10, description="Upper bound for thoughts processed concurrently")
+    target_thought_latency_seconds: float = Field(
+        30.0, description="Per-thought latency above which thought concurrency is reduced"
+    )
 
     model_config = ConfigDict(extra="forbid")
 
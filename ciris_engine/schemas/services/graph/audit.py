@@ -9,6 +9,8 @@ from typing import Dict, List, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from ciris_engine.schemas.services.nodes import AuditEntry
+
 
 class AuditEventData(BaseModel):
     """Data for an audit event."""
@@ -44,6 +46,8 @@ class VerificationReport(BaseModel):
     chain_intact: bool = Field(..., description="Whether hash chain is intact")
     last_valid_entry: Optional[str] = Field(None, description="Last valid entry ID")
     first_invalid_entry: Optional[str] = Field(None, description="First invalid entry ID")
+    full_verification: bool = Field(True, description="Whether the whole chain was re-verified")
+    checkpoint_sequence: Optional[int] = Field(None, description="Checkpoint incremental verification resumed from")
 
     # Timing
     verification_started: datetime = Field(..., description="Verification start time")
@@ -96,3 +100,11 @@ class AuditQuery(BaseModel):
     order_desc: bool = Field(True, description="Order descending")
     limit: Optional[int] = Field(100, description="Maximum results")
     offset: int = Field(0, description="Results offset")
+
+
+class AuditEntryPage(BaseModel):
+    """One page of a keyset-paginated audit query."""
+
+    entries: List[AuditEntry] = Field(default_factory=list, description="Entries on this page")
+    total: int = Field(..., description="Total entries matching the query filters")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, None on the last page")
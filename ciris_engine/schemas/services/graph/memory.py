@@ -82,3 +82,20 @@ class MemoryOperationContext(BaseModel):
     channel_id: Optional[str] = Field(None, description="Channel context")
     user_id: Optional[str] = Field(None, description="User context")
     metadata: Dict[str, str] = Field(default_factory=dict, description="Additional metadata")
+
+
+class ConnectedNodeInfo(BaseModel):
+    """A node linked to a user node by one edge."""
+
+    node_id: str = Field(..., description="Connected node ID")
+    node_type: str = Field(..., description="Connected node type")
+    relationship: str = Field(..., description="Relationship of the linking edge")
+    attributes: dict = Field(default_factory=dict, description="Connected node attributes")
+
+
+class UserGraphProfile(BaseModel):
+    """A user node's attributes together with its directly connected nodes."""
+
+    user_id: str = Field(..., description="User ID (without the user/ prefix)")
+    attributes: dict = Field(default_factory=dict, description="All user node attributes")
+    connected_nodes: List[ConnectedNodeInfo] = Field(default_factory=list, description="Directly connected nodes")
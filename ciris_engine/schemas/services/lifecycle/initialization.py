@@ -16,6 +16,9 @@ class InitializationStatus(BaseModel):
     phase_status: Dict[str, str] = Field(default_factory=dict, description="Status of each phase")
     error: Optional[str] = Field(None, description="Error message if initialization failed")
     total_steps: int = Field(0, description="Total number of steps registered")
+    step_durations_ms: Dict[str, float] = Field(
+        default_factory=dict, description="Wall-clock duration of each executed step (phase/name)"
+    )
 
     model_config = ConfigDict()
 
@@ -31,3 +34,36 @@ class InitializationVerification(BaseModel):
     no_errors: bool = Field(..., description="Whether there were no errors")
     all_steps_completed: bool = Field(..., description="Whether all steps completed")
     phase_results: Dict[str, bool] = Field(default_factory=dict, description="Results for each phase")
+
+
+class ServiceStartupRecord(BaseModel):
+    """Timing record for a single service started by the startup scheduler."""
+
+    service_name: str = Field(..., description="Name of the service that was started")
+    phase: str = Field(..., description="Startup group the service belongs to (infrastructure, memory, core)")
+    wave: int = Field(..., description="Topological wave the service was started in (0 = no dependencies)")
+    depends_on: List[str] = Field(default_factory=list, description="Services that had to start first")
+    started_at: datetime = Field(..., description="When the service start began")
+    duration_ms: float = Field(..., description="Wall-clock time spent starting the service")
+    success: bool = Field(..., description="Whether the service started successfully")
+    error: Optional[str] = Field(None, description="Error message if the start failed")
+
+    @field_serializer("started_at")
+    def serialize_datetime(self, dt: datetime) -> str:
+        return dt.isoformat()
+
+
+class StartupTimeline(BaseModel):
+    """Per-service startup timeline and cold-start metrics."""
+
+    services: List[ServiceStartupRecord] = Field(default_factory=list, description="Service start records in order")
+    initialization_started_at: Optional[datetime] = Field(None, description="When initialization began")
+    initialization_duration_seconds: Optional[float] = Field(None, description="Duration of the initialization sequence")
+    first_work_round_at: Optional[datetime] = Field(None, description="When the first WORK round completed")
+    cold_start_seconds: Optional[float] = Field(
+        None, description="Time from initialization start to the first completed WORK round"
+    )
+
+    @field_serializer("initialization_started_at", "first_work_round_at")
+    def serialize_datetime(self, dt: Optional[datetime]) -> Optional[str]:
+        return dt.isoformat() if dt else None
@@ -0,0 +1,210 @@
+"""
+Startup profiling for the CIRIS runtime.
+
+Enabled with ``main.py --profile-startup`` or ``CIRIS_PROFILE_STARTUP=true``.
+Records an import-time tree (similar to ``python -X importtime`` but usable
+after interpreter start) and formats a start-to-ready report that includes the
+InitializationService step breakdown and per-service startup timeline.
+
+This module only depends on the standard library so it can be installed before
+any heavy runtime import.
+"""
+
+import importlib.abc
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Sequence
+
+PROFILE_ENV_VAR = "CIRIS_PROFILE_STARTUP"
+PROFILE_FLAG = "--profile-startup"
+
+
+@dataclass
+class ImportRecord:
+    """Timing for one imported module and the modules it imported."""
+
+    name: str
+    cumulative_us: float = 0.0
+    children: List["ImportRecord"] = field(default_factory=list)
+
+    @property
+    def self_us(self) -> float:
+        return self.cumulative_us - sum(child.cumulative_us for child in self.children)
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wraps a module loader to time ``exec_module``."""
+
+    def __init__(self, loader: Any, profiler: "ImportProfiler") -> None:
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec: ModuleSpec) -> Optional[ModuleType]:
+        create = getattr(self._loader, "create_module", None)
+        return create(spec) if create else None
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._profiler._enter(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit()
+
+    def __getattr__(self, name: str) -> Any:
+        # Delegate get_source/get_code/is_package etc. to the real loader
+        return getattr(self._loader, name)
+
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """Meta path finder that records how long each module takes to import."""
+
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.roots: List[ImportRecord] = []
+        self._stack: List[ImportRecord] = []
+        self._starts: List[float] = []
+        self._resolving = False
+
+    def install(self) -> None:
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(
+        self, fullname: str, path: Optional[Sequence[str]], target: Optional[ModuleType] = None
+    ) -> Optional[ModuleSpec]:
+        if self._resolving:
+            return None
+        self._resolving = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(spec.loader, self)
+                    return spec
+            return None
+        finally:
+            self._resolving = False
+
+    def _enter(self, name: str) -> None:
+        record = ImportRecord(name=name)
+        (self._stack[-1].children if self._stack else self.roots).append(record)
+        self._stack.append(record)
+        self._starts.append(time.perf_counter())
+
+    def _exit(self) -> None:
+        record = self._stack.pop()
+        record.cumulative_us = (time.perf_counter() - self._starts.pop()) * 1_000_000
+
+    def top_modules(self, limit: int = 20) -> List[ImportRecord]:
+        """Modules with the highest self time."""
+        flat: List[ImportRecord] = []
+        pending = list(self.roots)
+        while pending:
+            record = pending.pop()
+            flat.append(record)
+            pending.extend(record.children)
+        return sorted(flat, key=lambda r: r.self_us, reverse=True)[:limit]
+
+    def format_tree(self, min_ms: float = 10.0, max_depth: int = 6) -> List[str]:
+        """Render the import tree, hiding subtrees cheaper than ``min_ms``."""
+        lines = [f"{'cumulative':>12} {'self':>10}  module"]
+
+        def walk(records: List[ImportRecord], depth: int) -> None:
+            for record in sorted(records, key=lambda r: r.cumulative_us, reverse=True):
+                if record.cumulative_us < min_ms * 1000:
+                    continue
+                lines.append(
+                    f"{record.cumulative_us / 1000:>10.1f}ms {record.self_us / 1000:>8.1f}ms  "
+                    f"{'  ' * depth}{record.name}"
+                )
+                if depth < max_depth:
+                    walk(record.children, depth + 1)
+
+        walk(self.roots, 0)
+        return lines
+
+
+_profiler: Optional[ImportProfiler] = None
+
+
+def profiling_requested(argv: Optional[Sequence[str]] = None) -> bool:
+    """Whether startup profiling was requested via CLI flag or environment."""
+    args = sys.argv if argv is None else argv
+    if PROFILE_FLAG in args:
+        return True
+    return os.environ.get(PROFILE_ENV_VAR, "").lower() in ("true", "1", "yes", "on")
+
+
+def install_import_profiler() -> ImportProfiler:
+    """Install the global import profiler (idempotent)."""
+    global _profiler
+    if _profiler is None:
+        _profiler = ImportProfiler()
+        _profiler.install()
+    return _profiler
+
+
+def get_import_profiler() -> Optional[ImportProfiler]:
+    return _profiler
+
+
+def format_startup_report(
+    initialization_status: Any = None,
+    startup_timeline: Any = None,
+    min_import_ms: float = 10.0,
+) -> str:
+    """Build the start-to-ready report.
+
+    Args:
+        initialization_status: InitializationStatus from the InitializationService
+        startup_timeline: StartupTimeline from the InitializationService
+        min_import_ms: Hide import subtrees cheaper than this
+    """
+    lines: List[str] = ["=" * 72, "CIRIS STARTUP PROFILE", "=" * 72]
+    profiler = _profiler
+
+    if profiler is not None:
+        total_import_ms = sum(r.cumulative_us for r in profiler.roots) / 1000
+        lines.append(f"Process start-to-ready: {(time.perf_counter() - profiler.started_at):.2f}s")
+        lines.append(f"Import time (after profiler install): {total_import_ms:.0f}ms")
+        lines.append("")
+        lines.append(f"Import tree (subtrees >= {min_import_ms:.0f}ms):")
+        lines.extend(profiler.format_tree(min_ms=min_import_ms))
+        lines.append("")
+        lines.append("Slowest modules (self time):")
+        for record in profiler.top_modules(15):
+            lines.append(f"{record.self_us / 1000:>10.1f}ms  {record.name}")
+        lines.append("")
+
+    if initialization_status is not None:
+        step_durations: Dict[str, float] = getattr(initialization_status, "step_durations_ms", {}) or {}
+        lines.append("Initialization steps:")
+        for step_name, duration_ms in step_durations.items():
+            lines.append(f"{duration_ms:>10.1f}ms  {step_name}")
+        duration = getattr(initialization_status, "duration_seconds", None)
+        if duration is not None:
+            lines.append(f"{duration * 1000:>10.1f}ms  TOTAL")
+        lines.append("")
+
+    if startup_timeline is not None and getattr(startup_timeline, "services", None):
+        lines.append("Service startup timeline:")
+        for record in startup_timeline.services:
+            status = "" if record.success else f"  FAILED: {record.error}"
+            lines.append(
+                f"{record.duration_ms:>10.1f}ms  [{record.phase} wave {record.wave}] {record.service_name}{status}"
+            )
+        lines.append("")
+
+    lines.append("=" * 72)
+    return "\n".join(lines)
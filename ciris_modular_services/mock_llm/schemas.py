@@ -12,9 +12,11 @@ from pydantic import BaseModel, Field
 class MockLLMConfig(BaseModel):
     """Configuration for MockLLM service."""
 
-    delay_ms: int = Field(default=100, description="Simulated response delay in milliseconds")
+    delay_ms: int = Field(default=0, ge=0, description="Simulated response delay in milliseconds")
+    jitter_ms: int = Field(default=0, ge=0, description="Uniform random delay added on top of delay_ms")
     failure_rate: float = Field(default=0.0, ge=0.0, le=1.0, description="Probability of simulated failures (0.0-1.0)")
     deterministic: bool = Field(default=True, description="Whether responses are deterministic (for testing)")
+    seed: int = Field(default=0, description="Seed for the delay and failure draws when deterministic")
 
 
 class MockLLMStatus(BaseModel):
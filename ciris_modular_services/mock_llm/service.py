@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import random
 from types import SimpleNamespace
 from typing import Any, Dict, List, Optional, Tuple, Type
 
@@ -6,14 +8,34 @@ import instructor
 from pydantic import BaseModel
 
 from ciris_engine.logic.adapters.base import Service
+from ciris_engine.logic.config.env_utils import get_env_var
 from ciris_engine.protocols.services import LLMService as MockLLMServiceProtocol
 from ciris_engine.schemas.runtime.enums import ServiceType
 from ciris_engine.schemas.runtime.resources import ResourceUsage
 
 from .responses import create_response
+from .schemas import MockLLMConfig
 
 logger = logging.getLogger(__name__)
 
+# Environment overrides for the simulated provider behaviour (benchmarks, chaos testing)
+_ENV_OVERRIDES = {
+    "delay_ms": "CIRIS_MOCK_LLM_DELAY_MS",
+    "jitter_ms": "CIRIS_MOCK_LLM_JITTER_MS",
+    "failure_rate": "CIRIS_MOCK_LLM_FAILURE_RATE",
+    "seed": "CIRIS_MOCK_LLM_SEED",
+}
+
+
+def _load_config(**settings: Any) -> MockLLMConfig:
+    """Build the mock config from service settings, with environment variables taking precedence."""
+    values = {key: value for key, value in settings.items() if key in MockLLMConfig.model_fields}
+    for field_name, env_name in _ENV_OVERRIDES.items():
+        env_value = get_env_var(env_name)
+        if env_value:
+            values[field_name] = env_value
+    return MockLLMConfig.model_validate(values)
+
 
 class MockInstructorClient:
     """Mock instructor-patched client that properly handles response_model parameter."""
@@ -124,10 +146,15 @@ class MockLLMClient:
 class MockLLMService(Service, MockLLMServiceProtocol):
     """Mock LLM service used for offline testing."""
 
-    def __init__(self, *_: Any, **__: Any) -> None:
+    def __init__(self, *_: Any, **settings: Any) -> None:
         super().__init__()
         self._client: Optional[MockLLMClient] = None
         self.model_name = "mock-model"
+        self.mock_config = _load_config(**settings)
+        self._rng = random.Random(self.mock_config.seed if self.mock_config.deterministic else None)
+        self._response_count = 0
+        self._failure_count = 0
+        self._total_delay_ms = 0.0
 
     def get_service_type(self) -> ServiceType:
         """Get the service type."""
@@ -156,13 +183,32 @@ class MockLLMService(Service, MockLLMServiceProtocol):
             "healthy": self._client is not None,
             "service_name": "MockLLMService",
             "status": "running" if self._client else "stopped",
-            "details": {"model": self.model_name, "mock": True},
+            "details": {
+                "model": self.model_name,
+                "mock": True,
+                "response_count": self._response_count,
+                "failure_count": self._failure_count,
+                "average_delay_ms": self._total_delay_ms / self._response_count if self._response_count else 0.0,
+            },
         }
 
     async def is_healthy(self) -> bool:
         """Check if service is healthy."""
         return self._client is not None
 
+    async def _simulate_provider(self) -> None:
+        """Apply the configured latency, then fail the call at the configured rate."""
+        config = self.mock_config
+        delay_ms = config.delay_ms + (self._rng.uniform(0, config.jitter_ms) if config.jitter_ms else 0.0)
+        failed = config.failure_rate > 0 and self._rng.random() < config.failure_rate
+        self._response_count += 1
+        self._total_delay_ms += delay_ms
+        if delay_ms:
+            await asyncio.sleep(delay_ms / 1000)
+        if failed:
+            self._failure_count += 1
+            raise RuntimeError("Mock LLM simulated provider failure")
+
     def _get_client(self) -> MockLLMClient:
         if not self._client:
             raise RuntimeError("MockLLMService has not been started")
@@ -182,6 +228,7 @@ class MockLLMService(Service, MockLLMServiceProtocol):
             raise RuntimeError("MockLLMService has not been started")
 
         logger.debug(f"Mock call_llm_structured with response_model: {response_model}")
+        await self._simulate_provider()
 
         response = await self._client._create(
             messages=messages, response_model=response_model, max_tokens=max_tokens, temperature=temperature, **kwargs
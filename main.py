@@ -5,6 +5,13 @@ try:
     load_dotenv()
 except ImportError:
     pass  # dotenv is optional; skip if not installed
+
+# Startup profiling must hook imports before the runtime is imported below
+from ciris_engine.utils.startup_profiler import format_startup_report, install_import_profiler, profiling_requested
+
+if profiling_requested():
+    install_import_profiler()
+
 import asyncio
 import json
 import logging
@@ -182,6 +189,12 @@ async def _run_runtime(runtime: CIRISRuntime, timeout: Optional[int], num_rounds
 )
 @click.option("--mock-llm/--no-mock-llm", default=False, help="Use the mock LLM service for offline testing")
 @click.option("--num-rounds", type=int, help="Maximum number of processing rounds (default: infinite)")
+@click.option(
+    "--profile-startup",
+    is_flag=True,
+    default=False,
+    help="Print import-time tree and initialization step breakdown once the runtime is ready",
+)
 def main(
     adapter_types_list: tuple[str, ...],
     template: str,
@@ -197,6 +210,7 @@ def main(
     discord_bot_token: Optional[str],
     mock_llm: bool,
     num_rounds: Optional[int],
+    profile_startup: bool,
 ) -> None:
     """Unified CIRIS agent entry point."""
     # Setup basic console logging first (without file logging)
@@ -384,6 +398,14 @@ def main(
         )
         await runtime.initialize()
 
+        if profile_startup or profiling_requested():
+            init_service = runtime.initialization_service
+            report = format_startup_report(
+                initialization_status=await init_service.get_initialization_status() if init_service else None,
+                startup_timeline=init_service.get_startup_timeline() if init_service else None,
+            )
+            print(report, file=sys.stderr)
+
         # Setup signal handlers for graceful shutdown
         setup_signal_handlers(runtime)
 
@@ -0,0 +1,68 @@
+"""Tests for APIAuthService user lookup, listing and password handling."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ciris_engine.logic.adapters.api.services.auth_service import APIAuthService
+from ciris_engine.schemas.api.auth import UserRole
+from ciris_engine.schemas.runtime.api import APIRole
+
+
+@pytest.fixture
+def auth_service():
+    service = APIAuthService()
+    # bcrypt at the default cost makes these tests slow without adding anything
+    service._hash_password = lambda password: f"plain:{password}"
+    service._verify_password = lambda password, password_hash: password_hash == f"plain:{password}"
+    return service
+
+
+@pytest.mark.asyncio
+async def test_username_index_follows_user_mutations(auth_service):
+    user = await auth_service.create_user("alice", "secret")
+    assert auth_service.get_user_by_username("alice") is user
+    assert await auth_service.create_user("alice", "other") is None
+
+    assert await auth_service.verify_user_password("alice", "secret") is user
+    assert await auth_service.verify_user_password("alice", "wrong") is None
+    assert await auth_service.verify_user_password("nobody", "secret") is None
+
+    assert await auth_service.change_password(user.wa_id, "rotated", current_password="secret")
+    assert await auth_service.verify_user_password("alice", "rotated") is user
+
+    await auth_service.update_user(user.wa_id, api_role=APIRole.ADMIN)
+    assert auth_service.get_user_by_username("alice").api_role == APIRole.ADMIN
+
+
+def test_oauth_lookup(auth_service):
+    auth_service.create_oauth_user("google", "123", "bob@example.com", "Bob", UserRole.OBSERVER)
+    user = auth_service.get_user_by_oauth("google", "123")
+    assert user is not None and user.wa_id == "google:123"
+    assert auth_service.get_user_by_oauth("google", "999") is None
+
+
+@pytest.mark.asyncio
+async def test_list_users_page(auth_service):
+    base = datetime.now(timezone.utc)
+    for i in range(5):
+        user = await auth_service.create_user(f"user{i}", "pw")
+        user.created_at = base + timedelta(minutes=i)
+    for i in range(3):
+        oauth_user = auth_service.create_oauth_user("github", str(i), None, f"gh{i}", UserRole.OBSERVER)
+        oauth_user.created_at = base + timedelta(minutes=10 + i)
+
+    everyone = auth_service.list_users()
+    # Fallback admin plus five password users plus three OAuth users
+    assert len(everyone) == 9
+    assert [u.name for u in everyone[:3]] == ["gh2", "gh1", "gh0"]
+
+    page, total = auth_service.list_users_page(offset=2, limit=3)
+    assert total == 9
+    assert [u.name for u in page] == ["gh0", "user4", "user3"]
+
+    oauth_only, total = auth_service.list_users_page(auth_type="oauth")
+    assert total == 3 and all(u.auth_type == "oauth" for u in oauth_only)
+
+    searched, total = auth_service.list_users_page(search="USER1")
+    assert total == 1 and searched[0].name == "user1"
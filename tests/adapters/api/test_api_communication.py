@@ -10,6 +10,7 @@ Tests:
 """
 
 import asyncio
+import json
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -71,8 +72,9 @@ class TestAPICommunicationMessageSending:
             assert result is True
             assert communication_service._response_queue.qsize() > 0
 
-            # Verify correlation was created
-            mock_persistence.add_correlation.assert_called_once()
+            # Verify correlation was persisted once the side effects drained
+            await communication_service._side_effects.flush()
+            mock_persistence.add_correlations.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_send_message_with_correlation(self, communication_service, app_state):
@@ -83,10 +85,11 @@ class TestAPICommunicationMessageSending:
         with patch("ciris_engine.logic.persistence") as mock_persistence:
             # Send message
             await communication_service.send_message(channel_id="api_127.0.0.1_8080", content="Correlated response")
+            await communication_service._side_effects.flush()
 
             # Verify correlation was created
-            mock_persistence.add_correlation.assert_called_once()
-            correlation = mock_persistence.add_correlation.call_args[0][0]
+            mock_persistence.add_correlations.assert_called_once()
+            (correlation,) = mock_persistence.add_correlations.call_args[0][0]
             assert correlation.service_type == "api"
             assert correlation.action_type == "speak"
             assert correlation.request_data.parameters["content"] == "Correlated response"
@@ -112,18 +115,46 @@ class TestAPICommunicationMessageSending:
 
     @pytest.mark.asyncio
     async def test_send_message_error_handling(self, communication_service, app_state):
-        """Test error handling during message sending."""
+        """A failing correlation write does not fail an already delivered message."""
         # Start the service
         await communication_service.start()
 
         # Mock persistence to raise an error
         with patch("ciris_engine.logic.persistence") as mock_persistence:
+            mock_persistence.add_correlations.side_effect = Exception("Database error")
             mock_persistence.add_correlation.side_effect = Exception("Database error")
 
-            # Should handle error gracefully
             result = await communication_service.send_message(channel_id="api_127.0.0.1_8080", content="Test message")
-            assert result is False
-            assert communication_service._error_count == 1
+            await communication_service._side_effects.flush()
+
+            assert result is True
+            assert communication_service._response_queue.qsize() == 1
+            assert communication_service._error_count == 0
+            assert communication_service._side_effects.get_metrics()["side_effect_failures"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_send_message_error_handling_on_delivery(self, communication_service, app_state):
+        """Errors delivering the message are reported."""
+        await communication_service.start()
+        communication_service._response_queue = Mock()
+        communication_service._response_queue.put = AsyncMock(side_effect=Exception("Queue error"))
+
+        result = await communication_service.send_message(channel_id="api_127.0.0.1_8080", content="Test message")
+        assert result is False
+        assert communication_service._error_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_queued_correlations(self, communication_service, app_state):
+        """Correlations still queued at shutdown are persisted."""
+        await communication_service.start()
+
+        with patch("ciris_engine.logic.persistence") as mock_persistence:
+            for i in range(3):
+                await communication_service.send_message(channel_id="api_127.0.0.1_8080", content=f"Message {i}")
+            await communication_service.stop()
+
+            written = [c for call in mock_persistence.add_correlations.call_args_list for c in call[0][0]]
+            assert [c.request_data.parameters["content"] for c in written] == ["Message 0", "Message 1", "Message 2"]
 
 
 class TestAPICommunicationMessageFetching:
@@ -239,23 +270,73 @@ class TestAPICommunicationChannelManagement:
 
         # Mock WebSocket client
         mock_ws = Mock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
 
         # Register WebSocket
         communication_service.register_websocket("client123", mock_ws)
 
-        # Send message to WebSocket channel
+        # Send message to WebSocket channel; the client's writer task delivers it
         result = await communication_service.send_message(channel_id="ws:client123", content="WebSocket message")
 
         assert result is True
-        mock_ws.send_json.assert_called_once()
-        call_args = mock_ws.send_json.call_args[0][0]
+        for _ in range(10):
+            if mock_ws.send_text.called:
+                break
+            await asyncio.sleep(0)
+        mock_ws.send_text.assert_called_once()
+        call_args = json.loads(mock_ws.send_text.call_args[0][0])
         assert call_args["type"] == "message"
         assert call_args["data"]["content"] == "WebSocket message"
 
         # Unregister
-        communication_service.unregister_websocket("client123")
-        assert "client123" not in communication_service._websocket_clients
+        await communication_service.unregister_websocket("client123")
+        assert "client123" not in communication_service.broadcaster.connections
+        assert await communication_service.send_message(channel_id="ws:client123", content="gone") is False
+
+    @pytest.mark.asyncio
+    async def test_agent_replies_reach_stream_subscribers(self, communication_service):
+        """Test that replies on HTTP channels are broadcast to "messages" subscribers."""
+        mock_ws = Mock()
+        mock_ws.send_text = AsyncMock()
+        communication_service.register_websocket("watcher", mock_ws, readable_channels=["api_127.0.0.1_8080"])
+
+        result = await communication_service.send_message(channel_id="api_127.0.0.1_8080", content="Hello stream")
+
+        assert result is True
+        for _ in range(10):
+            if mock_ws.send_text.called:
+                break
+            await asyncio.sleep(0)
+        frame = json.loads(mock_ws.send_text.call_args[0][0])
+        assert frame["type"] == "message"
+        assert frame["channel"] == "messages"
+        assert frame["data"]["channel_id"] == "api_127.0.0.1_8080"
+        assert frame["data"]["content"] == "Hello stream"
+
+        await communication_service.unregister_websocket("watcher")
+
+    @pytest.mark.asyncio
+    async def test_stream_only_carries_replies_the_user_can_read(self, communication_service):
+        """Test that one user's stream never receives another user's conversation."""
+        ws_a = Mock()
+        ws_a.send_text = AsyncMock()
+        ws_b = Mock()
+        ws_b.send_text = AsyncMock()
+        communication_service.register_websocket("a", ws_a, user_id="alice", readable_channels=["api_alice"])
+        communication_service.register_websocket("b", ws_b, user_id="bob", readable_channels=["api_bob"])
+
+        await communication_service.send_message(channel_id="api_alice", content="For Alice only")
+        for _ in range(10):
+            if ws_a.send_text.called:
+                break
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert json.loads(ws_a.send_text.call_args[0][0])["data"]["content"] == "For Alice only"
+        ws_b.send_text.assert_not_called()
+
+        await communication_service.unregister_websocket("a")
+        await communication_service.unregister_websocket("b")
 
 
 class TestAPICommunicationMetadata:
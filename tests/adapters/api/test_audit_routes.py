@@ -0,0 +1,64 @@
+"""Tests for audit entry pagination through the API."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ciris_engine.schemas.services.graph.audit import AuditEntryPage
+from ciris_engine.schemas.services.graph_core import GraphScope
+from ciris_engine.schemas.services.nodes import AuditEntry, AuditEntryContext
+
+
+@pytest.fixture
+def audit_service(app):
+    service = Mock()
+    entry = AuditEntry(
+        id="audit_1",
+        action="speak",
+        actor="agent",
+        timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        context=AuditEntryContext(service_name="test", correlation_id="event_1"),
+        scope=GraphScope.LOCAL,
+        attributes={},
+    )
+    service.query_audit_page = AsyncMock(return_value=AuditEntryPage(entries=[entry], total=42, next_cursor="next"))
+    app.state.audit_service = service
+    return service
+
+
+def test_entries_return_exact_total_and_next_cursor(client, auth_headers, audit_service):
+    response = client.get("/v1/audit/entries?limit=1&cursor=abc&actor=agent", headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["total"] == 42
+    assert data["next_cursor"] == "next"
+    assert [entry["id"] for entry in data["entries"]] == ["audit_1"]
+
+    query = audit_service.query_audit_page.await_args.args[0]
+    assert query.actor == "agent"
+    assert query.limit == 1
+    assert audit_service.query_audit_page.await_args.kwargs["cursor"] == "abc"
+
+
+def test_search_passes_cursor_through(client, auth_headers, audit_service):
+    response = client.post("/v1/audit/search?search_text=speak&cursor=abc", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert audit_service.query_audit_page.await_args.kwargs["cursor"] == "abc"
+
+
+def test_malformed_cursor_is_a_bad_request(client, auth_headers, audit_service):
+    audit_service.query_audit_page.side_effect = ValueError("Invalid audit cursor: bad padding")
+
+    response = client.get("/v1/audit/entries?cursor=garbage", headers=auth_headers)
+
+    assert response.status_code == 400
+
+
+def test_offset_with_cursor_is_a_bad_request(client, auth_headers, audit_service):
+    response = client.get("/v1/audit/entries?cursor=abc&offset=10", headers=auth_headers)
+
+    assert response.status_code == 400
+    audit_service.query_audit_page.assert_not_called()
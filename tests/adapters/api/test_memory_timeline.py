@@ -0,0 +1,161 @@
+"""Tests for the index-backed memory timeline sampling and query listings."""
+
+import functools
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from ciris_engine.logic.adapters.api.routes import memory
+from ciris_engine.logic.persistence.db.core import get_db_connection, initialize_database
+from ciris_engine.logic.persistence.models.graph import count_graph_nodes, get_graph_nodes_page
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "timeline.db")
+    initialize_database(path)
+    monkeypatch.setattr(memory, "get_db_connection", functools.partial(get_db_connection, db_path=path))
+    monkeypatch.setattr(memory, "get_graph_nodes_page", functools.partial(get_graph_nodes_page, db_path=path))
+    monkeypatch.setattr(memory, "count_graph_nodes", functools.partial(count_graph_nodes, db_path=path))
+    return path
+
+
+@pytest.fixture
+def timeline_client(app, client, db_path):
+    app.state.memory_service = MagicMock()
+    return client
+
+
+def _insert(db_path, nodes):
+    """nodes: (node_id, node_type, scope, updated_at)"""
+    with get_db_connection(db_path=db_path) as conn:
+        conn.executemany(
+            "INSERT INTO graph_nodes (node_id, scope, node_type, attributes_json, version, updated_by, updated_at) "
+            "VALUES (?, ?, ?, '{}', 1, 'test', ?)",
+            [(node_id, scope, node_type, updated_at.isoformat()) for node_id, node_type, scope, updated_at in nodes],
+        )
+        conn.commit()
+
+
+def _hours_ago(hours, seconds=0):
+    return datetime.now(timezone.utc) - timedelta(hours=hours, seconds=seconds)
+
+
+def test_allocation_is_proportional_and_capped():
+    assert memory._allocate_timeline_samples({"a": 3, "b": 1}, 10) == {"a": 3, "b": 1}
+
+    quotas = memory._allocate_timeline_samples({"a": 900, "b": 90, "c": 10}, 100)
+    assert quotas == {"a": 90, "b": 9, "c": 1}
+
+    quotas = memory._allocate_timeline_samples({"a": 1, "b": 1, "c": 1}, 2)
+    assert sum(quotas.values()) == 2
+    assert all(quota == 1 for quota in quotas.values())
+
+
+def test_timeline_counts_are_exact_and_sample_respects_limit(timeline_client, auth_headers, db_path):
+    nodes = [(f"concept_{i}", "concept", "local", _hours_ago(2, seconds=i * 10)) for i in range(120)]
+    nodes += [(f"old_{i}", "concept", "local", _hours_ago(5, seconds=i)) for i in range(30)]
+    # Metric nodes are never part of the timeline
+    nodes += [(f"metric_{i}", "tsdb_data", "local", _hours_ago(2, seconds=i)) for i in range(50)]
+    nodes += [("identity_root", "agent", "identity", _hours_ago(1))]
+    _insert(db_path, nodes)
+
+    response = timeline_client.get("/v1/memory/timeline?hours=24&limit=20", headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["total"] == 151
+    assert sum(data["buckets"].values()) == 151
+    assert len(data["memories"]) == 20
+    assert not any(node["id"].startswith("metric_") for node in data["memories"])
+    # Both busy hours are represented
+    assert any(node["id"].startswith("old_") for node in data["memories"])
+
+    scoped = timeline_client.get("/v1/memory/timeline?hours=24&scope=identity", headers=auth_headers).json()["data"]
+    assert scoped["total"] == 1
+    assert [node["id"] for node in scoped["memories"]] == ["identity_root"]
+
+
+def test_day_buckets_include_today(timeline_client, auth_headers, db_path):
+    _insert(db_path, [("recent", "concept", "local", _hours_ago(0, seconds=30))])
+
+    data = timeline_client.get("/v1/memory/timeline?hours=48&bucket_size=day", headers=auth_headers).json()["data"]
+
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    assert data["buckets"][today] == 1
+    assert data["total"] == 1
+
+
+def test_sampling_is_deterministic_and_fills_bunched_buckets(db_path):
+    now = datetime.now(timezone.utc)
+    burst = now - timedelta(minutes=30)
+    # Every node shares one instant, so the time-stride probes all land on the same node
+    _insert(db_path, [(f"burst_{i:03d}", "concept", "local", burst) for i in range(100)])
+
+    buckets = memory._timeline_hour_buckets(now - timedelta(hours=3), now)
+    filters, params = memory._timeline_filters(None, None)
+
+    def sample():
+        with get_db_connection(db_path=db_path) as conn:
+            cursor = conn.cursor()
+            counts = memory._count_timeline_buckets(cursor, buckets, filters, params)
+            quotas = memory._allocate_timeline_samples(counts, 10)
+            rows = memory._sample_timeline_rows(cursor, buckets, quotas, filters, params)
+            return sorted(row["node_id"] for row in rows)
+
+    first = sample()
+    assert len(first) == 10
+    assert first == sample()
+
+
+def test_type_listing_pages_by_cursor_with_exact_total(timeline_client, auth_headers, db_path):
+    # Several nodes share an updated_at, so the node_id tiebreaker decides page boundaries
+    nodes = [(f"concept_{i:02d}", "concept", "local", _hours_ago(i // 3)) for i in range(25)]
+    nodes += [(f"obs_{i}", "observation", "local", _hours_ago(1)) for i in range(5)]
+    nodes += [("concept_identity", "concept", "identity", _hours_ago(0))]
+    _insert(db_path, nodes)
+
+    seen = []
+    body = {"type": "concept", "limit": 10}
+    for _ in range(5):
+        response = timeline_client.post("/v1/memory/query", json=body, headers=auth_headers)
+        assert response.status_code == 200
+        result = response.json()
+        assert result["metadata"]["total"] == 25
+        seen.extend(node["id"] for node in result["data"])
+        cursor = result["metadata"]["next_cursor"]
+        if cursor is None:
+            break
+        body = {"type": "concept", "limit": 10, "cursor": cursor}
+
+    assert len(seen) == 25
+    assert set(seen) == {f"concept_{i:02d}" for i in range(25)}
+    # Newest first
+    assert seen[:3] == ["concept_02", "concept_01", "concept_00"]
+
+
+def test_time_listing_filters_on_updated_at(timeline_client, auth_headers, db_path):
+    _insert(db_path, [("recent", "concept", "local", _hours_ago(1)), ("old", "concept", "local", _hours_ago(10))])
+
+    since = _hours_ago(5).isoformat()
+    result = timeline_client.post("/v1/memory/query", json={"since": since}, headers=auth_headers).json()
+
+    assert [node["id"] for node in result["data"]] == ["recent"]
+    assert result["metadata"]["total"] == 1
+    assert result["metadata"]["next_cursor"] is None
+
+
+def test_query_cursor_rejects_offset_and_non_listings(timeline_client, auth_headers, db_path):
+    cursor = memory._encode_query_cursor(_hours_ago(1).isoformat(), "concept_1")
+
+    response = timeline_client.post(
+        "/v1/memory/query", json={"type": "concept", "cursor": cursor, "offset": 5}, headers=auth_headers
+    )
+    assert response.status_code == 400
+
+    response = timeline_client.post("/v1/memory/query", json={"query": "x", "cursor": cursor}, headers=auth_headers)
+    assert response.status_code == 400
+
+    response = timeline_client.post("/v1/memory/query", json={"type": "concept", "cursor": "%%"}, headers=auth_headers)
+    assert response.status_code == 400
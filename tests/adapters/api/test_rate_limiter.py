@@ -0,0 +1,98 @@
+"""Tests for the API rate limiter and middleware."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from ciris_engine.logic.adapters.api.middleware import rate_limiter as rl
+from ciris_engine.logic.adapters.api.middleware.rate_limiter import RateLimiter, RateLimitMiddleware
+
+
+@pytest.mark.asyncio
+async def test_bucket_refills_on_monotonic_clock():
+    limiter = RateLimiter(requests_per_minute=60)
+    clock = [1000.0]
+    with patch.object(rl.time, "monotonic", side_effect=lambda: clock[0]):
+        for _ in range(60):
+            assert await limiter.check_rate_limit("client")
+        assert not await limiter.check_rate_limit("client")
+        assert limiter.get_retry_after("client") == 2
+
+        clock[0] += 2.0  # one token per second
+        assert await limiter.check_rate_limit("client")
+        assert await limiter.check_rate_limit("client")
+        assert not await limiter.check_rate_limit("client")
+
+        # Other clients have their own budget
+        assert await limiter.check_rate_limit("other")
+
+    metrics = limiter.get_metrics()
+    assert metrics["rate_limit_allowed"] == 63
+    assert metrics["rate_limit_rejected"] == 2
+    assert metrics["rate_limit_tracked_clients"] == 2
+
+
+@pytest.mark.asyncio
+async def test_costs_are_weighted_and_capped():
+    limiter = RateLimiter(requests_per_minute=10)
+    assert (await limiter.acquire("c", cost=4)).remaining == 6
+    assert (await limiter.acquire("c", cost=4)).allowed
+    decision = await limiter.acquire("c", cost=4)
+    assert not decision.allowed and decision.retry_after > 0
+
+    # A cost above the bucket size is capped so the route stays callable
+    assert (await limiter.acquire("fresh", cost=1000)).allowed
+    # Zero-cost requests never consume tokens
+    assert (await limiter.acquire("c", cost=0)).allowed
+
+
+def test_idle_buckets_are_swept_per_shard():
+    clock = [0.0]
+    with patch.object(rl.time, "monotonic", side_effect=lambda: clock[0]):
+        limiter = RateLimiter(requests_per_minute=60, shards=1)
+        limiter.try_acquire("idle")
+        clock[0] = rl.BUCKET_IDLE_SECONDS + rl.CLEANUP_INTERVAL_SECONDS + 1
+        limiter.try_acquire("active")
+    assert limiter.get_metrics()["rate_limit_tracked_clients"] == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_store_enforces_one_budget(tmp_path):
+    db_path = str(tmp_path / "rate_limit.db")
+    worker_a = RateLimiter(requests_per_minute=5, shared_db_path=db_path)
+    worker_b = RateLimiter(requests_per_minute=5, shared_db_path=db_path)
+
+    results = [await (worker_a if i % 2 else worker_b).check_rate_limit("client") for i in range(6)]
+    assert results == [True] * 5 + [False]
+    assert worker_b.get_metrics()["rate_limit_shared"] == 1.0
+
+
+def test_middleware_applies_route_costs():
+    middleware = RateLimitMiddleware(requests_per_minute=10, route_costs={"/v1/expensive": 10})
+    assert middleware.route_cost("/v1/agent/interact") == 5.0
+    assert middleware.route_cost("/v1/memory/visualize/graph") == 10.0
+    assert middleware.route_cost("/v1/agent/status") == 1.0
+    assert middleware.route_cost("/v1/expensive/sub") == 10
+
+    app = FastAPI()
+
+    @app.get("/v1/expensive")
+    async def expensive() -> dict:
+        return {}
+
+    @app.get("/v1/cheap")
+    async def cheap() -> dict:
+        return {}
+
+    @app.middleware("http")
+    async def limit(request, call_next):
+        return await middleware(request, call_next)
+
+    client = TestClient(app)
+    response = client.get("/v1/cheap")
+    assert response.status_code == 200
+    assert response.headers["X-RateLimit-Remaining"] == "9"
+    assert client.get("/v1/expensive").status_code == 429
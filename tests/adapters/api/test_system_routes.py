@@ -108,3 +108,19 @@ class TestSystemRoutes:
         """Test that invalid endpoints return 404."""
         response = client.get("/v1/system/invalid", headers=auth_headers)
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_startup_timeline_requires_auth(self, client):
+        """Test that startup timeline endpoint requires auth."""
+        response = client.get("/v1/system/startup")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_startup_timeline_with_auth(self, client, auth_headers):
+        """Test startup timeline endpoint with valid auth."""
+        response = client.get("/v1/system/startup", headers=auth_headers)
+        # May be 200 or 503 if initialization service not available
+        assert response.status_code in [status.HTTP_200_OK, status.HTTP_503_SERVICE_UNAVAILABLE]
+
+        if response.status_code == status.HTTP_200_OK:
+            data = response.json()["data"]
+            assert "services" in data
+            assert "cold_start_seconds" in data
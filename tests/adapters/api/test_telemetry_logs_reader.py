@@ -0,0 +1,131 @@
+"""Tests for the indexed telemetry log file reader."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from ciris_engine.logic.adapters.api.routes import telemetry_logs_index
+from ciris_engine.logic.adapters.api.routes.telemetry_logs_reader import LogFileReader
+
+BASE_TIME = datetime(2026, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def small_blocks(monkeypatch):
+    """Use tiny blocks so a few hundred lines span many of them."""
+    monkeypatch.setattr(telemetry_logs_index, "BLOCK_SIZE", 1024)
+
+
+def _line(seconds: int, level: str = "INFO", module: str = "ciris_engine.test", text: str = "") -> str:
+    timestamp = (BASE_TIME + timedelta(seconds=seconds)).strftime("%Y-%m-%d %H:%M:%S.%f")[:23]
+    return f"{timestamp} - {module} - {level} - {text or f'entry {seconds}'}\n"
+
+
+def _write_segment(logs_dir, name: str, seconds: range, **kwargs) -> None:
+    with open(logs_dir / name, "a") as f:
+        for second in seconds:
+            f.write(_line(second, **kwargs))
+
+
+@pytest.fixture
+def logs_dir(tmp_path):
+    _write_segment(tmp_path, "ciris_agent_20260101_115900.log", range(0, 150))
+    _write_segment(tmp_path, "ciris_agent_20260101_120230.log", range(150, 300))
+    (tmp_path / ".current_log").write_text(str(tmp_path / "ciris_agent_20260101_120230.log"))
+    (tmp_path / "incidents_20260101_120230.log").write_text("")
+    (tmp_path / ".current_incident_log").write_text(str(tmp_path / "incidents_20260101_120230.log"))
+    return tmp_path
+
+
+def _messages(entries):
+    return [entry.message for entry in entries]
+
+
+def test_pages_walk_back_across_segments(logs_dir):
+    reader = LogFileReader(str(logs_dir))
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        page = reader.read_page(limit=40, cursor=cursor)
+        seen = _messages(page.entries) + seen
+        pages += 1
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == [f"entry {i}" for i in range(300)]
+    assert pages == 8
+    assert reader.read_logs(limit=3)[-1].message == "entry 299"
+
+
+def test_cursor_is_stable_while_the_log_grows(logs_dir):
+    reader = LogFileReader(str(logs_dir))
+    first = reader.read_page(limit=10)
+    _write_segment(logs_dir, "ciris_agent_20260101_120230.log", range(300, 400))
+
+    second = reader.read_page(limit=10, cursor=first.next_cursor)
+    assert _messages(second.entries) == [f"entry {i}" for i in range(280, 290)]
+    assert reader.read_page(limit=1).entries[0].message == "entry 399"
+
+
+def test_filters_seek_to_matching_blocks(logs_dir, monkeypatch):
+    _write_segment(logs_dir, "ciris_agent_20260101_120230.log", range(300, 302), level="ERROR", module="discord.x")
+    _write_segment(logs_dir, "ciris_agent_20260101_120230.log", range(302, 450))
+    reader = LogFileReader(str(logs_dir))
+
+    scanned = []
+    scan_range = reader._scan_range
+
+    def counting_scan(path, start, end, query):
+        scanned.append(end - start)
+        return scan_range(path, start, end, query)
+
+    monkeypatch.setattr(reader, "_scan_range", counting_scan)
+
+    errors = reader.read_page(level="ERROR", limit=10)
+    assert _messages(errors.entries) == ["entry 300", "entry 301"]
+    assert errors.next_cursor is None
+    # Only the tail and the block holding the errors are parsed, not the whole log
+    assert sum(scanned) < 3 * telemetry_logs_index.BLOCK_SIZE
+
+    window = reader.read_page(
+        service="ciris_engine",
+        start_time=BASE_TIME + timedelta(seconds=100),
+        end_time=BASE_TIME + timedelta(seconds=104),
+    )
+    assert _messages(window.entries) == [f"entry {i}" for i in range(100, 105)]
+
+    index_file = logs_dir / ".index" / "ciris_agent_20260101_115900.log.idx"
+    assert index_file.exists()
+
+
+def test_index_is_reused_from_sidecar(logs_dir, monkeypatch):
+    LogFileReader(str(logs_dir)).read_page(level="ERROR")
+
+    reader = LogFileReader(str(logs_dir))
+    indexed = []
+    extend = telemetry_logs_index.LogSegmentIndex._extend
+    monkeypatch.setattr(
+        telemetry_logs_index.LogSegmentIndex, "_extend", lambda self, size: indexed.append(self) or extend(self, size)
+    )
+    reader.read_page(level="ERROR")
+    assert indexed == []
+
+
+def test_rotated_segment_is_reindexed(logs_dir):
+    reader = LogFileReader(str(logs_dir))
+    assert reader.read_page(level="WARNING").entries == []
+
+    # Rotated in place: the file is replaced with shorter, different content
+    segment = logs_dir / "ciris_agent_20260101_120230.log"
+    segment.write_text("")
+    _write_segment(logs_dir, segment.name, range(500, 600), level="WARNING")
+
+    page = reader.read_page(level="WARNING", limit=200)
+    assert _messages(page.entries) == [f"entry {i}" for i in range(500, 600)]
+
+
+def test_invalid_cursor_is_rejected(logs_dir):
+    with pytest.raises(ValueError, match="Invalid log cursor"):
+        LogFileReader(str(logs_dir)).read_page(cursor="not-a-cursor")
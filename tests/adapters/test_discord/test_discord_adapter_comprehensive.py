@@ -11,6 +11,7 @@ import pytest
 
 from ciris_engine.logic.adapters.discord.config import DiscordAdapterConfig
 from ciris_engine.logic.adapters.discord.discord_adapter import DiscordAdapter
+from ciris_engine.logic.adapters.discord.discord_outbound_queue import MessagePriority
 from ciris_engine.logic.adapters.discord.discord_reaction_handler import ApprovalStatus
 from ciris_engine.logic.persistence import initialize_database
 from ciris_engine.schemas.adapters.tools import ToolExecutionResult, ToolExecutionStatus
@@ -154,9 +155,12 @@ class TestDiscordAdapterCore:
         result = await discord_adapter.send_message("123456789", "Test message")
 
         assert result is True
-        discord_adapter._message_handler.send_message_to_channel.assert_called_once_with("123456789", "Test message")
+        discord_adapter._message_handler.send_message_to_channel.assert_called_once_with(
+            "123456789", "Test message", MessagePriority.NORMAL
+        )
 
-        # Check telemetry was emitted
+        # Check telemetry was emitted once the side effects drained
+        await discord_adapter._side_effects.flush()
         discord_adapter.bus_manager.memory.memorize_metric.assert_called()
 
     @pytest.mark.asyncio
@@ -11,6 +11,7 @@ import pytest
 import pytest_asyncio
 
 from ciris_engine.logic.adapters.discord.discord_adapter import DiscordAdapter
+from ciris_engine.logic.adapters.discord.discord_outbound_queue import MessagePriority
 from ciris_engine.logic.persistence import initialize_database
 from ciris_engine.logic.services.lifecycle.time import TimeService
 from ciris_engine.schemas.adapters.tools import ToolExecutionResult, ToolExecutionStatus, ToolInfo, ToolParameterSchema
@@ -123,9 +124,12 @@ class TestDiscordAdapter:
         result = await adapter.send_message("123456789", "Test message")
 
         assert result is True
-        adapter._message_handler.send_message_to_channel.assert_called_once_with("123456789", "Test message")
+        adapter._message_handler.send_message_to_channel.assert_called_once_with(
+            "123456789", "Test message", MessagePriority.NORMAL
+        )
 
-        # Check telemetry was emitted
+        # Check telemetry was emitted once the side effects drained
+        await adapter._side_effects.flush()
         mock_bus_manager.memory.memorize_metric.assert_called()
         call_args = mock_bus_manager.memory.memorize_metric.call_args
         assert call_args[1]["metric_name"] == "discord.message.sent"
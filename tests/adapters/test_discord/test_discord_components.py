@@ -1,5 +1,9 @@
 """Unit tests for individual Discord adapter components."""
 
+import asyncio
+import hashlib
+import io
+import json
 from datetime import datetime, timedelta, timezone
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
@@ -69,6 +73,132 @@ class TestDiscordVisionHelper:
             result = await helper.process_message_images(mock_message)
             assert result is None
 
+    @staticmethod
+    def _attachment(filename: str, content_type: str = "image/png") -> Mock:
+        attachment = Mock()
+        attachment.content_type = content_type
+        attachment.filename = filename
+        attachment.size = 1024
+        attachment.url = f"https://example.com/{filename}"
+        return attachment
+
+    @pytest.mark.asyncio
+    async def test_reposted_image_described_once(self, tmp_path: Any) -> None:
+        """Descriptions are cached by image content and survive a restart."""
+        describer = AsyncMock(return_value="A cat")
+        cache_path = str(tmp_path / "vision_cache.json")
+        helper = DiscordVisionHelper(describer=describer, cache_path=cache_path)
+        assert helper.is_available() is True
+
+        message = Mock()
+        message.attachments = [self._attachment("cat.png"), self._attachment("cat_again.png")]
+        with patch.object(helper, "_download_image", AsyncMock(return_value=b"same bytes")):
+            result = await helper.process_message_images(message)
+
+        assert result is not None
+        assert "Image 'cat.png': A cat" in result
+        assert "Image 'cat_again.png': A cat" in result
+        assert describer.await_count == 1
+
+        restarted = DiscordVisionHelper(describer=describer, cache_path=cache_path)
+        with patch.object(restarted, "_download_image", AsyncMock(return_value=b"same bytes")):
+            assert await restarted._process_single_image(self._attachment("cat.png")) == "A cat"
+        assert describer.await_count == 1
+        assert restarted.get_status()["cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self) -> None:
+        """The description cache is bounded."""
+        helper = DiscordVisionHelper(describer=AsyncMock(return_value="described"), cache_max_entries=2)
+        for content in (b"one", b"two", b"one", b"three"):
+            with patch.object(helper, "_download_image", AsyncMock(return_value=content)):
+                await helper._process_single_image(self._attachment("img.png"))
+
+        assert helper.get_status()["cache_size"] == 2
+        assert helper.get_status()["api_calls"] == 3
+        assert helper._cache_get(hashlib.sha256(b"one").hexdigest()) == "described"
+        assert helper._cache_get(hashlib.sha256(b"two").hexdigest()) is None
+
+    @pytest.mark.asyncio
+    async def test_images_processed_concurrently_with_cap(self) -> None:
+        """Attachments are described in parallel, at most max_concurrent at a time."""
+        active = 0
+        peak = 0
+
+        async def describer(image_data: bytes, content_type: str) -> str:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return image_data.decode()
+
+        helper = DiscordVisionHelper(describer=describer, max_concurrent=2)
+        message = Mock()
+        message.attachments = [self._attachment(f"{i}.png") for i in range(5)]
+
+        async def download(url: str) -> bytes:
+            return url.rsplit("/", 1)[-1].encode()
+
+        with patch.object(helper, "_download_image", side_effect=download):
+            result = await helper.process_message_images(message)
+
+        assert peak == 2
+        assert result is not None
+        assert [line.split(":")[0] for line in result.split("\n\n")] == [f"Image '{i}.png'" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_large_images_downscaled_before_upload(self) -> None:
+        """Images over max_dimension are shrunk before they reach the vision API."""
+        from PIL import Image
+
+        buffer = io.BytesIO()
+        Image.effect_noise((2048, 1536), 64).convert("RGB").save(buffer, format="PNG")
+        original = buffer.getvalue()
+        uploaded = {}
+
+        async def describer(image_data: bytes, content_type: str) -> str:
+            uploaded["size"] = Image.open(io.BytesIO(image_data)).size
+            uploaded["content_type"] = content_type
+            return "noise"
+
+        helper = DiscordVisionHelper(describer=describer, max_dimension=512)
+        with patch.object(helper, "_download_image", AsyncMock(return_value=original)):
+            assert await helper._process_single_image(self._attachment("noise.png")) == "noise"
+
+        assert uploaded == {"size": (512, 384), "content_type": "image/jpeg"}
+        assert helper.get_status()["bytes_uploaded"] < len(original)
+
+    @pytest.mark.asyncio
+    async def test_download_failure_not_cached(self) -> None:
+        """Failed downloads are reported and retried on the next request."""
+        describer = AsyncMock(return_value="described")
+        helper = DiscordVisionHelper(describer=describer)
+        response = AsyncMock()
+        response.status = 404
+        session = Mock()
+        session.get.return_value.__aenter__ = AsyncMock(return_value=response)
+        session.get.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        with patch.object(helper, "_get_session", return_value=session):
+            result = await helper._process_single_image(self._attachment("gone.png"))
+
+        assert result == "Failed to download image (HTTP 404)"
+        describer.assert_not_awaited()
+        assert helper.get_status()["cache_size"] == 0
+        await helper.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cache_saves_keep_the_newest(self, tmp_path: Any) -> None:
+        """Saves racing in worker threads never leave temp files or an older snapshot behind."""
+        cache_path = tmp_path / "vision_cache.json"
+        helper = DiscordVisionHelper(describer=AsyncMock(), cache_path=str(cache_path))
+
+        await asyncio.gather(*(helper._cache_put(f"digest{i}", f"image {i}") for i in range(20)))
+
+        assert json.loads(cache_path.read_text()) == {f"digest{i}": f"image {i}" for i in range(20)}
+        assert [path.name for path in tmp_path.iterdir()] == ["vision_cache.json"]
+
 
 class TestDiscordErrorHandler:
     """Test Discord error handling."""
@@ -172,6 +302,32 @@ class TestDiscordRateLimiter:
         stats = rate_limiter.get_stats()
         assert stats["requests"] >= 0
 
+    @pytest.mark.asyncio
+    async def test_channels_have_separate_buckets(self, rate_limiter: DiscordRateLimiter) -> None:
+        """Message buckets are per channel, as Discord keys them by major parameter."""
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            for _ in range(5):
+                await rate_limiter.acquire("channels/111/messages", "POST")
+            await rate_limiter.acquire("channels/222/messages", "POST")
+            assert not mock_sleep.called
+
+            await rate_limiter.acquire("channels/111/messages", "POST")
+            assert mock_sleep.called
+        assert rate_limiter.get_stats()["buckets_tracked"] == 2
+
+    @pytest.mark.asyncio
+    async def test_headers_drive_bucket(self, rate_limiter: DiscordRateLimiter) -> None:
+        """A bucket reported exhausted by Discord makes the next request wait for its reset."""
+        rate_limiter.update_from_response(
+            "channels/111/messages",
+            {"X-RateLimit-Limit": "5", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "2.0"},
+        )
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await rate_limiter.acquire("channels/111/messages", "POST")
+            wait_time = mock_sleep.call_args[0][0]
+        assert 1.5 < wait_time <= 2.0 * (1 + rate_limiter.safety_margin)
+
 
 class TestDiscordEmbedFormatter:
     """Test Discord embed formatting."""
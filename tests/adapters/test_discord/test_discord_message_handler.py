@@ -9,6 +9,7 @@ import discord
 import pytest
 
 from ciris_engine.logic.adapters.discord.discord_message_handler import DiscordMessageHandler
+from ciris_engine.logic.adapters.discord.discord_outbound_queue import MessagePriority
 from ciris_engine.schemas.runtime.messages import FetchedMessage
 
 
@@ -44,6 +45,24 @@ class TestDiscordMessageHandler:
         await handler.send_message_to_channel("123456789", "Hello world")
         mock_channel.send.assert_called_once_with("Hello world")
 
+    @pytest.mark.asyncio
+    async def test_send_chunks_paced_by_rate_limiter(self, mock_bot):
+        """With a rate limiter, chunks wait for the channel bucket instead of a fixed delay."""
+        rate_limiter = Mock()
+        rate_limiter.acquire = AsyncMock()
+        handler = DiscordMessageHandler(mock_bot, rate_limiter)
+        mock_channel = Mock(id=123456789)
+        mock_channel.send = AsyncMock(return_value=Mock(id=123))
+        mock_bot.get_channel.return_value = mock_channel
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await handler.send_message_to_channel("123456789", "line\n" * 1000)
+
+        assert mock_channel.send.call_count == 3
+        assert rate_limiter.acquire.await_count == 3
+        rate_limiter.acquire.assert_awaited_with("channels/123456789/messages", "POST", MessagePriority.NORMAL)
+        mock_sleep.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_send_message_channel_not_found(self, handler, mock_bot):
         """Test sending message when channel not found."""
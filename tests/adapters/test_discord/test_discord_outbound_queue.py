@@ -0,0 +1,212 @@
+"""Tests for the Discord outbound message queue."""
+
+import asyncio
+from typing import List, Tuple
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ciris_engine.logic.adapters.discord.discord_guidance_handler import DiscordGuidanceHandler
+from ciris_engine.logic.adapters.discord.discord_outbound_queue import DiscordOutboundQueue, MessagePriority
+from ciris_engine.logic.adapters.discord.discord_rate_limiter import DiscordRateLimiter, RateLimitBucket
+
+
+class RecordingSender:
+    """Records sends; the first send blocks until released so others pile up behind it."""
+
+    def __init__(self) -> None:
+        self.sent: List[Tuple[str, str]] = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, channel_id: str, content: str) -> None:
+        if not self.sent:
+            self.sent.append((channel_id, content))
+            await self.release.wait()
+            return
+        self.sent.append((channel_id, content))
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_guidance_overtakes_queued_replies():
+    sender = RecordingSender()
+    queue = DiscordOutboundQueue(sender, max_coalesce=1)
+
+    first = asyncio.create_task(queue.send("chan", "reply 1"))
+    await _settle()
+    rest = [
+        asyncio.create_task(queue.send("chan", "reply 2")),
+        asyncio.create_task(queue.send("chan", "deferral", MessagePriority.GUIDANCE)),
+    ]
+    await _settle()
+    assert queue.get_stats()["outbound_queue_depth"] == 2.0
+
+    sender.release.set()
+    await asyncio.gather(first, *rest)
+    assert [content for _, content in sender.sent] == ["reply 1", "deferral", "reply 2"]
+
+
+@pytest.mark.asyncio
+async def test_queued_replies_are_coalesced():
+    sender = RecordingSender()
+    queue = DiscordOutboundQueue(sender, max_length=20)
+
+    first = asyncio.create_task(queue.send("chan", "first"))
+    await _settle()
+    rest = [asyncio.create_task(queue.send("chan", text)) for text in ("a", "b", "this one is too long")]
+    await _settle()
+
+    sender.release.set()
+    await asyncio.gather(first, *rest)
+    assert [content for _, content in sender.sent] == ["first", "a\n\nb", "this one is too long"]
+
+    stats = queue.get_stats()
+    assert stats["outbound_messages_sent"] == 4.0
+    assert stats["outbound_messages_coalesced"] == 1.0
+    assert stats["outbound_queue_depth"] == 0.0
+    assert stats["outbound_max_queue_ms"] > 0.0
+
+
+@pytest.mark.asyncio
+async def test_guidance_messages_are_not_coalesced():
+    sender = RecordingSender()
+    queue = DiscordOutboundQueue(sender)
+
+    first = asyncio.create_task(queue.send("chan", "first"))
+    await _settle()
+    rest = [asyncio.create_task(queue.send("chan", text, MessagePriority.GUIDANCE)) for text in ("g1", "g2")]
+    await _settle()
+
+    sender.release.set()
+    await asyncio.gather(first, *rest)
+    assert [content for _, content in sender.sent] == ["first", "g1", "g2"]
+
+
+@pytest.mark.asyncio
+async def test_channels_do_not_wait_on_each_other():
+    sender = RecordingSender()
+    queue = DiscordOutboundQueue(sender)
+
+    blocked = asyncio.create_task(queue.send("slow", "stuck"))
+    await _settle()
+    await asyncio.wait_for(queue.send("fast", "hello"), timeout=1)
+    assert ("fast", "hello") in sender.sent
+
+    sender.release.set()
+    await blocked
+    await queue.drain()
+    assert queue.get_stats()["outbound_channels_active"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_delivery_errors_reach_the_sender():
+    async def failing_send(channel_id: str, content: str) -> None:
+        raise RuntimeError("channel gone")
+
+    queue = DiscordOutboundQueue(failing_send)
+    with pytest.raises(RuntimeError, match="channel gone"):
+        await queue.send("chan", "hello")
+    assert queue.get_stats()["outbound_messages_failed"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_sender_message_is_dropped():
+    sender = RecordingSender()
+    queue = DiscordOutboundQueue(sender)
+
+    first = asyncio.create_task(queue.send("chan", "first"))
+    await _settle()
+    abandoned = asyncio.create_task(queue.send("chan", "never mind"))
+    await _settle()
+    abandoned.cancel()
+
+    sender.release.set()
+    await first
+    await queue.drain()
+    assert [content for _, content in sender.sent] == ["first"]
+
+
+@pytest.mark.asyncio
+async def test_submitted_operations_return_their_result_in_turn():
+    sender = RecordingSender()
+    queue = DiscordOutboundQueue(sender)
+
+    first = asyncio.create_task(queue.send("chan", "reply"))
+    await _settle()
+
+    async def send_embed() -> str:
+        sender.sent.append(("chan", "embed"))
+        return "sent message"
+
+    operation = asyncio.create_task(queue.submit("chan", send_embed))
+    queued_reply = asyncio.create_task(queue.send("chan", "later reply"))
+    await _settle()
+
+    sender.release.set()
+    assert await operation == "sent message"
+    await asyncio.gather(first, queued_reply)
+    assert [content for _, content in sender.sent] == ["reply", "embed", "later reply"]
+
+
+@pytest.mark.asyncio
+async def test_guidance_overtakes_replies_queued_in_other_channels():
+    limiter = DiscordRateLimiter(safety_margin=0.0)
+    limiter._global_bucket = RateLimitBucket(1, 0.05)
+    sent: List[str] = []
+
+    async def deliver(channel_id: str, content: str) -> None:
+        await limiter.acquire(f"channels/{channel_id}/messages", "POST")
+        sent.append(content)
+
+    queue = DiscordOutboundQueue(deliver)
+    replies = [asyncio.create_task(queue.send(str(100 + i), f"reply {i}")) for i in range(3)]
+    await _settle()
+    # One reply took the only global slot, the others wait for the bucket to refill
+    assert sent == ["reply 0"]
+
+    deferral_channel = Mock(id=999)
+    deferral_channel.send = AsyncMock(side_effect=lambda content: sent.append(content))
+    handler = DiscordGuidanceHandler(outbound_queue=queue, rate_limiter=limiter)
+
+    await asyncio.gather(handler.send_guidance("999", deferral_channel, "deferral"), *replies)
+    assert sent == ["reply 0", "deferral", "reply 1", "reply 2"]
+
+
+@pytest.mark.asyncio
+async def test_channel_id_formats_share_one_queue():
+    sender = RecordingSender()
+    queue = DiscordOutboundQueue(sender, max_coalesce=1)
+
+    first = asyncio.create_task(queue.send("discord_42_1234", "first"))
+    await _settle()
+    rest = [
+        asyncio.create_task(queue.send("1234", "second")),
+        asyncio.create_task(queue.send("discord_1234", "deferral", MessagePriority.GUIDANCE)),
+    ]
+    await _settle()
+    assert queue.get_stats()["outbound_channels_active"] == 1.0
+
+    sender.release.set()
+    await asyncio.gather(first, *rest)
+    assert sender.sent == [("discord_42_1234", "first"), ("discord_1234", "deferral"), ("1234", "second")]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_worker_releases_its_senders():
+    sender = RecordingSender()
+    queue = DiscordOutboundQueue(sender)
+
+    in_flight = asyncio.create_task(queue.send("chan", "first"))
+    await _settle()
+    queued = asyncio.create_task(queue.send("chan", "second"))
+    await _settle()
+
+    queue._workers["chan"].cancel()
+    results = await asyncio.wait_for(asyncio.gather(in_flight, queued, return_exceptions=True), timeout=1)
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    assert queue.get_stats()["outbound_queue_depth"] == 0.0
+    assert queue.get_stats()["outbound_channels_active"] == 0.0
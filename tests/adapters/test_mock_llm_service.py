@@ -24,3 +24,51 @@ async def test_mock_llm_structured_outputs():
     assert isinstance(await client._create(response_model=EpistemicHumilityResult), EpistemicHumilityResult)
     assert isinstance(await client._create(response_model=EntropyCheckResult), EntropyCheckResult)
     assert isinstance(await client._create(response_model=CoherenceCheckResult), CoherenceCheckResult)
+
+
+@pytest.mark.asyncio
+async def test_mock_llm_service_simulates_provider_latency_and_failures(monkeypatch):
+    from ciris_modular_services.mock_llm.service import MockLLMService
+
+    monkeypatch.setenv("CIRIS_MOCK_LLM_FAILURE_RATE", "0.5")
+    monkeypatch.setenv("CIRIS_MOCK_LLM_SEED", "7")
+    service = MockLLMService(delay_ms=1)
+    await service.start()
+    try:
+        assert service.mock_config.delay_ms == 1
+        assert service.mock_config.failure_rate == 0.5
+
+        outcomes = []
+        for _ in range(20):
+            try:
+                await service.call_llm_structured([{"role": "user", "content": "hi"}], EthicalDMAResult)
+                outcomes.append(True)
+            except RuntimeError:
+                outcomes.append(False)
+
+        details = service.get_status()["details"]
+        assert details["response_count"] == 20
+        assert details["failure_count"] == outcomes.count(False) > 0
+        assert details["average_delay_ms"] == 1.0
+
+        # The same seed reproduces the same failure sequence
+        replay = MockLLMService(delay_ms=1)
+        await replay.start()
+        replayed = []
+        for _ in range(20):
+            try:
+                await replay.call_llm_structured([{"role": "user", "content": "hi"}], EthicalDMAResult)
+                replayed.append(True)
+            except RuntimeError:
+                replayed.append(False)
+        assert replayed == outcomes
+    finally:
+        await service.stop()
+
+
+def test_mock_llm_service_defaults_to_no_simulation():
+    from ciris_modular_services.mock_llm.service import MockLLMService
+
+    config = MockLLMService().mock_config
+    assert config.delay_ms == 0
+    assert config.failure_rate == 0.0
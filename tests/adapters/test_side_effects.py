@@ -0,0 +1,168 @@
+"""Tests for the post-delivery side-effect pipeline."""
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from ciris_engine.logic.adapters.side_effects import SideEffectPipeline, get_channel_correlations
+from ciris_engine.schemas.telemetry.core import ServiceCorrelation, ServiceCorrelationStatus, ServiceRequestData
+
+
+def _correlation(channel_id=None) -> ServiceCorrelation:
+    now = datetime.now(timezone.utc)
+    request_data = None
+    if channel_id:
+        request_data = ServiceRequestData(
+            service_type="communication",
+            method_name="send_message",
+            channel_id=channel_id,
+            parameters={"content": "reply"},
+            request_timestamp=now,
+        )
+    return ServiceCorrelation(
+        correlation_id=str(uuid.uuid4()),
+        service_type="test",
+        handler_name="TestAdapter",
+        action_type="speak",
+        request_data=request_data,
+        status=ServiceCorrelationStatus.COMPLETED,
+        created_at=now,
+        updated_at=now,
+        timestamp=now,
+    )
+
+
+@pytest.mark.asyncio
+async def test_correlations_are_batched():
+    pipeline = SideEffectPipeline("test", batch_size=10)
+    with patch("ciris_engine.logic.persistence") as mock_persistence:
+        correlations = [_correlation() for _ in range(5)]
+        for correlation in correlations:
+            await pipeline.record_correlation(correlation)
+        await pipeline.flush()
+
+        written = [c for call in mock_persistence.add_correlations.call_args_list for c in call[0][0]]
+        assert written == correlations
+        assert mock_persistence.add_correlations.call_count < 5
+        assert pipeline.get_metrics()["side_effect_correlations_written"] == 5.0
+    await pipeline.stop()
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried_row_by_row():
+    pipeline = SideEffectPipeline("test")
+    with patch("ciris_engine.logic.persistence") as mock_persistence:
+        good, bad = _correlation(), _correlation()
+
+        def add_correlation(correlation, *args):
+            if correlation is bad:
+                raise Exception("bad row")
+            return correlation.correlation_id
+
+        mock_persistence.add_correlations.side_effect = Exception("constraint failed")
+        mock_persistence.add_correlation.side_effect = add_correlation
+
+        await pipeline.record_correlation(good)
+        await pipeline.record_correlation(bad)
+        await pipeline.flush()
+
+        metrics = pipeline.get_metrics()
+        assert metrics["side_effect_correlations_written"] == 1.0
+        assert metrics["side_effect_failures"] == 1.0
+    await pipeline.stop()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_applies_backpressure():
+    pipeline = SideEffectPipeline("test", max_pending=1, batch_size=1)
+    release = asyncio.Event()
+    ran = []
+
+    async def slow():
+        await release.wait()
+        ran.append("slow")
+
+    async def fast():
+        ran.append("fast")
+
+    await pipeline.run(slow)
+    await asyncio.sleep(0)  # worker picks up the slow effect
+    await pipeline.run(fast)  # fills the queue
+    blocked = asyncio.create_task(pipeline.run(fast))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    release.set()
+    await blocked
+    await pipeline.flush()
+    assert ran == ["slow", "fast", "fast"]
+    assert pipeline.get_metrics()["side_effect_backpressure_waits"] == 1.0
+    await pipeline.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_and_later_effects_run_inline():
+    pipeline = SideEffectPipeline("test")
+    ran = []
+
+    async def effect():
+        ran.append(len(ran))
+
+    await pipeline.run(effect)
+    await pipeline.stop()
+    assert ran == [0]
+
+    await pipeline.run(effect)
+    assert ran == [0, 1]
+    assert pipeline.get_metrics()["side_effects_run"] == 2.0
+
+
+@pytest.mark.asyncio
+async def test_flush_drains_queue_when_worker_is_gone():
+    pipeline = SideEffectPipeline("test")
+    ran = []
+
+    async def effect():
+        ran.append("ran")
+
+    await pipeline.run(effect)
+    pipeline._worker.cancel()  # worker dies before it picks the effect up
+    await asyncio.sleep(0)
+
+    await pipeline.flush()
+    assert ran == ["ran"]
+    assert pipeline.get_metrics()["side_effects_pending"] == 0.0
+    await pipeline.stop()
+
+
+@pytest.mark.asyncio
+async def test_channel_history_includes_queued_correlations():
+    pipeline = SideEffectPipeline("test")
+    release = asyncio.Event()
+
+    async def blocker():
+        await release.wait()
+
+    with patch("ciris_engine.logic.persistence") as mock_persistence:
+        persisted = _correlation("chan_1")
+        mock_persistence.get_correlations_by_channel.return_value = [persisted]
+
+        await pipeline.run(blocker)
+        await asyncio.sleep(0)  # worker is busy, so the reply stays queued
+        reply = _correlation("chan_1")
+        await pipeline.record_correlation(reply)
+        await pipeline.record_correlation(_correlation("chan_2"))
+
+        assert pipeline.pending_for_channel("chan_1") == [reply]
+        history = get_channel_correlations("chan_1", limit=10)
+        assert [c.correlation_id for c in history] == [persisted.correlation_id, reply.correlation_id]
+
+        release.set()
+        await pipeline.flush()
+        assert pipeline.pending_for_channel("chan_1") == []
+        mock_persistence.get_correlations_by_channel.return_value = [persisted, reply]
+        assert get_channel_correlations("chan_1", limit=10) == [persisted, reply]
+    await pipeline.stop()
@@ -14,6 +14,7 @@ from ciris_engine.logic.adapters.discord.config import DiscordAdapterConfig
 from ciris_engine.logic.adapters.discord.discord_adapter import DiscordAdapter
 from ciris_engine.logic.adapters.discord.discord_error_handler import DiscordErrorHandler
 from ciris_engine.logic.adapters.discord.discord_observer import DiscordObserver
+from ciris_engine.logic.adapters.discord.discord_outbound_queue import MessagePriority
 from ciris_engine.logic.persistence import initialize_database
 from ciris_engine.schemas.services.core import ServiceCapabilities, ServiceStatus
 
@@ -156,7 +157,9 @@ class TestDiscordAdapter:
         result = await discord_adapter.send_message("test_channel", "Test message")
 
         assert result is True
-        discord_adapter._message_handler.send_message_to_channel.assert_called_once_with("test_channel", "Test message")
+        discord_adapter._message_handler.send_message_to_channel.assert_called_once_with(
+            "test_channel", "Test message", MessagePriority.NORMAL
+        )
 
     @pytest.mark.asyncio
     async def test_send_message_with_embed(self, discord_adapter: DiscordAdapter) -> None:
@@ -173,7 +176,9 @@ class TestDiscordAdapter:
         result = await discord_adapter.send_message("test_channel", "Test message")
 
         assert result is True
-        discord_adapter._message_handler.send_message_to_channel.assert_called_once_with("test_channel", "Test message")
+        discord_adapter._message_handler.send_message_to_channel.assert_called_once_with(
+            "test_channel", "Test message", MessagePriority.NORMAL
+        )
 
     @pytest.mark.asyncio
     async def test_send_message_too_long(self, discord_adapter: DiscordAdapter) -> None:
@@ -0,0 +1,88 @@
+"""Tests for the streaming audit export."""
+
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ciris_engine.logic.audit import export_stream
+from ciris_engine.logic.audit.export_stream import stream_audit_export
+from ciris_engine.logic.buses.memory_bus import MemoryBus
+from ciris_engine.logic.services.graph.audit_service import GraphAuditService
+from ciris_engine.logic.services.lifecycle.time import TimeService
+from ciris_engine.schemas.services.graph.audit import AuditEventData
+from ciris_engine.schemas.services.operations import MemoryOpResult, MemoryOpStatus
+
+
+@pytest.fixture
+async def audit_service(tmp_path):
+    bus = Mock(spec=MemoryBus)
+    bus.memorize = AsyncMock(return_value=MemoryOpResult(status=MemoryOpStatus.OK, error=None))
+    service = GraphAuditService(
+        memory_bus=bus,
+        time_service=TimeService(),
+        db_path=str(tmp_path / "audit.db"),
+        key_path=str(tmp_path / "keys"),
+        enable_hash_chain=True,
+    )
+    await service.start()
+    for i in range(7):
+        await service.log_event(f"event_{i}", AuditEventData(entity_id=f"e{i}", actor="tester"))
+    yield service
+    await service.stop()
+
+
+async def _collect(stream):
+    return b"".join([chunk async for chunk in stream])
+
+
+async def test_ndjson_streams_in_chunks(audit_service):
+    chunks = [c async for c in stream_audit_export(str(audit_service.db_path), "ndjson", chunk_size=3)]
+    assert len(chunks) == 3
+
+    rows = [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+    assert [r["sequence_number"] for r in rows] == list(range(1, 8))
+    assert rows[0]["event_type"] == "event_0"
+
+
+async def test_csv_and_columnar(audit_service):
+    data = await _collect(stream_audit_export(str(audit_service.db_path), "csv", chunk_size=2))
+    rows = list(csv.DictReader(io.StringIO(data.decode())))
+    assert len(rows) == 7
+    assert rows[-1]["event_type"] == "event_6"
+
+    data = await _collect(stream_audit_export(str(audit_service.db_path), "columnar", chunk_size=4))
+    batches = [json.loads(line) for line in data.decode().splitlines()]
+    assert [b["rows"] for b in batches] == [4, 3]
+    assert batches[1]["columns"]["sequence_number"] == [5, 6, 7]
+
+
+async def test_gzip_compression(audit_service):
+    data = await _collect(stream_audit_export(str(audit_service.db_path), "ndjson", "gzip", chunk_size=2))
+    assert len(gzip.decompress(data).decode().splitlines()) == 7
+
+
+async def test_time_range_filter(audit_service):
+    future = datetime.now(timezone.utc) + timedelta(hours=1)
+    data = await _collect(stream_audit_export(str(audit_service.db_path), "ndjson", start_time=future))
+    assert data == b""
+
+
+@pytest.mark.skipif(not export_stream.PYARROW_AVAILABLE, reason="pyarrow not installed")
+async def test_parquet_row_groups(audit_service):
+    import pyarrow.parquet
+
+    data = await _collect(stream_audit_export(str(audit_service.db_path), "parquet", chunk_size=3))
+    parquet_file = pyarrow.parquet.ParquetFile(io.BytesIO(data))
+    assert parquet_file.metadata.num_rows == 7
+    assert parquet_file.metadata.num_row_groups == 3
+
+
+async def test_service_rejects_unavailable_options(audit_service, monkeypatch):
+    monkeypatch.setattr(export_stream, "ZSTD_AVAILABLE", False)
+    with pytest.raises(ValueError, match="zstandard"):
+        await _collect(audit_service.stream_audit_export(compression="zstd"))
@@ -0,0 +1,47 @@
+"""Tests for Merkle helpers used by batched audit signing."""
+
+import hashlib
+
+import pytest
+
+from ciris_engine.logic.audit.merkle import (
+    decode_proof,
+    encode_proof,
+    merkle_proofs,
+    merkle_root,
+    verify_merkle_proof,
+)
+
+
+def _hashes(count):
+    return [hashlib.sha256(str(i).encode()).hexdigest() for i in range(count)]
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 5, 8, 13])
+def test_every_entry_proves_inclusion(count):
+    leaves = _hashes(count)
+    root = merkle_root(leaves)
+    proofs = merkle_proofs(leaves)
+
+    assert len(proofs) == count
+    for leaf, proof in zip(leaves, proofs):
+        assert verify_merkle_proof(leaf, decode_proof(encode_proof(proof)), root)
+
+
+def test_tampered_entry_fails_proof():
+    leaves = _hashes(6)
+    root = merkle_root(leaves)
+    proof = merkle_proofs(leaves)[2]
+
+    assert not verify_merkle_proof(_hashes(7)[6], proof, root)
+    assert not verify_merkle_proof(leaves[3], proof, root)
+
+
+def test_root_depends_on_order():
+    leaves = _hashes(4)
+    assert merkle_root(leaves) != merkle_root(list(reversed(leaves)))
+
+
+def test_empty_batch_rejected():
+    with pytest.raises(ValueError):
+        merkle_root([])
@@ -0,0 +1,153 @@
+"""Tests for incremental and parallel audit chain verification."""
+
+import sqlite3
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ciris_engine.logic.audit.verifier import AuditVerifier
+from ciris_engine.logic.buses.memory_bus import MemoryBus
+from ciris_engine.logic.services.graph.audit_service import GraphAuditService
+from ciris_engine.logic.services.lifecycle.time import TimeService
+from ciris_engine.schemas.services.graph.audit import AuditEventData
+from ciris_engine.schemas.services.operations import MemoryOpResult, MemoryOpStatus
+
+
+@pytest.fixture
+def time_service():
+    return TimeService()
+
+
+@pytest.fixture
+async def audit_service(tmp_path, time_service):
+    bus = Mock(spec=MemoryBus)
+    bus.memorize = AsyncMock(return_value=MemoryOpResult(status=MemoryOpStatus.OK, error=None))
+    service = GraphAuditService(
+        memory_bus=bus,
+        time_service=time_service,
+        db_path=str(tmp_path / "audit.db"),
+        key_path=str(tmp_path / "keys"),
+        enable_hash_chain=True,
+    )
+    await service.start()
+    yield service
+    await service.stop()
+
+
+async def _log(service, count, prefix="event"):
+    for i in range(count):
+        await service.log_event(f"{prefix}_{i}", AuditEventData(entity_id=f"{prefix}{i}", actor="tester"))
+
+
+async def test_incremental_verification_resumes_from_checkpoint(audit_service):
+    await _log(audit_service, 4)
+    verifier = audit_service.verifier
+
+    first = verifier.verify_complete_chain()
+    assert first.valid
+    assert first.full_verification
+    assert first.entries_checked == 4
+    assert verifier.get_last_checkpoint()["sequence_number"] == 4
+
+    await _log(audit_service, 3, prefix="later")
+    second = verifier.verify_complete_chain()
+    assert second.valid
+    assert not second.full_verification
+    assert second.checkpoint_sequence == 4
+    assert second.entries_checked == 3
+    assert second.entries_verified == 7
+
+    unchanged = verifier.verify_complete_chain()
+    assert unchanged.valid and unchanged.entries_checked == 0
+
+
+async def test_full_verification_catches_tampering_behind_checkpoint(audit_service):
+    await _log(audit_service, 5)
+    verifier = audit_service.verifier
+    assert verifier.verify_complete_chain().valid
+
+    conn = sqlite3.connect(verifier.db_path)
+    conn.execute("UPDATE audit_log SET event_payload = '{}' WHERE sequence_number = 2")
+    conn.commit()
+    conn.close()
+
+    # Checkpointed entries are not re-read incrementally
+    assert verifier.verify_complete_chain().valid
+
+    full = verifier.verify_complete_chain(full=True)
+    assert not full.valid
+    assert any("sequence 2" in error for error in full.hash_chain_errors)
+
+
+async def test_tampered_checkpoint_forces_full_verification(audit_service):
+    await _log(audit_service, 3)
+    verifier = audit_service.verifier
+    assert verifier.verify_complete_chain().valid
+
+    conn = sqlite3.connect(verifier.db_path)
+    conn.execute("UPDATE audit_log SET entry_hash = ? WHERE sequence_number = 3", ("f" * 64,))
+    conn.commit()
+    conn.close()
+
+    result = verifier.verify_complete_chain()
+    assert result.full_verification
+    assert not result.valid
+
+
+async def test_forged_checkpoint_forces_full_verification(audit_service):
+    await _log(audit_service, 5)
+    verifier = audit_service.verifier
+    assert verifier.get_last_checkpoint() is None
+
+    # Tamper with an entry, then plant a checkpoint past it that matches the chain but was not signed by the audit key
+    conn = sqlite3.connect(verifier.db_path)
+    conn.execute("UPDATE audit_log SET event_payload = '{}' WHERE sequence_number = 2")
+    entry_hash = conn.execute("SELECT entry_hash FROM audit_log WHERE sequence_number = 5").fetchone()[0]
+    conn.execute(
+        "INSERT INTO audit_verification_checkpoints "
+        "(sequence_number, entry_hash, verified_at, signature, signing_key_id) VALUES (?, ?, ?, ?, ?)",
+        (5, entry_hash, "2025-01-01T00:00:00+00:00", "Zm9yZ2Vk", verifier.signature_manager.key_id),
+    )
+    conn.commit()
+    conn.close()
+
+    result = verifier.verify_complete_chain()
+    assert result.full_verification
+    assert not result.valid
+    assert any("sequence 2" in error for error in result.hash_chain_errors)
+
+
+async def test_checkpoints_are_signed_with_the_audit_key(audit_service):
+    await _log(audit_service, 2)
+    verifier = audit_service.verifier
+    assert verifier.verify_complete_chain().valid
+
+    checkpoint = verifier.get_last_checkpoint()
+    assert checkpoint["signing_key_id"] == verifier.signature_manager.key_id
+    assert verifier.signature_manager.verify_signature(
+        f"checkpoint:2:{checkpoint['entry_hash']}", checkpoint["signature"], checkpoint["signing_key_id"]
+    )
+
+
+async def test_parallel_signature_verification(audit_service, time_service):
+    await _log(audit_service, 6)
+
+    verifier = AuditVerifier(
+        audit_service.verifier.db_path,
+        str(audit_service.key_path),
+        time_service,
+        max_workers=2,
+        parallel_threshold=1,
+    )
+    verifier.initialize()
+    assert verifier.verify_complete_chain(full=True).valid
+
+    conn = sqlite3.connect(verifier.db_path)
+    row = conn.execute("SELECT signature FROM audit_log WHERE sequence_number = 1").fetchone()
+    conn.execute("UPDATE audit_log SET signature = ? WHERE sequence_number = 4", (row[0],))
+    conn.commit()
+    conn.close()
+
+    result = verifier.verify_complete_chain(full=True)
+    assert not result.signatures_valid
+    assert len(result.signature_errors) == 1
@@ -0,0 +1,124 @@
+"""Tests for concurrent conscience execution."""
+
+import asyncio
+import time
+
+import pytest
+
+from ciris_engine.logic.conscience.executor import CANCELLED, FAILED, PASSED, TIMEOUT, UNAVAILABLE, run_consciences
+from ciris_engine.logic.conscience.registry import conscienceRegistry
+from ciris_engine.logic.registries.circuit_breaker import CircuitBreakerConfig
+from ciris_engine.schemas.actions.parameters import SpeakParams
+from ciris_engine.schemas.conscience.core import ConscienceCheckResult, ConscienceStatus
+from ciris_engine.schemas.dma.results import ActionSelectionDMAResult
+from ciris_engine.schemas.runtime.enums import HandlerActionType
+
+
+class FakeConscience:
+    def __init__(self, passed=True, delay=0.0, reason=None):
+        self.passed = passed
+        self.delay = delay
+        self.reason = reason
+        self.calls = 0
+        self.cancelled = False
+
+    async def check(self, action, context):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return ConscienceCheckResult(
+            status=ConscienceStatus.PASSED if self.passed else ConscienceStatus.FAILED,
+            passed=self.passed,
+            reason=self.reason,
+        )
+
+
+@pytest.fixture
+def action():
+    return ActionSelectionDMAResult(
+        selected_action=HandlerActionType.SPEAK,
+        action_parameters=SpeakParams(content="hello"),
+        rationale="test",
+    )
+
+
+def _registry(*consciences, timeout=30.0):
+    registry = conscienceRegistry()
+    for priority, (name, conscience) in enumerate(consciences):
+        registry.register_conscience(
+            name, conscience, priority=priority, circuit_breaker_config=CircuitBreakerConfig(timeout_duration=timeout)
+        )
+    return registry
+
+
+async def test_checks_run_concurrently(action):
+    registry = _registry(*[(f"c{i}", FakeConscience(delay=0.2)) for i in range(4)])
+
+    start = time.perf_counter()
+    outcomes = await run_consciences(registry.get_consciences(), action, {})
+    elapsed = time.perf_counter() - start
+
+    assert [o.status for o in outcomes] == [PASSED] * 4
+    assert elapsed < 0.6
+    assert all(o.latency_ms >= 150 for o in outcomes)
+
+
+async def test_outcomes_keep_priority_order(action):
+    # The lower priority conscience fails first, but results stay in registry order
+    registry = _registry(
+        ("entropy", FakeConscience(passed=False, delay=0.1, reason="entropy")),
+        ("coherence", FakeConscience(passed=False, delay=0.0, reason="coherence")),
+    )
+    outcomes = await run_consciences(registry.get_consciences(), action, {})
+    assert [o.name for o in outcomes] == ["entropy", "coherence"]
+    first_override = next(o for o in outcomes if o.status == FAILED)
+    assert first_override.result.reason == "entropy"
+
+
+async def test_timeout_records_circuit_breaker_failure(action):
+    registry = _registry(("slow", FakeConscience(delay=1.0)), timeout=0.05)
+    outcomes = await run_consciences(registry.get_consciences(), action, {})
+    assert outcomes[0].status == TIMEOUT
+    assert registry.get_consciences()[0].circuit_breaker.failure_count == 1
+
+
+async def test_open_circuit_breaker_skips_conscience(action):
+    conscience = FakeConscience()
+    registry = _registry(("flaky", conscience))
+    breaker = registry.get_consciences()[0].circuit_breaker
+    for _ in range(breaker.config.failure_threshold):
+        breaker.record_failure()
+
+    outcomes = await run_consciences(registry.get_consciences(), action, {})
+    assert outcomes[0].status == UNAVAILABLE
+    assert conscience.calls == 0
+
+
+async def test_early_cancel_stops_lower_priority_checks(action):
+    slow = FakeConscience(delay=5.0)
+    registry = _registry(
+        ("fast_veto", FakeConscience(passed=False, delay=0.01)),
+        ("slow", slow),
+    )
+
+    start = time.perf_counter()
+    outcomes = await run_consciences(registry.get_consciences(), action, {}, early_cancel=True)
+    assert time.perf_counter() - start < 1.0
+    assert [o.status for o in outcomes] == [FAILED, CANCELLED]
+    assert slow.cancelled
+    # Cancellation is not a failure of the cancelled conscience
+    assert registry.get_consciences()[1].circuit_breaker.failure_count == 0
+
+
+async def test_early_cancel_waits_for_higher_priority(action):
+    # A fast override from a lower priority conscience is not decisive yet
+    registry = _registry(
+        ("first", FakeConscience(passed=False, delay=0.1, reason="first")),
+        ("second", FakeConscience(passed=False, delay=0.0, reason="second")),
+        ("third", FakeConscience(delay=5.0)),
+    )
+    outcomes = await run_consciences(registry.get_consciences(), action, {}, early_cancel=True)
+    assert [o.status for o in outcomes] == [FAILED, FAILED, CANCELLED]
@@ -0,0 +1,85 @@
+"""Tests for the cached tool catalog."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ciris_engine.logic.context.tool_catalog import ToolCatalog, get_tool_catalog
+from ciris_engine.schemas.adapters.tools import ToolInfo, ToolParameterSchema
+
+
+def _tool_service(adapter_id: str, names):
+    service = MagicMock()
+    service.adapter_id = adapter_id
+    service.get_available_tools = AsyncMock(return_value=list(names))
+    service.get_tool_info = AsyncMock(
+        side_effect=lambda name: ToolInfo(
+            name=name,
+            description=f"{name} tool",
+            parameters=ToolParameterSchema(type="object", properties={}, required=[]),
+        )
+    )
+    return service
+
+
+@pytest.mark.asyncio
+async def test_catalog_built_once_until_invalidated():
+    discord = _tool_service("discord_123", ["send", "delete"])
+    registry = MagicMock()
+    registry.get_services_by_type.return_value = [discord]
+    catalog = ToolCatalog()
+
+    first = await catalog.get_available_tools(registry)
+    second = await catalog.get_available_tools(registry)
+
+    assert [t.name for t in first["discord"]] == ["send", "delete"]
+    assert second is first
+    assert discord.get_available_tools.await_count == 1
+    assert discord.get_tool_info.await_count == 2
+
+    # An adapter load/unload forces a rebuild
+    catalog.invalidate()
+    await catalog.get_available_tools(registry)
+    assert discord.get_available_tools.await_count == 2
+    assert catalog.get_metrics()["tool_catalog_builds"] == 2.0
+    assert catalog.get_metrics()["tool_catalog_hits"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_catalog_rebuilds_when_tool_services_change():
+    discord = _tool_service("discord_123", ["send"])
+    api = _tool_service("api_1", ["curl"])
+    registry = MagicMock()
+    registry.get_services_by_type.return_value = [discord]
+    catalog = ToolCatalog()
+
+    assert set(await catalog.get_available_tools(registry)) == {"discord"}
+
+    registry.get_services_by_type.return_value = [discord, api]
+    assert set(await catalog.get_available_tools(registry)) == {"discord", "api"}
+
+    # e.g. the API tool service's circuit breaker opened
+    registry.get_services_by_type.return_value = [discord]
+    assert set(await catalog.get_available_tools(registry)) == {"discord"}
+
+
+@pytest.mark.asyncio
+async def test_catalog_does_not_cache_failures():
+    bad = MagicMock()
+    bad.adapter_id = "bad_tool"
+    bad.get_available_tools.return_value = ["tool1"]
+    bad.get_tool_info.return_value = {"name": "tool1"}  # Not ToolInfo
+    registry = MagicMock()
+    registry.get_services_by_type.return_value = [bad]
+    catalog = ToolCatalog()
+
+    for _ in range(2):
+        with pytest.raises(TypeError):
+            await catalog.get_available_tools(registry)
+    assert bad.get_available_tools.call_count == 2
+
+
+def test_get_tool_catalog_is_per_registry():
+    first, second = MagicMock(), MagicMock()
+    assert get_tool_catalog(first) is get_tool_catalog(first)
+    assert get_tool_catalog(first) is not get_tool_catalog(second)
@@ -0,0 +1,115 @@
+"""
+Unit tests for DMAPromptLoader template compilation and caching.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from ciris_engine.logic.dma.prompt_loader import DMAPromptLoader, PromptSlot, compile_prompt
+
+PROMPTS_DIR = Path(__file__).parents[4] / "ciris_engine" / "logic" / "dma" / "prompts"
+
+
+@pytest.fixture
+def prompts_dir(tmp_path):
+    for name in ("csdma_common_sense.yml", "pdma_ethical.yml", "dsdma_base.yml"):
+        shutil.copy(PROMPTS_DIR / name, tmp_path / name)
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "plain text with {{escaped}} braces",
+        "{a} and {b}",
+        "{a!r} padded {b:>8} indexed {c[0]} attribute {d.real}",
+        "{a:{width}}",
+    ],
+)
+def test_compiled_render_matches_str_format(template):
+    values = {"a": "x", "b": "y", "c": ["z"], "d": 3, "width": 5}
+    assert compile_prompt(template).render(**values) == template.format(**values)
+
+
+def test_bound_values_are_pre_rendered():
+    compiled = compile_prompt("Domain {domain_name} ({rules}): {context}", domain_name="medical", rules="triage")
+
+    assert compiled.segments == ("Domain medical (triage): ", PromptSlot("context"))
+    assert compiled.static_prefix == "Domain medical (triage): "
+    assert compiled.render(context="ward 3") == "Domain medical (triage): ward 3"
+    with pytest.raises(KeyError):
+        compiled.render()
+
+
+def test_messages_match_per_section_formatting(prompts_dir):
+    loader = DMAPromptLoader(str(prompts_dir))
+    template = loader.load_prompt_template("csdma_common_sense")
+    kwargs = {"context_summary": "Earth", "original_thought_content": "Lift the car"}
+
+    sections = [
+        template.system_guidance_header,
+        template.evaluation_steps,
+        template.response_format,
+    ]
+    expected = "\n\n".join(section.format(**kwargs) for section in sections if section)
+
+    assert loader.get_system_message(template, **kwargs) == expected
+    assert loader.get_user_message(template, **kwargs) == template.context_integration.format(**kwargs)
+
+
+def test_static_system_message_is_compiled_once(prompts_dir):
+    loader = DMAPromptLoader(str(prompts_dir))
+    template = loader.load_prompt_template("pdma_ethical")
+
+    first = loader.get_system_message(template, original_thought_content="a", full_context_str="")
+    second = loader.get_system_message(template, original_thought_content="b", full_context_str="x")
+
+    assert first is second
+    assert loader.compile_system_message(template).is_static
+    stats = loader.get_stats()
+    assert stats["compiled_prompt_misses"] == 1.0
+    assert stats["compiled_prompt_hits"] == 2.0
+
+
+def test_changed_template_file_is_reloaded(prompts_dir):
+    loader = DMAPromptLoader(str(prompts_dir))
+    template = loader.load_prompt_template("pdma_ethical")
+    assert loader.load_prompt_template("pdma_ethical") is template
+    assert loader.reload_if_changed(template) is template
+
+    path = prompts_dir / "pdma_ethical.yml"
+    path.write_text(path.read_text().replace("ethical reasoning shard", "ethics shard"))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    updated = loader.reload_if_changed(template)
+    assert updated is not template
+    assert "ethics shard" in loader.get_system_message(updated)
+
+    # A broken edit keeps the last good version
+    path.write_text("- not a mapping")
+    assert loader.reload_if_changed(updated) is updated
+
+
+def test_dsdma_picks_up_edited_template(prompts_dir, monkeypatch):
+    from unittest.mock import Mock
+
+    from ciris_engine.logic.dma import dsdma_base
+
+    loader = DMAPromptLoader(str(prompts_dir))
+    monkeypatch.setattr(dsdma_base, "get_prompt_loader", lambda: loader)
+    dsdma = dsdma_base.BaseDSDMA("test", service_registry=Mock())
+    overridden = dsdma_base.BaseDSDMA("test", service_registry=Mock(), prompt_template="Fixed {context_str}")
+
+    path = prompts_dir / "dsdma_base.yml"
+    path.write_text(path.read_text().replace("system_guidance_header: |\n", "system_guidance_header: |\n  Edited\n", 1))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    dsdma._reload_prompt_template()
+    overridden._reload_prompt_template()
+    assert dsdma.prompt_template.startswith("Edited")
+    assert overridden.prompt_template == "Fixed {context_str}"
@@ -0,0 +1,99 @@
+"""Tests for the shared time-series window cache."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from ciris_engine.logic.infrastructure.sub_services.timeseries_window_cache import TimeSeriesWindowCache
+from ciris_engine.schemas.runtime.memory import TimeSeriesDataPoint
+
+START = datetime(2026, 1, 8, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class FakeMemoryBus:
+    """Serves stored points by time range and records the ranges asked for."""
+
+    def __init__(self) -> None:
+        self.points = []
+        self.queries = []
+
+    def add(self, when: datetime, name: str = "llm.response_time", value: float = 1.0) -> None:
+        self.points.append(
+            TimeSeriesDataPoint(timestamp=when, metric_name=name, value=value, correlation_type="METRIC_DATAPOINT")
+        )
+
+    async def recall_timeseries(self, scope, start_time, end_time, limit, handler_name, **kwargs):
+        assert limit is None
+        self.queries.append((start_time, end_time))
+        return sorted((p for p in self.points if start_time <= p.timestamp <= end_time), key=lambda p: p.timestamp)
+
+
+@pytest.fixture
+def clock():
+    time_service = MagicMock()
+    time_service.now.return_value = START
+    return time_service
+
+
+@pytest.mark.asyncio
+async def test_windows_are_complete_beyond_the_recall_cap(clock):
+    bus = FakeMemoryBus()
+    for minute in range(5000):
+        bus.add(START - timedelta(minutes=minute))
+    cache = TimeSeriesWindowCache(bus, clock, retention_hours=24 * 7)
+
+    week = await cache.get_window(hours=24 * 7)
+    day = await cache.get_window(hours=24)
+
+    assert len(week) == 5000
+    assert len(day) == 24 * 60 + 1
+    assert [p.timestamp for p in day] == sorted(p.timestamp for p in day)
+
+
+@pytest.mark.asyncio
+async def test_refresh_fetches_only_the_delta(clock):
+    bus = FakeMemoryBus()
+    bus.add(START - timedelta(hours=1))
+    cache = TimeSeriesWindowCache(bus, clock, overlap_seconds=60)
+    await cache.get_window(hours=24)
+
+    bus.add(START + timedelta(minutes=5), value=2.0)
+    clock.now.return_value = START + timedelta(minutes=10)
+    window = await cache.get_window(hours=24)
+
+    assert [p.value for p in window] == [1.0, 2.0]
+    # Second query starts at the watermark minus the overlap, not a week back
+    assert bus.queries[1][0] == START - timedelta(hours=1, seconds=60)
+    assert cache.get_stats()["timeseries_cache_points_fetched"] == 2.0
+
+
+@pytest.mark.asyncio
+async def test_late_writes_inside_overlap_are_picked_up_once(clock):
+    bus = FakeMemoryBus()
+    bus.add(START)
+    cache = TimeSeriesWindowCache(bus, clock, overlap_seconds=60)
+    await cache.get_window(hours=1)
+
+    # Written late, timestamped just before the watermark
+    bus.add(START - timedelta(seconds=30), value=3.0)
+    clock.now.return_value = START + timedelta(minutes=1)
+    first = await cache.get_window(hours=1)
+    second = await cache.get_window(hours=1)
+
+    assert [p.value for p in first] == [3.0, 1.0]
+    assert [p.value for p in second] == [3.0, 1.0]
+    assert cache.get_stats()["timeseries_cache_duplicates_skipped"] >= 2.0
+
+
+@pytest.mark.asyncio
+async def test_points_past_retention_are_evicted(clock):
+    bus = FakeMemoryBus()
+    bus.add(START - timedelta(hours=2))
+    bus.add(START)
+    cache = TimeSeriesWindowCache(bus, clock, retention_hours=3)
+    assert len(await cache.get_window(hours=3)) == 2
+
+    clock.now.return_value = START + timedelta(hours=2)
+    assert [p.timestamp for p in await cache.get_window(hours=24)] == [START]
+    assert cache.get_stats()["timeseries_cache_points"] == 1.0
@@ -315,6 +315,23 @@ class TestAgentProcessor:
         assert status["state"] == "shutdown"  # Initial state (lowercase)
         assert "is_processing" in status
         assert "processor_metrics" in status
+        assert "tool_catalog" not in status
+
+    def test_status_includes_tool_catalog_metrics(self, main_processor, mock_services):
+        """The shared tool catalog's cache counters are reported with the processor status."""
+        from ciris_engine.logic.context.tool_catalog import get_tool_catalog
+
+        registry = Mock()
+        mock_services["service_registry"] = registry
+        get_tool_catalog(registry).invalidate()
+
+        status = main_processor.get_status()
+
+        assert status["tool_catalog"] == {
+            "tool_catalog_version": 1.0,
+            "tool_catalog_builds": 0.0,
+            "tool_catalog_hits": 0.0,
+        }
 
     @pytest.mark.asyncio
     async def test_validate_transition(self, main_processor):
@@ -479,3 +479,61 @@ class TestThoughtProcessor:
         assert result is not None
         # Verify context builder was called
         thought_processor.context_builder.build_thought_context.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_conscience_override_follows_priority(self, thought_processor: ThoughtProcessor) -> None:
+        """The highest priority failing conscience decides, even if a lower one finishes first."""
+        import asyncio
+
+        from ciris_engine.logic.conscience.registry import conscienceRegistry
+        from ciris_engine.schemas.conscience.core import ConscienceCheckResult, ConscienceStatus
+
+        def conscience(delay: float, passed: bool, reason: str) -> Mock:
+            async def check(action, context):
+                await asyncio.sleep(delay)
+                status = ConscienceStatus.PASSED if passed else ConscienceStatus.FAILED
+                return ConscienceCheckResult(status=status, passed=passed, reason=reason)
+
+            return Mock(check=check)
+
+        registry = conscienceRegistry()
+        registry.register_conscience("first", conscience(0.05, False, "first says no"), priority=0)
+        registry.register_conscience("second", conscience(0.0, False, "second says no"), priority=1)
+        registry.register_conscience("third", conscience(0.0, True, "fine"), priority=2)
+        thought_processor.conscience_registry = registry
+
+        action = ActionSelectionDMAResult(
+            selected_action=HandlerActionType.SPEAK,
+            action_parameters=SpeakParams(content="hello"),
+            rationale="test",
+        )
+        result = await thought_processor._apply_conscience_simple(action, Mock(), {})
+
+        assert result.overridden
+        assert result.override_reason == "first says no"
+        assert result.final_action.selected_action == HandlerActionType.PONDER
+        assert "Overridden by first" in result.final_action.rationale
+
+    @pytest.mark.asyncio
+    async def test_task_authorization_verdict_cached(self, thought_processor: ThoughtProcessor) -> None:
+        """Repeated thoughts for the same signed task reuse the verdict until WAs change."""
+        from ciris_engine.schemas.services.authority_core import WARole
+
+        task = Mock(task_id="task-1", signature="sig", signed_by="wa-1", status=TaskStatus.ACTIVE)
+        auth = Mock()
+        auth.wa_cache_version = 1
+        auth.verify_task_signature = AsyncMock(return_value=True)
+        auth.get_wa = AsyncMock(return_value=Mock(role=WARole.OBSERVER))
+        thought_processor.auth_service = auth
+        thought = Mock(source_task_id="task-1", thought_id="th-1")
+
+        with patch("ciris_engine.logic.persistence.get_task_by_id", return_value=task):
+            for _ in range(3):
+                assert await thought_processor._verify_task_authorization(thought)
+            assert auth.verify_task_signature.await_count == 1
+
+            # Revoking or updating a WA bumps the version and forces re-verification
+            auth.wa_cache_version = 2
+            auth.get_wa = AsyncMock(return_value=None)
+            assert not await thought_processor._verify_task_authorization(thought)
+            assert auth.verify_task_signature.await_count == 2
@@ -0,0 +1,119 @@
+"""Tests for the adaptive thought scheduler."""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ciris_engine.logic import persistence
+from ciris_engine.logic.processors.support.thought_scheduler import AdaptiveThoughtScheduler
+from ciris_engine.schemas.runtime.enums import ThoughtStatus
+from ciris_engine.schemas.runtime.models import Thought
+
+NOW = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _thought(thought_id: str, task_id: str, age_seconds: int) -> Thought:
+    created = (NOW - timedelta(seconds=age_seconds)).isoformat()
+    return Thought(
+        thought_id=thought_id,
+        source_task_id=task_id,
+        content=thought_id,
+        status=ThoughtStatus.PENDING,
+        created_at=created,
+        updated_at=created,
+    )
+
+
+def _run_round(scheduler: AdaptiveThoughtScheduler, pending: int, latency: float = 1.0, failures: int = 0) -> None:
+    selected = scheduler.select([_thought(f"t{i}", "task", i) for i in range(pending)], {}, NOW)
+    for i in range(len(selected)):
+        scheduler.record_result(latency, success=i >= failures)
+    scheduler.end_round()
+
+
+def test_select_orders_by_task_priority_then_age():
+    scheduler = AdaptiveThoughtScheduler(initial_concurrency=3)
+    pending = [
+        _thought("low_old", "low", 300),
+        _thought("high_new", "high", 10),
+        _thought("high_old", "high", 60),
+        _thought("normal", "unknown", 600),
+    ]
+
+    selected = scheduler.select(pending, {"high": 8, "low": 1}, NOW)
+
+    assert [t.thought_id for t in selected] == ["high_old", "high_new", "low_old"]
+    stats = scheduler.get_stats()
+    assert stats["thought_queue_wait_max_ms"] == 300_000
+    assert stats["thought_queue_wait_avg_ms"] == pytest.approx((60 + 10 + 300) / 3 * 1000)
+
+
+def test_concurrency_grows_while_backlogged_and_under_target():
+    scheduler = AdaptiveThoughtScheduler(min_concurrency=1, max_concurrency=6, initial_concurrency=2)
+
+    for _ in range(10):
+        _run_round(scheduler, pending=20)
+
+    assert scheduler.concurrency_limit == 6
+    assert scheduler.get_stats()["thought_round_utilization"] == 1.0
+
+    # No backlog: the limit holds
+    _run_round(scheduler, pending=3)
+    assert scheduler.concurrency_limit == 6
+    assert scheduler.get_stats()["thought_round_utilization"] == 0.5
+
+
+def test_concurrency_backs_off_on_latency_and_errors():
+    scheduler = AdaptiveThoughtScheduler(max_concurrency=10, initial_concurrency=8, target_latency_seconds=5.0)
+
+    _run_round(scheduler, pending=20, latency=20.0)
+    assert scheduler.concurrency_limit == 7
+
+    _run_round(scheduler, pending=20, latency=1.0, failures=4)
+    assert scheduler.concurrency_limit == 3
+    assert scheduler.get_stats()["thought_error_rate"] == pytest.approx(4 / 7)
+
+    for _ in range(5):
+        _run_round(scheduler, pending=20, latency=1.0, failures=3)
+    assert scheduler.concurrency_limit == scheduler.min_concurrency == 1
+
+
+@pytest.mark.asyncio
+async def test_wait_is_woken_by_notification_from_another_thread():
+    scheduler = AdaptiveThoughtScheduler()
+    assert await scheduler.wait_for_work(0.01) is False
+
+    waiter = asyncio.create_task(scheduler.wait_for_work(30.0))
+    await asyncio.sleep(0)
+    threading.Thread(target=scheduler.notify, args=("thought",)).start()
+
+    assert await asyncio.wait_for(waiter, timeout=1) is True
+    assert scheduler.get_stats()["thought_work_wakeups"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_work_committed_before_the_wait_is_not_lost():
+    scheduler = AdaptiveThoughtScheduler()
+    persistence.add_work_listener(scheduler.notify)
+    try:
+        persistence.notify_work_added("task")
+    finally:
+        persistence.remove_work_listener(scheduler.notify)
+
+    assert await asyncio.wait_for(scheduler.wait_for_work(30.0), timeout=1) is True
+    # Removed listeners are no longer told about work
+    persistence.notify_work_added("task")
+    assert await scheduler.wait_for_work(0.01) is False
+
+
+@pytest.mark.asyncio
+async def test_stop_event_ends_the_wait():
+    scheduler = AdaptiveThoughtScheduler()
+    stop_event = asyncio.Event()
+    waiter = asyncio.create_task(scheduler.wait_for_work(30.0, stop_event))
+    await asyncio.sleep(0)
+    stop_event.set()
+
+    assert await asyncio.wait_for(waiter, timeout=1) is False
@@ -0,0 +1,87 @@
+"""Unit tests for the dependency-aware StartupScheduler."""
+
+import asyncio
+
+import pytest
+
+from ciris_engine.logic.runtime.startup_scheduler import StartupScheduler
+
+
+def _recorder(events, name, delay=0.0):
+    async def start():
+        events.append(f"start:{name}")
+        await asyncio.sleep(delay)
+        events.append(f"end:{name}")
+
+    return start
+
+
+class TestStartupScheduler:
+    """Test cases for StartupScheduler."""
+
+    def test_compute_waves(self):
+        scheduler = StartupScheduler("test")
+        events = []
+        scheduler.add("time", _recorder(events, "time"))
+        scheduler.add("llm", _recorder(events, "llm"), depends_on=["telemetry"])
+        scheduler.add("telemetry", _recorder(events, "telemetry"), depends_on=["time"])
+        scheduler.add("audit", _recorder(events, "audit"), depends_on=["time"])
+
+        assert scheduler.compute_waves() == [["time"], ["telemetry", "audit"], ["llm"]]
+
+    def test_unknown_dependency_rejected(self):
+        scheduler = StartupScheduler("test")
+        scheduler.add("llm", _recorder([], "llm"), depends_on=["missing"])
+        with pytest.raises(ValueError, match="unknown service"):
+            scheduler.compute_waves()
+
+    def test_cycle_rejected(self):
+        scheduler = StartupScheduler("test")
+        scheduler.add("a", _recorder([], "a"), depends_on=["b"])
+        scheduler.add("b", _recorder([], "b"), depends_on=["a"])
+        with pytest.raises(ValueError, match="cycle"):
+            scheduler.compute_waves()
+
+    def test_duplicate_rejected(self):
+        scheduler = StartupScheduler("test")
+        scheduler.add("a", _recorder([], "a"))
+        with pytest.raises(ValueError, match="already registered"):
+            scheduler.add("a", _recorder([], "a"))
+
+    @pytest.mark.asyncio
+    async def test_independent_services_start_concurrently(self):
+        scheduler = StartupScheduler("test")
+        events = []
+        scheduler.add("a", _recorder(events, "a", delay=0.05))
+        scheduler.add("b", _recorder(events, "b", delay=0.05))
+        scheduler.add("c", _recorder(events, "c"), depends_on=["a", "b"])
+
+        records = await scheduler.run()
+
+        # Both wave-0 services start before either finishes; c starts after both
+        assert events[:2] == ["start:a", "start:b"]
+        assert events.index("start:c") > max(events.index("end:a"), events.index("end:b"))
+        assert [(r.service_name, r.wave) for r in records] == [("a", 0), ("b", 0), ("c", 1)]
+        assert all(r.success and r.phase == "test" for r in records)
+
+    @pytest.mark.asyncio
+    async def test_failure_stops_later_waves(self):
+        scheduler = StartupScheduler("test")
+        events = []
+
+        async def broken():
+            raise KeyError("boom")
+
+        scheduler.add("a", broken)
+        scheduler.add("b", _recorder(events, "b"))
+        scheduler.add("c", _recorder(events, "c"), depends_on=["a"])
+
+        with pytest.raises(KeyError):
+            await scheduler.run()
+
+        # Wave 0 settled fully, wave 1 never started
+        assert "end:b" in events
+        assert "start:c" not in events
+        failed = [r for r in scheduler.records if not r.success]
+        assert [r.service_name for r in failed] == ["a"]
+        assert "boom" in failed[0].error
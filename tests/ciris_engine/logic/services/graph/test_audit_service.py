@@ -287,3 +287,122 @@ async def test_audit_service_health_check(audit_service):
 
     assert isinstance(is_healthy, bool)
     assert is_healthy is True  # Should be healthy after start
+
+
+@pytest.mark.asyncio
+async def test_audit_service_batched_signing(memory_bus, time_service):
+    """Batched entries are committed together and verify via the signed Merkle root."""
+    import sqlite3
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "audit.db")
+        service = GraphAuditService(
+            memory_bus=memory_bus,
+            time_service=time_service,
+            db_path=db_path,
+            key_path=os.path.join(temp_dir, "keys"),
+            enable_hash_chain=True,
+            batch_signing=True,
+            batch_max_entries=4,
+            batch_interval_ms=10_000,
+        )
+        await service.start()
+        try:
+            for i in range(6):
+                await service.log_event(f"batched_event_{i}", AuditEventData(entity_id=f"e{i}", actor="tester"))
+
+            # First four filled a batch, the rest wait for the next flush
+            metrics = service._collect_custom_metrics()
+            assert metrics["hash_chain_batches_committed"] == 1.0
+            assert metrics["hash_chain_pending_entries"] == 2.0
+
+            report = await service.verify_audit_integrity()
+            assert report.verified, report.errors
+            assert report.total_entries == 6
+
+            assert service.verifier.verify_root_anchors().valid
+            assert service.verifier.verify_entry(5).valid
+
+            # Tampering with a batched entry breaks its inclusion proof
+            conn = sqlite3.connect(db_path)
+            conn.execute("UPDATE audit_log SET entry_hash = ? WHERE entry_id = 2", ("0" * 64,))
+            conn.commit()
+            conn.close()
+            tampered = service.verifier.verify_entry(2)
+            assert not tampered.signature_valid
+        finally:
+            await service.stop()
+
+
+class _FailingCommitConnection:
+    """Wraps a sqlite3 connection so commit() can be made to fail."""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.fail = True
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def commit(self):
+        if self.fail:
+            import sqlite3
+
+            raise sqlite3.OperationalError("disk I/O error")
+        self._conn.commit()
+
+
+@pytest.mark.asyncio
+async def test_audit_service_batched_signing_retries_failed_commit(memory_bus, time_service):
+    """A batch whose commit fails is requeued and lands on the next flush."""
+    from ciris_engine.logic.services.graph import audit_service as audit_module
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        service = GraphAuditService(
+            memory_bus=memory_bus,
+            time_service=time_service,
+            db_path=os.path.join(temp_dir, "audit.db"),
+            key_path=os.path.join(temp_dir, "keys"),
+            enable_hash_chain=True,
+            batch_signing=True,
+            batch_max_entries=100,
+            batch_interval_ms=10_000,
+        )
+        await service.start()
+        real_connection = service._db_connection
+        failing = _FailingCommitConnection(real_connection)
+        service._db_connection = failing
+        try:
+            for i in range(3):
+                await service.log_event(f"retried_event_{i}", AuditEventData(entity_id=f"e{i}", actor="tester"))
+
+            await service._flush_hash_chain_batch()
+            metrics = service._collect_custom_metrics()
+            assert metrics["hash_chain_pending_entries"] == 3.0
+            assert metrics["hash_chain_flush_failures"] == 1.0
+            count = real_connection.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0]
+            assert count == 0
+
+            # Entries logged while the batch was failing keep their order behind it
+            await service.log_event("retried_event_3", AuditEventData(entity_id="e3", actor="tester"))
+            failing.fail = False
+            await service._flush_hash_chain_batch()
+
+            rows = real_connection.execute("SELECT event_type FROM audit_log ORDER BY sequence_number").fetchall()
+            assert [row[0] for row in rows] == [f"retried_event_{i}" for i in range(4)]
+            assert service._collect_custom_metrics()["hash_chain_flush_failures"] == 0.0
+            report = await service.verify_audit_integrity()
+            assert report.verified, report.errors
+
+            # A flush that keeps failing surfaces the error instead of only logging it
+            failing.fail = True
+            await service.log_event("stuck_event", AuditEventData(entity_id="e4", actor="tester"))
+            for _ in range(audit_module.CHAIN_FLUSH_FAILURE_LIMIT - 1):
+                await service._flush_hash_chain_batch()
+            with pytest.raises(RuntimeError, match="pending"):
+                await service._flush_hash_chain_batch()
+            assert len(service._pending_chain_entries) == 1
+            failing.fail = False
+        finally:
+            service._db_connection = real_connection
+            await service.stop()
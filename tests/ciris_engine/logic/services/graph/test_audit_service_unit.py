@@ -367,3 +367,100 @@ class TestGraphAuditService:
         """Test that audit service uses correct node type."""
         node_type = audit_service.get_node_type()
         assert node_type == "AUDIT"
+
+
+class TestAuditKeysetPagination:
+    """query_audit_page reads the indexed graph table directly."""
+
+    @pytest.fixture
+    def graph_db(self, tmp_path, monkeypatch):
+        import functools
+
+        from ciris_engine.logic.persistence.db.core import initialize_database
+        from ciris_engine.logic.persistence.models import graph
+        from ciris_engine.logic.services.graph import audit_service as audit_module
+
+        path = str(tmp_path / "graph.db")
+        initialize_database(path)
+        monkeypatch.setattr(
+            audit_module, "get_audit_entry_nodes", functools.partial(graph.get_audit_entry_nodes, db_path=path)
+        )
+        monkeypatch.setattr(
+            audit_module, "count_audit_entry_nodes", functools.partial(graph.count_audit_entry_nodes, db_path=path)
+        )
+        return path
+
+    @pytest.fixture
+    def audit_service(self, tmp_path) -> GraphAuditService:
+        time_service = Mock(now=Mock(return_value=datetime(2026, 1, 1, tzinfo=timezone.utc)))
+        return GraphAuditService(memory_bus=Mock(), time_service=time_service, db_path=str(tmp_path / "audit.db"))
+
+    def _store_entries(self, graph_db, count):
+        from ciris_engine.logic.persistence.models.graph import add_graph_node
+        from ciris_engine.schemas.services.graph_core import GraphScope
+        from ciris_engine.schemas.services.nodes import AuditEntry, AuditEntryContext
+
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        time_service = Mock(now=Mock(return_value=base))
+        for i in range(count):
+            entry = AuditEntry(
+                id=f"audit_{i:03d}",
+                action="speak" if i % 2 else "tool",
+                actor=f"actor_{i % 3}",
+                # Pairs of entries share a timestamp so the node_id tiebreaker matters
+                timestamp=base + timedelta(seconds=i // 2),
+                context=AuditEntryContext(
+                    service_name="test",
+                    correlation_id=f"event_{i}",
+                    additional_data={"outcome": "failure" if i % 5 == 0 else "success"},
+                ),
+                scope=GraphScope.LOCAL,
+                attributes={},
+            )
+            add_graph_node(entry.to_graph_node(), time_service=time_service, db_path=graph_db)
+
+    @pytest.mark.asyncio
+    async def test_cursor_walks_every_entry_once_newest_first(self, audit_service, graph_db):
+        from ciris_engine.schemas.services.graph.audit import AuditQuery
+
+        self._store_entries(graph_db, 25)
+
+        seen = []
+        cursor = None
+        while True:
+            page = await audit_service.query_audit_page(AuditQuery(limit=10), cursor=cursor)
+            assert page.total == 25
+            seen.extend(entry.id for entry in page.entries)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert seen == [f"audit_{i:03d}" for i in range(24, -1, -1)]
+
+    @pytest.mark.asyncio
+    async def test_filters_run_in_sql_with_exact_totals(self, audit_service, graph_db):
+        from ciris_engine.schemas.services.graph.audit import AuditQuery
+
+        self._store_entries(graph_db, 30)
+
+        page = await audit_service.query_audit_page(AuditQuery(actor="actor_1", event_type="speak", limit=3))
+        assert page.total == 5
+        assert [entry.id for entry in page.entries] == ["audit_025", "audit_019", "audit_013"]
+        assert page.next_cursor is not None
+
+        failures = await audit_service.query_audit_page(AuditQuery(outcome="failure", limit=100))
+        assert failures.total == 6
+        assert failures.next_cursor is None
+
+        window = AuditQuery(
+            start_time=datetime(2026, 1, 1, 0, 0, 5, tzinfo=timezone.utc),
+            end_time=datetime(2026, 1, 1, 0, 0, 6, tzinfo=timezone.utc),
+        )
+        assert (await audit_service.query_audit_page(window)).total == 4
+
+    @pytest.mark.asyncio
+    async def test_malformed_cursor_is_rejected(self, audit_service, graph_db):
+        from ciris_engine.schemas.services.graph.audit import AuditQuery
+
+        with pytest.raises(ValueError, match="Invalid audit cursor"):
+            await audit_service.query_audit_page(AuditQuery(), cursor="not-a-cursor")
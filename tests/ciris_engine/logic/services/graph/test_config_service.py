@@ -398,3 +398,43 @@ async def test_config_service_path_values(config_service):
     configs = await config_service.list_configs(prefix="paths.")
     assert "paths.test" in configs
     assert configs["paths.test"] == "/home/user/test.txt"
+
+
+@pytest.mark.asyncio
+async def test_config_service_more_than_search_limit(config_service):
+    """Keys stay visible once there are more config nodes than a graph search returns."""
+    for i in range(120):
+        await config_service.set_config(f"bulk.key_{i:03d}", i, updated_by="test_user")
+
+    # A fresh service over the same database builds its index from a full scan
+    fresh = GraphConfigService(graph_memory_service=config_service.graph, time_service=config_service._time_service)
+    configs = await fresh.list_configs(prefix="bulk.")
+    assert len(configs) == 120
+    assert (await fresh.get_config("bulk.key_000")).value.value == 0
+
+
+@pytest.mark.asyncio
+async def test_config_service_reads_served_from_index(config_service, monkeypatch):
+    """Reads are answered from the cache and index; writes invalidate the cached entry."""
+    from ciris_engine.logic import persistence
+
+    await config_service.set_config("cached.key", "v1", updated_by="test_user")
+    assert (await config_service.get_config("cached.key")).value.value == "v1"
+
+    def fail(*args, **kwargs):
+        raise AssertionError("config read hit the database")
+
+    with monkeypatch.context() as m:
+        m.setattr(persistence, "get_graph_node", fail)
+        m.setattr(persistence, "get_nodes_by_type", fail)
+        assert (await config_service.get_config("cached.key")).value.value == "v1"
+        assert await config_service.get_config("never.set") is None
+
+    await config_service.set_config("cached.key", "v2", updated_by="test_user")
+    updated = await config_service.get_config("cached.key")
+    assert updated.value.value == "v2"
+    assert updated.version == 2
+
+    metrics = config_service._collect_custom_metrics()
+    assert metrics["config_cache_hits"] >= 2
+    assert metrics["config_cache_misses"] >= 1
@@ -192,6 +192,19 @@ async def test_memory_service_timeseries(memory_service):
     assert len(test_metrics) >= 3
 
 
+@pytest.mark.asyncio
+async def test_memory_service_timeseries_limit(memory_service):
+    """Test that recall_timeseries caps results unless limit is None."""
+    for i in range(5):
+        await memory_service.memorize_metric(metric_name="limited_metric", value=float(i), scope="local")
+
+    capped = await memory_service.recall_timeseries(scope="local", hours=24, limit=2)
+    assert len(capped) == 2
+
+    uncapped = await memory_service.recall_timeseries(scope="local", hours=24, limit=None)
+    assert len([dp for dp in uncapped if dp.metric_name == "limited_metric"]) == 5
+
+
 def test_memory_service_capabilities(memory_service):
     """Test MemoryService.get_capabilities() returns correct info."""
     caps = memory_service.get_capabilities()
@@ -299,3 +312,77 @@ async def test_memory_service_graph_query(memory_service):
     # Should get parent node
     assert len(nodes) >= 1
     assert nodes[0].id == "parent_node"
+
+
+@pytest.mark.asyncio
+async def test_recall_user_profiles_cached_and_invalidated(memory_service):
+    """User profiles are loaded in one batch, cached, and dropped when the graph changes."""
+    from unittest.mock import patch
+
+    from ciris_engine.logic.persistence.models import graph as persistence
+    from ciris_engine.schemas.services.graph_core import GraphEdge
+
+    for user_id, name in (("111", "alice"), ("222", "bob")):
+        await memory_service.memorize(
+            GraphNode(
+                id=f"user/{user_id}",
+                type=NodeType.USER,
+                scope=GraphScope.LOCAL,
+                attributes={"username": name},
+            )
+        )
+    await memory_service.memorize(
+        GraphNode(id="concept/tea", type=NodeType.CONCEPT, scope=GraphScope.LOCAL, attributes={"label": "tea"})
+    )
+    memory_service.create_edge(
+        GraphEdge(source="user/111", target="concept/tea", relationship="LIKES", scope=GraphScope.LOCAL)
+    )
+    # An edge between two users in the same batch shows up on both profiles
+    memory_service.create_edge(
+        GraphEdge(source="user/111", target="user/222", relationship="KNOWS", scope=GraphScope.LOCAL)
+    )
+
+    with patch.object(persistence, "get_graph_nodes_by_ids", wraps=persistence.get_graph_nodes_by_ids) as nodes:
+        profiles = await memory_service.recall_user_profiles(["111", "222", "333"])
+        # Users, then their connected nodes
+        assert nodes.call_count == 2
+
+        assert set(profiles) == {"111", "222"}
+        alice = profiles["111"]
+        assert alice.attributes["username"] == "alice"
+        assert {(c.node_id, c.relationship) for c in alice.connected_nodes} == {
+            ("concept/tea", "LIKES"),
+            ("user/222", "KNOWS"),
+        }
+        tea = next(c for c in alice.connected_nodes if c.node_id == "concept/tea")
+        assert tea.attributes["label"] == "tea"
+        assert [c.node_id for c in profiles["222"].connected_nodes] == ["user/111"]
+
+        # Second lookup, including the user without a node, is served from cache
+        assert set(await memory_service.recall_user_profiles(["111", "222", "333"])) == {"111", "222"}
+        assert nodes.call_count == 2
+
+    # Changing a connected node drops the profiles built from it
+    await memory_service.memorize(
+        GraphNode(id="concept/tea", type=NodeType.CONCEPT, scope=GraphScope.LOCAL, attributes={"label": "green tea"})
+    )
+    profiles = await memory_service.recall_user_profiles(["111"])
+    tea = next(c for c in profiles["111"].connected_nodes if c.node_id == "concept/tea")
+    assert tea.attributes["label"] == "green tea"
+
+    # Creating a user node clears its cached "no profile" entry
+    await memory_service.memorize(
+        GraphNode(id="user/333", type=NodeType.USER, scope=GraphScope.LOCAL, attributes={"username": "carol"})
+    )
+    assert (await memory_service.recall_user_profiles(["333"]))["333"].attributes["username"] == "carol"
+
+    # New edges invalidate both endpoints
+    memory_service.create_edge(
+        GraphEdge(source="user/333", target="user/222", relationship="KNOWS", scope=GraphScope.LOCAL)
+    )
+    profiles = await memory_service.recall_user_profiles(["222"])
+    assert {c.node_id for c in profiles["222"].connected_nodes} == {"user/111", "user/333"}
+
+    metrics = memory_service._collect_custom_metrics()
+    assert metrics["user_profile_cache_hits"] >= 3
+    assert metrics["user_profile_cache_invalidations"] >= 3
@@ -2,7 +2,7 @@
 
 import os
 import tempfile
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 import pytest_asyncio
@@ -384,3 +384,103 @@ async def test_jwt_expiration_extraction(auth_service):
     assert channel_verification.valid is True
     # When no expiration in token, should use current time as fallback
     assert channel_verification.expires_at is not None
+
+
+@pytest.mark.asyncio
+async def test_wa_cache_invalidation(auth_service):
+    """get_wa serves from cache and writes invalidate it and bump the version."""
+    from unittest.mock import patch
+
+    private_key, public_key = auth_service.generate_keypair()
+    wa = WACertificate(
+        wa_id="wa-2025-06-24-CACH01",
+        name="Cached WA",
+        role=WARole.OBSERVER,
+        pubkey=auth_service._encode_public_key(public_key),
+        jwt_kid="cache-kid",
+        scopes_json='["read:self"]',
+        created_at=datetime.now(timezone.utc),
+    )
+    await auth_service._store_wa_certificate(wa)
+    assert (await auth_service.get_wa(wa.wa_id)).name == "Cached WA"
+
+    with patch.object(auth_service, "_load_wa", wraps=auth_service._load_wa) as load:
+        await auth_service.get_wa(wa.wa_id)
+        load.assert_not_called()
+
+    version = auth_service.wa_cache_version
+    await auth_service.update_last_login(wa.wa_id)
+    assert auth_service.wa_cache_version == version
+
+    await auth_service.update_wa(wa.wa_id, name="Renamed WA")
+    assert auth_service.wa_cache_version == version + 1
+    assert (await auth_service.get_wa(wa.wa_id)).name == "Renamed WA"
+
+    await auth_service.revoke_wa(wa.wa_id, "test")
+    assert auth_service.wa_cache_version > version + 1
+    assert await auth_service.get_wa(wa.wa_id) is None
+
+
+@pytest.mark.asyncio
+async def test_wa_lookups_served_from_cache(auth_service):
+    """kid, OAuth and adapter lookups hit the database once and follow writes."""
+    from unittest.mock import patch
+
+    private_key, public_key = auth_service.generate_keypair()
+    wa = WACertificate(
+        wa_id="wa-2025-06-24-IDX001",
+        name="Indexed WA",
+        role=WARole.OBSERVER,
+        pubkey=auth_service._encode_public_key(public_key),
+        jwt_kid="index-kid",
+        oauth_provider="github",
+        oauth_external_id="42",
+        adapter_id="api_0",
+        scopes_json='["read:self"]',
+        created_at=datetime.now(timezone.utc),
+    )
+    await auth_service._store_wa_certificate(wa)
+    assert (await auth_service._get_wa_by_kid("index-kid")).wa_id == wa.wa_id
+
+    with patch("sqlite3.connect", side_effect=AssertionError("database hit")):
+        assert (await auth_service._get_wa_by_kid("index-kid")).wa_id == wa.wa_id
+        assert (await auth_service.get_wa_by_oauth("github", "42")).wa_id == wa.wa_id
+        assert (await auth_service._get_wa_by_adapter("api_0")).wa_id == wa.wa_id
+        assert (await auth_service.get_wa(wa.wa_id)).name == "Indexed WA"
+
+    await auth_service.update_wa(wa.wa_id, jwt_kid="rotated-kid")
+    assert await auth_service._get_wa_by_kid("index-kid") is None
+    assert (await auth_service._get_wa_by_kid("rotated-kid")).wa_id == wa.wa_id
+
+
+@pytest.mark.asyncio
+async def test_verified_token_cache_respects_revocation_and_expiry(auth_service):
+    """Cached tokens skip signature checks until the WA changes or the token expires."""
+    from unittest.mock import patch
+
+    private_key, public_key = auth_service.generate_keypair()
+    wa = WACertificate(
+        wa_id="wa-2025-06-24-TOK001",
+        name="Token WA",
+        role=WARole.OBSERVER,
+        pubkey=auth_service._encode_public_key(public_key),
+        jwt_kid="token-kid",
+        scopes_json='["read:self"]',
+        created_at=datetime.now(timezone.utc),
+    )
+    await auth_service._store_wa_certificate(wa)
+    token = auth_service.create_gateway_token(wa)
+
+    assert await auth_service._verify_jwt_and_get_context(token) is not None
+    with patch("jwt.decode", side_effect=AssertionError("re-verified")):
+        context, _ = await auth_service._verify_jwt_and_get_context(token)
+    assert context.wa_id == wa.wa_id
+
+    # An expired cache entry is dropped even inside the TTL
+    cached = auth_service._token_cache[auth_service._token_key(token)]
+    cached.expiration = datetime.now(timezone.utc) - timedelta(seconds=1)
+    assert auth_service._get_verified_token(auth_service._token_key(token)) is None
+
+    assert await auth_service._verify_jwt_and_get_context(token) is not None
+    await auth_service.revoke_wa(wa.wa_id, "test")
+    assert await auth_service._verify_jwt_and_get_context(token) is None
@@ -230,3 +230,34 @@ async def test_initialization_service_timeout(init_service):
     success = await init_service.initialize()
     assert success is False
     assert init_service._error is not None
+
+
+@pytest.mark.asyncio
+async def test_initialization_service_startup_timeline(init_service, time_service):
+    """Test service startup records and cold-start tracking."""
+    from datetime import timedelta
+
+    from ciris_engine.schemas.services.lifecycle.initialization import ServiceStartupRecord
+
+    await init_service.start()
+    began = time_service.now() - timedelta(seconds=5)
+    init_service.record_service_startup(
+        [
+            ServiceStartupRecord(
+                service_name="TimeService", phase="infrastructure", wave=0, started_at=began, duration_ms=1.0, success=True
+            )
+        ]
+    )
+
+    timeline = init_service.get_startup_timeline()
+    assert [r.service_name for r in timeline.services] == ["TimeService"]
+    assert timeline.initialization_started_at == began
+    assert timeline.cold_start_seconds is None
+
+    init_service.mark_first_work_round()
+    first = init_service.get_startup_timeline()
+    assert first.cold_start_seconds is not None and first.cold_start_seconds >= 5.0
+
+    # Only the first WORK round counts
+    init_service.mark_first_work_round()
+    assert init_service.get_startup_timeline().first_work_round_at == first.first_work_round_at
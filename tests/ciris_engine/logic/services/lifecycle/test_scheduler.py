@@ -0,0 +1,155 @@
+"""Unit tests for TaskSchedulerService deadline scheduling."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from ciris_engine.logic.services.lifecycle.scheduler import TaskSchedulerService
+
+START = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    """Time service whose clock only moves when told to."""
+
+    def __init__(self, now: datetime):
+        self.current = now
+
+    def now(self) -> datetime:
+        return self.current
+
+
+@pytest.fixture
+def clock():
+    return FakeClock(START)
+
+
+@pytest.fixture
+def scheduler(clock):
+    service = TaskSchedulerService(db_path=":memory:", time_service=clock, check_interval_seconds=60)
+    with patch("ciris_engine.logic.services.lifecycle.scheduler.add_thought") as add_thought:
+        service.added_thoughts = add_thought
+        yield service
+
+
+async def _schedule_at(scheduler, name: str, when: datetime):
+    # Task ids come from the clock, so keep them distinct
+    scheduler._time_service.current += timedelta(microseconds=1)
+    return await scheduler.schedule_task(
+        name=name,
+        goal_description=name,
+        trigger_prompt=name,
+        origin_thought_id="origin",
+        defer_until=when.isoformat(),
+    )
+
+
+def _fired(scheduler):
+    return [call.args[0].content for call in scheduler.added_thoughts.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_one_time_tasks_fire_in_deadline_order(scheduler, clock):
+    for name, minutes in (("late", 30), ("early", 10), ("middle", 20)):
+        await _schedule_at(scheduler, name, START + timedelta(minutes=minutes))
+
+    clock.current = START + timedelta(minutes=25)
+    await scheduler._run_scheduled_task()
+
+    assert _fired(scheduler) == ["early", "middle"]
+    assert [task.name for task in scheduler._active_tasks.values()] == ["late"]
+
+    metrics = scheduler._collect_custom_metrics()
+    assert metrics["schedule_fires"] == 2.0
+    assert metrics["schedule_lag_max_seconds"] == 15 * 60
+    assert metrics["schedule_lag_seconds"] == 5 * 60
+    assert metrics["scheduled_deadlines"] == 1.0
+    assert metrics["seconds_until_next_fire"] == 5 * 60
+
+
+@pytest.mark.asyncio
+async def test_missed_cron_occurrences_fire_once(scheduler, clock):
+    task = await scheduler.schedule_task(
+        name="tick", goal_description="tick", trigger_prompt="tick", origin_thought_id="o", schedule_cron="*/5 * * * *"
+    )
+    assert scheduler._next_fire[task.task_id] == START + timedelta(minutes=5)
+
+    # Host was suspended for an hour and a bit
+    clock.current = START + timedelta(hours=1, minutes=2)
+    await scheduler._run_scheduled_task()
+
+    assert _fired(scheduler) == ["tick"]
+    assert scheduler._next_fire[task.task_id] == START + timedelta(hours=1, minutes=5)
+    assert scheduler._collect_custom_metrics()["schedule_coalesced_fires"] == 1.0
+
+    clock.current = START + timedelta(hours=1, minutes=5)
+    await scheduler._run_scheduled_task()
+    assert _fired(scheduler) == ["tick", "tick"]
+    assert scheduler._next_fire[task.task_id] == START + timedelta(hours=1, minutes=10)
+    assert scheduler._collect_custom_metrics()["schedule_coalesced_fires"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_cancel_and_defer_update_deadlines(scheduler, clock):
+    cancelled = await _schedule_at(scheduler, "cancelled", START + timedelta(minutes=1))
+    deferred = await _schedule_at(scheduler, "deferred", START + timedelta(minutes=2))
+
+    assert await scheduler.cancel_task(cancelled.task_id)
+    assert await scheduler._defer_task(deferred.task_id, (START + timedelta(hours=1)).isoformat(), "later")
+
+    clock.current = START + timedelta(minutes=30)
+    await scheduler._run_scheduled_task()
+    assert _fired(scheduler) == []
+
+    clock.current = START + timedelta(hours=1)
+    await scheduler._run_scheduled_task()
+    assert _fired(scheduler) == ["deferred"]
+    assert scheduler._peek_deadline() is None
+
+
+@pytest.mark.asyncio
+async def test_failed_one_time_trigger_is_retried(scheduler, clock):
+    scheduler.added_thoughts.side_effect = RuntimeError("database locked")
+    task = await _schedule_at(scheduler, "flaky", START)
+
+    await scheduler._run_scheduled_task()
+    retry_at = clock.current + timedelta(seconds=60)
+    assert scheduler._next_fire[task.task_id] == retry_at
+
+    scheduler.added_thoughts.side_effect = None
+    clock.current = retry_at
+    await scheduler._run_scheduled_task()
+    assert task.task_id not in scheduler._active_tasks
+
+
+@pytest.mark.asyncio
+async def test_wait_wakes_on_schedule_change(scheduler):
+    waiter = asyncio.create_task(scheduler._wait_for_next_run())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await _schedule_at(scheduler, "soon", START + timedelta(minutes=1))
+    await asyncio.wait_for(waiter, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_wait_sleeps_until_earliest_deadline(scheduler, clock):
+    await _schedule_at(scheduler, "soon", START + timedelta(seconds=30))
+
+    with patch("ciris_engine.logic.services.lifecycle.scheduler.asyncio.wait_for") as wait_for:
+        wait_for.side_effect = lambda awaitable, timeout: awaitable.close() or asyncio.sleep(0)
+        await scheduler._wait_for_next_run()
+
+    assert wait_for.call_args.kwargs["timeout"] == pytest.approx(30.0, abs=0.001)
+
+
+@pytest.mark.asyncio
+async def test_stale_heap_entries_are_compacted(scheduler):
+    for i in range(200):
+        task = await _schedule_at(scheduler, f"t{i}", START + timedelta(minutes=i + 1))
+        await scheduler.cancel_task(task.task_id)
+
+    assert len(scheduler._deadlines) <= 64
+    assert scheduler._peek_deadline() is None
@@ -0,0 +1,133 @@
+"""Tests for the TSDB log handler."""
+
+import logging
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ciris_engine.logic.telemetry.log_collector import TSDBLogHandler
+
+
+@pytest.fixture
+def written():
+    """Capture correlations the handler writes instead of touching SQLite."""
+    batches = []
+    with patch(
+        "ciris_engine.logic.telemetry.log_collector.add_correlations",
+        side_effect=lambda corrs, *args: batches.append(list(corrs)),
+    ):
+        yield batches
+
+
+def _blocking_writer(written):
+    """A writer stuck in its first write until released, so later records queue up behind it."""
+    started, release = threading.Event(), threading.Event()
+
+    def write(corrs, *args):
+        started.set()
+        release.wait(5)
+        written.append(list(corrs))
+
+    return patch("ciris_engine.logic.telemetry.log_collector.add_correlations", side_effect=write), started, release
+
+
+def _logger(name: str, handler: TSDBLogHandler) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.WARNING)
+    return logger
+
+
+def test_records_written_in_batches_off_thread(written):
+    handler = TSDBLogHandler(time_service=MagicMock(), batch_size=50, burst_per_logger=1000)
+    logger = _logger("test.batches", handler)
+    writer_threads = set()
+
+    def record_thread(corrs, *args):
+        writer_threads.add(threading.current_thread().name)
+        written.append(list(corrs))
+
+    with patch("ciris_engine.logic.telemetry.log_collector.add_correlations", side_effect=record_thread):
+        for i in range(120):
+            logger.warning("message %d", i)
+        handler.flush()
+
+    correlations = [c for batch in written for c in batch]
+    assert [c.log_data.log_message.endswith(f"message {i}") for i, c in enumerate(correlations)] == [True] * 120
+    assert len(written) < 120
+    assert writer_threads == {"tsdb-log-writer"}
+    handler.close()
+
+
+def test_repeats_are_deduplicated_with_counts(written):
+    handler = TSDBLogHandler(time_service=MagicMock())
+    logger = _logger("test.dedupe", handler)
+
+    writer, started, release = _blocking_writer(written)
+    with writer:
+        logger.error("warming up")
+        assert started.wait(5)
+        for _ in range(10):
+            logger.error("disk full")
+        release.set()
+        handler.flush()
+
+    correlations = [c for batch in written for c in batch]
+    disk_full = [c for c in correlations if c.log_data.log_message.endswith("disk full")]
+    assert len(disk_full) == 1
+    assert disk_full[0].tags["repeat_count"] == "10"
+    assert handler.get_stats()["deduplicated"] == 9
+    handler.close()
+
+
+def test_noisy_logger_is_rate_limited_and_sampled(written):
+    handler = TSDBLogHandler(time_service=MagicMock(), rate_per_logger=0.0, burst_per_logger=5, sample_every=10)
+    noisy = _logger("test.noisy", handler)
+    quiet = _logger("test.quiet", handler)
+
+    for i in range(55):
+        noisy.warning("storm %d", i)
+    quiet.warning("still heard")
+    handler.flush()
+
+    messages = [c.log_data.log_message for batch in written for c in batch]
+    assert sum("storm" in m for m in messages) == 5 + 5  # burst, then every 10th of the remaining 50
+    assert any("still heard" in m for m in messages)
+    assert handler.get_stats()["rate_limited"] == 45
+    handler.close()
+
+
+def test_overflow_drops_and_reports(written):
+    handler = TSDBLogHandler(time_service=MagicMock(), max_queue=3)
+    logger = _logger("test.overflow", handler)
+
+    writer, started, release = _blocking_writer(written)
+    with writer:
+        logger.warning("first")
+        assert started.wait(5)
+        for i in range(10):
+            logger.warning("burst %d", i)
+        release.set()
+        handler.flush()
+        logger.warning("after")
+        handler.flush()
+
+    stats = handler.get_stats()
+    assert stats["dropped"] == 7
+    markers = [c for batch in written for c in batch if "dropped_records" in c.tags]
+    assert [int(c.tags["dropped_records"]) for c in markers] == [stats["dropped"]]
+    handler.close()
+
+
+def test_close_writes_pending_records(written):
+    handler = TSDBLogHandler(time_service=MagicMock(), flush_interval=60.0)
+    logger = _logger("test.close", handler)
+
+    logger.warning("last words")
+    handler.close()
+
+    assert any("last words" in c.log_data.log_message for batch in written for c in batch)
+    logger.warning("after close")
+    assert handler.get_stats()["captured"] == 1
@@ -0,0 +1,61 @@
+"""Tests for the startup import profiler."""
+
+import sys
+
+import pytest
+
+from ciris_engine.schemas.services.lifecycle.initialization import InitializationStatus
+from ciris_engine.utils import startup_profiler
+from ciris_engine.utils.startup_profiler import ImportProfiler, format_startup_report, profiling_requested
+
+
+@pytest.fixture
+def module_dir(tmp_path, monkeypatch):
+    """Create a throwaway package whose import we can time."""
+    (tmp_path / "profiled_pkg").mkdir()
+    (tmp_path / "profiled_pkg" / "__init__.py").write_text("from . import child\n")
+    (tmp_path / "profiled_pkg" / "child.py").write_text("import time\ntime.sleep(0.02)\nVALUE = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+    for name in ("profiled_pkg", "profiled_pkg.child"):
+        sys.modules.pop(name, None)
+
+
+def test_profiler_records_import_tree(module_dir):
+    profiler = ImportProfiler()
+    profiler.install()
+    try:
+        import profiled_pkg  # noqa: F401
+    finally:
+        profiler.uninstall()
+
+    assert profiled_pkg.child.VALUE == 42
+    root = next(r for r in profiler.roots if r.name == "profiled_pkg")
+    child = next(r for r in root.children if r.name == "profiled_pkg.child")
+    assert child.cumulative_us >= 20_000
+    assert root.cumulative_us >= child.cumulative_us
+    assert any("profiled_pkg.child" in line for line in profiler.format_tree(min_ms=1.0))
+    assert profiler.top_modules(1)[0].name == "profiled_pkg.child"
+
+
+def test_profiling_requested(monkeypatch):
+    monkeypatch.delenv("CIRIS_PROFILE_STARTUP", raising=False)
+    assert profiling_requested(["main.py"]) is False
+    assert profiling_requested(["main.py", "--profile-startup"]) is True
+    monkeypatch.setenv("CIRIS_PROFILE_STARTUP", "true")
+    assert profiling_requested(["main.py"]) is True
+
+
+def test_format_startup_report_includes_steps(monkeypatch):
+    monkeypatch.setattr(startup_profiler, "_profiler", None)
+    status = InitializationStatus(
+        complete=True,
+        duration_seconds=1.5,
+        step_durations_ms={"memory/Memory Service": 120.0, "services/Core Services": 900.0},
+    )
+
+    report = format_startup_report(initialization_status=status)
+
+    assert "memory/Memory Service" in report
+    assert "services/Core Services" in report
+    assert "TOTAL" in report
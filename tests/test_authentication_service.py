@@ -529,14 +529,15 @@ class TestAuthenticationServiceJWT:
         token = auth_service.create_gateway_token(wa)
 
         # First verification - not cached
-        assert token not in auth_service._token_cache
+        token_key = auth_service._token_key(token)
+        assert token_key not in auth_service._token_cache
 
         context = await auth_service._verify_token_internal(token)
         assert context is not None
 
-        # Should now be cached
-        assert token in auth_service._token_cache
-        assert auth_service._token_cache[token] == context
+        # Should now be cached by token hash
+        assert token_key in auth_service._token_cache
+        assert auth_service._token_cache[token_key].context == context
 
         # Second verification should use cache
         context2 = await auth_service._verify_token_internal(token)
@@ -503,3 +503,48 @@ class TestBuildSystemSnapshotWithBatch:
         snapshot3 = await build_system_snapshot_with_batch(task=None, thought=mock_thought3, batch_data=batch_data)
 
         assert snapshot3.current_thought_summary.status is None
+
+    async def test_build_snapshot_uses_prefetched_user_profiles(self):
+        """User profiles come from the batch prefetch, one lookup for every thought."""
+        from ciris_engine.schemas.services.graph.memory import UserGraphProfile
+
+        thoughts = []
+        for thought_id, content in (("t1", "User <@111> said hi"), ("t2", "Reply to <@111> and ID: 222")):
+            thought = MagicMock()
+            thought.thought_id = thought_id
+            thought.content = content
+            thought.status = "processing"
+            thought.source_task_id = "task_001"
+            thought.thought_type = "standard"
+            thought.thought_depth = 0
+            thought.context = None
+            thoughts.append(thought)
+
+        profiles = {
+            "111": UserGraphProfile(user_id="111", attributes={"username": "alice"}),
+            "222": UserGraphProfile(user_id="222", attributes={"username": "bob"}),
+        }
+        with (
+            patch("ciris_engine.logic.context.batch_context.persistence") as mock_persistence,
+            patch(
+                "ciris_engine.logic.context.batch_context.recall_user_graph_profiles",
+                new=AsyncMock(return_value=profiles),
+            ) as recall_profiles,
+        ):
+            mock_persistence.get_recent_completed_tasks.return_value = []
+            mock_persistence.get_top_tasks.return_value = []
+            mock_memory = AsyncMock()
+            mock_memory.recall.return_value = []
+
+            batch_data = await prefetch_batch_context(memory_service=mock_memory, thoughts=thoughts)
+            snapshots = [
+                await build_system_snapshot_with_batch(
+                    task=None, thought=thought, batch_data=batch_data, memory_service=mock_memory
+                )
+                for thought in thoughts
+            ]
+
+        recall_profiles.assert_awaited_once()
+        assert recall_profiles.await_args[0][1] == ["111", "222"]
+        assert [p.display_name for p in snapshots[0].user_profiles] == ["alice"]
+        assert [p.display_name for p in snapshots[1].user_profiles] == ["alice", "bob"]
@@ -28,12 +28,8 @@ def test_cli_offline_non_interactive(monkeypatch):
     def mock_runtime_init(modes: List[str], **kwargs):
         return runtime_mock
 
-    monkeypatch.setattr(
-        "ciris_engine.logic.runtime.ciris_runtime.CIRISRuntime.__new__", lambda cls, *args, **kwargs: runtime_mock
-    )
-    monkeypatch.setattr(
-        "ciris_engine.logic.runtime.ciris_runtime.CIRISRuntime.__init__", lambda self, *args, **kwargs: None
-    )
+    # Patch the name main uses; patching CIRISRuntime.__new__ would outlive the test
+    monkeypatch.setattr(main, "CIRISRuntime", MagicMock(return_value=runtime_mock))
 
     monkeypatch.setattr(main, "_run_runtime", AsyncMock())
 
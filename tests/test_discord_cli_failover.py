@@ -24,12 +24,8 @@ def test_run_discord_uses_env(monkeypatch):
     runtime_mock.startup_channel_id = "111"
     runtime_mock._shutdown_complete = True  # Mark as shutdown complete to prevent monitor task from forcing exit
 
-    monkeypatch.setattr(
-        "ciris_engine.logic.runtime.ciris_runtime.CIRISRuntime.__new__", lambda cls, *args, **kwargs: runtime_mock
-    )
-    monkeypatch.setattr(
-        "ciris_engine.logic.runtime.ciris_runtime.CIRISRuntime.__init__", lambda self, *args, **kwargs: None
-    )
+    # Patch the name main uses; patching CIRISRuntime.__new__ would outlive the test
+    monkeypatch.setattr(main, "CIRISRuntime", MagicMock(return_value=runtime_mock))
 
     monkeypatch.setattr(main, "load_config", AsyncMock(return_value=MagicMock(discord_home_channel_id="111")))
     monkeypatch.setattr(main, "_run_runtime", AsyncMock())
@@ -63,6 +63,24 @@ class TestDiscordConfigLoading:
 
         assert observer.monitored_channel_ids == test_channels
 
+    def test_observer_wires_vision_settings(self, tmp_path):
+        """The observer's vision helper uses the configured cache file and describer."""
+        describer = AsyncMock(return_value="described")
+        with patch.dict(os.environ, {"DISCORD_VISION_CACHE_PATH": str(tmp_path / "vision.json")}):
+            config = DiscordAdapterConfig(vision_describer=describer)
+            config.load_env_vars()
+
+        observer = DiscordObserver(
+            agent_id="test_agent",
+            vision_cache_path=config.vision_cache_path,
+            vision_describer=config.vision_describer,
+        )
+
+        assert observer._vision_helper._cache_path == tmp_path / "vision.json"
+        assert observer._vision_helper._describer is describer
+        assert observer._vision_helper.is_available()
+        assert "vision_describer" not in config.model_dump()
+
     def test_observer_empty_channels_without_config(self):
         """Test that observer has empty list when no channels provided."""
         observer = DiscordObserver(
@@ -88,7 +88,11 @@ class TestMigrationSystem:
 
     def test_migration_files_exist(self):
         """Test that expected migration files exist."""
-        expected_migrations = ["001_initial_schema.sql", "002_add_retry_status.sql"]
+        expected_migrations = [
+            "001_initial_schema.sql",
+            "002_add_retry_status.sql",
+            "003_add_graph_timeline_indexes.sql",
+        ]
 
         migration_files = list(MIGRATIONS_DIR.glob("*.sql"))
         migration_names = [f.name for f in migration_files]
@@ -325,6 +329,7 @@ class TestMigrationSystem:
             # Should have at least the initial migrations
             assert "001_initial_schema.sql" in applied
             assert "002_add_retry_status.sql" in applied
+            assert "003_add_graph_timeline_indexes.sql" in applied
 
     def test_migration_with_comments(self, temp_db_path: str, temp_migrations_dir: Path):
         """Test migration files with SQL comments."""
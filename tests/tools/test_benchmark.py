@@ -0,0 +1,161 @@
+"""
+Tests for the benchmark tool's measurement and comparison logic.
+"""
+
+import os
+import socket
+import sqlite3
+
+import pytest
+
+from tools.benchmark.compare import compare_results, format_comparison
+from tools.benchmark.harness import (
+    RUNTIME_RESOURCE_DIRS,
+    BenchmarkConfig,
+    BenchmarkHarness,
+    _isolated_working_directory,
+)
+from tools.benchmark.metrics import LatencyRecorder, SQLiteStatementCounter, percentile, summarize
+from tools.benchmark.stages import StageTimer
+
+
+def _result(mps=2.0, p99=100.0, writes=10.0, error_rate=0.0):
+    return {
+        "summary": {"messages_per_second": mps, "thoughts_per_second": mps * 2, "error_rate": error_rate},
+        "latency_ms": {"handler.speak": {"p50": 10.0, "p95": 50.0, "p99": p99}},
+        "sqlite": {"statements_per_task": writes * 10, "writes_per_task": writes},
+    }
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestMetrics:
+    def test_percentiles_interpolate(self):
+        samples = [float(i) for i in range(1, 101)]
+        assert percentile(samples, 50) == pytest.approx(50.5)
+        assert percentile(samples, 99) == pytest.approx(99.01)
+        assert percentile([], 95) == 0.0
+
+        summary = summarize([30.0, 10.0, 20.0])
+        assert summary["count"] == 3.0
+        assert summary["p50"] == 20.0
+        assert summary["max"] == 30.0
+
+    def test_recorder_summarizes_by_stage(self):
+        recorder = LatencyRecorder()
+        for value in (1.0, 2.0, 3.0):
+            recorder.record("thought", value)
+        recorder.record("llm_call", 5.0)
+
+        assert recorder.count("thought") == 3
+        assert list(recorder.summary()) == ["llm_call", "thought"]
+        recorder.reset()
+        assert recorder.summary() == {}
+
+    def test_sqlite_counter_classifies_statements(self, tmp_path):
+        counter = SQLiteStatementCounter()
+        counter.install()
+        try:
+            conn = sqlite3.connect(tmp_path / "bench.db")
+            conn.execute("CREATE TABLE t (x INTEGER)")
+            conn.execute("INSERT INTO t VALUES (1)")
+            conn.execute("-- refresh\nUPDATE t SET x = 2")
+            conn.execute("SELECT x FROM t").fetchall()
+            conn.commit()
+            conn.close()
+        finally:
+            counter.uninstall()
+
+        counts = counter.snapshot()
+        assert counts["INSERT"] == 1
+        assert counts["UPDATE"] == 1
+        assert counts["SELECT"] == 1
+        summary = counter.summary(tasks=2)
+        assert summary["writes"] == 2.0
+        assert summary["writes_per_task"] == 1.0
+
+        # Connections opened after uninstall are not traced
+        conn = sqlite3.connect(tmp_path / "bench.db")
+        conn.execute("SELECT x FROM t").fetchall()
+        conn.close()
+        assert counter.snapshot() == counts
+
+
+class TestStageTimer:
+    @pytest.mark.asyncio
+    async def test_wraps_and_restores_pipeline_methods(self):
+        from ciris_engine.logic.infrastructure.handlers.action_dispatcher import ActionDispatcher
+
+        original = ActionDispatcher.__dict__["dispatch"]
+        recorder = LatencyRecorder()
+        timer = StageTimer(recorder)
+        timer.install()
+        try:
+            assert ActionDispatcher.__dict__["dispatch"] is not original
+        finally:
+            timer.uninstall()
+        assert ActionDispatcher.__dict__["dispatch"] is original
+
+
+class TestHarnessIsolation:
+    def test_runtime_resources_are_linked_into_the_working_directory(self, tmp_path, monkeypatch):
+        checkout = tmp_path / "checkout"
+        work_dir = tmp_path / "work"
+        checkout.mkdir()
+        work_dir.mkdir()
+        monkeypatch.chdir(checkout)
+
+        with _isolated_working_directory(work_dir):
+            assert os.getcwd() == str(work_dir)
+            assert all((work_dir / name).is_dir() for name in RUNTIME_RESOURCE_DIRS)
+
+        assert os.getcwd() == str(checkout)
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_run_leaves_the_working_directory_untouched(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        config = BenchmarkConfig(messages=2, concurrency=1, warmup_messages=0, port=_free_port())
+
+        result = await BenchmarkHarness(config).run()
+
+        assert result["summary"]["completed"] == 2.0
+        assert os.getcwd() == str(tmp_path)
+        # No data/, logs/ or key directories in the caller's working directory
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestCompare:
+    def test_identical_results_have_no_regressions(self):
+        assert compare_results(_result(), _result()) == []
+        assert format_comparison([], 0.1) == "No regressions beyond 10%"
+
+    def test_flags_metrics_that_moved_the_wrong_way(self):
+        regressions = compare_results(_result(), _result(mps=1.5, p99=130.0, writes=12.0), threshold=0.1)
+
+        assert [r.metric for r in regressions] == [
+            "summary.thoughts_per_second",
+            "summary.messages_per_second",
+            "sqlite.statements_per_task",
+            "sqlite.writes_per_task",
+            "latency_ms.handler.speak.p99",
+        ]
+        assert regressions[-1].change == pytest.approx(0.3)
+
+    def test_improvements_noise_and_zero_baselines(self):
+        # Faster and leaner is never a regression
+        assert compare_results(_result(), _result(mps=3.0, p99=50.0, writes=5.0)) == []
+        # Latency changes under the noise floor are ignored even when large in relative terms
+        baseline = _result()
+        baseline["latency_ms"]["handler.speak"]["p50"] = 0.2
+        current = _result()
+        current["latency_ms"]["handler.speak"]["p50"] = 0.9
+        assert compare_results(baseline, current) == []
+        # Errors appearing where there were none are always flagged
+        regressions = compare_results(_result(), _result(error_rate=0.05))
+        assert [r.metric for r in regressions] == ["summary.error_rate"]
+        assert "new" in regressions[0].describe()
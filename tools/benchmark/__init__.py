@@ -0,0 +1,14 @@
+"""
+CIRIS Benchmark - deterministic end-to-end throughput benchmark.
+
+This tool provides:
+- A full runtime with the mock LLM, with synthetic latency and error injection
+- Synthetic message load through the API adapter
+- Throughput, per-stage latency percentiles, SQLite statement counts and peak RSS
+- JSON baselines and regression comparison
+"""
+
+from .compare import Regression, compare_results
+from .harness import BenchmarkConfig, BenchmarkHarness, run_benchmark
+
+__all__ = ["BenchmarkConfig", "BenchmarkHarness", "Regression", "compare_results", "run_benchmark"]
@@ -0,0 +1,111 @@
+"""Command-line interface for the benchmark tool."""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+from .compare import DEFAULT_THRESHOLD, compare_results, format_comparison
+from .harness import BenchmarkConfig, run_benchmark
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        result: Dict[str, Any] = json.load(f)
+    return result
+
+
+def _print_summary(result: Dict[str, Any]) -> None:
+    summary = result["summary"]
+    print(
+        f"{summary['completed']:.0f}/{summary['messages']:.0f} messages in {summary['duration_seconds']:.1f}s: "
+        f"{summary['messages_per_second']:.2f} msg/s, {summary['thoughts_per_second']:.2f} thoughts/s, "
+        f"error rate {summary['error_rate']:.1%}, peak RSS {summary['peak_rss_mb']:.0f} MiB"
+    )
+    print(f"{'stage':<24} {'count':>7} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10}")
+    for stage, stats in result["latency_ms"].items():
+        print(f"{stage:<24} {stats['count']:>7.0f} {stats['p50']:>10.1f} {stats['p95']:>10.1f} {stats['p99']:>10.1f}")
+    sqlite = result["sqlite"]
+    print(f"SQLite: {sqlite['statements_per_task']:.1f} statements/task, {sqlite['writes_per_task']:.1f} writes/task")
+
+
+def _report_regressions(baseline_path: str, current: Dict[str, Any], threshold: float) -> int:
+    regressions = compare_results(_load(baseline_path), current, threshold)
+    print(format_comparison(regressions, threshold))
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="CIRIS Benchmark - deterministic mock-LLM end-to-end throughput benchmark",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Record a baseline
+  python -m tools.benchmark run --output benchmark_baseline.json
+
+  # Run with 200ms simulated LLM latency and 5% provider errors, compare to the baseline
+  python -m tools.benchmark run --llm-delay-ms 200 --llm-failure-rate 0.05 --baseline benchmark_baseline.json
+
+  # Compare two saved results
+  python -m tools.benchmark compare benchmark_baseline.json benchmark_new.json --threshold 0.15
+        """,
+    )
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+    defaults = BenchmarkConfig()
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmark")
+    run_parser.add_argument("--messages", type=int, default=defaults.messages, help="Messages in the measured load")
+    run_parser.add_argument("--concurrency", type=int, default=defaults.concurrency, help="Messages in flight")
+    run_parser.add_argument("--warmup", type=int, default=defaults.warmup_messages, help="Unmeasured warmup messages")
+    run_parser.add_argument("--llm-delay-ms", type=int, default=defaults.llm_delay_ms, help="Simulated LLM latency")
+    run_parser.add_argument("--llm-jitter-ms", type=int, default=defaults.llm_jitter_ms, help="Random extra latency")
+    run_parser.add_argument(
+        "--llm-failure-rate", type=float, default=defaults.llm_failure_rate, help="Fraction of LLM calls that fail"
+    )
+    run_parser.add_argument("--seed", type=int, default=defaults.seed, help="Seed for latency and failure draws")
+    run_parser.add_argument("--port", type=int, default=defaults.port, help="API port for the benchmark runtime")
+    run_parser.add_argument(
+        "--timeout", type=float, default=defaults.interaction_timeout, help="Per-interaction timeout in seconds"
+    )
+    run_parser.add_argument("--output", help="Write the result JSON here")
+    run_parser.add_argument("--baseline", help="Compare against this saved result; exit 1 on regression")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Tolerated relative change")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare a result against a baseline")
+    compare_parser.add_argument("baseline", help="Baseline result JSON")
+    compare_parser.add_argument("current", help="Result JSON to check")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Tolerated relative change")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        config = BenchmarkConfig(
+            messages=args.messages,
+            concurrency=args.concurrency,
+            warmup_messages=args.warmup,
+            llm_delay_ms=args.llm_delay_ms,
+            llm_jitter_ms=args.llm_jitter_ms,
+            llm_failure_rate=args.llm_failure_rate,
+            seed=args.seed,
+            port=args.port,
+            interaction_timeout=args.timeout,
+        )
+        result = run_benchmark(config)
+        _print_summary(result)
+        if args.output:
+            Path(args.output).write_text(json.dumps(result, indent=2) + "\n")
+            print(f"Result written to {args.output}")
+        if args.baseline:
+            return _report_regressions(args.baseline, result, args.threshold)
+        return 0
+    if args.command == "compare":
+        return _report_regressions(args.baseline, _load(args.current), args.threshold)
+
+    parser.print_help()
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
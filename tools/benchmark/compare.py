@@ -0,0 +1,104 @@
+"""
+Baseline comparison for benchmark results.
+
+Only metrics with a known "better" direction are compared. A metric regresses
+when it moves the wrong way by more than the relative threshold; latency
+changes below a small absolute floor are treated as noise.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Tuple
+
+DEFAULT_THRESHOLD = 0.10
+LATENCY_NOISE_FLOOR_MS = 1.0
+
+HIGHER_IS_BETTER = ("summary.thoughts_per_second", "summary.messages_per_second")
+LOWER_IS_BETTER = (
+    "summary.error_rate",
+    "summary.peak_rss_mb",
+    "sqlite.statements_per_task",
+    "sqlite.writes_per_task",
+)
+LATENCY_PERCENTILES = ("p50", "p95", "p99")
+
+
+@dataclass
+class Regression:
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change from the baseline; inf when the baseline was zero."""
+        if self.baseline == 0:
+            return float("inf")
+        return (self.current - self.baseline) / self.baseline
+
+    def describe(self) -> str:
+        change = "new" if self.baseline == 0 else f"{self.change:+.1%}"
+        return f"{self.metric}: {self.baseline:.3f} -> {self.current:.3f} ({change})"
+
+
+def _lookup(result: Dict[str, Any], path: str) -> Any:
+    value: Any = result
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def _compared_metrics(baseline: Dict[str, Any]) -> Iterator[Tuple[str, bool, float]]:
+    """(metric path, higher is better, absolute noise floor) for each comparable metric."""
+    for path in HIGHER_IS_BETTER:
+        yield path, True, 0.0
+    for path in LOWER_IS_BETTER:
+        yield path, False, 0.0
+    # Stage names can contain dots (handler.speak), see _stage_value
+    for stage in sorted(baseline.get("latency_ms", {})):
+        for pct in LATENCY_PERCENTILES:
+            yield f"latency_ms.{stage}.{pct}", False, LATENCY_NOISE_FLOOR_MS
+
+
+def _stage_value(result: Dict[str, Any], path: str) -> Any:
+    if not path.startswith("latency_ms."):
+        return _lookup(result, path)
+    stage, pct = path[len("latency_ms.") :].rsplit(".", 1)
+    return result.get("latency_ms", {}).get(stage, {}).get(pct)
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> List[Regression]:
+    """
+    Find metrics that got worse than the baseline by more than the threshold.
+
+    Args:
+        baseline: Saved benchmark result
+        current: New benchmark result
+        threshold: Tolerated relative change, e.g. 0.1 for 10%
+
+    Returns:
+        Regressions, in metric order
+    """
+    regressions = []
+    for path, higher_is_better, noise_floor in _compared_metrics(baseline):
+        base_value = _stage_value(baseline, path)
+        new_value = _stage_value(current, path)
+        if not isinstance(base_value, (int, float)) or not isinstance(new_value, (int, float)):
+            continue
+        worse_by = (base_value - new_value) if higher_is_better else (new_value - base_value)
+        if worse_by <= noise_floor:
+            continue
+        if base_value == 0 or worse_by / abs(base_value) > threshold:
+            regressions.append(Regression(path, float(base_value), float(new_value)))
+    return regressions
+
+
+def format_comparison(regressions: List[Regression], threshold: float) -> str:
+    if not regressions:
+        return f"No regressions beyond {threshold:.0%}"
+    lines = [f"{len(regressions)} regression(s) beyond {threshold:.0%}:"]
+    lines.extend(f"  {regression.describe()}" for regression in regressions)
+    return "\n".join(lines)
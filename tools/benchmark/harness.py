@@ -0,0 +1,323 @@
+"""
+End-to-end throughput benchmark against a full runtime with the mock LLM.
+
+Boots CIRISRuntime in-process with the API adapter and the mock LLM module,
+drives a fixed synthetic message load through /v1/agent/interact and records:
+
+- throughput (messages and thoughts per second)
+- end-to-end interaction latency and per-stage pipeline latency percentiles
+- SQLite statements and writes per task
+- peak RSS
+
+The load is deterministic: message contents are fixed and the mock LLM's
+latency and failure draws are seeded.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+import httpx
+
+from .metrics import LatencyRecorder, SQLiteStatementCounter, peak_rss_mb
+from .stages import StageTimer
+
+logger = logging.getLogger(__name__)
+
+RESULT_SCHEMA_VERSION = 1
+TIMEOUT_RESPONSE_PREFIX = "Still processing"
+SHUTDOWN_TIMEOUT = 60.0
+ADMIN_USERNAME = "admin"
+ADMIN_PASSWORD = "ciris_admin_password"
+# Interactions are routed per user channel, so every load worker gets its own user
+LOAD_USER_PASSWORD = "benchmark_password"
+REPO_ROOT = Path(__file__).resolve().parents[2]
+# Read-only resources the runtime looks up relative to the working directory
+RUNTIME_RESOURCE_DIRS = ("ciris_templates", "ciris_modular_services")
+
+
+@dataclass
+class BenchmarkConfig:
+    """Load shape and simulated provider behaviour for one benchmark run."""
+
+    messages: int = 50
+    concurrency: int = 4
+    warmup_messages: int = 3
+    llm_delay_ms: int = 0
+    llm_jitter_ms: int = 0
+    llm_failure_rate: float = 0.0
+    seed: int = 42
+    host: str = "127.0.0.1"
+    port: int = 18765
+    interaction_timeout: float = 30.0
+    startup_timeout: float = 60.0
+
+
+def _mock_llm_environment(config: BenchmarkConfig) -> Dict[str, str]:
+    return {
+        "CIRIS_MOCK_LLM": "true",
+        "CIRIS_MOCK_LLM_DELAY_MS": str(config.llm_delay_ms),
+        "CIRIS_MOCK_LLM_JITTER_MS": str(config.llm_jitter_ms),
+        "CIRIS_MOCK_LLM_FAILURE_RATE": str(config.llm_failure_rate),
+        "CIRIS_MOCK_LLM_SEED": str(config.seed),
+    }
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=5,
+            cwd=REPO_ROOT,
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+@contextlib.contextmanager
+def _isolated_working_directory(path: Path) -> Iterator[Path]:
+    """
+    Run with path as the working directory.
+
+    Persistence, keys and logs resolve their default locations against the
+    working directory, so this keeps every file the runtime writes under path.
+    """
+    for name in RUNTIME_RESOURCE_DIRS:
+        source = REPO_ROOT / name
+        if source.is_dir():
+            (path / name).symlink_to(source, target_is_directory=True)
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield path
+    finally:
+        os.chdir(previous)
+
+
+@contextlib.contextmanager
+def _preserved_root_logging() -> Iterator[None]:
+    """Restore the root logger after the runtime replaces its handlers with file logging."""
+    root = logging.getLogger()
+    handlers, level, propagate = list(root.handlers), root.level, root.propagate
+    try:
+        yield
+    finally:
+        for handler in root.handlers:
+            if handler not in handlers:
+                handler.close()
+        root.handlers = handlers
+        root.setLevel(level)
+        root.propagate = propagate
+
+
+class _LoadStats:
+    def __init__(self) -> None:
+        self.completed = 0
+        self.timeouts = 0
+        self.errors = 0
+
+
+class BenchmarkHarness:
+    """Runs one benchmark: boot, warm up, drive the load, collect, shut down."""
+
+    def __init__(self, config: BenchmarkConfig) -> None:
+        self.config = config
+        self.recorder = LatencyRecorder()
+        self.sqlite_counter = SQLiteStatementCounter()
+        self.stage_timer = StageTimer(self.recorder)
+        self._base_url = f"http://{config.host}:{config.port}"
+
+    async def run(self) -> Dict[str, Any]:
+        """Run the benchmark and return the result document."""
+        saved_env = {name: os.environ.get(name) for name in _mock_llm_environment(self.config)}
+        os.environ.update(_mock_llm_environment(self.config))
+        self.sqlite_counter.install()
+        self.stage_timer.install()
+        try:
+            with tempfile.TemporaryDirectory(prefix="ciris_benchmark_") as work_dir:
+                with _isolated_working_directory(Path(work_dir)), _preserved_root_logging():
+                    return await self._run_with_runtime()
+        finally:
+            self.stage_timer.uninstall()
+            self.sqlite_counter.uninstall()
+            for name, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+    async def _run_with_runtime(self) -> Dict[str, Any]:
+        from ciris_engine.logic.adapters.api.config import APIAdapterConfig
+        from ciris_engine.logic.runtime.ciris_runtime import CIRISRuntime
+        from ciris_engine.logic.runtime.prevent_sideeffects import allow_runtime_creation
+        from ciris_engine.schemas.config.essential import EssentialConfig
+
+        allow_runtime_creation()
+        # Default paths are relative, so they land in the isolated working directory
+        essential_config = EssentialConfig()
+        api_config = APIAdapterConfig()
+        api_config.host = self.config.host
+        api_config.port = self.config.port
+        api_config.interaction_timeout = self.config.interaction_timeout
+
+        runtime = CIRISRuntime(
+            adapter_types=["api"],
+            essential_config=essential_config,
+            startup_channel_id=api_config.get_home_channel_id(api_config.host, api_config.port),
+            adapter_configs={"api": api_config},
+            modules=["mock_llm"],
+        )
+        tasks_before = asyncio.all_tasks()
+        await runtime.initialize()
+        run_task = asyncio.create_task(runtime.run())
+        try:
+            async with httpx.AsyncClient(
+                base_url=self._base_url, timeout=self.config.interaction_timeout + 10
+            ) as client:
+                await self._wait_until_ready(client, run_task)
+                admin_headers = await self._login(client, ADMIN_USERNAME, ADMIN_PASSWORD)
+                worker_headers = [
+                    await self._create_load_user(client, admin_headers, worker)
+                    for worker in range(max(1, self.config.concurrency))
+                ]
+                return await self._drive_load(client, worker_headers)
+        finally:
+            runtime.request_shutdown("Benchmark complete")
+            await self._wait_for_shutdown(run_task, tasks_before)
+
+    async def _wait_for_shutdown(self, run_task: "asyncio.Task[None]", tasks_before: Set["asyncio.Task[Any]"]) -> None:
+        """Wait for the runtime and every task it started to stop.
+
+        A runtime that is still running when the isolated working directory is
+        removed keeps its services writing into a deleted tree, so failing to
+        shut down is an error rather than a warning.
+        """
+        try:
+            await asyncio.wait_for(run_task, timeout=SHUTDOWN_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise RuntimeError(f"Runtime did not shut down within {SHUTDOWN_TIMEOUT:.0f}s") from None
+
+        await asyncio.sleep(0)
+        leftover = asyncio.all_tasks() - tasks_before - {asyncio.current_task()}
+        leftover = {task for task in leftover if not task.done()}
+        if leftover:
+            for task in leftover:
+                task.cancel()
+            names = sorted(task.get_coro().__qualname__ for task in leftover)
+            raise RuntimeError(f"Runtime left tasks running after shutdown: {', '.join(names)}")
+
+    async def _wait_until_ready(self, client: httpx.AsyncClient, run_task: "asyncio.Task[None]") -> None:
+        deadline = time.monotonic() + self.config.startup_timeout
+        while time.monotonic() < deadline:
+            if run_task.done():
+                raise RuntimeError("Runtime exited before the API became ready")
+            try:
+                if (await client.get("/v1/system/health")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.2)
+        raise TimeoutError(f"API not ready after {self.config.startup_timeout}s")
+
+    async def _login(self, client: httpx.AsyncClient, username: str, password: str) -> Dict[str, str]:
+        response = await client.post("/v1/auth/login", json={"username": username, "password": password})
+        response.raise_for_status()
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    async def _create_load_user(
+        self, client: httpx.AsyncClient, admin_headers: Dict[str, str], worker: int
+    ) -> Dict[str, str]:
+        username = f"benchmark_{worker}"
+        response = await client.post(
+            "/v1/users",
+            json={"username": username, "password": LOAD_USER_PASSWORD, "api_role": "ADMIN"},
+            headers=admin_headers,
+        )
+        response.raise_for_status()
+        return await self._login(client, username, LOAD_USER_PASSWORD)
+
+    async def _interact(
+        self, client: httpx.AsyncClient, headers: Dict[str, str], index: int, stats: _LoadStats
+    ) -> None:
+        started = time.perf_counter()
+        try:
+            response = await client.post(
+                "/v1/agent/interact", json={"message": f"Benchmark message {index}: please respond."}, headers=headers
+            )
+            response.raise_for_status()
+            reply = response.json()["data"]["response"]
+        except (httpx.HTTPError, KeyError, ValueError) as e:
+            logger.warning(f"Benchmark interaction {index} failed: {e}")
+            stats.errors += 1
+            return
+        if reply.startswith(TIMEOUT_RESPONSE_PREFIX):
+            stats.timeouts += 1
+            return
+        stats.completed += 1
+        self.recorder.record("end_to_end", (time.perf_counter() - started) * 1000)
+
+    async def _drive_load(self, client: httpx.AsyncClient, worker_headers: List[Dict[str, str]]) -> Dict[str, Any]:
+        config = self.config
+        for index in range(config.warmup_messages):
+            await self._interact(client, worker_headers[0], -1 - index, _LoadStats())
+
+        self.recorder.reset()
+        self.stage_timer.errors.clear()
+        self.sqlite_counter.reset()
+
+        stats = _LoadStats()
+        indices = iter(range(config.messages))
+
+        async def worker(headers: Dict[str, str]) -> None:
+            # Each worker waits for its reply before sending the next message on its channel
+            for index in indices:
+                await self._interact(client, headers, index, stats)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(headers) for headers in worker_headers))
+        duration = time.perf_counter() - started
+
+        thoughts = self.recorder.count("thought")
+        return {
+            "schema_version": RESULT_SCHEMA_VERSION,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "config": asdict(config),
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "git_revision": _git_revision(),
+            },
+            "summary": {
+                "messages": float(config.messages),
+                "completed": float(stats.completed),
+                "timeouts": float(stats.timeouts),
+                "errors": float(stats.errors),
+                "error_rate": (stats.timeouts + stats.errors) / config.messages if config.messages else 0.0,
+                "duration_seconds": duration,
+                "messages_per_second": stats.completed / duration if duration else 0.0,
+                "thoughts": float(thoughts),
+                "thoughts_per_second": thoughts / duration if duration else 0.0,
+                "peak_rss_mb": peak_rss_mb(),
+            },
+            "latency_ms": self.recorder.summary(),
+            "stage_errors": {stage: float(count) for stage, count in sorted(self.stage_timer.errors.items())},
+            "sqlite": self.sqlite_counter.summary(tasks=stats.completed + stats.timeouts),
+        }
+
+
+def run_benchmark(config: BenchmarkConfig) -> Dict[str, Any]:
+    """Run a benchmark in a fresh event loop and return its result document."""
+    return asyncio.run(BenchmarkHarness(config).run())
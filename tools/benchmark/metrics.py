@@ -0,0 +1,133 @@
+"""
+Measurement primitives for the benchmark harness.
+
+Latency samples are kept in full (benchmark runs are bounded) so percentiles
+are exact. SQLite statements are counted through a trace callback installed
+on every connection opened while the counter is active.
+"""
+
+import re
+import resource
+import sqlite3
+import sys
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Sequence
+
+_STATEMENT_KIND = re.compile(r"^\s*(?:--[^\n]*\n\s*)*([A-Za-z]+)")
+WRITE_KINDS = frozenset({"INSERT", "UPDATE", "DELETE", "REPLACE", "UPSERT"})
+
+
+def percentile(sorted_samples: Sequence[float], pct: float) -> float:
+    """Linear-interpolated percentile of already sorted samples."""
+    if not sorted_samples:
+        return 0.0
+    rank = (len(sorted_samples) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_samples) - 1)
+    return sorted_samples[lower] + (sorted_samples[upper] - sorted_samples[lower]) * (rank - lower)
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    """Count, mean, p50/p95/p99 and max of latency samples in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "count": float(len(ordered)),
+        "mean": sum(ordered) / len(ordered) if ordered else 0.0,
+        "p50": percentile(ordered, 50),
+        "p95": percentile(ordered, 95),
+        "p99": percentile(ordered, 99),
+        "max": ordered[-1] if ordered else 0.0,
+    }
+
+
+class LatencyRecorder:
+    """Latency samples per named stage; safe to record from any thread."""
+
+    def __init__(self) -> None:
+        self._samples: DefaultDict[str, List[float]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, elapsed_ms: float) -> None:
+        with self._lock:
+            self._samples[stage].append(elapsed_ms)
+
+    def count(self, stage: str) -> int:
+        with self._lock:
+            return len(self._samples.get(stage, ()))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            snapshot = {stage: list(samples) for stage, samples in self._samples.items()}
+        return {stage: summarize(samples) for stage, samples in sorted(snapshot.items())}
+
+
+class SQLiteStatementCounter:
+    """
+    Counts statements executed on SQLite connections, by leading keyword.
+
+    While installed, sqlite3.connect is wrapped so every new connection gets a
+    trace callback. Connections opened before install are not counted, which
+    is fine for the persistence layer: it opens a connection per operation.
+    """
+
+    def __init__(self) -> None:
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+        self._original_connect: Optional[Callable[..., sqlite3.Connection]] = None
+
+    def install(self) -> None:
+        if self._original_connect is not None:
+            return
+        original = sqlite3.connect
+        self._original_connect = original
+
+        def connect(*args: Any, **kwargs: Any) -> sqlite3.Connection:
+            conn = original(*args, **kwargs)
+            conn.set_trace_callback(self._trace)
+            return conn
+
+        sqlite3.connect = connect  # type: ignore[assignment]
+
+    def uninstall(self) -> None:
+        if self._original_connect is not None:
+            sqlite3.connect = self._original_connect  # type: ignore[assignment]
+            self._original_connect = None
+
+    def _trace(self, statement: str) -> None:
+        match = _STATEMENT_KIND.match(statement)
+        kind = match.group(1).upper() if match else "OTHER"
+        with self._lock:
+            self._counts[kind] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def summary(self, tasks: int) -> Dict[str, Any]:
+        """Totals and per-task averages; tasks is the number of completed interactions."""
+        counts = self.snapshot()
+        statements = sum(counts.values())
+        writes = sum(count for kind, count in counts.items() if kind in WRITE_KINDS)
+        return {
+            "statements": float(statements),
+            "writes": float(writes),
+            "statements_per_task": statements / tasks if tasks else 0.0,
+            "writes_per_task": writes / tasks if tasks else 0.0,
+            "by_kind": {kind: float(count) for kind, count in sorted(counts.items())},
+        }
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
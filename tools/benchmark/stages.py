@@ -0,0 +1,99 @@
+"""
+Per-stage timing of the thought pipeline.
+
+Wraps the coroutine methods that bound each pipeline stage so their wall time
+lands in a LatencyRecorder. Only the benchmark process is patched; nothing in
+the engine knows about it.
+"""
+
+import functools
+import importlib
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .metrics import LatencyRecorder
+
+
+def _handler_stage(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+    result = kwargs.get("action_selection_result", args[0] if args else None)
+    action = getattr(result, "selected_action", None)
+    return f"handler.{getattr(action, 'value', action) or 'unknown'}"
+
+
+class Stage(NamedTuple):
+    name: str
+    module: str
+    class_name: str
+    method: str
+    label: Optional[Callable[[Tuple[Any, ...], Dict[str, Any]], str]] = None
+
+
+PIPELINE_STAGES = (
+    Stage("thought", "ciris_engine.logic.processors.core.thought_processor", "ThoughtProcessor", "process_thought"),
+    Stage("context_build", "ciris_engine.logic.context.builder", "ContextBuilder", "build_thought_context"),
+    Stage(
+        "initial_dmas", "ciris_engine.logic.processors.support.dma_orchestrator", "DMAOrchestrator", "run_initial_dmas"
+    ),
+    Stage(
+        "action_selection",
+        "ciris_engine.logic.processors.support.dma_orchestrator",
+        "DMAOrchestrator",
+        "run_action_selection",
+    ),
+    Stage(
+        "conscience",
+        "ciris_engine.logic.processors.core.thought_processor",
+        "ThoughtProcessor",
+        "_apply_conscience_simple",
+    ),
+    Stage(
+        "handler",
+        "ciris_engine.logic.infrastructure.handlers.action_dispatcher",
+        "ActionDispatcher",
+        "dispatch",
+        _handler_stage,
+    ),
+    Stage("llm_call", "ciris_engine.logic.buses.llm_bus", "LLMBus", "call_llm_structured"),
+)
+
+
+class StageTimer:
+    """Installs timing wrappers on the pipeline stage methods."""
+
+    def __init__(self, recorder: LatencyRecorder) -> None:
+        self.recorder = recorder
+        self.errors: Counter = Counter()
+        self._patched: List[Tuple[type, str, Any]] = []
+
+    def install(self) -> None:
+        if self._patched:
+            return
+        for stage in PIPELINE_STAGES:
+            owner = getattr(importlib.import_module(stage.module), stage.class_name)
+            original = owner.__dict__[stage.method]
+            setattr(owner, stage.method, self._wrap(stage, original))
+            self._patched.append((owner, stage.method, original))
+
+    def uninstall(self) -> None:
+        while self._patched:
+            owner, method, original = self._patched.pop()
+            setattr(owner, method, original)
+
+    def _wrap(self, stage: Stage, original: Callable[..., Any]) -> Callable[..., Any]:
+        recorder = self.recorder
+        errors = self.errors
+
+        @functools.wraps(original)
+        async def timed(instance: Any, *args: Any, **kwargs: Any) -> Any:
+            name = stage.label(args, kwargs) if stage.label else stage.name
+            started = time.perf_counter()
+            try:
+                return await original(instance, *args, **kwargs)
+            except Exception:
+                errors[name] += 1
+                raise
+            finally:
+                recorder.record(name, (time.perf_counter() - started) * 1000)
+
+        return timed